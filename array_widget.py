@@ -0,0 +1,348 @@
+"""
+풀링된 배열 위젯과 글리프 아틀라스
+칸마다 Rectangle + Text를 새로 만드는 대신 미리 만든 칸을 재사용하고,
+숫자는 (폰트, 크기, 굵기)마다 한 번만 조판한 글리프의 점 데이터를 복사해서 그립니다.
+값이 바뀌어도 Pango 레이아웃이나 SVG 파싱이 다시 일어나지 않습니다.
+"""
+
+from manim import *
+
+
+FONT = "NanumGothic"
+DEFAULT_CHARSET = "0123456789-"
+
+
+class GlyphAtlas:
+    """
+    글자별 윤곽선 템플릿 모음.
+    템플릿은 가로 중심이 x=0, 숫자 "0"의 세로 중심이 y=0이 되도록 정렬되어
+    같은 아틀라스의 글리프끼리는 기준선이 맞습니다.
+    """
+
+    _shared = {}
+
+    @classmethod
+    def get(cls, font: str = FONT, font_size: float = 28, weight: str = NORMAL) -> "GlyphAtlas":
+        """(폰트, 크기, 굵기)별로 공유되는 아틀라스"""
+        key = (font, font_size, weight)
+        if key not in cls._shared:
+            cls._shared[key] = cls(font, font_size, weight)
+        return cls._shared[key]
+
+    def __init__(self, font: str = FONT, font_size: float = 28, weight: str = NORMAL, charset: str = DEFAULT_CHARSET):
+        self.font = font
+        self.font_size = font_size
+        self.weight = weight
+        self.glyphs = {}
+        self.advance = 0.0
+        self.space = 0.0
+        self.typeset_count = 0
+        self.add_chars(charset)
+
+    def add_chars(self, chars: str) -> None:
+        """아틀라스에 없는 글자만 한 번에 조판하여 추가"""
+        new_chars = [c for c in dict.fromkeys(chars) if c not in self.glyphs and not c.isspace()]
+        if not new_chars:
+            return
+
+        # 기준 글자 "0"을 항상 앞에 두어 추가 조판 때도 세로 기준이 같게 함
+        text = Text("0" + "".join(new_chars), font=self.font, font_size=self.font_size, weight=self.weight)
+        self.typeset_count += 1
+        reference_y = text.submobjects[0].get_center()[1]
+        for char, glyph in zip(new_chars, text.submobjects[1:]):
+            template = glyph.copy()
+            template.shift(np.array([-glyph.get_center()[0], -reference_y, 0.0]))
+            self.glyphs[char] = template
+
+        digit_widths = [self.glyphs[c].width for c in "0123456789" if c in self.glyphs]
+        self.advance = max(digit_widths or [g.width for g in self.glyphs.values()]) * 1.15
+        self.space = self.advance * 0.6
+
+    def glyph(self, char: str) -> VMobject:
+        if char not in self.glyphs:
+            self.add_chars(char)
+        return self.glyphs[char]
+
+    def layout(self, string: str) -> list:
+        """문자열의 각 글자 (템플릿, x 오프셋) 목록. 전체 가로 중심이 0"""
+        xs = []
+        x = 0.0
+        for char in string:
+            step = self.space if char.isspace() else self.advance
+            xs.append((char, x + step / 2))
+            x += step
+        return [(self.glyph(char), offset - x / 2) for char, offset in xs if not char.isspace()]
+
+
+class GlyphLabel(VGroup):
+    """
+    고정 개수의 글리프 슬롯으로 된 텍스트.
+    set_text()는 슬롯의 점 데이터만 바꾸므로 새 mobject를 만들지 않습니다.
+    """
+
+    def __init__(self, atlas: GlyphAtlas, max_chars: int, text: str = "", color=WHITE):
+        super().__init__()
+        self.atlas = atlas
+        self.text = ""
+        self.add(*[VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0) for _ in range(max_chars)])
+        self.set_text(text)
+
+    def set_text(self, text: str, center=None) -> "GlyphLabel":
+        """
+        텍스트를 바꿉니다. center가 없으면 현재 위치를 유지하는데, 글리프 높이에 따라
+        경계 상자 중심이 조금씩 달라지므로 위치가 고정된 칸에서는 center를 넘기세요.
+        """
+        if center is None:
+            center = self.get_center() if self.text else ORIGIN
+        center = np.array(center, dtype=float)
+
+        glyphs = self.atlas.layout(str(text))
+        if len(glyphs) > len(self.submobjects):
+            color = self.submobjects[0].get_fill_color() if self.submobjects else WHITE
+            self.add(*[
+                VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+                for _ in range(len(glyphs) - len(self.submobjects))
+            ])
+        for slot, (template, x) in zip(self.submobjects, glyphs):
+            slot.set_points(template.points + np.array([center[0] + x, center[1], 0.0]))
+        # 남는 슬롯은 중심 한 점으로 접어 둠 (그려지지 않고 경계 상자에도 영향 없음)
+        for slot in self.submobjects[len(glyphs):]:
+            slot.set_points(np.repeat(center[None, :], 4, axis=0))
+        self.text = str(text)
+        return self
+
+
+class ArrayWidget(VGroup):
+    """
+    배열 위젯: capacity개의 칸(상자 + GlyphLabel)을 미리 만들어 재사용합니다.
+    cells[i]는 i번째 칸이며 VGroup(box, label) 구조라 기존 씬의
+    `boxes[i].animate.set_color(...)`, `Swap(...)`을 그대로 쓸 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        values,
+        cell_size: float = 0.8,
+        font_size: float = 28,
+        font: str = FONT,
+        color=BLUE,
+        text_color=WHITE,
+        stroke_width: float = 2,
+        buff: float = 0.1,
+        capacity: int = None,
+        max_chars: int = None,
+    ):
+        super().__init__()
+        values = list(values)
+        strings = [str(v) for v in values]
+        capacity = max(capacity or len(values), len(values))
+        self.atlas = GlyphAtlas.get(font, font_size)
+        self.base_color = color
+        self.marks = {}
+        self.values = values
+
+        max_chars = max_chars or max((len(s) for s in strings), default=1)
+        box_template = Rectangle(width=cell_size, height=cell_size, color=color, stroke_width=stroke_width)
+        label_template = GlyphLabel(self.atlas, max_chars, color=text_color)
+
+        self.cells = VGroup()
+        step = cell_size + buff
+        for i in range(capacity):
+            box = box_template.copy().move_to(i * step * RIGHT)
+            label = label_template.copy()
+            label.set_text(strings[i] if i < len(strings) else "", center=box.get_center())
+            self.cells.add(VGroup(box, label))
+        self.add(self.cells)
+        self.cells.move_to(ORIGIN)
+
+        for cell in self.cells[len(values):]:
+            self._set_visible(cell, False)
+
+    @staticmethod
+    def _set_visible(cell, visible: bool) -> None:
+        # 상자는 선만, 라벨은 채우기만 있으므로 각각의 불투명도만 바꿈
+        box, label = cell
+        box.set_stroke(opacity=1.0 if visible else 0.0)
+        label.set_fill(opacity=1.0 if visible else 0.0)
+
+    def __len__(self):
+        return len(self.values)
+
+    def label(self, index: int) -> GlyphLabel:
+        return self.cells[index][1]
+
+    # --- 즉시 변경 (애니메이션 없이 다음 프레임에 반영) ---
+
+    def set_value(self, index: int, value) -> "ArrayWidget":
+        self.values[index] = value
+        self.label(index).set_text(str(value), center=self.cells[index][0].get_center())
+        return self
+
+    def set_array(self, values) -> "ArrayWidget":
+        """같은 칸 풀로 다른 배열을 표시 (capacity 이내)"""
+        values = list(values)
+        if len(values) > len(self.cells):
+            raise ValueError(f"Array of length {len(values)} exceeds widget capacity {len(self.cells)}")
+        for i, cell in enumerate(self.cells):
+            if i < len(values):
+                self._set_visible(cell, True)
+                cell[1].set_text(str(values[i]), center=cell[0].get_center())
+            else:
+                self._set_visible(cell, False)
+        self.values = values
+        return self
+
+    # --- 애니메이션 (TraceScene 위젯 인터페이스) ---
+
+    def highlight(self, indices, color):
+        return [self.cells[i].animate.set_color(color) for i in indices]
+
+    def unhighlight(self, indices):
+        return [self.cells[i].animate.set_color(self.marks.get(i, self.base_color)) for i in indices]
+
+    def mark(self, indices, color):
+        for i in indices:
+            self.marks[i] = color
+        return self.highlight(indices, color)
+
+    def swap(self, i: int, j: int):
+        a, b = self.cells[i], self.cells[j]
+        # 칸의 순서를 위치와 맞춰 둠 (애니메이션은 mobject를 직접 참조)
+        self.cells.submobjects[i], self.cells.submobjects[j] = b, a
+        self.values[i], self.values[j] = self.values[j], self.values[i]
+        self.marks[i], self.marks[j] = self.marks.get(j, self.base_color), self.marks.get(i, self.base_color)
+        return [Swap(a, b)]
+
+    def set_values(self, pairs):
+        """값 변경 애니메이션. 목표 라벨은 기존 라벨의 복사본이라 조판이 없음"""
+        animations = []
+        for index, value in pairs:
+            label = self.label(index)
+            target = label.copy().set_text(str(value), center=self.cells[index][0].get_center())
+            self.values[index] = value
+            animations.append(Transform(label, target))
+        return animations
+
+
+class BarArray(VGroup):
+    """
+    큰 배열용 막대그래프. 막대 전체가 VMobject 하나(막대마다 닫힌 서브패스 하나)이고,
+    현재 접근 중인 막대는 그 위에 겹치는 두 번째 VMobject로 그립니다.
+    n이 1000이어도 mobject는 2개뿐이라 프레임마다 점 배열만 바꿔 넣으면 됩니다.
+    """
+
+    def __init__(self, values, width: float = 12.0, height: float = 5.0, color=BLUE, active_color=YELLOW):
+        super().__init__()
+        self.bar_width = width
+        self.bar_height = height
+        self.base_color = color
+        self.bars = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+        self.active = VMobject(fill_color=active_color, fill_opacity=1.0, stroke_width=0)
+        self.add(self.bars, self.active)
+        self.set_state(values)
+
+    def set_state(self, values, active=()) -> "BarArray":
+        """막대 높이와 강조할 인덱스를 한 번에 갱신 (mobject 생성 없음)"""
+        # 지연 import: sort_trace는 manim 없이도 쓰는 모듈
+        from sort_trace import bar_points
+
+        points = bar_points(values, self.bar_width, self.bar_height, baseline=-self.bar_height / 2)
+        # 첫 막대의 왼쪽 아래 꼭짓점은 값과 무관하므로 이동한 만큼을 여기서 구함
+        if self.bars.has_points():
+            points += self.bars.points[0] - points[0]
+        self.bars.set_points(points)
+        active = np.asarray(active, dtype=int)
+        self.active.set_points(points.reshape(-1, 16, 3)[active].reshape(-1, 3))
+        return self
+
+    def play_frames(self, frames, touched):
+        """
+        sort_trace.batch_frames 결과를 재생하는 업데이트 애니메이션.
+        alpha에 해당하는 스냅샷 하나를 그리므로 프레임당 비용이 이벤트 수와 무관합니다.
+        """
+        last = len(frames) - 1
+
+        def update(mobject, alpha):
+            index = min(int(alpha * last), last)
+            mobject.set_state(frames[index], touched[index - 1] if index > 0 else ())
+
+        return UpdateFromAlphaFunc(self, update, rate_func=linear)
+
+    def finish(self, color=GREEN):
+        """정렬 완료: 강조를 지우고 전체 색을 바꿈"""
+        self.active.set_points(np.zeros((0, 3)))
+        return self.bars.animate.set_fill(color)
+
+
+class ScrollingArray(VGroup):
+    """
+    긴 배열(예: dp[1..10^6])의 window칸만 보여주는 위젯.
+    칸과 인덱스 라벨은 풀링되어 있어 스크롤해도 점 데이터만 바뀝니다.
+    """
+
+    def __init__(
+        self,
+        window: int = 10,
+        label: str = "",
+        cell_size: float = 1.0,
+        font_size: float = 22,
+        index_font_size: float = 14,
+        max_chars: int = 3,
+        max_index_chars: int = 7,
+        empty: str = "-",
+        color=BLUE,
+        cursor_color=YELLOW,
+    ):
+        super().__init__()
+        self.window = window
+        self.empty = empty
+        self.base_color = color
+        self.cursor_color = cursor_color
+        self.start = 0
+        self.array = ArrayWidget([empty] * window, cell_size=cell_size, font_size=font_size, color=color, max_chars=max_chars)
+        index_atlas = GlyphAtlas.get(FONT, index_font_size)
+        self.index_labels = VGroup(*[GlyphLabel(index_atlas, max_index_chars, color=GRAY) for _ in range(window)])
+        self.index_offset = DOWN * (cell_size / 2 + index_font_size / 60)
+        self.add(self.array, self.index_labels)
+        if label:
+            self.add(Text(label, font_size=font_size, font=FONT).next_to(self.array, LEFT, buff=0.3))
+
+    def show(self, table, start: int, filled: int = None, cursor: int = None) -> "ScrollingArray":
+        """table[start:start + window] 표시. filled보다 큰 인덱스는 빈칸, cursor 칸은 강조"""
+        self.start = start
+        for k, cell in enumerate(self.array.cells):
+            i = start + k
+            box = cell[0]
+            visible = i < len(table)
+            self.array._set_visible(cell, visible)
+            self.index_labels[k].set_fill(opacity=1.0 if visible else 0.0)
+            if not visible:
+                continue
+            value = table[i] if filled is None or i <= filled else self.empty
+            self.array.set_value(k, value)
+            self.index_labels[k].set_text(str(i), center=box.get_center() + self.index_offset)
+            box.set_stroke(self.cursor_color if i == cursor else self.base_color)
+        return self
+
+    def stream(self, table, schedule, first: int = 0):
+        """
+        커서가 schedule을 따라 전진하며 값이 채워지는 애니메이션.
+        창은 커서를 오른쪽 끝에 두고 스크롤하며, 프레임마다 window칸만 갱신합니다.
+        """
+        last = len(schedule) - 1
+
+        def update(mobject, alpha):
+            cursor = int(schedule[min(int(alpha * (last + 1)), last)])
+            mobject.show(table, max(first, cursor - self.window + 1), filled=cursor, cursor=cursor)
+
+        return UpdateFromAlphaFunc(self, update, rate_func=linear)
+
+    def focus(self, table, index: int, first: int = 0) -> "ScrollingArray":
+        """index가 창 가운데 오도록 이동 (전체가 채워진 상태)"""
+        start = max(first, min(index - self.window // 2, len(table) - self.window))
+        return self.show(table, start, cursor=index)
+
+    def cell(self, index: int):
+        """현재 창에 보이는 index 칸 (창 밖이면 None)"""
+        k = index - self.start
+        return self.array.cells[k] if 0 <= k < self.window else None
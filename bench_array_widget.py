@@ -0,0 +1,85 @@
+"""
+ArrayWidget 벤치마크
+배열 길이별로 칸 생성 비용과 값 변경 비용을 기존 Rectangle + Text 방식과 비교합니다.
+
+사용법:
+    python bench_array_widget.py
+    python bench_array_widget.py --sizes 10 100 1000 --repeat 3
+"""
+
+import argparse
+import random
+import time
+
+from manim import *
+
+from array_widget import ArrayWidget, GlyphAtlas
+
+
+def naive_build(values, font_size=28):
+    """SortVisualization._create_array_visual의 기존 방식"""
+    group = VGroup()
+    for i, value in enumerate(values):
+        box = Rectangle(width=0.8, height=0.8, color=BLUE, stroke_width=2)
+        text = Text(str(value), font_size=font_size, font="NanumGothic", color=WHITE)
+        element = VGroup(box, text)
+        element.shift(i * 1.0 * RIGHT)
+        group.add(element)
+    return group
+
+
+def naive_update(group, values, font_size=28):
+    """값이 바뀔 때마다 Text를 새로 만드는 기존 방식"""
+    for element, value in zip(group, values):
+        text = Text(str(value), font_size=font_size, font="NanumGothic", color=WHITE).move_to(element[1])
+        element[1].become(text)
+
+
+def widget_build(values, font_size=28):
+    return ArrayWidget(values, font_size=font_size, max_chars=5)
+
+
+def widget_update(widget, values):
+    for i, value in enumerate(values):
+        widget.set_value(i, value)
+
+
+def best_of(repeat, func, *args):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ArrayWidget 생성/갱신 비용 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    # 아틀라스 생성(글리프 조판 1회)은 씬 전체에서 한 번이므로 따로 측정
+    atlas_time, _ = best_of(1, GlyphAtlas.get, "NanumGothic", 28)
+    print(f"GlyphAtlas 생성 (1회): {atlas_time * 1000:.1f} ms")
+    print(f"{'n':>6} | {'naive build':>12} | {'widget build':>12} | {'naive update':>12} | {'widget update':>13}")
+    print("-" * 68)
+
+    for n in args.sizes:
+        values = [rng.randint(-1000, 1000) for _ in range(n)]
+        new_values = [rng.randint(-1000, 1000) for _ in range(n)]
+
+        naive_build_time, naive_group = best_of(args.repeat, naive_build, values)
+        widget_build_time, widget = best_of(args.repeat, widget_build, values)
+        naive_update_time, _ = best_of(args.repeat, naive_update, naive_group, new_values)
+        widget_update_time, _ = best_of(args.repeat, widget_update, widget, new_values)
+
+        print(f"{n:>6} | {naive_build_time * 1000:>9.1f} ms | {widget_build_time * 1000:>9.1f} ms | "
+              f"{naive_update_time * 1000:>9.1f} ms | {widget_update_time * 1000:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+선분(LSD) 모드와 곡선(윤곽선 + 베지어) 모드 비교 벤치마크
+원/타원/나선이 섞인 합성 이미지에서 두 엔진이 만드는 mobject 수, 베지어 곡선 수,
+생성 스크립트(+ .npy) 크기, 추출 시간을 비교합니다. --render를 주면 manim으로
+각 스크립트를 -ql 렌더링한 시간도 잽니다 (manim이 설치되어 있어야 함).
+
+사용법:
+    python bench_contour_curves.py
+    python bench_contour_curves.py --sizes 512 1024 --max-lines 2000 --render
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+
+import cv2
+import numpy as np
+
+from image_to_manim import ImageToManim
+
+DEFAULT_SIZES = [256, 512, 1024, 2048]
+
+# (엔진, line_mode) 조합
+VARIANTS = [("lines", "group"), ("lines", "batched"), ("curves", "group"), ("curves", "batched")]
+
+
+def curved_image(side: int, seed: int = 0) -> np.ndarray:
+    """면적에 비례하는 개수의 원, 타원, 나선을 그린 흑백 이미지"""
+    rng = np.random.default_rng(seed)
+    image = np.zeros((side, side), dtype=np.uint8)
+    n_shapes = max(4, side * side // 40000)
+    for _ in range(n_shapes):
+        center = tuple(int(v) for v in rng.integers(0, side, size=2))
+        radius = int(rng.uniform(side / 40, side / 8))
+        kind = rng.integers(0, 3)
+        if kind == 0:
+            cv2.circle(image, center, radius, 255, 2)
+        elif kind == 1:
+            axes = (radius, max(2, int(radius * rng.uniform(0.3, 0.9))))
+            cv2.ellipse(image, center, axes, float(rng.uniform(0, 180)), 0, 360, 255, 2)
+        else:
+            turns = np.linspace(0, 4 * np.pi, 200)
+            spiral = np.stack([np.cos(turns), np.sin(turns)], axis=1) * (turns / turns[-1] * radius)[:, None]
+            cv2.polylines(image, [(spiral + center).astype(np.int32)], False, 255, 2)
+    return image
+
+
+def mobject_counts(converter: ImageToManim) -> tuple:
+    """생성 스크립트가 만드는 mobject 수와 그려지는 3차 베지어 곡선 수"""
+    if converter.config["engine"] == "curves":
+        n_curves = sum(len(path) for path in converter.curve_data)
+        n_paths = len(converter.curve_data)
+    else:
+        n_curves = n_paths = len(converter.lines_data)
+    n_mobjects = 1 if converter.config["line_mode"] == "batched" else n_paths
+    return n_mobjects, n_curves
+
+
+def render_time(script_path: str, class_name: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        ["manim", "render", "-ql", "--disable_caching", script_path, class_name],
+        cwd=os.path.dirname(script_path), check=True, capture_output=True,
+    )
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LSD 선분 모드와 베지어 곡선 모드 비교")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--max-lines", type=int, default=0, help="선분/윤곽선 최대 개수 (0: 제한 없음)")
+    parser.add_argument("--format", choices=["inline", "npy"], default="npy")
+    parser.add_argument("--render", action="store_true", help="manim -ql 렌더링 시간도 측정")
+    args = parser.parse_args(argv)
+    if args.render and shutil.which("manim") is None:
+        parser.error("--render에는 manim 명령이 필요합니다")
+
+    print(f"{'size':>9} | {'engine':>6} | {'mode':>7} | {'mobjects':>8} | {'curves':>7} | {'bytes':>11} | "
+          f"{'extract':>9} | {'render':>8}")
+    print("-" * 92)
+    with tempfile.TemporaryDirectory() as workdir:
+        for side in args.sizes:
+            image_path = os.path.join(workdir, f"curves_{side}.png")
+            cv2.imwrite(image_path, curved_image(side))
+            for engine, line_mode in VARIANTS:
+                name = f"{engine}_{line_mode}_{side}"
+                script_path = os.path.join(workdir, name + ".py")
+                converter = ImageToManim(
+                    image_path, class_name="BenchScene", engine=engine, line_mode=line_mode,
+                    max_lines=args.max_lines, line_data_format=args.format,
+                )
+                start = time.perf_counter()
+                converter.generate_script(script_path, verbose=False)
+                extract = time.perf_counter() - start
+
+                size = os.path.getsize(script_path)
+                data_path = os.path.splitext(script_path)[0] + ".npy"
+                if os.path.exists(data_path):
+                    size += os.path.getsize(data_path)
+                n_mobjects, n_curves = mobject_counts(converter)
+                render = f"{render_time(script_path, 'BenchScene'):>6.1f} s" if args.render else f"{'-':>8}"
+                print(f"{side:>4}x{side:<4} | {engine:>6} | {line_mode:>7} | {n_mobjects:>8} | {n_curves:>7} | "
+                      f"{size:>11,} | {extract * 1000:>6.0f} ms | {render}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+StableFluids 벤치마크
+격자 크기와 솔버(FFT 주기 / DCT 벽 / Jacobi 벽)별로 초당 step 수를 잽니다. 두 분사구가 마주 보고 미는
+흐름(NavierStokesScene의 압력 구간)을 점성과 함께 진행하므로 모든 항이 켜진 상태의 비용입니다.
+목표는 256 x 256에서 초당 30 step 이상입니다 (프레임마다 step 한 번이면 실시간).
+
+사용법:
+    python bench_fluid_solver.py
+    python bench_fluid_solver.py --sizes 128 256 512 --steps 100
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from fluid_solver import StableFluids
+
+DEFAULT_SIZES = [64, 128, 256, 512]
+TARGET_STEPS_PER_SECOND = 30
+
+# (이름, StableFluids 인자)
+VARIANTS = [
+    ("fft", dict(boundary="periodic")),
+    ("dct", dict(boundary="walls")),
+    ("jacobi", dict(boundary="walls", solver="jacobi")),
+]
+
+
+def jets(size: int, **kwargs) -> StableFluids:
+    """마주 보는 두 분사구와 색소가 있는 size x size 유체"""
+    fluid = StableFluids((size, size), x_range=(-1, 1), y_range=(-1, 1), viscosity=1e-4, **kwargs)
+    fluid.add_body_force((-0.6, 0), 0.1, (4, 0)).add_body_force((0.6, 0), 0.1, (-4, 0))
+    fluid.splat((-0.6, 0), 0.1, dye=1.0).splat((0.6, 0), 0.1, dye=1.0)
+    return fluid
+
+
+def steps_per_second(fluid: StableFluids, steps: int, dt: float) -> float:
+    fluid.step(dt) # 첫 step의 할당 비용 제외
+    start = time.perf_counter()
+    for _ in range(steps):
+        fluid.step(dt)
+    return steps / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="StableFluids 초당 step 수")
+    parser.add_argument("--sizes", nargs="+", type=int, default=DEFAULT_SIZES)
+    parser.add_argument("--steps", type=int, default=60)
+    parser.add_argument("--dt", type=float, default=1 / 30)
+    args = parser.parse_args(argv)
+
+    print(f"{'grid':>9} | {'solver':>6} | {'steps/s':>8} | {'ms/step':>8} | {'|div u|':>8} | {'target':>6}")
+    print("-" * 60)
+    for size in args.sizes:
+        for name, kwargs in VARIANTS:
+            fluid = jets(size, **kwargs)
+            rate = steps_per_second(fluid, args.steps, args.dt)
+            divergence = float(np.abs(fluid.divergence()).mean())
+            target = "ok" if rate >= TARGET_STEPS_PER_SECOND else "-"
+            print(f"{size:>4}x{size:<4} | {name:>6} | {rate:>8.1f} | {1000 / rate:>8.2f} | {divergence:>8.4f} | {target:>6}")
+
+
+if __name__ == "__main__":
+    main()
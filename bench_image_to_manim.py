@@ -0,0 +1,184 @@
+"""
+ImageToManim 벤치마크
+합성 이미지(256² ~ 8K)에서 LSD 검출, 상위 k개 선택 + 좌표 변환, 스크립트 포매팅 시간을
+기존 리스트 방식(파이썬 반복문 + np.argsort)과 비교합니다.
+이어서 선분 데이터를 스크립트에 넣는 방식(inline)과 .npy 파일로 빼는 방식(npy)의
+파일 크기, 파싱 시간, line_data 로드 시간과 메모리를 비교합니다.
+마지막으로 전체 LSD 한 번과 타일 분할 LSD(프로세스 풀, 이음매 병합)의 시간과 선분 수를 비교합니다.
+
+사용법:
+    python bench_image_to_manim.py
+    python bench_image_to_manim.py --sizes 256 1024 4096 --max-lines 5000 --repeat 3
+    python bench_image_to_manim.py --sizes 4096 8k --tile-size 1024 --workers 8
+"""
+
+import argparse
+import os
+import tempfile
+import textwrap
+import sys
+import time
+
+import cv2
+import numpy as np
+
+from image_to_manim import ImageToManim, select_longest
+from tiled_detection import detect_lines_tiled
+
+
+# 한 변 길이 (8K는 7680 x 4320)
+DEFAULT_SIZES = ["256", "512", "1024", "2048", "4096", "8k"]
+SIZE_ALIASES = {"4k": (3840, 2160), "8k": (7680, 4320)}
+
+
+def parse_size(text: str):
+    if text.lower() in SIZE_ALIASES:
+        return SIZE_ALIASES[text.lower()]
+    side = int(text)
+    return side, side
+
+
+def synthetic_image(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """면적에 비례하는 개수의 임의 선분을 그린 흑백 이미지 (1024²에 약 2,000개)"""
+    rng = np.random.default_rng(seed)
+    image = np.zeros((height, width), dtype=np.uint8)
+    n_lines = max(20, width * height // 500)
+    starts = rng.integers(0, [width, height], size=(n_lines, 2))
+    lengths = rng.uniform(5, max(width, height) / 8, size=n_lines)
+    angles = rng.uniform(0, np.pi, size=n_lines)
+    ends = starts + np.stack([np.cos(angles), np.sin(angles)], axis=1) * lengths[:, None]
+    for (x1, y1), (x2, y2) in zip(starts, ends.astype(int)):
+        cv2.line(image, (int(x1), int(y1)), (int(x2), int(y2)), 255, 1)
+    return image
+
+
+def naive_select_transform(lines: list, max_lines: int, img_height: int, img_width: int) -> list:
+    """generate_script/_transform_coordinates의 기존 방식"""
+    if max_lines and len(lines) > max_lines:
+        line_lengths = [np.sqrt((line[2] - line[0]) ** 2 + (line[3] - line[1]) ** 2) for line in lines]
+        sorted_indices = np.argsort(line_lengths)[::-1]
+        lines = [lines[i] for i in sorted_indices[:max_lines]]
+    scale_factor = 8.0 / img_height
+    transformed = []
+    for x1, y1, x2, y2 in lines:
+        transformed.append([
+            np.array([(x1 - img_width / 2) * scale_factor, (img_height / 2 - y1) * scale_factor, 0.]),
+            np.array([(x2 - img_width / 2) * scale_factor, (img_height / 2 - y2) * scale_factor, 0.]),
+        ])
+    return transformed
+
+
+def naive_format(lines_data: list) -> str:
+    formatted = [
+        f"[np.array([{s[0]:.4f}, {s[1]:.4f}, {s[2]:.4f}]), np.array([{e[0]:.4f}, {e[1]:.4f}, {e[2]:.4f}])],"
+        for s, e in lines_data
+    ]
+    return "\n                ".join(formatted)
+
+
+def heap_bytes(line_data) -> int:
+    """
+    line_data가 차지하는 파이썬 힙 크기. memmap은 데이터를 소유하지 않으므로 헤더만 셉니다
+    (tracemalloc은 np.array 수만 개 생성을 수백 배 느리게 만들어 쓰지 않음).
+    """
+    if isinstance(line_data, np.ndarray):
+        return sys.getsizeof(line_data)
+    return sys.getsizeof(line_data) + sum(
+        sys.getsizeof(pair) + sum(sys.getsizeof(point) for point in pair) for pair in line_data
+    )
+
+
+def format_costs(converter: ImageToManim, data_format: str, workdir: str) -> dict:
+    """생성 스크립트(와 .npy)의 크기, compile() 시간, line_data 문 실행 시간과 힙 크기"""
+    converter.config["line_data_format"] = data_format
+    script_path = os.path.join(workdir, f"scene_{data_format}.py")
+    data_file = None
+    size = 0
+    if data_format == "npy":
+        data_path = converter.save_line_data(os.path.join(workdir, f"scene_{data_format}.npy"))
+        data_file = os.path.basename(data_path)
+        size += os.path.getsize(data_path)
+    source = converter.render_script(data_file)
+    size += len(source.encode())
+
+    start = time.perf_counter()
+    compile(source, script_path, "exec")
+    parse_time = time.perf_counter() - start
+
+    statement = compile(textwrap.dedent(converter.line_data_source(data_file)), script_path, "exec")
+    namespace = {"np": np, "os": os, "__file__": script_path}
+    start = time.perf_counter()
+    exec(statement, namespace)
+    load_time = time.perf_counter() - start
+    return {"size": size, "parse": parse_time, "load": load_time, "heap": heap_bytes(namespace["line_data"])}
+
+
+def best_of(repeat, func, *args):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ImageToManim 단계별 비용 벤치마크")
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES, help="한 변 길이 또는 4k/8k")
+    parser.add_argument("--max-lines", type=int, default=None, help="상위 k (기본: 검출된 선분의 절반)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tile-size", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=None, help="타일 검출 프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args(argv)
+
+    converter = ImageToManim("synthetic.png")
+    line_data = {}
+    detections = {}
+    print(f"{'size':>11} | {'lines':>7} | {'k':>7} | {'LSD':>9} | {'naive sel+xf':>12} | {'numpy sel+xf':>12} | "
+          f"{'naive fmt':>9} | {'numpy fmt':>9}")
+    print("-" * 100)
+
+    for text in args.sizes:
+        width, height = parse_size(text)
+        image = synthetic_image(width, height)
+        detect_time, lines = best_of(1, converter._detect_lines, image)
+        k = args.max_lines or max(1, len(lines) // 2)
+
+        naive_time, naive_data = best_of(args.repeat, naive_select_transform, lines.tolist(), k, height, width)
+        numpy_time, numpy_data = best_of(
+            args.repeat, lambda: converter._transform_coordinates(select_longest(lines, k), height, width)
+        )
+        naive_format_time, _ = best_of(args.repeat, naive_format, naive_data)
+        converter.lines_data = numpy_data
+        numpy_format_time, _ = best_of(args.repeat, converter.render_script)
+        line_data[(width, height)] = numpy_data
+        detections[(width, height)] = (image, detect_time, len(lines))
+
+        print(f"{width:>5}x{height:<5} | {len(lines):>7} | {k:>7} | {detect_time * 1000:>6.0f} ms | "
+              f"{naive_time * 1000:>9.1f} ms | {numpy_time * 1000:>9.1f} ms | "
+              f"{naive_format_time * 1000:>6.0f} ms | {numpy_format_time * 1000:>6.0f} ms")
+
+    print()
+    print(f"{'size':>11} | {'lines':>7} | {'format':>6} | {'bytes':>11} | {'parse':>9} | {'load':>9} | {'heap':>9}")
+    print("-" * 80)
+    with tempfile.TemporaryDirectory() as workdir:
+        for (width, height), data in line_data.items():
+            converter.lines_data = data
+            for data_format in ("inline", "npy"):
+                cost = format_costs(converter, data_format, workdir)
+                print(f"{width:>5}x{height:<5} | {len(data):>7} | {data_format:>6} | {cost['size']:>11,} | "
+                      f"{cost['parse'] * 1000:>6.1f} ms | {cost['load'] * 1000:>6.1f} ms | {cost['heap'] / 1024:>6.0f} KB")
+
+    print()
+    print(f"{'size':>11} | {'tiles':>5} | {'full LSD':>9} | {'lines':>7} | {'tiled LSD':>9} | {'lines':>7} | {'speedup':>7}")
+    print("-" * 80)
+    for (width, height), (image, detect_time, n_lines) in detections.items():
+        n_tiles = -(-width // args.tile_size) * -(-height // args.tile_size)
+        tiled_time, tiled = best_of(1, detect_lines_tiled, image, args.tile_size, 32, args.workers)
+        print(f"{width:>5}x{height:<5} | {n_tiles:>5} | {detect_time * 1000:>6.0f} ms | {n_lines:>7} | "
+              f"{tiled_time * 1000:>6.0f} ms | {len(tiled):>7} | {detect_time / tiled_time:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+증분 렌더링을 위한 빌드 매니페스트
+씬의 입력(소스, 로컬 import, 나레이션, 폰트, 품질)을 해시하여
+결과 MP4가 이미 최신이면 렌더링을 건너뜁니다.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from render_scheduler import quality_code
+from scene_analysis import extract_fonts, extract_narrations, local_imports
+
+
+DEFAULT_MANIFEST_PATH = "media/build_manifest.json"
+
+# manim -q 플래그별 출력 디렉터리 이름
+RESOLUTION_DIRS = {"l": "480p15", "m": "720p30", "h": "1080p60", "p": "1440p60", "k": "2160p60"}
+
+
+def output_path(scene_file: str, scene_class: str, quality: str, media_dir: str = "media") -> Path:
+    """manim이 렌더링한 MP4가 저장되는 경로"""
+    resolution = RESOLUTION_DIRS[quality_code(quality)]
+    return Path(media_dir) / "videos" / scene_file / resolution / f"{scene_class}.mp4"
+
+
+def _file_digest(path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def resolve_font(font: str) -> str:
+    """
+    폰트 이름/경로를 해시 가능한 값으로 변환합니다.
+    파일 경로면 내용 해시, 이름이면 fc-match로 찾은 파일의 해시,
+    찾을 수 없으면 이름 그대로 사용합니다.
+    """
+    if os.path.isfile(font):
+        return _file_digest(font)
+    if shutil.which("fc-match"):
+        try:
+            matched = subprocess.run(
+                ["fc-match", "-f", "%{file}", font],
+                capture_output=True, text=True, timeout=10,
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            matched = ""
+        if matched and os.path.isfile(matched):
+            return _file_digest(matched)
+    return f"name:{font}"
+
+
+def compute_fingerprint(scene_file: str, scene_class: str, quality: str, root: str = ".") -> Tuple[str, Dict]:
+    """
+    씬 렌더링 결과를 결정하는 입력들의 해시를 계산합니다.
+
+    Returns:
+        (전체 해시, 입력별 해시 dict)
+    """
+    source = Path(root) / f"{scene_file}.py"
+    inputs = {
+        "source": _file_digest(source),
+        "imports": {
+            path.name: _file_digest(path) for path in local_imports(source, root)
+        },
+        "narrations": hashlib.sha256(
+            "\0".join(extract_narrations(source, scene_class)).encode("utf-8")
+        ).hexdigest(),
+        "fonts": {font: resolve_font(font) for font in extract_fonts(source, scene_class)},
+        "quality": quality_code(quality),
+        "tts_engine": os.environ.get("MANIM_TTS_ENGINE", "gtts"),
+    }
+    digest = hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+    return digest, inputs
+
+
+class BuildManifest:
+    """렌더링된 씬의 입력 해시와 출력 파일 정보를 저장하는 매니페스트"""
+
+    def __init__(self, path: str = DEFAULT_MANIFEST_PATH, root: str = ".", media_dir: str = "media"):
+        self.path = path
+        self.root = root
+        self.media_dir = media_dir
+        self.entries: Dict[str, Dict] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+
+    @staticmethod
+    def key(scene_file: str, scene_class: str, quality: str) -> str:
+        return f"{scene_file}:{scene_class}:{quality}"
+
+    def is_up_to_date(self, scene_file: str, scene_class: str, quality: str) -> bool:
+        """입력 해시가 같고 기록된 MP4가 그대로 남아 있으면 True"""
+        entry = self.entries.get(self.key(scene_file, scene_class, quality))
+        if entry is None:
+            return False
+        video = Path(entry["output"])
+        try:
+            stat = video.stat()
+        except FileNotFoundError:
+            return False
+        if stat.st_size != entry["output_size"] or stat.st_mtime_ns != entry["output_mtime_ns"]:
+            return False
+        fingerprint, _ = compute_fingerprint(scene_file, scene_class, quality, self.root)
+        return fingerprint == entry["fingerprint"]
+
+    def record(self, scene_file: str, scene_class: str, quality: str) -> Optional[Dict]:
+        """렌더링 성공 후 현재 입력 해시와 출력 파일 정보를 기록"""
+        video = output_path(scene_file, scene_class, quality, self.media_dir)
+        if not video.exists():
+            return None
+        fingerprint, inputs = compute_fingerprint(scene_file, scene_class, quality, self.root)
+        stat = video.stat()
+        entry = {
+            "fingerprint": fingerprint,
+            "inputs": inputs,
+            "output": str(video),
+            "output_size": stat.st_size,
+            "output_mtime_ns": stat.st_mtime_ns,
+        }
+        self.entries[self.key(scene_file, scene_class, quality)] = entry
+        return entry
+
+    def save(self) -> None:
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,83 @@
+"""
+글리프 캐시로 조립하는 Text
+CachedText는 Text(text, font_size, font, color, weight)와 같은 모양의 VGroup(글자마다 VMobject)을
+glyph_cache에 저장된 윤곽선으로 만듭니다. 캐시에 없는 글자만 한 번에 Pango로 조판해 저장하므로
+값이 바뀌는 캡션("HashMap: {2: 0}", "dp[3] = 1")을 수천 개 만들어도 조판은 글자 수만큼만 일어납니다.
+
+글자 쌍 사이의 커닝은 반영되지 않습니다. 한글/숫자 캡션에서는 차이가 거의 없지만,
+t2c 같은 서식이나 정확한 조판이 필요한 제목에는 Text를 그대로 쓰세요.
+"""
+
+from typing import Dict, Sequence, Tuple
+
+from manim import *
+
+from glyph_cache import Glyph, GlyphStore, glyphs_from_reference_line, reference_line
+
+
+# 한 번에 조판하는 글자 수 (Pango 한 줄이 너무 길어지지 않도록)
+TYPESET_BATCH = 256
+
+
+def typeset_glyphs(chars: Sequence[str], font: str = "", font_size: float = DEFAULT_FONT_SIZE,
+                   weight: str = NORMAL) -> Tuple[Dict[str, Glyph], dict]:
+    """글자들을 기준 막대 사이에 끼워 조판하고 글자별 윤곽선/진행 폭을 구함"""
+    glyphs = {}
+    metrics = {}
+    for start in range(0, len(chars), TYPESET_BATCH):
+        batch = list(chars[start:start + TYPESET_BATCH])
+        text = Text(reference_line(batch), font=font, font_size=font_size, weight=weight)
+        batch_glyphs, metrics = glyphs_from_reference_line(batch, [part.points for part in text.submobjects])
+        glyphs.update(batch_glyphs)
+    return glyphs, metrics
+
+
+class CachedText(VGroup):
+    """
+    글리프 캐시로 만든 Text 대용 mobject.
+    Text처럼 공백/줄바꿈을 뺀 글자마다 서브 mobject가 하나씩 있고 ORIGIN에 중심이 옵니다.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        font_size: float = DEFAULT_FONT_SIZE,
+        font: str = "",
+        color=WHITE,
+        weight: str = NORMAL,
+        tab_width: int = 4,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.original_text = text
+        text = text.replace("\t", " " * tab_width)
+        store = GlyphStore.get(font, font_size, weight)
+        missing = store.missing(text)
+        if missing:
+            store.put(*typeset_glyphs(missing, font, font_size, weight))
+
+        for row, line in enumerate(text.split("\n")):
+            placed, _ = store.layout(line)
+            for glyph, x in placed:
+                if len(glyph.points):
+                    char = VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+                    char.set_points(glyph.points + np.array([x, -row * store.line_height, 0.0]))
+                    self.add(char)
+
+        self.text = text.replace(" ", "").replace("\n", "")
+        self._font_size = float(font_size)
+        self.move_to(ORIGIN)
+        self.initial_height = self.height
+
+    def __repr__(self):
+        return f"CachedText({repr(self.original_text)})"
+
+    @property
+    def font_size(self):
+        return self._font_size * self.height / self.initial_height if self.initial_height else self._font_size
+
+    @font_size.setter
+    def font_size(self, font_val):
+        if font_val <= 0:
+            raise ValueError("font_size must be greater than 0.")
+        self.scale(font_val / self.font_size)
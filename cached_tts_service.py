@@ -0,0 +1,52 @@
+"""
+공유 TTS 캐시를 사용하는 manim-voiceover SpeechService
+GTTSService 대신 사용하면 렌더링 중에는 캐시된 오디오를 복사만 합니다.
+"""
+
+import shutil
+from pathlib import Path
+
+from manim_voiceover.services.base import SpeechService
+
+from tts_cache import TTSCache, get_engine
+
+
+class CachedTTSService(SpeechService):
+    """
+    tts_cache.TTSCache를 통해 음성을 가져오는 SpeechService.
+    엔진은 MANIM_TTS_ENGINE 환경 변수로 바꿀 수 있습니다 (gtts, silent).
+    """
+
+    def __init__(self, lang: str = "ko", tld: str = "com", engine=None, cache: TTSCache = None, **kwargs):
+        self.lang = lang
+        self.tld = tld
+        self.engine = engine or get_engine()
+        self.tts_cache = cache or TTSCache()
+        SpeechService.__init__(self, **kwargs)
+
+    def generate_from_text(self, text: str, cache_dir: str = None, path: str = None, **kwargs) -> dict:
+        if cache_dir is None:
+            cache_dir = self.cache_dir
+
+        input_data = {
+            "input_text": text,
+            "service": f"cached_{self.engine.name}",
+            "lang": self.lang,
+            "tld": self.tld,
+        }
+        cached_result = self.get_cached_result(input_data, cache_dir)
+        if cached_result is not None:
+            return cached_result
+
+        # 공유 캐시에 없을 때만 합성 (프리페치가 끝났다면 항상 캐시 적중)
+        source = self.tts_cache.fetch(text, self.lang, self.tld, self.engine)
+        audio_path = path if path is not None else source.name
+        target = Path(cache_dir) / audio_path
+        if not target.exists():
+            shutil.copyfile(source, target)
+
+        return {
+            "input_text": text,
+            "input_data": input_data,
+            "original_audio": audio_path,
+        }
@@ -1,10 +1,14 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
+from cached_tts_service import CachedTTSService
+from tex_cache import install_tex_cache
+
+# 이 모듈의 수식을 공유 캐시에 한 번에 컴파일
+install_tex_cache(__file__)
 
 class CircleAngleScene(VoiceoverScene):
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
         with self.voiceover(text="안녕하세요. 오늘은 원과 각에 대한 수학 문제를 시각화해보겠습니다. 원의 중심 O와 원 위의 세 점 A, B, P가 있습니다. 각 점들을 연결하는 선분들을 그려보겠습니다."):
             circle = Circle(radius=2, color=WHITE)
             O = ORIGIN
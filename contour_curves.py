@@ -0,0 +1,191 @@
+"""
+Contour tracing and cubic Bezier fitting for ImageToManim's "curves" engine.
+Instead of LSD's straight segments, the image is binarized, its region
+boundaries are traced with cv2.findContours, and each contour is fitted with
+a chain of cubic Bezier curves (Schneider's algorithm: least-squares control
+points, Newton reparameterization, split at the worst point) after a small
+moving average removes the pixel staircase. A smooth outline that LSD breaks
+into hundreds of segments becomes a handful of curves in one path.
+
+Every stage is manim-free. Coordinates are in image pixels, and a path is a
+(K, 4, 2) array of [start, handle, handle, end] control points.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Newton refinements of the point parameters before a chunk is split
+REPARAMETERIZE_STEPS = 6
+
+
+def _bernstein(u: np.ndarray) -> np.ndarray:
+    """Cubic Bernstein basis at parameters u, shape (len(u), 4)."""
+    v = 1 - u
+    return np.stack([v ** 3, 3 * v * v * u, 3 * v * u * u, u ** 3], axis=1)
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    norm = np.hypot(*vector)
+    return vector / norm if norm > 1e-12 else np.zeros(2)
+
+
+def trace_contours(gray: np.ndarray, min_length: int = 8) -> List[np.ndarray]:
+    """
+    Boundaries of the foreground regions as closed (M, 2) float point arrays
+    (the first point is not repeated). The image is binarized with Otsu's
+    threshold; the minority side is taken as foreground, so both light-on-dark
+    and dark-on-light drawings work. Contours with fewer than min_length points
+    are dropped.
+    """
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    if np.count_nonzero(binary) > binary.size / 2:
+        binary = cv2.bitwise_not(binary)
+    contours, _ = cv2.findContours(binary, cv2.RETR_LIST, cv2.CHAIN_APPROX_NONE)
+    return [contour.reshape(-1, 2).astype(float) for contour in contours if len(contour) >= min_length]
+
+
+def smooth_closed(points: np.ndarray, window: int = 5) -> np.ndarray:
+    """
+    Circular moving average over a closed contour. Averaging out the one-pixel
+    staircase of traced boundaries lets each Bezier cover a much longer stretch.
+    """
+    if window <= 1 or len(points) < window:
+        return points
+    half = window // 2
+    padded = np.concatenate([points[-half:], points, points[:half]])
+    cumulative = np.concatenate([np.zeros((1, 2)), np.cumsum(padded, axis=0)])
+    return (cumulative[window:] - cumulative[:-window]) / window
+
+
+def _fit_one(points: np.ndarray, u: np.ndarray, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Least-squares handle lengths along the fixed end tangents (right points back into the curve)."""
+    first, last = points[0], points[-1]
+    basis = _bernstein(u)
+    a1 = basis[:, 1:2] * left
+    a2 = basis[:, 2:3] * right
+    c00, c01, c11 = (a1 * a1).sum(), (a1 * a2).sum(), (a2 * a2).sum()
+    rest = points - np.outer(basis[:, 0] + basis[:, 1], first) - np.outer(basis[:, 2] + basis[:, 3], last)
+    x0, x1 = (a1 * rest).sum(), (a2 * rest).sum()
+
+    chord = np.hypot(*(last - first))
+    det = c00 * c11 - c01 * c01
+    alpha_left = alpha_right = 0.0
+    if abs(det) > 1e-12:
+        alpha_left = (x0 * c11 - x1 * c01) / det
+        alpha_right = (c00 * x1 - c01 * x0) / det
+    if alpha_left < 1e-6 * chord or alpha_right < 1e-6 * chord:
+        # Degenerate fit: fall back to handles of a third of the chord
+        alpha_left = alpha_right = chord / 3
+    return np.array([first, first + left * alpha_left, last + right * alpha_right, last])
+
+
+def _reparameterize(points: np.ndarray, bezier: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """One Newton step per point towards the closest parameter on the curve."""
+    delta = _bernstein(u) @ bezier - points
+    d1 = 3 * ((1 - u)[:, None] ** 2 * (bezier[1] - bezier[0])
+              + 2 * ((1 - u) * u)[:, None] * (bezier[2] - bezier[1])
+              + u[:, None] ** 2 * (bezier[3] - bezier[2]))
+    d2 = 6 * ((1 - u)[:, None] * (bezier[2] - 2 * bezier[1] + bezier[0])
+              + u[:, None] * (bezier[3] - 2 * bezier[2] + bezier[1]))
+    numerator = (delta * d1).sum(axis=1)
+    denominator = (d1 * d1).sum(axis=1) + (delta * d2).sum(axis=1)
+    step = np.divide(numerator, denominator, out=np.zeros_like(u), where=np.abs(denominator) > 1e-12)
+    return np.clip(u - step, 0.0, 1.0)
+
+
+def fit_beziers(points: np.ndarray, max_error: float = 1.0, closed: bool = False) -> np.ndarray:
+    """
+    Fits a point chain with cubic Beziers so that no point is farther than about
+    max_error from the curve. Returns a (K, 4, 2) array; consecutive curves share
+    endpoints and tangents at the split points. A closed chain ends where it starts.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    if closed and len(points) > 2:
+        points = np.vstack([points, points[:1]])
+    if len(points) < 2:
+        return np.zeros((0, 4, 2))
+
+    # Tangents look a few points ahead so pixel staircases do not dominate them
+    reach = min(3, len(points) - 1)
+    left = _unit(points[reach] - points[0])
+    right = _unit(points[-1 - reach] - points[-1])
+    if closed and len(points) > 3:
+        left = _unit(points[reach] - points[-1 - reach])
+        right = -left
+
+    curves = []
+    stack = [(0, len(points) - 1, left, right)]
+    while stack:
+        start, end, left, right = stack.pop()
+        chunk = points[start:end + 1]
+        if len(chunk) == 2:
+            chord = np.hypot(*(chunk[1] - chunk[0])) / 3
+            curves.append((start, np.array([chunk[0], chunk[0] + left * chord, chunk[1] + right * chord, chunk[1]])))
+            continue
+
+        steps = np.hypot(*np.diff(chunk, axis=0).T)
+        u = np.concatenate([[0.0], np.cumsum(steps)]) / max(steps.sum(), 1e-12)
+        bezier = _fit_one(chunk, u, left, right)
+        for step in range(REPARAMETERIZE_STEPS + 1):
+            errors = ((_bernstein(u) @ bezier - chunk) ** 2).sum(axis=1)
+            worst = int(np.argmax(errors))
+            if errors[worst] <= max_error ** 2 or step == REPARAMETERIZE_STEPS:
+                break
+            u = _reparameterize(chunk, bezier, u)
+            bezier = _fit_one(chunk, u, left, right)
+        if errors[worst] <= max_error ** 2:
+            curves.append((start, bezier))
+            continue
+
+        split = start + min(max(worst, 1), len(chunk) - 2)
+        reach = min(2, split - start, end - split)
+        center = _unit(points[split - reach] - points[split + reach])
+        # Push the second half first so the first half is fitted (and emitted) first
+        stack.append((split, end, -center, right))
+        stack.append((start, split, left, center))
+
+    curves.sort(key=lambda item: item[0])
+    return np.array([bezier for _, bezier in curves])
+
+
+def path_length(points: np.ndarray) -> float:
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
+
+def select_longest_paths(contours: List[np.ndarray], k: int) -> List[np.ndarray]:
+    """The k contours with the longest outlines, longest first."""
+    if len(contours) <= k:
+        return contours
+    lengths = np.array([path_length(contour) for contour in contours])
+    return [contours[i] for i in np.argsort(lengths, kind="stable")[::-1][:k]]
+
+
+def extract_curves(
+    gray: np.ndarray,
+    max_error: float = 1.0,
+    min_length: int = 8,
+    max_paths: Optional[int] = None,
+    smooth: int = 5,
+) -> Tuple[List[np.ndarray], List[dict]]:
+    """
+    Traces, selects (longest max_paths contours), smooths and fits the contours of
+    a grayscale image. Returns the (K, 4, 2) Bezier paths and per-stage {"stage", "segments",
+    "seconds"} records, where "segments" counts contours or fitted curves.
+    """
+    start = time.perf_counter()
+    contours = trace_contours(gray, min_length)
+    stages = [{"stage": "trace", "segments": len(contours), "seconds": time.perf_counter() - start}]
+
+    if max_paths:
+        start = time.perf_counter()
+        contours = select_longest_paths(contours, max_paths)
+        stages.append({"stage": "select", "segments": len(contours), "seconds": time.perf_counter() - start})
+
+    start = time.perf_counter()
+    paths = [fit_beziers(smooth_closed(contour, smooth), max_error, closed=True) for contour in contours]
+    paths = [path for path in paths if len(path)]
+    stages.append({"stage": "fit", "segments": sum(len(path) for path in paths), "seconds": time.perf_counter() - start})
+    return paths, stages
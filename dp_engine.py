@@ -0,0 +1,153 @@
+"""
+NumPy 기반 DP 테이블 엔진
+점화식을 파이썬 반복문 대신 블록 단위 벡터 연산으로 계산하고,
+역추적 경로도 여러 시작점을 한꺼번에 따라가는 벡터 연산으로 구합니다.
+백준 1463(1로 만들기)은 N = 10^6에서도 수십 ms 안에 끝납니다.
+
+사용법:
+    python dp_engine.py 10
+    python dp_engine.py 1000000
+"""
+
+import argparse
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def min_ops_table(n: int, divisors: Sequence[int] = (2, 3)) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    "1을 빼거나, 나누어떨어지면 d로 나누기"로 i를 1로 만드는 최소 연산 횟수 (백준 1463).
+
+    dp[i] = min(dp[i - 1], dp[i // d] (i % d == 0)) + 1 에서 i // d는 블록 [lo, lo * min(d))의
+    바깥(이미 계산된 값)이므로 블록 안에서는 나누기 후보를 한 번에 구할 수 있고,
+    i - 1 연쇄는 dp[i] - i = cummin(후보 - i) 꼴의 누적 최솟값 한 번으로 풀립니다.
+
+    Returns:
+        (dp, parent): 길이 n + 1 배열. parent[i]는 i에서 한 번의 연산 후의 수이며
+        같은 횟수면 i - 1, divisors 순서대로 우선합니다 (파이썬 풀이와 같은 경로).
+        dp[0], parent[0], parent[1]은 -1입니다.
+    """
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+    step = min(divisors)
+    if step < 2:
+        raise ValueError(f"divisors must be at least 2, got {divisors}")
+
+    dp = np.zeros(n + 1, dtype=np.int64)
+    dp[0] = -1
+    unreachable = n + 1
+    lo = 2
+    while lo <= n:
+        hi = min(lo * step, n + 1)
+        i = np.arange(lo, hi)
+        candidate = np.full(len(i), unreachable, dtype=np.int64)
+        for d in divisors:
+            divisible = i % d == 0
+            candidate[divisible] = np.minimum(candidate[divisible], dp[i[divisible] // d] + 1)
+        # 블록 직전 값 dp[lo - 1]에서 1씩 빼 오는 경로가 첫 후보
+        offsets = np.concatenate([[dp[lo - 1] - (lo - 1)], candidate - i])
+        dp[lo:hi] = np.minimum.accumulate(offsets)[1:] + i
+        lo = hi
+
+    parent = np.full(n + 1, -1, dtype=np.int64)
+    i = np.arange(2, n + 1)
+    best = dp[i]
+    choice = np.where(dp[i - 1] + 1 == best, i - 1, -1)
+    for d in divisors:
+        use = (choice < 0) & (i % d == 0) & (dp[i // d] + 1 == best)
+        choice[use] = i[use] // d
+    parent[2:] = choice
+    return dp, parent
+
+
+def grid_min_path(grid) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    2차원 최소 경로 합 (오른쪽/아래로만 이동).
+    dp[r, c] = grid[r, c] + min(dp[r - 1, c], dp[r, c - 1])에서 한 행은
+    x_c = G_c + min_{j <= c}(u_j - G_{j-1}) (G는 행의 누적 합, u는 윗행)로 벡터화됩니다.
+
+    Returns:
+        (dp, parent): dp는 grid와 같은 모양, parent는 평탄화한 인덱스 (시작 칸은 -1).
+        위쪽과 왼쪽이 같으면 위쪽을 택합니다.
+    """
+    grid = np.asarray(grid, dtype=np.int64)
+    rows, cols = grid.shape
+    dp = np.empty_like(grid)
+    parent = np.full(grid.size, -1, dtype=np.int64)
+    inf = np.iinfo(np.int64).max // 4
+
+    up = np.full(cols, inf, dtype=np.int64)
+    up[0] = 0
+    for r in range(rows):
+        prefix = np.cumsum(grid[r])
+        shifted = np.concatenate([[0], prefix[:-1]])
+        dp[r] = prefix + np.minimum.accumulate(up - shifted)
+
+        left = np.concatenate([[inf], dp[r, :-1]])
+        flat = r * cols + np.arange(cols)
+        if r > 0:
+            parent[flat] = np.where(up <= left, flat - cols, flat - 1)
+        else:
+            parent[flat[1:]] = flat[1:] - 1
+        up = dp[r]
+    return dp, parent
+
+
+def backtrack(parent: np.ndarray, starts) -> np.ndarray:
+    """
+    여러 시작점의 역추적 경로를 한꺼번에 따라갑니다 (한 걸음마다 배열 인덱싱 한 번).
+
+    Returns:
+        (len(starts), 최대 경로 길이) 배열. 경로가 끝난 뒤는 -1로 채웁니다.
+    """
+    current = np.atleast_1d(np.asarray(starts, dtype=np.int64))
+    steps = [current]
+    while True:
+        alive = current >= 0
+        following = np.full_like(current, -1)
+        following[alive] = parent[current[alive]]
+        if not (following >= 0).any():
+            break
+        steps.append(following)
+        current = following
+    return np.stack(steps, axis=1)
+
+
+def path_of(parent: np.ndarray, start: int) -> list:
+    """시작점 하나의 역추적 경로"""
+    path = backtrack(parent, [start])[0]
+    return path[path >= 0].tolist()
+
+
+def stream_schedule(n: int, n_frames: int, first: int = 1) -> np.ndarray:
+    """
+    스크롤 창이 프레임마다 따라갈 커서 위치 (first..n, 증가).
+    앞쪽은 한 칸씩, 뒤쪽은 기하급수적으로 건너뛰어 작은 i의 계산 과정이 보입니다.
+    """
+    if n <= first:
+        return np.array([n])
+    n_frames = max(2, n_frames)
+    if n - first + 1 <= n_frames:
+        return np.arange(first, n + 1)
+    cursor = np.geomspace(first, n, n_frames)
+    # 처음 몇 프레임은 1칸씩 전진하도록 한 칸 간격 이상 보장
+    cursor = np.maximum(np.round(cursor).astype(np.int64), first + np.arange(n_frames))
+    cursor = np.minimum(cursor, n)
+    cursor[-1] = n
+    return np.unique(cursor)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="백준 1463 DP 테이블 계산")
+    parser.add_argument("n", type=int, help="N (최대 10^6 권장)")
+    args = parser.parse_args(argv)
+
+    dp, parent = min_ops_table(args.n)
+    path = path_of(parent, args.n)
+    print(f"dp[{args.n}] = {dp[args.n]}")
+    print("경로: " + " → ".join(map(str, path)))
+
+
+if __name__ == "__main__":
+    main()
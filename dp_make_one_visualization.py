@@ -1,18 +1,27 @@
 """
 백준 1463번 - 1로 만들기
 동적계획법을 이용한 최소 연산 횟수 시각화
+
+큰 N (DPMakeOneLargeVisualization, 기본 N=10^6):
+    manim dp_make_one_visualization.py DPMakeOneLargeVisualization -ql
+    DP_N=5000 manim dp_make_one_visualization.py DPMakeOneLargeVisualization -ql
 """
 
+import os
+
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
+from cached_tts_service import CachedTTSService
+from array_widget import ArrayWidget, ScrollingArray
+from cached_text import CachedText
+from dp_engine import min_ops_table, path_of, stream_schedule
 
 
 class DPMakeOneVisualization(VoiceoverScene):
     """1로 만들기 - DP 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 제목
         title = Text("백준 1463번 - 1로 만들기", font_size=44, font="NanumGothic").to_edge(UP)
@@ -47,13 +56,7 @@ class DPMakeOneVisualization(VoiceoverScene):
             self.play(FadeOut(ops_group))  # 연산 설명 제거
 
             # DP 배열 시각화
-            dp_boxes = VGroup()
-            for i in range(1, n + 1):
-                box = Rectangle(width=0.5, height=0.5, color=BLUE, stroke_width=1.5)
-                num_text = Text(str(i), font_size=16, font="NanumGothic", color=WHITE)
-                box_group = VGroup(box, num_text)
-                box_group.shift((i - 5.5) * 0.6 * RIGHT + UP * 0.5)
-                dp_boxes.add(box_group)
+            dp_boxes = ArrayWidget(range(1, n + 1), cell_size=0.5, font_size=16, stroke_width=1.5).move_to(UP * 0.5)
 
             self.play(Create(dp_boxes))
             self.wait(0.5)
@@ -85,17 +88,20 @@ class DPMakeOneVisualization(VoiceoverScene):
             self.play(Transform(value_text_2, value_text_3))
             self.wait(0.3)
 
-        # 10에 도달하는 경로 시각화
-        with self.voiceover(text="계속 계산하면 dp[10]은 3이 됩니다. 경로를 보면 10에서 2로 나누어 5가 되고, 5에서 1을 빼 4가 되고, 4를 2로 나누어 2가 되고, 2를 2로 나누어 1이 됩니다."):
+        # 10에 도달하는 경로 시각화 (parent 배열 역추적)
+        dp_table, parent = min_ops_table(n)
+        route = path_of(parent, n)
+        steps = ", ".join(f"{a}에서 {_op_name(a, b)} {b}" for a, b in zip(route, route[1:]))
+        with self.voiceover(text=f"계속 계산하면 dp[{n}]은 {dp_table[n]}이 됩니다. 경로를 역추적하면 {steps}가 됩니다."):
             # DP 배열 제거
             self.play(FadeOut(dp_boxes), FadeOut(value_text_3))
 
-            path = Text("경로: 10 → 5 → 4 → 2 → 1", font_size=26, font="NanumGothic", color=YELLOW)
+            path = Text("경로: " + " → ".join(map(str, route)), font_size=26, font="NanumGothic", color=YELLOW)
             path.move_to(ORIGIN)
             self.play(Write(path))
             self.wait(0.5)
 
-            ops_count = Text("총 3번의 연산", font_size=26, font="NanumGothic", color=YELLOW)
+            ops_count = CachedText(f"총 {dp_table[n]}번의 연산", font_size=26, font="NanumGothic", color=YELLOW)
             ops_count.move_to(DOWN * 0.8)
             self.play(Write(ops_count))
             self.wait(1)
@@ -105,11 +111,64 @@ class DPMakeOneVisualization(VoiceoverScene):
             self.wait(1)
 
 
+def _op_name(a: int, b: int) -> str:
+    """a에서 b로 가는 연산 이름"""
+    if b == a - 1:
+        return "1을 빼"
+    d = a // b
+    return f"{d}{'으로' if str(d)[-1] in '036' else '로'} 나누어"
+
+
+class DPMakeOneLargeVisualization(VoiceoverScene):
+    """
+    큰 N의 1로 만들기: 테이블은 NumPy 배열(dp_engine)에 한 번에 계산하고,
+    화면에는 커서를 따라 스크롤하는 창만 보여 주며 프레임마다 창의 칸만 갱신합니다.
+    """
+
+    stream_run_time = 12
+    window = 10
+
+    def construct(self):
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
+
+        n = int(os.environ.get("DP_N", 10 ** 6))
+        dp_table, parent = min_ops_table(n)
+        route = path_of(parent, n)
+
+        title = Text(f"1로 만들기 (N = {n:,})", font_size=40, font="NanumGothic").to_edge(UP)
+        table = ScrollingArray(self.window, label="dp", max_index_chars=len(str(n))).move_to(UP * 0.5)
+        table.show(dp_table, 1, filled=1, cursor=1)
+
+        with self.voiceover(text=f"N이 {n}일 때 dp 배열 전체를 계산해봅시다."):
+            self.play(Write(title), FadeIn(table))
+
+        schedule = stream_schedule(n, int(self.stream_run_time * config.frame_rate))
+        with self.voiceover(text="dp[1]부터 차례대로 채워 나갑니다. 뒤로 갈수록 빠르게 건너뜁니다."):
+            self.play(table.stream(dp_table, schedule, first=1), run_time=self.stream_run_time)
+
+        with self.voiceover(text=f"dp[{n}]은 {dp_table[n]}입니다. parent 배열을 따라 경로를 역추적합니다."):
+            result = CachedText(f"dp[{n}] = {dp_table[n]}", font_size=32, font="NanumGothic", color=GREEN).move_to(DOWN * 1.2)
+            self.play(Write(result))
+
+        path_text = Text("경로: " + " → ".join(map(str, route)), font_size=22, font="NanumGothic", color=YELLOW)
+        if path_text.width > config.frame_width - 1:
+            path_text.scale_to_fit_width(config.frame_width - 1)
+        path_text.move_to(DOWN * 2.4)
+
+        with self.voiceover(text=f"{len(route) - 1}번의 연산으로 1에 도달합니다."):
+            # 경로의 각 수로 창을 옮겨 가며 표시
+            for index in route:
+                table.focus(dp_table, index, first=1)
+                self.wait(max(0.1, 3 / len(route)))
+            self.play(Write(path_text))
+            self.wait(1)
+
+
 class DPMakeOneTreeVisualization(VoiceoverScene):
     """1로 만들기 - 트리 구조로 경로 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         title = Text("1로 만들기 - 경로 트리", font_size=44, font="NanumGothic").to_edge(UP)
 
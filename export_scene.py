@@ -1,12 +1,18 @@
 
+import argparse
 import json
+import sys
+
 import numpy as np
 from manim import *
 
+from scene_binary import COMPRESSIONS, ENCODINGS, write_scene
+
 def get_scene_data():
     """
     Uses Manim objects to define a scene and returns its geometric data as a dictionary.
-    This data will be exported as JSON for use in a web frontend.
+    This data will be exported as JSON (or scene_binary's scene_data.bin) for use in a web frontend.
+    Point arrays are NumPy arrays; scene_binary stores each as a typed block.
     """
     # Define scene boundaries and parameters
     x_min, x_max = -8, 8
@@ -34,13 +40,11 @@ def get_scene_data():
     # --- 2. Sine Graph on the right ---
     graph_origin = [1, 0, 0]
     
-    # Pre-calculate points for the sine wave
-    sine_points = []
-    for i in range(n_points_sine + 1):
-        angle = (i / n_points_sine) * sine_x_end
-        x = graph_origin[0] + angle
-        y = graph_origin[1] + np.sin(angle) * circle_radius # Scale sine wave by circle radius
-        sine_points.append([x, y, 0])
+    # Pre-calculate points for the sine wave as one (n + 1, 3) array
+    angles = np.arange(n_points_sine + 1) / n_points_sine * sine_x_end
+    sine_points = np.zeros((n_points_sine + 1, 3))
+    sine_points[:, 0] = graph_origin[0] + angles
+    sine_points[:, 1] = graph_origin[1] + np.sin(angles) * circle_radius # Scale sine wave by circle radius
 
     # Axes for the sine graph
     graph_x_axis = Line(
@@ -84,7 +88,31 @@ def get_scene_data():
     
     return scene_data
 
-if __name__ == "__main__":
+def _json_default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export the trig scene for the web frontend")
+    parser.add_argument("--binary", metavar="PATH", help="write scene_data.bin here instead of JSON to stdout")
+    parser.add_argument("--encoding", choices=ENCODINGS,
+                        help="point encoding of the binary file (default: float32; needs --binary)")
+    parser.add_argument("--compress", nargs="*", choices=COMPRESSIONS,
+                        help="also write .gz / .br sidecars of the binary file (needs --binary)")
+    args = parser.parse_args(argv)
+    if not args.binary and (args.encoding is not None or args.compress is not None):
+        parser.error("--encoding and --compress only apply to --binary output")
+
     data = get_scene_data()
+    if args.binary:
+        for path in write_scene(args.binary, data, args.encoding or "float32", args.compress or []):
+            print(path, file=sys.stderr)
+        return
     # Print the JSON data to stdout
-    print(json.dumps(data, indent=4))
+    print(json.dumps(data, indent=4, default=_json_default))
+
+
+if __name__ == "__main__":
+    main()
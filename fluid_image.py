@@ -0,0 +1,69 @@
+"""
+유체 이미지 mobject
+fluid_solver.StableFluids의 한 물리량(색소, 압력, 속력, 와도)을 색으로 칠한 ImageMobject입니다.
+이미지가 솔버의 x_range/y_range 영역에 그대로 놓이므로, 같은 솔버의 flow()로 움직이는 입자나
+velocity_function()으로 만든 ArrowVectorField/StreamLines와 좌표가 맞습니다.
+씬에 추가되어 있는 동안 updater가 매 프레임 솔버를 진행하고 픽셀을 다시 칠합니다.
+"""
+
+from manim import *
+
+from fluid_solver import StableFluids, colorize
+
+
+QUANTITIES = {
+    "dye": lambda solver: solver.dye,
+    "pressure": lambda solver: solver.pressure,
+    "speed": lambda solver: solver.speed(),
+    "vorticity": lambda solver: solver.vorticity(),
+}
+
+
+class FluidImage(ImageMobject):
+    """
+    quantity는 QUANTITIES의 이름이나 solver -> (H, W) 함수입니다.
+    colors는 vmin에서 vmax까지 고르게 나눈 그라디언트 색입니다.
+    """
+
+    def __init__(self, solver: StableFluids, quantity="dye", colors=(BLACK, BLUE, WHITE), vmin: float = 0.0,
+                 vmax: float = 1.0, steps_per_frame: int = 1, running: bool = True, **kwargs):
+        self.solver = solver
+        self.quantity = QUANTITIES[quantity] if isinstance(quantity, str) else quantity
+        self.colors = [color_to_rgb(color) for color in colors]
+        self.vmin, self.vmax = vmin, vmax
+        self.steps_per_frame = steps_per_frame
+        super().__init__(self.render(1.0), **kwargs)
+        self.stretch_to_fit_width(solver.x_range[1] - solver.x_range[0])
+        self.stretch_to_fit_height(solver.y_range[1] - solver.y_range[0])
+        self.move_to(solver.center())
+        if running:
+            self.start()
+
+    def render(self, opacity: float) -> np.ndarray:
+        return colorize(self.quantity(self.solver), self.colors, self.vmin, self.vmax, opacity)
+
+    def sync(self) -> "FluidImage":
+        """현재 솔버 상태로 픽셀을 다시 칠함 (FadeIn/FadeOut이 바꾼 투명도는 유지)"""
+        self.pixel_array = self.render(self.fill_opacity)
+        return self
+
+    def advance(self, dt: float) -> "FluidImage":
+        for _ in range(self.steps_per_frame):
+            self.solver.step(dt / self.steps_per_frame)
+        return self.sync()
+
+    def start(self) -> "FluidImage":
+        """updater로 매 프레임 솔버 진행 시작"""
+        solver = self.solver
+
+        # 솔버 설정과 상태 배열을 기본값으로 쥐어 segment_cache 해시가 점성, 경계 등과 속도, 외력을 읽게 함
+        # (배열은 솔버가 제자리에서 고치므로 해시할 때의 내용이 들어감)
+        def advance(mob, dt, settings=solver.settings(),
+                    state=(solver.velocity, solver.dye, solver.pressure, solver.body_force)):
+            return mob.advance(dt)
+
+        self.stop()
+        return self.add_updater(advance)
+
+    def stop(self) -> "FluidImage":
+        return self.clear_updaters()
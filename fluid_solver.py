@@ -0,0 +1,471 @@
+"""
+2차원 비압축성 유체 솔버 (Stable Fluids, Stam 1999)
+격자 위의 속도장 velocity (H, W, 2)와 색소 dye (H, W)를 매 프레임 step(dt)로 진행합니다.
+나비에-스토크스 방정식의 각 항이 단계 하나씩에 대응합니다.
+- 외력 (+g): 속도에 body_force, gravity, 색소 농도에 비례한 buoyancy를 더함
+- 대류 ((u·∇)u): 반-라그랑주 이류. 격자점에서 속도를 따라 거슬러 올라간 위치의 값을 쌍선형 보간
+- 점성 (ν∇²u): 암시적 확산 (I - νdt∇²)u = u*
+- 압력 (-∇p/ρ): 발산을 없애는 사영 ∇²q = ∇·u, u -= ∇q
+convection, pressure 등을 끄면 그 항이 빠진 흐름을 볼 수 있습니다 (NavierStokesScene의 항별 구간).
+
+경계는 두 가지입니다.
+- periodic: 상하좌우가 이어진 영역. 확산과 사영을 FFT로 한 번에 정확히 풉니다 (solver="fft", 기본).
+- walls: 벽으로 막힌 상자. 벽을 뚫는 속도는 0이고 벽을 따라 미끄러지는 것은 허용합니다.
+  - solver="dct" (기본): 벽은 가장자리 칸의 바깥 면입니다. 확산과 사영을 코사인/사인 변환(DCT-II/DST-II)으로
+    한 번에 정확히 풉니다. 벽을 축으로 뒤집어 붙인 신호의 FFT와 같고, 칸 수 n이면 길이 n인 FFT로 계산합니다.
+  - solver="jacobi": 벽은 가장자리 칸의 중심입니다. Jacobi 반복으로 풀므로 느리고, 반복 수만큼만 수렴합니다.
+반-라그랑주 이류와 암시적 확산은 dt가 커도 발산하지 않으므로 프레임 간격 그대로 한 번에 진행합니다.
+
+좌표는 manim 좌표(x_range, y_range)를 그대로 씁니다. 격자 (i, j) 칸의 중심은
+(x_range[0] + (j + 0.5)·dx, y_range[0] + (i + 0.5)·dy)이고, 행 i가 클수록 위쪽입니다.
+"""
+
+from typing import Callable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+BOUNDARIES = ("periodic", "walls")
+SOLVERS = ("fft", "dct", "jacobi")
+DEFAULT_ITERATIONS = 40
+
+
+def colorize(values: np.ndarray, colors: Sequence[Sequence[float]] = ((0, 0, 0), (1, 1, 1)),
+             vmin: float = 0.0, vmax: float = 1.0, opacity: float = 1.0) -> np.ndarray:
+    """
+    (H, W) 값을 colors를 고르게 나눈 그라디언트로 칠한 RGBA 이미지 (H, W, 4) uint8.
+    격자의 행 0(아래)이 이미지의 마지막 행이 되도록 위아래를 뒤집습니다 (ImageMobject용).
+    """
+    stops = np.asarray(colors, dtype=np.float32)[:, :3]
+    scale = 1.0 / (vmax - vmin) if vmax != vmin else 0.0
+    position = np.clip((values[::-1] - vmin) * scale, 0, 1) * (len(stops) - 1)
+    index = np.minimum(position.astype(np.intp), len(stops) - 2) if len(stops) > 1 else np.zeros(values.shape, np.intp)
+    frac = (position - index)[..., None] if len(stops) > 1 else 0.0
+    upper = stops[np.minimum(index + 1, len(stops) - 1)]
+    rgb = stops[index] + (upper - stops[index]) * frac
+    image = np.empty(values.shape + (4,), dtype=np.uint8)
+    image[..., :3] = np.round(rgb * 255)
+    image[..., 3] = round(255 * opacity)
+    return image
+
+
+def _along(axis: int, ndim: int, index) -> tuple:
+    key = [slice(None)] * ndim
+    key[axis] = index
+    return tuple(key)
+
+
+def _twiddle(axis: int, ndim: int, n: int, sign: float) -> np.ndarray:
+    shape = [1] * ndim
+    shape[axis] = n // 2 + 1
+    return np.exp(sign * 0.5j * np.pi * np.arange(n // 2 + 1) / n).reshape(shape)
+
+
+def _dct(field: np.ndarray, axis: int) -> np.ndarray:
+    """
+    axis 방향 DCT-II, X_k = 2·Σ x_m cos(πk(2m + 1)/2n). 짝수 번째 값과 뒤집은 홀수 번째 값을 이어 붙여
+    길이 n인 rfft 한 번으로 계산합니다 (Makhoul). 양 끝 칸의 바깥 면을 축으로 뒤집어 붙인 신호의 계수입니다.
+    """
+    n = field.shape[axis]
+    ndim = field.ndim
+    reordered = np.concatenate([field[_along(axis, ndim, slice(0, None, 2))],
+                                np.flip(field[_along(axis, ndim, slice(1, None, 2))], axis)], axis=axis)
+    spectrum = np.fft.rfft(reordered, axis=axis) * _twiddle(axis, ndim, n, -1)
+    result = np.empty(field.shape, dtype=spectrum.real.dtype)
+    result[_along(axis, ndim, slice(0, n // 2 + 1))] = 2 * spectrum.real
+    result[_along(axis, ndim, slice(n // 2 + 1, None))] = np.flip(
+        -2 * spectrum.imag[_along(axis, ndim, slice(1, (n + 1) // 2))], axis)
+    return result
+
+
+def _idct(coefficients: np.ndarray, axis: int) -> np.ndarray:
+    """_dct의 역변환 (DCT-III)"""
+    n = coefficients.shape[axis]
+    ndim = coefficients.ndim
+    # X_{n-k}, k = 0..n//2 (X_n = 0)
+    mirrored = np.concatenate([np.zeros_like(coefficients[_along(axis, ndim, slice(0, 1))]),
+                               np.flip(coefficients[_along(axis, ndim, slice(n // 2 + n % 2, None))], axis)], axis=axis)
+    spectrum = (coefficients[_along(axis, ndim, slice(0, n // 2 + 1))] - 1j * mirrored) * (0.5 * _twiddle(axis, ndim, n, 1))
+    reordered = np.fft.irfft(spectrum, n=n, axis=axis)
+    half = (n + 1) // 2
+    field = np.empty(coefficients.shape, dtype=reordered.dtype)
+    field[_along(axis, ndim, slice(0, None, 2))] = reordered[_along(axis, ndim, slice(0, half))]
+    field[_along(axis, ndim, slice(1, None, 2))] = np.flip(reordered[_along(axis, ndim, slice(half, None))], axis)
+    return field
+
+
+def _alternate(field: np.ndarray, axis: int) -> np.ndarray:
+    """(-1)^m·x_m"""
+    shape = [1] * field.ndim
+    shape[axis] = field.shape[axis]
+    return field * np.where(np.arange(field.shape[axis]) % 2, -1, 1).astype(field.dtype).reshape(shape)
+
+
+def _wall_transform(field: np.ndarray, axis: int, odd: bool) -> np.ndarray:
+    """
+    벽(양 끝 칸의 바깥 면)에서 대칭(코사인) 또는 반대칭(odd, 사인)인 신호의 계수를 주파수 0..n 순서로 (n + 1개).
+    코사인은 주파수 n이, 사인은 주파수 0이 0입니다. 사인(DST-II)은 부호를 번갈아 바꾼 신호의 DCT-II를 뒤집은 것입니다.
+    """
+    n = field.shape[axis]
+    shape = list(field.shape)
+    shape[axis] = n + 1
+    result = np.zeros(shape, dtype=field.dtype)
+    if odd:
+        result[_along(axis, field.ndim, slice(1, None))] = np.flip(_dct(_alternate(field, axis), axis), axis)
+    else:
+        result[_along(axis, field.ndim, slice(0, n))] = _dct(field, axis)
+    return result
+
+
+def _wall_inverse(coefficients: np.ndarray, axis: int, odd: bool) -> np.ndarray:
+    """_wall_transform의 역변환"""
+    ndim = coefficients.ndim
+    if odd:
+        return _alternate(_idct(np.flip(coefficients[_along(axis, ndim, slice(1, None))], axis), axis), axis)
+    return _idct(coefficients[_along(axis, ndim, slice(0, -1))], axis)
+
+
+class StableFluids:
+    """
+    shape (H, W) 격자의 유체. velocity, dye, pressure, body_force는 제자리에서 갱신되는 배열이라
+    이미지, 화살표, 입자가 참조를 쥐고 매 프레임 읽으면 됩니다.
+    pressure는 밀도로 나눈 압력 p/ρ입니다.
+    """
+
+    def __init__(self, shape: Tuple[int, int] = (128, 128), x_range: Sequence[float] = (-1, 1),
+                 y_range: Sequence[float] = (-1, 1), viscosity: float = 0.0, dye_diffusion: float = 0.0,
+                 boundary: str = "periodic", solver: Optional[str] = None, iterations: int = DEFAULT_ITERATIONS,
+                 convection: bool = True, pressure: bool = True, gravity: Sequence[float] = (0, 0),
+                 buoyancy: float = 0.0, dtype=np.float32):
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"boundary must be one of {BOUNDARIES}")
+        solver = solver or ("fft" if boundary == "periodic" else "dct")
+        if solver not in SOLVERS:
+            raise ValueError(f"solver must be one of {SOLVERS}")
+        if solver == "fft" and boundary != "periodic":
+            raise ValueError("the FFT solver needs a periodic boundary")
+        if solver == "dct" and boundary != "walls":
+            raise ValueError("the DCT solver needs a walled boundary")
+        self.height, self.width = shape
+        self.x_range = (float(x_range[0]), float(x_range[1]))
+        self.y_range = (float(y_range[0]), float(y_range[1]))
+        self.dx = (self.x_range[1] - self.x_range[0]) / self.width
+        self.dy = (self.y_range[1] - self.y_range[0]) / self.height
+        self.viscosity = viscosity
+        self.dye_diffusion = dye_diffusion
+        self.boundary = boundary
+        self.solver = solver
+        self.iterations = iterations
+        self.convection = convection
+        self.pressure_projection = pressure
+        self.gravity = np.asarray(gravity, dtype=dtype)
+        self.buoyancy = buoyancy
+        self.dtype = dtype
+
+        self.velocity = np.zeros((self.height, self.width, 2), dtype=dtype)
+        self.dye = np.zeros((self.height, self.width), dtype=dtype)
+        self.pressure = np.zeros((self.height, self.width), dtype=dtype)
+        self.body_force = np.zeros((self.height, self.width, 2), dtype=dtype)
+        self.time = 0.0
+
+        # 칸 중심의 월드 좌표와 격자 인덱스 (이류의 출발점)
+        self.x = self.x_range[0] + (np.arange(self.width) + 0.5) * self.dx
+        self.y = self.y_range[0] + (np.arange(self.height) + 0.5) * self.dy
+        self._rows, self._cols = np.meshgrid(np.arange(self.height, dtype=dtype),
+                                             np.arange(self.width, dtype=dtype), indexing="ij")
+        if solver == "fft":
+            kx = 2 * np.pi * np.fft.rfftfreq(self.width, d=self.dx)[None, :]
+            ky = 2 * np.pi * np.fft.fftfreq(self.height, d=self.dy)[:, None]
+            self._k2 = (kx ** 2 + ky ** 2).astype(dtype) # 확산
+            # 나이퀴스트 주파수는 켤레 대칭 짝의 부호가 모호해 사영이 맞지 않으므로 미분에서 뺌
+            if self.width % 2 == 0:
+                kx[:, -1] = 0
+            if self.height % 2 == 0:
+                ky[self.height // 2] = 0
+            self._kx, self._ky = kx.astype(dtype), ky.astype(dtype)
+            k2 = self._kx ** 2 + self._ky ** 2
+            k2[k2 == 0] = 1.0 # 평균 성분 등: 사영/압력에서 0으로 나누지 않게 (분자도 0)
+            self._projection_k2 = k2
+        elif solver == "dct":
+            # 벽 사이 거리 n칸을 반 파장 단위로 나눈 파수 0..n. 사인의 주파수 n은 격자 위 체크무늬라
+            # 미분에서 뺌 (FFT의 나이퀴스트와 같음)
+            kx = np.pi * np.arange(self.width + 1)[None, :] / (self.width * self.dx)
+            ky = np.pi * np.arange(self.height + 1)[:, None] / (self.height * self.dy)
+            self._k2 = (kx ** 2 + ky ** 2).astype(dtype)
+            kx[:, -1] = 0
+            ky[-1] = 0
+            self._kx, self._ky = kx.astype(dtype), ky.astype(dtype)
+            k2 = self._kx ** 2 + self._ky ** 2
+            k2[k2 == 0] = 1.0
+            self._projection_k2 = k2
+
+    # --- 좌표 ---
+
+    def grid(self) -> Tuple[np.ndarray, np.ndarray]:
+        """칸 중심의 월드 좌표 (X, Y), 각각 (H, W)"""
+        return np.meshgrid(self.x, self.y)
+
+    def center(self) -> np.ndarray:
+        return np.array([(self.x_range[0] + self.x_range[1]) / 2, (self.y_range[0] + self.y_range[1]) / 2, 0.0])
+
+    # --- 초기 조건 / 입력 ---
+
+    def splat(self, center: Sequence[float], radius: float, velocity: Sequence[float] = (0, 0),
+              dye: float = 0.0) -> "StableFluids":
+        """center 주변에 가우시안으로 속도와 색소를 더함 (마우스 드래그, 분사구)"""
+        weight = self._gaussian(center, radius)
+        self.velocity += weight[..., None] * np.asarray(velocity[:2], dtype=self.dtype)
+        self.dye += weight * self.dtype(dye)
+        self._apply_velocity_boundary(self.velocity)
+        return self
+
+    def add_body_force(self, center: Sequence[float], radius: float, acceleration: Sequence[float]) -> "StableFluids":
+        """step마다 계속 작용하는 가속도를 center 주변에 가우시안으로 추가"""
+        weight = self._gaussian(center, radius)
+        self.body_force += weight[..., None] * np.asarray(acceleration[:2], dtype=self.dtype)
+        return self
+
+    def _gaussian(self, center: Sequence[float], radius: float) -> np.ndarray:
+        dx2 = ((self.x - center[0]) / radius) ** 2
+        dy2 = ((self.y - center[1]) / radius) ** 2
+        return np.exp(-(dy2[:, None] + dx2[None, :])).astype(self.dtype)
+
+    # --- 진행 ---
+
+    def step(self, dt: float) -> "StableFluids":
+        """외력 -> 대류 -> 점성 -> 압력 사영 순으로 속도를 진행하고, 새 속도로 색소를 실어 나름"""
+        velocity = self.velocity
+        if self.buoyancy or self.gravity.any() or self.body_force.any():
+            velocity += dt * (self.body_force + self.gravity)
+            if self.buoyancy:
+                velocity[..., 1] += (dt * self.buoyancy) * self.dye
+            self._apply_velocity_boundary(velocity)
+        if self.convection:
+            velocity[...] = self.advect(velocity, dt)
+            self._apply_velocity_boundary(velocity)
+        if self.solver == "fft":
+            self._spectral_diffuse_project(dt)
+        elif self.solver == "dct":
+            self._cosine_diffuse_project(dt)
+        else:
+            if self.viscosity:
+                velocity[...] = self._jacobi_diffuse(velocity, self.viscosity * dt)
+                self._apply_velocity_boundary(velocity)
+            if self.pressure_projection:
+                self._jacobi_project(dt)
+        self.dye[...] = self.advect(self.dye, dt)
+        if self.dye_diffusion:
+            self.dye[...] = self._diffuse_scalar(self.dye, self.dye_diffusion * dt)
+        self.time += dt
+        return self
+
+    def advect(self, field: np.ndarray, dt: float) -> np.ndarray:
+        """현재 속도로 dt만큼 거슬러 올라간 위치의 field 값 (반-라그랑주)"""
+        cols = self._cols - (dt / self.dx) * self.velocity[..., 0]
+        rows = self._rows - (dt / self.dy) * self.velocity[..., 1]
+        return self._interpolate(field, cols, rows)
+
+    def _interpolate(self, field: np.ndarray, cols: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """격자 인덱스 (cols, rows)에서 field를 쌍선형 보간. periodic은 감싸고 walls는 가장자리로 자름"""
+        height, width = self.height, self.width
+        if self.boundary == "periodic":
+            # np.mod는 부동소수에서 느려서 floor로 감쌈
+            cols = cols - width * np.floor(cols * (1 / width))
+            rows = rows - height * np.floor(rows * (1 / height))
+            c0 = cols.astype(np.intp)
+            r0 = rows.astype(np.intp)
+            fc, fr = cols - c0, rows - r0
+            c0[c0 == width] = 0 # 반올림으로 width가 되는 경우
+            r0[r0 == height] = 0
+            c1 = c0 + 1
+            c1[c1 == width] = 0
+            r1 = r0 + 1
+            r1[r1 == height] = 0
+        else:
+            cols = np.clip(cols, 0, width - 1)
+            rows = np.clip(rows, 0, height - 1)
+            c0 = np.minimum(cols.astype(np.intp), width - 2)
+            r0 = np.minimum(rows.astype(np.intp), height - 2)
+            fc, fr = cols - c0, rows - r0
+            c1, r1 = c0 + 1, r0 + 1
+        flat = field.reshape(height * width, -1)
+        shape = cols.shape + field.shape[2:]
+        r0 *= width
+        r1 *= width
+        if field.ndim == 3:
+            fc, fr = fc[..., None], fr[..., None]
+        bottom = np.take(flat, r0 + c0, axis=0).reshape(shape)
+        bottom += (np.take(flat, r0 + c1, axis=0).reshape(shape) - bottom) * fc
+        top = np.take(flat, r1 + c0, axis=0).reshape(shape)
+        top += (np.take(flat, r1 + c1, axis=0).reshape(shape) - top) * fc
+        bottom += (top - bottom) * fr
+        return bottom
+
+    def _spectral_diffuse_project(self, dt: float) -> None:
+        """주기 영역에서 점성 확산과 압력 사영을 푸리에 공간에서 한 번에 (정확한 해)"""
+        if not (self.viscosity or self.pressure_projection):
+            return
+        spectrum = np.fft.rfft2(self.velocity, axes=(0, 1))
+        u_hat, v_hat = spectrum[..., 0], spectrum[..., 1]
+        if self.viscosity:
+            spectrum /= (1 + (self.viscosity * dt) * self._k2)[..., None]
+        if self.pressure_projection:
+            # q̂ = -i(k·û)/|k|², u -= ∇q  =>  û -= k(k·û)/|k|²
+            projection = (self._kx * u_hat + self._ky * v_hat) / self._projection_k2
+            u_hat -= self._kx * projection
+            v_hat -= self._ky * projection
+            self.pressure[...] = np.fft.irfft2(-1j * projection, s=(self.height, self.width)) / dt
+        self.velocity[...] = np.fft.irfft2(spectrum, s=(self.height, self.width), axes=(0, 1))
+
+    def _cosine_diffuse_project(self, dt: float) -> None:
+        """
+        벽 경계에서 점성 확산과 압력 사영을 코사인/사인 계수 공간에서 한 번에 (정확한 해).
+        u = Σ A sin(kx·x)cos(ky·y), v = Σ B cos(kx·x)sin(ky·y)라서 벽을 뚫는 속도는 0이고,
+        q = Σ Q cos cos는 벽에서 법선 기울기가 0입니다. ∇·u = Σ (kx·A + ky·B) cos cos
+        """
+        if not (self.viscosity or self.pressure_projection):
+            return
+        a_hat = _wall_transform(_wall_transform(self.velocity[..., 0], 1, True), 0, False)
+        b_hat = _wall_transform(_wall_transform(self.velocity[..., 1], 1, False), 0, True)
+        if self.viscosity:
+            decay = 1 / (1 + (self.viscosity * dt) * self._k2)
+            a_hat *= decay
+            b_hat *= decay
+        if self.pressure_projection:
+            # ∇²q = ∇·u => Q = -(kx·A + ky·B)/|k|², u -= ∇q => A -= kx·(kx·A + ky·B)/|k|²
+            projection = (self._kx * a_hat + self._ky * b_hat) / self._projection_k2
+            a_hat -= self._kx * projection
+            b_hat -= self._ky * projection
+            self.pressure[...] = _wall_inverse(_wall_inverse(projection, 0, False), 1, False) * (-1 / dt)
+        self.velocity[..., 0] = _wall_inverse(_wall_inverse(a_hat, 0, False), 1, True)
+        self.velocity[..., 1] = _wall_inverse(_wall_inverse(b_hat, 0, True), 1, False)
+
+    # --- Jacobi (solver="jacobi") ---
+
+    def _fill_border(self, padded: np.ndarray) -> None:
+        """테두리 한 칸을 채움. periodic은 반대편 값, walls는 가장자리 값 (노이만 경계)"""
+        if self.boundary == "periodic":
+            padded[0], padded[-1] = padded[-2], padded[1]
+            padded[:, 0], padded[:, -1] = padded[:, -2], padded[:, 1]
+        else:
+            padded[0], padded[-1] = padded[1], padded[-2]
+            padded[:, 0], padded[:, -1] = padded[:, 1], padded[:, -2]
+
+    def _jacobi(self, rhs: np.ndarray, initial: np.ndarray, wx: float, wy: float, diagonal: float) -> np.ndarray:
+        """
+        diagonal·x - wx·(좌+우) - wy·(하+상) = rhs를 iterations번 Jacobi 반복으로 풂.
+        테두리를 가진 버퍼 두 개를 번갈아 써서 반복마다 새 배열을 만들지 않음
+        """
+        pad = ((1, 1), (1, 1)) + ((0, 0),) * (rhs.ndim - 2)
+        current = np.pad(initial.astype(self.dtype), pad)
+        following = np.empty_like(current)
+        horizontal = np.empty_like(rhs, dtype=self.dtype)
+        vertical = np.empty_like(horizontal)
+        scale = 1.0 / diagonal
+        for _ in range(self.iterations):
+            self._fill_border(current)
+            np.add(current[1:-1, :-2], current[1:-1, 2:], out=horizontal)
+            np.add(current[:-2, 1:-1], current[2:, 1:-1], out=vertical)
+            horizontal *= wx
+            vertical *= wy
+            horizontal += vertical
+            horizontal += rhs
+            np.multiply(horizontal, scale, out=following[1:-1, 1:-1])
+            current, following = following, current
+        return current[1:-1, 1:-1].copy()
+
+    def _jacobi_diffuse(self, field: np.ndarray, amount: float) -> np.ndarray:
+        """(I - amount·∇²)x = field"""
+        ax, ay = amount / self.dx ** 2, amount / self.dy ** 2
+        return self._jacobi(field, field, ax, ay, 1 + 2 * ax + 2 * ay)
+
+    def _diffuse_scalar(self, field: np.ndarray, amount: float) -> np.ndarray:
+        if self.solver == "fft":
+            return np.fft.irfft2(np.fft.rfft2(field) / (1 + amount * self._k2), s=field.shape)
+        if self.solver == "dct": # 벽에서 법선 기울기 0 (색소가 벽을 넘지 않음)
+            spectrum = _wall_transform(_wall_transform(field, 1, False), 0, False) / (1 + amount * self._k2)
+            return _wall_inverse(_wall_inverse(spectrum, 0, False), 1, False)
+        return self._jacobi_diffuse(field, amount)
+
+    def _jacobi_project(self, dt: float) -> None:
+        """∇²q = ∇·u를 Jacobi로 풀고 u -= ∇q. 이전 q에서 시작해 반복 수가 적어도 수렴이 이어짐"""
+        wx, wy = 1 / self.dx ** 2, 1 / self.dy ** 2
+        q = self._jacobi(-self.divergence(), self.pressure * dt, wx, wy, 2 * wx + 2 * wy)
+        grad_x, grad_y = self._gradient(q)
+        self.velocity[..., 0] -= grad_x
+        self.velocity[..., 1] -= grad_y
+        self._apply_velocity_boundary(self.velocity)
+        self.pressure[...] = q / dt
+
+    def _apply_velocity_boundary(self, velocity: np.ndarray) -> None:
+        """
+        Jacobi 벽 경계: 벽인 가장자리 칸 중심에서 벽을 뚫는 속도 성분을 0으로 (미끄러짐은 허용).
+        DCT는 벽이 칸 바깥 면이고 사영이 그 면을 지나는 흐름을 없애므로 여기서 할 일이 없음
+        """
+        if self.boundary == "walls" and self.solver == "jacobi":
+            velocity[:, [0, -1], 0] = 0
+            velocity[[0, -1], :, 1] = 0
+
+    # --- 진단량 (시각화용) ---
+
+    def _gradient(self, field: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """중심 차분 (∂/∂x, ∂/∂y)"""
+        mode = "wrap" if self.boundary == "periodic" else "edge"
+        padded = np.pad(field, 1, mode=mode)
+        grad_x = (padded[1:-1, 2:] - padded[1:-1, :-2]) / (2 * self.dx)
+        grad_y = (padded[2:, 1:-1] - padded[:-2, 1:-1]) / (2 * self.dy)
+        return grad_x, grad_y
+
+    def divergence(self) -> np.ndarray:
+        """∇·u (사영 직후에는 0에 가까움)"""
+        du_dx, _ = self._gradient(self.velocity[..., 0])
+        _, dv_dy = self._gradient(self.velocity[..., 1])
+        return du_dx + dv_dy
+
+    def vorticity(self) -> np.ndarray:
+        """∂v/∂x - ∂u/∂y (반시계 회전이 양수)"""
+        dv_dx, _ = self._gradient(self.velocity[..., 1])
+        _, du_dy = self._gradient(self.velocity[..., 0])
+        return dv_dx - du_dy
+
+    def speed(self) -> np.ndarray:
+        return np.hypot(self.velocity[..., 0], self.velocity[..., 1])
+
+    def kinetic_energy(self) -> float:
+        """칸 평균 운동 에너지 ½|u|²"""
+        return float(0.5 * np.mean(self.velocity[..., 0] ** 2 + self.velocity[..., 1] ** 2))
+
+    # --- 샘플링 (입자, 화살표, 유선) ---
+
+    def sample(self, points: np.ndarray) -> np.ndarray:
+        """월드 좌표 points (N, 2 또는 3)에서의 속도 (N, 2)"""
+        points = np.asarray(points, dtype=float).reshape(-1, np.shape(points)[-1])
+        cols = (points[:, 0] - self.x_range[0]) / self.dx - 0.5
+        rows = (points[:, 1] - self.y_range[0]) / self.dy - 0.5
+        return self._interpolate(self.velocity, cols, rows)
+
+    def flow(self) -> Callable[[np.ndarray, float], np.ndarray]:
+        """particle_system의 흐름장 (ParticleSystem.add_flow에 넘김). 매번 현재 속도를 읽음"""
+        # 솔버 객체는 segment_cache 해시에 타입 이름으로만 들어가므로, 설정과 속도 배열을 기본값으로 쥐어
+        # 흐름장의 내용이 키에 들어가게 함
+        def field(positions: np.ndarray, t: float, settings=self.settings(), velocity=self.velocity) -> np.ndarray:
+            result = np.zeros_like(positions)
+            result[:, :2] = self.sample(positions)
+            return result
+        return field
+
+    def velocity_function(self) -> Callable[[np.ndarray], np.ndarray]:
+        """점 하나 -> 3차원 속도 벡터 (manim ArrowVectorField, StreamLines의 func)"""
+        def func(point: np.ndarray) -> np.ndarray:
+            vx, vy = self.sample(np.asarray(point)[None, :2])[0]
+            return np.array([vx, vy, 0.0])
+        return func
+
+    def settings(self) -> dict:
+        """결과에 영향을 주는 설정 (캐시 키용)"""
+        return {
+            "shape": (self.height, self.width), "x_range": self.x_range, "y_range": self.y_range,
+            "viscosity": self.viscosity, "dye_diffusion": self.dye_diffusion, "boundary": self.boundary,
+            "solver": self.solver, "iterations": self.iterations, "convection": self.convection,
+            "pressure": self.pressure_projection, "gravity": tuple(self.gravity.tolist()), "buoyancy": self.buoyancy,
+        }
@@ -0,0 +1,316 @@
+"""
+글리프 단위 Text 캐시
+Text()는 문자열마다 Pango로 SVG를 새로 만들어 "HashMap: {2: 0}"처럼 값만 바뀐 캡션도
+매번 조판합니다. 이 모듈은 (폰트, 크기, 굵기)마다 글자 하나씩의 윤곽선과 가로 진행 폭을
+디스크에 저장해 두고, 캡션은 저장된 윤곽선을 이어 붙여 만듭니다 (cached_text.CachedText).
+
+저장 구조 (키마다 디렉터리 하나):
+    <root>/<폰트-크기-굵기-해시>/index.json   글자 -> 파일/진행 폭/마지막 사용 시각
+    <root>/<폰트-크기-굵기-해시>/u<코드포인트>.npy
+
+조회는 index.json만 읽으므로 디렉터리를 훑지 않으며, 글자 수가 max_glyphs를 넘으면
+오래 쓰지 않은 글자부터 지웁니다.
+
+사용법:
+    python glyph_cache.py trace_scene.py problem_visualizer.py dp_make_one_visualization.py
+"""
+
+import argparse
+import atexit
+import fcntl
+import hashlib
+import json
+import os
+import re
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from scene_analysis import extract_text
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "manim_agent", "glyphs")
+# 완성형 한글 11,172자를 다 넣고도 남는 크기
+DEFAULT_MAX_GLYPHS = 16384
+# 기준 막대: 글자 사이에 끼워 조판해서 글자마다의 진행 폭과 기준선을 잽니다
+REFERENCE_CHAR = "|"
+# f-string의 {값} 자리에 올 수 있는 글자
+DYNAMIC_CHARSET = "0123456789-.,[]() "
+
+# points: 펜 위치(x)와 기준선(y)이 원점인 윤곽선 점 배열, advance: 다음 글자까지의 가로 폭
+Glyph = namedtuple("Glyph", ["points", "advance"])
+
+
+def _key_slug(font: str, font_size: float, weight: str) -> str:
+    """키 디렉터리 이름. 폰트가 경로여도 겹치지 않도록 해시를 붙임"""
+    readable = re.sub(r"[^\w.-]", "_", f"{Path(font).stem or 'default'}-{font_size:g}-{weight}")
+    digest = hashlib.sha256(f"{font}\0{font_size:g}\0{weight}".encode()).hexdigest()[:8]
+    return f"{readable}-{digest}"
+
+
+def _glyph_file(char: str) -> str:
+    return f"u{ord(char):04x}.npy"
+
+
+class GlyphStore:
+    """
+    (폰트, 크기, 굵기) 하나의 글리프 캐시.
+    사용 시각은 메모리에서만 갱신하고, 새 글자를 넣거나 flush()할 때 index.json에 씁니다.
+    """
+
+    _shared = {}
+
+    @classmethod
+    def get(cls, font: str = "", font_size: float = 48, weight: str = "NORMAL", root: Optional[str] = None) -> "GlyphStore":
+        """(폰트, 크기, 굵기, 루트)별로 공유되는 저장소"""
+        key = (font, float(font_size), weight, root)
+        if key not in cls._shared:
+            cls._shared[key] = cls(font, font_size, weight, root)
+        return cls._shared[key]
+
+    def __init__(
+        self,
+        font: str = "",
+        font_size: float = 48,
+        weight: str = "NORMAL",
+        root: Optional[str] = None,
+        max_glyphs: int = DEFAULT_MAX_GLYPHS,
+    ):
+        self.font = font
+        self.font_size = float(font_size)
+        self.weight = weight
+        self.max_glyphs = max_glyphs
+        root = Path(root or os.environ.get("MANIM_GLYPH_CACHE", DEFAULT_CACHE_DIR))
+        self.directory = root / _key_slug(font, self.font_size, weight)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.directory / "index.json"
+        self.index = self._read_index()
+        self.glyphs: Dict[str, Glyph] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+    # --- index.json ---
+
+    def _read_index(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            index = {}
+        index.setdefault("glyphs", {})
+        index.setdefault("metrics", {})
+        return index
+
+    @contextmanager
+    def _locked(self):
+        """여러 렌더 프로세스가 같은 키에 동시에 쓰지 않도록 잠금"""
+        with open(self.directory / "index.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _write_index(self, fresh: Iterable[str] = ()) -> None:
+        """디스크의 index와 합쳐 쓰고, 넘치면 방금 넣은 글자를 빼고 오래된 것부터 삭제"""
+        with self._locked():
+            on_disk = self._read_index()
+            merged = on_disk["glyphs"]
+            for char, entry in self.index["glyphs"].items():
+                if char not in merged or merged[char]["used"] < entry["used"]:
+                    merged[char] = entry
+            on_disk["metrics"].update(self.index["metrics"])
+
+            fresh = set(fresh)
+            excess = len(merged) - self.max_glyphs
+            if excess > 0:
+                candidates = sorted((entry["used"], char) for char, entry in merged.items() if char not in fresh)
+                for _, char in candidates[:excess]:
+                    entry = merged.pop(char)
+                    self.glyphs.pop(char, None)
+                    try:
+                        (self.directory / entry["file"]).unlink()
+                    except FileNotFoundError:
+                        pass
+
+            tmp_path = self.index_path.with_name(f"index.json.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(on_disk, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+            self.index = on_disk
+        self._dirty = False
+
+    # --- 조회/저장 ---
+
+    def __contains__(self, char: str) -> bool:
+        return char in self.glyphs or char in self.index["glyphs"]
+
+    def __len__(self) -> int:
+        return len(self.index["glyphs"])
+
+    @property
+    def line_height(self) -> float:
+        return self.index["metrics"].get("line_height", 0.0)
+
+    def missing(self, text: str) -> List[str]:
+        """캐시에 없는 글자 (중복 없이 처음 나온 순서, 줄바꿈 제외)"""
+        return [char for char in dict.fromkeys(text) if char != "\n" and char not in self]
+
+    def glyph(self, char: str) -> Glyph:
+        """글리프 하나 (없으면 KeyError). 디스크에서 읽은 것은 메모리에 보관"""
+        entry = self.index["glyphs"].get(char)
+        if char not in self.glyphs:
+            if entry is None:
+                self.misses += 1
+                raise KeyError(char)
+            try:
+                points = np.load(self.directory / entry["file"])
+            except FileNotFoundError:
+                # 다른 프로세스가 지운 글자: 다시 조판해야 함
+                del self.index["glyphs"][char]
+                self.misses += 1
+                raise KeyError(char) from None
+            self.glyphs[char] = Glyph(points, entry["advance"])
+        self.hits += 1
+        if entry is not None:
+            entry["used"] = time.time()
+            self._dirty = True
+        return self.glyphs[char]
+
+    def put(self, glyphs: Dict[str, Glyph], metrics: Optional[dict] = None) -> None:
+        """새로 조판한 글리프를 저장 (npy는 원자적으로 쓰고 index는 한 번만 갱신)"""
+        now = time.time()
+        for char, glyph in glyphs.items():
+            name = _glyph_file(char)
+            tmp_path = self.directory / f"{name}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.asarray(glyph.points, dtype=np.float64))
+            os.replace(tmp_path, self.directory / name)
+            self.glyphs[char] = Glyph(np.asarray(glyph.points, dtype=np.float64), float(glyph.advance))
+            self.index["glyphs"][char] = {"file": name, "advance": float(glyph.advance), "used": now}
+        if metrics:
+            self.index["metrics"].update(metrics)
+        self._write_index(glyphs)
+
+    def flush(self) -> None:
+        """메모리에서 갱신한 사용 시각을 index.json에 반영"""
+        if self._dirty:
+            self._write_index()
+
+    def layout(self, line: str) -> Tuple[List[Tuple[Glyph, float]], float]:
+        """한 줄의 (글리프, 펜 x 위치) 목록과 전체 폭. 모든 글자가 캐시에 있어야 함"""
+        placed = []
+        x = 0.0
+        for char in line:
+            glyph = self.glyph(char)
+            placed.append((glyph, x))
+            x += glyph.advance
+        return placed, x
+
+
+@atexit.register
+def flush_all() -> None:
+    for store in GlyphStore._shared.values():
+        try:
+            store.flush()
+        except OSError:
+            pass
+
+
+# --- 기준 막대를 끼운 조판 결과에서 글리프 추출 ---
+
+def reference_line(chars: Sequence[str]) -> str:
+    """글자마다 앞뒤에 기준 막대를 둔 한 줄 ("||a|b|c|"). 맨 앞 두 막대로 막대 폭을 잼"""
+    return REFERENCE_CHAR * 2 + REFERENCE_CHAR.join(chars) + REFERENCE_CHAR
+
+
+def glyphs_from_reference_line(chars: Sequence[str], parts: Sequence[np.ndarray]) -> Tuple[Dict[str, Glyph], dict]:
+    """
+    reference_line(chars)를 조판한 글리프별 점 배열(공백은 글리프가 없음)에서
+    글자마다 윤곽선과 진행 폭을 구합니다.
+
+    막대의 왼쪽 끝 + 막대 폭을 각 글자의 펜 위치로, 첫 막대의 세로 중심을 기준선으로 삼습니다.
+    진행 폭은 다음 막대까지의 거리라 글자 쌍 사이의 커닝은 반영되지 않습니다.
+    """
+    expected = 2 + len(chars) + sum(not char.isspace() for char in chars)
+    if len(parts) != expected:
+        raise ValueError(f"expected {expected} glyphs for {len(chars)} characters, got {len(parts)}")
+
+    def left(points):
+        return points[:, 0].min()
+
+    bar_advance = left(parts[1]) - left(parts[0])
+    bottom, top = parts[0][:, 1].min(), parts[0][:, 1].max()
+    origin_y = (bottom + top) / 2
+
+    glyphs = {}
+    k = 1
+    for char in chars:
+        pen_x = left(parts[k]) + bar_advance
+        k += 1
+        if char.isspace():
+            outline = np.zeros((0, 3))
+        else:
+            outline = parts[k] - np.array([pen_x, origin_y, 0.0])
+            k += 1
+        glyphs[char] = Glyph(outline, left(parts[k]) - pen_x)
+    return glyphs, {"line_height": 1.2 * (top - bottom)}
+
+
+# --- 미리 채우기 ---
+
+def text_requirements(paths: Iterable) -> Dict[Tuple[str, float, str], str]:
+    """씬 모듈들의 Text 호출에서 (폰트, 크기, 굵기)별로 필요한 글자 모음"""
+    required: Dict[Tuple[str, float, str], str] = {}
+    for path in paths:
+        for call in extract_text(path):
+            key = (call["font"], call["font_size"], call["weight"])
+            chars = "".join(call["strings"]) + (DYNAMIC_CHARSET if call["dynamic"] else "")
+            required[key] = required.get(key, "") + chars
+    return {key: "".join(dict.fromkeys(chars.replace("\n", ""))) for key, chars in required.items()}
+
+
+def prewarm(
+    paths: Iterable,
+    root: Optional[str] = None,
+    typeset: Optional[Callable] = None,
+) -> dict:
+    """
+    씬 모듈의 문자열 리터럴과 f-string 틀에 나오는 글자 중 캐시에 없는 것만 조판합니다.
+    typeset(chars, font, font_size, weight) -> (글리프, metrics). 기본은 cached_text.typeset_glyphs
+    """
+    if typeset is None:
+        from cached_text import typeset_glyphs as typeset
+
+    summary = {"keys": 0, "requested": 0, "cached": 0, "typeset": 0}
+    for (font, font_size, weight), chars in text_requirements(paths).items():
+        store = GlyphStore.get(font, font_size, weight, root)
+        missing = store.missing(chars)
+        summary["keys"] += 1
+        summary["requested"] += len(chars)
+        summary["cached"] += len(chars) - len(missing)
+        if missing:
+            glyphs, metrics = typeset(missing, font, font_size, weight)
+            store.put(glyphs, metrics)
+            summary["typeset"] += len(glyphs)
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="씬 모듈의 Text 글자를 글리프 캐시에 미리 조판")
+    parser.add_argument("paths", nargs="+", help="씬 파일 경로")
+    parser.add_argument("--cache-dir", default=None, help="캐시 디렉터리 (기본: MANIM_GLYPH_CACHE 또는 ~/.cache)")
+    args = parser.parse_args(argv)
+
+    summary = prewarm(args.paths, args.cache_dir)
+    print(f"(폰트, 크기, 굵기) {summary['keys']}종, 글자 {summary['requested']}개: "
+          f"캐시 {summary['cached']}, 새로 조판 {summary['typeset']}")
+
+
+if __name__ == "__main__":
+    main()
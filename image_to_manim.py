@@ -1,7 +1,37 @@
+import argparse
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, Optional
+
 import cv2
 import numpy as np
 from manim import * # Assuming manim is installed and available
 
+from contour_curves import extract_curves
+from line_simplify import format_stages, simplify_lines
+from tiled_detection import detect_lines, detect_lines_tiled, init_worker
+
+LINE_DATA_FORMATS = ("inline", "npy")
+LINE_MODES = ("group", "batched")
+ENGINES = ("lines", "curves")
+# Reduced-resolution grayscale decode flags (libjpeg scales while decoding)
+DECODE_FLAGS = {
+    1: cv2.IMREAD_GRAYSCALE,
+    2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp"}
+
+# One line of the generated line_data list (start xyz, end xyz)
+LINE_TEMPLATE = "[np.array([%.4f, %.4f, %.4f]), np.array([%.4f, %.4f, %.4f])],"
+# One row of the generated curve_points array (a Bezier anchor or handle)
+POINT_TEMPLATE = "[%.4f, %.4f, %.4f],"
+
 class ImageToManim:
     def __init__(self, image_path: str, **config):
         self.image_path = image_path
@@ -10,41 +40,143 @@ class ImageToManim:
             "max_lines": 500,
             "line_color": WHITE, # Use Manim's WHITE
             "animation_style": "Create", # Or ShowCreation
+            "engine": "lines", # Or "curves": one cubic Bezier path per contour (contour_curves)
+            "curve_options": {}, # Keyword arguments for contour_curves.extract_curves
+            "line_data_format": "inline", # Or "npy": float32 sidecar loaded with mmap
+            "line_mode": "group", # Or "batched": all segments in one VMobject
+            "simplify": False, # Dedupe/merge segments before max_lines (line_simplify)
+            "simplify_options": {}, # Keyword arguments for line_simplify.simplify_lines
+            "decode_scale": 1, # 2, 4 or 8: decode at 1/n resolution
+            "tile_size": None, # Detect in overlapping tiles of this many pixels (tiled_detection)
+            "tile_overlap": 32,
+            "detect_workers": None, # Processes for tiled detection (default: CPU count)
             **config
         }
-        self.lines_data = [] # To store transformed Manim line data
+        self.lines_data = np.zeros((0, 2, 3)) # To store transformed Manim line data
+        self.curve_data = [] # Transformed (K, 4, 3) Bezier control points per contour
+        self.stages = [] # Segment count and time per pipeline stage
 
-    def generate_script(self, output_path: str):
-        # 1. Load image
+    def process(self):
+        """
+        Runs the detection pipeline and returns the Manim line data as an (N, 2, 3)
+        array of [start, end] points. Lines stay in NumPy arrays the whole way.
+        With the "curves" engine, returns the list of (K, 4, 3) Bezier paths instead;
+        max_lines then limits the number of contours.
+        """
         gray_image = self._load_image()
         img_height, img_width = gray_image.shape[:2]
 
-        # 2. Detect lines
+        if self.config["engine"] == "curves":
+            paths, self.stages = extract_curves(
+                gray_image, max_paths=self.config["max_lines"], **self.config["curve_options"]
+            )
+            self.curve_data = [self._transform_points(path, img_height, img_width) for path in paths]
+            return self.curve_data
+
+        start = time.perf_counter()
         raw_lines = self._detect_lines(gray_image)
+        self.stages = [{"stage": "detect", "segments": len(raw_lines), "seconds": time.perf_counter() - start}]
+
+        if self.config["simplify"]:
+            raw_lines, stages = simplify_lines(raw_lines, **self.config["simplify_options"])
+            self.stages += stages[1:]
+
+        if self.config["max_lines"]:
+            start = time.perf_counter()
+            raw_lines = select_longest(raw_lines, self.config["max_lines"])
+            self.stages.append({"stage": "select", "segments": len(raw_lines), "seconds": time.perf_counter() - start})
 
-        # Sort lines by length and take top N if max_lines is set
-        if self.config["max_lines"] and len(raw_lines) > self.config["max_lines"]:
-            # Calculate length for each line to sort
-            # Line format: [x1, y1, x2, y2]
-            line_lengths = [
-                np.sqrt((line[2] - line[0])**2 + (line[3] - line[1])**2)
-                for line in raw_lines
-            ]
-            # Sort by length in descending order and get indices
-            sorted_indices = np.argsort(line_lengths)[::-1]
-            raw_lines = [raw_lines[i] for i in sorted_indices[:self.config["max_lines"]]]
-
-        # 3. Transform coordinates
         self.lines_data = self._transform_coordinates(raw_lines, img_height, img_width)
+        return self.lines_data
+
+    def line_data_source(self, data_file: Optional[str] = None) -> str:
+        """
+        The `line_data = ...` statement of the generated construct(). Either one
+        literal with a formatted np.array pair per line, or (with data_file) a
+        zero-copy memory-mapped load of the .npy sidecar next to the script.
+        """
+        if data_file is not None:
+            return (
+                f"        line_data = np.load(\n"
+                f"            os.path.join(os.path.dirname(os.path.abspath(__file__)), {data_file!r}),\n"
+                f'            mmap_mode="r",\n'
+                f"        )"
+            )
+
+        # One %-format over all coordinates instead of an f-string per line
+        coordinates = np.asarray(self.lines_data, dtype=float).reshape(-1)
+        lines_str = "\n                ".join([LINE_TEMPLATE] * len(self.lines_data)) % tuple(coordinates.tolist())
+        return f"""        line_data = [
+                {lines_str}
+        ]"""
 
-        # 4. Generate Manim script content
+    def lines_source(self) -> str:
+        """
+        The statements that build `lines` from line_data. "group" makes one Line per
+        segment; "batched" makes a single VMobject whose subpaths are the segments, set
+        in one vectorized call, so Create animates one draw fraction over the batch.
+        """
+        line_color = _color_source(self.config["line_color"])
+        if self.config["line_mode"] == "batched":
+            return f"""        # Every segment as a straight cubic curve of one VMobject
+        segments = np.asarray(line_data, dtype=float)
+        t = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, :, None]
+        lines = VMobject(stroke_color={line_color})
+        lines.set_points((segments[:, :1] + (segments[:, 1:] - segments[:, :1]) * t).reshape(-1, 3))"""
+        return f"""        lines = VGroup(*[
+            Line(start, end, color={line_color}) for start, end in line_data
+        ])"""
+
+    def curve_points(self) -> np.ndarray:
+        """All Bezier control points of self.curve_data as one (P, 3) array, four per curve."""
+        if not self.curve_data:
+            return np.zeros((0, 3))
+        return np.concatenate([np.asarray(path, dtype=float).reshape(-1, 3) for path in self.curve_data])
+
+    def curve_data_source(self, data_file: Optional[str] = None) -> str:
+        """
+        The statements that define curve_data, one (4K, 3) control-point array per
+        contour: the points either inline or memory-mapped from the .npy sidecar, then
+        split at the contour boundaries.
+        """
+        if data_file is not None:
+            points_source = (
+                f"        curve_points = np.load(\n"
+                f"            os.path.join(os.path.dirname(os.path.abspath(__file__)), {data_file!r}),\n"
+                f'            mmap_mode="r",\n'
+                f"        )"
+            )
+        else:
+            points = self.curve_points()
+            points_str = "\n            ".join([POINT_TEMPLATE] * len(points)) % tuple(points.reshape(-1).tolist())
+            points_source = f"""        curve_points = np.array([
+            {points_str}
+        ])"""
+        offsets = np.cumsum([len(path) * 4 for path in self.curve_data])[:-1].tolist()
+        return f"{points_source}\n        curve_data = np.split(curve_points, {offsets})"
+
+    def curves_source(self) -> str:
+        """
+        The statements that build `paths` from curve_data: one VMobject per contour,
+        or ("batched") a single VMobject whose subpaths are all the contours.
+        """
+        line_color = _color_source(self.config["line_color"])
+        if self.config["line_mode"] == "batched":
+            return f"""        paths = VMobject(stroke_color={line_color})
+        paths.set_points(np.asarray(curve_points, dtype=float))"""
+        return f"""        paths = VGroup(*[
+            VMobject(stroke_color={line_color}).set_points(np.asarray(points, dtype=float)) for points in curve_data
+        ])"""
+
+    def render_script(self, data_file: Optional[str] = None) -> str:
+        """Formats self.lines_data (or a reference to its sidecar) into the Manim script source."""
         class_name = self.config["class_name"]
-        line_color = self.config["line_color"]
         animation_style = self.config["animation_style"]
 
-        if not self.lines_data:
+        curves = self.config["engine"] == "curves"
+        if not (len(self.curve_data) if curves else len(self.lines_data)):
             # Handle no lines detected scenario
-            script_content = (
+            return (
                 f"from manim import *\n"
                 f"import numpy as np\n\n"
                 f"class {class_name}(Scene):\n"
@@ -53,47 +185,65 @@ class ImageToManim:
                 f"        self.play(Write(text))\n"
                 f"        self.wait()\n"
             )
+
+        imports = "import os\n\n" if data_file is not None else "\n"
+        if curves:
+            data_source, build_source, name = self.curve_data_source(data_file), self.curves_source(), "paths"
         else:
-            # Format line data for embedding in the script
-            formatted_line_data = []
-            for start_point, end_point in self.lines_data:
-                formatted_line_data.append(
-                    f"[np.array([{start_point[0]:.4f}, {start_point[1]:.4f}, {start_point[2]:.4f}]), "
-                    f"np.array([{end_point[0]:.4f}, {end_point[1]:.4f}, {end_point[2]:.4f}])],"
-                )
-            lines_str = "\n                ".join(formatted_line_data)
-
-            script_content = f"""from manim import *
+            data_source, build_source, name = self.line_data_source(data_file), self.lines_source(), "lines"
+        return f"""{imports}from manim import *
 import numpy as np
 
 class {class_name}(Scene):
     def construct(self):
-        line_data = [
-                {lines_str}
-        ]
+{data_source}
 
-        lines = VGroup(*[
-            Line(start, end, color={line_color}) for start, end in line_data
-        ])
+{build_source}
 
-        self.play({animation_style}(lines), run_time=3)
+        self.play({animation_style}({name}), run_time=3)
         self.wait()
-"""
+""".lstrip("\n")
+
+    def save_line_data(self, path: str) -> str:
+        """Writes self.lines_data as an (N, 2, 3) float32 .npy file (curves: curve_points() as (P, 3))."""
+        data = self.curve_points() if self.config["engine"] == "curves" else self.lines_data
+        np.save(path, np.asarray(data, dtype=np.float32))
+        return path
+
+    def generate_script(self, output_path: str, verbose: bool = True):
+        data_format = self.config["line_data_format"]
+        if data_format not in LINE_DATA_FORMATS:
+            raise ValueError(f"Unknown line_data_format: {data_format!r} (expected one of {LINE_DATA_FORMATS})")
+        if self.config["line_mode"] not in LINE_MODES:
+            raise ValueError(f"Unknown line_mode: {self.config['line_mode']!r} (expected one of {LINE_MODES})")
+        if self.config["engine"] not in ENGINES:
+            raise ValueError(f"Unknown engine: {self.config['engine']!r} (expected one of {ENGINES})")
+        self.process()
+
+        data_file = None
+        if data_format == "npy" and (len(self.lines_data) or len(self.curve_data)):
+            data_path = self.save_line_data(os.path.splitext(output_path)[0] + ".npy")
+            data_file = os.path.basename(data_path)
+        script_content = self.render_script(data_file)
 
-        # 5. Write script to file
         with open(output_path, "w") as f:
             f.write(script_content)
 
-        print(f"Manim script generated successfully at {output_path}")
+        if verbose:
+            print(f"Manim script generated successfully at {output_path}")
 
     def _load_image(self) -> np.ndarray:
         """
-        Loads the image from self.image_path and converts it to grayscale.
+        Decodes self.image_path straight to grayscale, at 1/decode_scale resolution
+        when decode_scale is 2, 4 or 8, so no full-size colour buffer is allocated.
         Raises FileNotFoundError if the image does not exist.
         Raises ValueError if the image cannot be read or is in an unsupported format.
         """
-        image = cv2.imread(self.image_path)
-        if image is None:
+        decode_scale = self.config["decode_scale"]
+        if decode_scale not in DECODE_FLAGS:
+            raise ValueError(f"Unknown decode_scale: {decode_scale!r} (expected one of {tuple(DECODE_FLAGS)})")
+        gray_image = cv2.imread(self.image_path, DECODE_FLAGS[decode_scale])
+        if gray_image is None:
             # Check if file exists to differentiate between FileNotFoundError and ValueError
             try:
                 with open(self.image_path, 'rb') as f:
@@ -101,45 +251,165 @@ class {class_name}(Scene):
                 raise ValueError(f"Could not read image file: {self.image_path}. It might be corrupted or in an unsupported format.")
             except FileNotFoundError:
                 raise FileNotFoundError(f"Image file not found: {self.image_path}")
-
-        # Convert to grayscale
-        gray_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         return gray_image
 
-    def _detect_lines(self, image: np.ndarray) -> list:
+    def _detect_lines(self, image: np.ndarray) -> np.ndarray:
         """
-        Detects line segments in the given grayscale image using OpenCV's LSD.
-        Returns a list of detected lines, each as [x1, y1, x2, y2].
+        Detects line segments in the given grayscale image using OpenCV's LSD, over
+        the whole image or, with tile_size set, tile by tile across a process pool.
+        Returns an (N, 4) float array of [x1, y1, x2, y2] rows (N may be 0).
         """
-        lsd = cv2.createLineSegmentDetector(0)
-        lines = lsd.detect(image)[0] # lines is an array of shape (N, 1, 4)
-        if lines is None:
-            return []
-        # Reshape to (N, 4) for easier processing
-        return lines.reshape(-1, 4).tolist()
+        if self.config["tile_size"]:
+            return detect_lines_tiled(
+                image, self.config["tile_size"], self.config["tile_overlap"], self.config["detect_workers"]
+            )
+        return detect_lines(image)
 
-    def _transform_coordinates(self, lines: list, img_height: int, img_width: int) -> list:
+    def _transform_coordinates(self, lines, img_height: int, img_width: int) -> np.ndarray:
         """
         Transforms OpenCV pixel coordinates to Manim's coordinate system.
         Includes centering, y-axis inversion, and scaling to fit Manim's frame.
+        Accepts an (N, 4) array (or list of rows) and returns an (N, 2, 3) array.
         """
-        transformed_lines = []
-        manim_frame_height = config.frame_height # Default 8.0
+        return self._transform_points(np.asarray(lines, dtype=float).reshape(-1, 2, 2), img_height, img_width)
+
+    def _transform_points(self, points, img_height: int, img_width: int) -> np.ndarray:
+        """The same transform for any (..., 2) array of pixel points; returns (..., 3)."""
+        points = np.asarray(points, dtype=float)
 
         # Calculate scale factor to fit the image height into Manim's frame height
-        scale_factor = manim_frame_height / img_height
-
-        for x1, y1, x2, y2 in lines:
-            # Transform point 1
-            mx1 = (x1 - img_width / 2) * scale_factor
-            my1 = (img_height / 2 - y1) * scale_factor # Invert Y-axis
-
-            # Transform point 2
-            mx2 = (x2 - img_width / 2) * scale_factor
-            my2 = (img_height / 2 - y2) * scale_factor # Invert Y-axis
-
-            transformed_lines.append([
-                np.array([mx1, my1, 0.]),
-                np.array([mx2, my2, 0.])
-            ])
-        return transformed_lines
+        scale_factor = config.frame_height / img_height
+
+        # (x, y) -> ((x - W/2) * s, (H/2 - y) * s, 0) for every point at once
+        transformed = np.zeros(points.shape[:-1] + (3,))
+        transformed[..., :2] = (points - [img_width / 2, img_height / 2]) * [scale_factor, -scale_factor]
+        return transformed
+
+
+def _color_source(color) -> str:
+    """Source text for a color: Manim colors become a hex string literal, strings are used as code."""
+    if hasattr(color, "to_hex"):
+        return repr(color.to_hex())
+    return str(color)
+
+
+def select_longest(lines: np.ndarray, k: int) -> np.ndarray:
+    """
+    Returns the k longest lines, longest first. np.argpartition picks the top k in
+    O(N); only those k are sorted.
+    """
+    lines = np.asarray(lines).reshape(-1, 4)
+    if len(lines) <= k:
+        return lines
+    squared = (lines[:, 2] - lines[:, 0]) ** 2 + (lines[:, 3] - lines[:, 1]) ** 2
+    top = np.argpartition(squared, len(lines) - k)[len(lines) - k:]
+    return lines[top[np.argsort(squared[top], kind="stable")[::-1]]]
+
+
+# --- Batch mode ---
+
+ConversionResult = namedtuple("ConversionResult", ["image_path", "output_path", "n_lines", "seconds", "error"])
+
+
+def class_name_for(image_path: str) -> str:
+    """Scene class name from an image file name ("my-drawing.png" -> "MyDrawingScene")."""
+    stem = os.path.splitext(os.path.basename(image_path))[0]
+    words = re.findall(r"[A-Za-z0-9]+", stem)
+    name = "".join(word[:1].upper() + word[1:] for word in words) or "Vectorized"
+    if name[0].isdigit():
+        name = "Image" + name
+    return name + "Scene"
+
+
+def find_images(directory: str) -> list:
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS
+    )
+
+
+def _convert_one(job) -> ConversionResult:
+    image_path, output_path, options = job
+    start = time.perf_counter()
+    try:
+        converter = ImageToManim(image_path, **{"class_name": class_name_for(image_path), **options})
+        converter.generate_script(output_path, verbose=False)
+    except (OSError, ValueError, cv2.error) as e:
+        return ConversionResult(image_path, output_path, 0, time.perf_counter() - start, str(e))
+    n_paths = len(converter.curve_data) if converter.config["engine"] == "curves" else len(converter.lines_data)
+    return ConversionResult(image_path, output_path, n_paths, time.perf_counter() - start, None)
+
+
+def convert_directory(input_dir: str, output_dir: str, workers: Optional[int] = None, **options) -> Iterator[ConversionResult]:
+    """
+    Converts every image in input_dir to <output_dir>/<name>.py across a process
+    pool, yielding each result as soon as its image finishes (completion order).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    # Images already run in parallel, so each worker detects its tiles in-process
+    options = {"detect_workers": 1, **options}
+    jobs = [
+        (path, os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0] + ".py"), options)
+        for path in find_images(input_dir)
+    ]
+    if not jobs:
+        return
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+        futures = [pool.submit(_convert_one, job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert an image (or a directory of images) into Manim line scenes")
+    parser.add_argument("input", help="image file or directory of images")
+    parser.add_argument("-o", "--output", required=True, help="output .py file (single image) or directory")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="worker processes for directory images or tiles (default: CPU count)")
+    parser.add_argument("--max-lines", type=int, default=500)
+    parser.add_argument("--format", choices=LINE_DATA_FORMATS, default="inline",
+                        help="embed line data in the script, or write a float32 .npy sidecar")
+    parser.add_argument("--line-mode", choices=LINE_MODES, default="group",
+                        help="one Line per segment, or all segments in a single VMobject")
+    parser.add_argument("--simplify", action="store_true", help="remove duplicate and merge collinear segments")
+    parser.add_argument("--chain-epsilon", type=float, default=None,
+                        help="also chain segments into polylines and simplify them (pixels, implies --simplify)")
+    parser.add_argument("--engine", choices=ENGINES, default="lines",
+                        help="straight LSD segments, or one Bezier path per traced contour")
+    parser.add_argument("--curve-error", type=float, default=1.0, help="maximum Bezier fitting error in pixels")
+    parser.add_argument("--decode-scale", type=int, choices=sorted(DECODE_FLAGS), default=1,
+                        help="decode the image at 1/n resolution")
+    parser.add_argument("--tile-size", type=int, default=None,
+                        help="detect lines in overlapping tiles of this size across processes")
+    parser.add_argument("--tile-overlap", type=int, default=32)
+    args = parser.parse_args(argv)
+    options = {
+        "max_lines": args.max_lines, "line_data_format": args.format, "line_mode": args.line_mode,
+        "decode_scale": args.decode_scale, "tile_size": args.tile_size, "tile_overlap": args.tile_overlap,
+        "engine": args.engine, "curve_options": {"max_error": args.curve_error},
+    }
+    if not os.path.isdir(args.input):
+        options["detect_workers"] = args.jobs
+    if args.simplify or args.chain_epsilon is not None:
+        options.update(simplify=True, simplify_options={"chain_epsilon": args.chain_epsilon})
+
+    if not os.path.isdir(args.input):
+        converter = ImageToManim(args.input, **options)
+        converter.generate_script(args.output)
+        if options.get("simplify") or args.engine == "curves":
+            print(format_stages(converter.stages))
+        return
+
+    failed = 0
+    for result in convert_directory(args.input, args.output, args.jobs, **options):
+        if result.error:
+            failed += 1
+            print(f"FAIL {result.image_path}: {result.error}", flush=True)
+        else:
+            print(f"ok   {result.image_path} -> {result.output_path} ({result.n_lines} lines, {result.seconds:.2f}s)", flush=True)
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,15 @@
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
+from cached_tts_service import CachedTTSService
+from tex_cache import install_tex_cache
+
+# 이 모듈의 수식을 공유 캐시에 한 번에 컴파일
+install_tex_cache(__file__)
 
 
 class KoreanMathProblem(VoiceoverScene):
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 1. Introduction
         self.voiceover(text="안녕하세요, 여러분! 오늘은 한국 고등학생들이 자주 마주하는 수학 문제, 바로 이차방정식 풀이에 대해 알아보겠습니다.")
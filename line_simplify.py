@@ -0,0 +1,341 @@
+"""
+Post-detection cleanup for LSD line segments.
+LSD often splits one visual edge into many collinear fragments and reports
+near-identical segments twice. These stages shrink the segment count before
+ImageToManim picks the longest lines and writes the scene:
+
+1. remove_duplicates: drop segments whose endpoints match a longer one.
+2. merge_collinear: join nearly collinear fragments separated by small gaps.
+3. chain_polylines + douglas_peucker (optional): link segments that meet
+   end to end into polylines and drop vertices that barely bend them.
+
+Candidate pairs come from a uniform spatial grid (grid_pairs), so every stage
+is O(N + pairs) NumPy work. All coordinates are in image pixels.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+def grid_pairs(points: np.ndarray, cell: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    All index pairs (i, j), i != j, whose points fall in the same or adjacent
+    grid cells. Every pair closer than `cell` is included (plus some farther ones).
+    Each unordered pair appears once.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    n = len(points)
+    if n < 2:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+
+    cells = np.floor(points / cell).astype(np.int64)
+    cells -= cells.min(axis=0)
+    # Shift by one so that x - 1 and x + 1 never wrap into another row
+    width = cells[:, 0].max() + 3
+    keys = (cells[:, 1] + 1) * width + (cells[:, 0] + 1)
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+
+    pairs_i, pairs_j = [], []
+    # Same cell plus half of the 8 neighbours, so each cell pair is visited once
+    for dx, dy in ((0, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
+        target = keys + dy * width + dx
+        lo = np.searchsorted(sorted_keys, target, side="left")
+        hi = np.searchsorted(sorted_keys, target, side="right")
+        counts = hi - lo
+        total = counts.sum()
+        if not total:
+            continue
+        i = np.repeat(np.arange(n), counts)
+        position = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts) + np.repeat(lo, counts)
+        j = order[position]
+        if (dx, dy) == (0, 0):
+            keep = i < j
+            i, j = i[keep], j[keep]
+        pairs_i.append(i)
+        pairs_j.append(j)
+    if not pairs_i:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+def connected_components(n: int, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Component label (smallest member index) for each of n nodes given edges (a, b),
+    by min-label propagation with pointer jumping.
+    """
+    labels = np.arange(n)
+    if not len(a):
+        return labels
+    while True:
+        smaller = np.minimum(labels[a], labels[b])
+        updated = labels.copy()
+        np.minimum.at(updated, a, smaller)
+        np.minimum.at(updated, b, smaller)
+        # A label is always the index of a node whose own label is no larger
+        jumped = updated[updated]
+        while not np.array_equal(jumped, updated):
+            updated, jumped = jumped, jumped[jumped]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def _lengths(lines: np.ndarray) -> np.ndarray:
+    return np.hypot(lines[:, 2] - lines[:, 0], lines[:, 3] - lines[:, 1])
+
+
+def remove_duplicates(lines: np.ndarray, tol: float = 3.5) -> np.ndarray:
+    """
+    Drops segments whose two endpoints are each within `tol` of a longer
+    segment's endpoints (in either direction). Greedy: a segment is dropped if
+    it duplicates any longer one. The result is sorted longest first.
+    The default tolerance also catches the two opposite edges LSD reports for
+    a stroke 1-2 px wide.
+    """
+    lines = np.asarray(lines, dtype=float).reshape(-1, 4)
+    lines = lines[np.argsort(-_lengths(lines), kind="stable")]
+    midpoints = (lines[:, :2] + lines[:, 2:]) / 2
+    # Duplicates have midpoints within tol of each other
+    i, j = grid_pairs(midpoints, 2 * tol)
+    i, j = np.minimum(i, j), np.maximum(i, j)
+
+    a, b = lines[i], lines[j]
+    same = np.maximum(np.hypot(*(a[:, :2] - b[:, :2]).T), np.hypot(*(a[:, 2:] - b[:, 2:]).T)) <= tol
+    flipped = np.maximum(np.hypot(*(a[:, :2] - b[:, 2:]).T), np.hypot(*(a[:, 2:] - b[:, :2]).T)) <= tol
+    drop = np.zeros(len(lines), dtype=bool)
+    drop[j[same | flipped]] = True
+    return lines[~drop]
+
+
+def merge_collinear(
+    lines: np.ndarray,
+    angle_tol: float = 2.0,
+    distance_tol: float = 1.5,
+    gap_tol: float = 4.0,
+) -> np.ndarray:
+    """
+    Merges nearly collinear segments into one segment per group.
+
+    Two segments join a group when their directions differ by at most angle_tol
+    degrees, each one's endpoints lie within distance_tol of the other's line,
+    and the gap between them along that line is at most gap_tol (overlap counts
+    as no gap). A group becomes the length-weighted best-fit line clipped to the
+    extent of its endpoints. If that fit misses an endpoint by more than
+    distance_tol (a slowly bending chain), the group's segments are kept as they are.
+    """
+    lines = np.asarray(lines, dtype=float).reshape(-1, 4)
+    n = len(lines)
+    if n < 2:
+        return lines
+    p0, p1 = lines[:, :2], lines[:, 2:]
+    vectors = p1 - p0
+    length = _lengths(lines)
+    direction = vectors / np.maximum(length, 1e-12)[:, None]
+
+    # Sample points along every segment; segments within gap_tol of each other
+    # then have samples closer than one cell
+    cell = 2 * gap_tol + 2
+    spacing = cell / 2
+    n_samples = np.ceil(length / spacing).astype(np.int64) + 1
+    owner = np.repeat(np.arange(n), n_samples)
+    step = np.arange(n_samples.sum()) - np.repeat(np.cumsum(n_samples) - n_samples, n_samples)
+    t = step / np.repeat(np.maximum(n_samples - 1, 1), n_samples)
+    samples = p0[owner] + vectors[owner] * t[:, None]
+
+    si, sj = grid_pairs(samples, cell)
+    a, b = owner[si], owner[sj]
+    distinct = a != b
+    pair = np.unique(np.minimum(a, b)[distinct] * n + np.maximum(a, b)[distinct])
+    a, b = pair // n, pair % n
+
+    parallel = np.abs((direction[a] * direction[b]).sum(axis=1)) >= np.cos(np.deg2rad(angle_tol))
+    normal_a = np.stack([-direction[a, 1], direction[a, 0]], axis=1)
+    normal_b = np.stack([-direction[b, 1], direction[b, 0]], axis=1)
+    offset = np.maximum.reduce([
+        np.abs(((p0[b] - p0[a]) * normal_a).sum(axis=1)),
+        np.abs(((p1[b] - p0[a]) * normal_a).sum(axis=1)),
+        np.abs(((p0[a] - p0[b]) * normal_b).sum(axis=1)),
+        np.abs(((p1[a] - p0[b]) * normal_b).sum(axis=1)),
+    ])
+    tb0 = ((p0[b] - p0[a]) * direction[a]).sum(axis=1)
+    tb1 = ((p1[b] - p0[a]) * direction[a]).sum(axis=1)
+    gap = np.maximum(np.minimum(tb0, tb1) - length[a], -np.maximum(tb0, tb1))
+    joined = parallel & (offset <= distance_tol) & (gap <= gap_tol)
+
+    labels = connected_components(n, a[joined], b[joined])
+    return _fit_groups(lines, labels, length, distance_tol)
+
+
+def _fit_groups(lines: np.ndarray, labels: np.ndarray, length: np.ndarray, distance_tol: float) -> np.ndarray:
+    """One best-fit segment per label group (see merge_collinear)."""
+    n = len(lines)
+    size = np.bincount(labels, minlength=n)
+    p0, p1 = lines[:, :2], lines[:, 2:]
+    weight = np.maximum(length, 1e-9)
+
+    # Average direction with doubled angles so that opposite orientations agree
+    angle = np.arctan2(p1[:, 1] - p0[:, 1], p1[:, 0] - p0[:, 0])
+    cos2 = np.bincount(labels, weight * np.cos(2 * angle), minlength=n)
+    sin2 = np.bincount(labels, weight * np.sin(2 * angle), minlength=n)
+    group_angle = 0.5 * np.arctan2(sin2, cos2)
+    group_dir = np.stack([np.cos(group_angle), np.sin(group_angle)], axis=1)
+    group_normal = np.stack([-group_dir[:, 1], group_dir[:, 0]], axis=1)
+
+    total = np.bincount(labels, weight, minlength=n)
+    middle = (p0 + p1) / 2
+    centroid = np.stack([
+        np.bincount(labels, weight * middle[:, 0], minlength=n),
+        np.bincount(labels, weight * middle[:, 1], minlength=n),
+    ], axis=1) / np.maximum(total, 1e-12)[:, None]
+
+    endpoints = np.concatenate([p0, p1])
+    owner = np.concatenate([labels, labels])
+    relative = endpoints - centroid[owner]
+    along = (relative * group_dir[owner]).sum(axis=1)
+    across = np.abs((relative * group_normal[owner]).sum(axis=1))
+    t_min = np.full(n, np.inf)
+    t_max = np.full(n, -np.inf)
+    residual = np.zeros(n)
+    np.minimum.at(t_min, owner, along)
+    np.maximum.at(t_max, owner, along)
+    np.maximum.at(residual, owner, across)
+
+    merged = (size >= 2) & (residual <= distance_tol)
+    keep_original = ~merged[labels]
+    groups = np.flatnonzero(merged)
+    fitted = np.hstack([
+        centroid[groups] + group_dir[groups] * t_min[groups, None],
+        centroid[groups] + group_dir[groups] * t_max[groups, None],
+    ])
+    return np.concatenate([lines[keep_original], fitted])
+
+
+def chain_polylines(lines: np.ndarray, join_tol: float = 1.5) -> List[np.ndarray]:
+    """
+    Links segments that meet end to end (endpoints within join_tol) into
+    polylines. Only unambiguous joints are followed: where exactly two segment
+    ends meet. Returns (K, 2) vertex arrays; a joint vertex is the midpoint of the
+    two ends, and a closed loop repeats its first vertex at the end.
+    """
+    lines = np.asarray(lines, dtype=float).reshape(-1, 4)
+    n = len(lines)
+    ends = lines.reshape(-1, 2)  # end e belongs to segment e // 2
+    i, j = grid_pairs(ends, 2 * join_tol)
+    close = (i // 2 != j // 2) & (np.hypot(*(ends[i] - ends[j]).T) <= join_tol)
+    i, j = i[close], j[close]
+    degree = np.bincount(np.concatenate([i, j]), minlength=2 * n)
+    unique = (degree[i] == 1) & (degree[j] == 1)
+    partner = np.full(2 * n, -1, dtype=np.int64)
+    partner[i[unique]] = j[unique]
+    partner[j[unique]] = i[unique]
+
+    visited = np.zeros(n, dtype=bool)
+    polylines = []
+    for start in range(n):
+        if visited[start]:
+            continue
+        # Walk backwards to the free end of the chain (or once around a loop)
+        entry = 2 * start
+        while partner[entry] >= 0:
+            previous = partner[entry]
+            if previous // 2 == start:
+                break
+            entry = previous ^ 1
+
+        vertices = [ends[entry]]
+        while True:
+            visited[entry // 2] = True
+            exit_end = entry ^ 1
+            following = partner[exit_end]
+            if following < 0 or visited[following // 2]:
+                vertices.append(ends[exit_end])
+                break
+            vertices.append((ends[exit_end] + ends[following]) / 2)
+            entry = following
+        polylines.append(np.array(vertices))
+    return polylines
+
+
+def douglas_peucker(points: np.ndarray, epsilon: float) -> np.ndarray:
+    """Boolean mask of the vertices kept by Douglas–Peucker with tolerance epsilon (pixels)."""
+    points = np.asarray(points, dtype=float)
+    keep = np.zeros(len(points), dtype=bool)
+    if len(points) <= 2:
+        keep[:] = True
+        return keep
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        inner = points[first + 1:last] - points[first]
+        chord = points[last] - points[first]
+        chord_length = np.hypot(*chord)
+        if chord_length > 0:
+            distance = np.abs(inner[:, 0] * chord[1] - inner[:, 1] * chord[0]) / chord_length
+        else:
+            # Closed loop: measure from the shared end point
+            distance = np.hypot(inner[:, 0], inner[:, 1])
+        k = int(np.argmax(distance))
+        if distance[k] > epsilon:
+            split = first + 1 + k
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return keep
+
+
+def polylines_to_segments(polylines: List[np.ndarray], epsilon: Optional[float] = None) -> np.ndarray:
+    """Polylines (optionally simplified with Douglas–Peucker) back to (N, 4) segments."""
+    segments = []
+    for vertices in polylines:
+        if epsilon:
+            vertices = vertices[douglas_peucker(vertices, epsilon)]
+        segments.append(np.hstack([vertices[:-1], vertices[1:]]))
+    return np.concatenate(segments) if segments else np.zeros((0, 4))
+
+
+def simplify_lines(
+    lines: np.ndarray,
+    dedupe_tol: float = 3.5,
+    angle_tol: float = 2.0,
+    distance_tol: float = 1.5,
+    gap_tol: float = 4.0,
+    chain_epsilon: Optional[float] = None,
+    join_tol: float = 1.5,
+) -> Tuple[np.ndarray, List[dict]]:
+    """
+    Runs the cleanup stages in order. Polyline chaining runs only when
+    chain_epsilon is given.
+
+    Returns:
+        (lines, stages): the simplified (N, 4) array and one
+        {"stage", "segments", "seconds"} dict per stage, starting with "input".
+    """
+    lines = np.asarray(lines, dtype=float).reshape(-1, 4)
+    stages = [{"stage": "input", "segments": len(lines), "seconds": 0.0}]
+
+    def run(name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        stages.append({"stage": name, "segments": len(result), "seconds": time.perf_counter() - start})
+        return result
+
+    lines = run("dedupe", remove_duplicates, lines, dedupe_tol)
+    lines = run("merge", merge_collinear, lines, angle_tol, distance_tol, gap_tol)
+    if chain_epsilon is not None:
+        lines = run("chain", lambda: polylines_to_segments(chain_polylines(lines, join_tol), chain_epsilon))
+    return lines, stages
+
+
+def format_stages(stages: List[dict]) -> str:
+    """One line per stage: name, segment count and time."""
+    return "\n".join(
+        f"{stage['stage']:>8}: {stage['segments']:>8} segments  {stage['seconds'] * 1000:8.1f} ms" for stage in stages
+    )
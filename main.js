@@ -36,17 +36,24 @@ let angle = 0; // The main variable controlled by the slider
 // --- Helper Functions ---
 function createLine(points, color = 0xffffff) {
     const material = new THREE.LineBasicMaterial({ color: color });
-    // The points are already in the correct format [[x,y,z], [x,y,z], ...]
-    // We need to flatten the array and create a BufferAttribute.
+    // The points are either a flat Float32Array [x,y,z, x,y,z, ...] from scene_data.bin,
+    // used as is, or [[x,y,z], [x,y,z], ...] that we flatten into one.
     const geometry = new THREE.BufferGeometry();
-    const vertices = new Float32Array(points.flat());
+    const vertices = ArrayBuffer.isView(points) ? points : new Float32Array(points.flat());
     geometry.setAttribute('position', new THREE.BufferAttribute(vertices, 3));
     return new THREE.Line(geometry, material);
 }
 
+// scene_data.bin (see scene_binary.js), then scene_data.json.
+async function loadSceneData() {
+    const scene = await loadSceneBinary('scene_data.bin');
+    if (scene) return scene;
+    const response = await fetch('scene_data.json');
+    return response.json();
+}
+
 // --- Load Scene Data and Initialize ---
-fetch('scene_data.json')
-    .then(response => response.json())
+loadSceneData()
     .then(data => {
         sceneData = data;
         drawStaticScene(data);
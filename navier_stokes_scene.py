@@ -1,7 +1,23 @@
 
 from manim import *
-
-class NavierStokesScene(Scene):
+from fluid_image import FluidImage
+from fluid_solver import StableFluids
+from particle_field import ParticleField
+from particle_system import ParticleSystem, vortex
+from section_render import SectionCheckpointMixin
+from segment_cache import install_segment_cache
+from tex_cache import install_tex_cache
+
+# 이 모듈의 수식을 공유 캐시에 한 번에 컴파일
+install_tex_cache(__file__)
+# play() 세그먼트를 호출 위치가 아닌 화면 내용으로 캐시
+install_segment_cache()
+
+# 항별 구간의 유체 패널: 설명 문구 아래 8 x 3.5 영역, 정사각형 칸
+PANEL = dict(shape=(112, 256), x_range=(-4, 4), y_range=(-3.5, 0))
+
+# 항별 구간은 서로 독립이라 section_render.py로 동시에 렌더링할 수 있음
+class NavierStokesScene(SectionCheckpointMixin, Scene):
     def construct(self):
         # 1. Intro
         title = Tex("Navier-Stokes Equation", font_size=60)
@@ -43,114 +59,141 @@ class NavierStokesScene(Scene):
         self.play(Write(eq_full))
         self.wait(1)
 
-        # Time Derivative
+        # Time Derivative: a steady push accelerates a band of fluid (du/dt = f)
+        self.checkpoint("time_derivative")
         self.play(eq_full[0].animate.set_color(YELLOW))
         term_explanation = terms[0].next_to(eq_full, DOWN, buff=1)
         arrow = Arrow(eq_full[0].get_bottom(), term_explanation.get_top(), buff=0.2)
-        dot = Dot(point=LEFT*2, radius=0.1, color=BLUE)
-        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(dot))
-        self.play(dot.animate.shift(RIGHT*4).set_color(RED), rate_func=smooth, run_time=2)
+        fluid = StableFluids(**PANEL)
+        X, Y = fluid.grid()
+        fluid.dye[...] = np.sin(2 * PI * X) > 0
+        fluid.body_force[..., 0] = 0.8 * np.exp(-((Y + 1.75) / 0.6) ** 2)
+        panel = FluidImage(fluid, colors=(BLACK, BLUE), running=False)
+        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(panel))
+        panel.start()
+        self.wait(3)
+        panel.stop()
         self.wait(1)
-        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(dot))
+        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(panel))
         self.play(eq_full[0].animate.set_color(WHITE))
 
 
-        # Convection
+        # Convection: a shear layer carries its own velocity along and rolls up
+        self.checkpoint("convection")
         self.play(eq_full[1].animate.set_color(YELLOW))
         term_explanation = terms[1].next_to(eq_full, DOWN, buff=1)
         arrow = Arrow(eq_full[1].get_bottom(), term_explanation.get_top(), buff=0.2)
-        pipe = VGroup(
-            Line(LEFT*4 + UP, RIGHT*4 + UP),
-            Line(LEFT*4 + DOWN, LEFT*1 + DOWN),
-            Line(LEFT*1 + DOWN, LEFT*1 + DOWN*1.5),
-            Line(RIGHT*1 + DOWN*1.5, RIGHT*1 + DOWN),
-            Line(RIGHT*1 + DOWN, RIGHT*4 + DOWN)
-        )
-        dots = VGroup(*[Dot(point=LEFT*4 + (UP*0.8 - UP*i*0.4), radius=0.1, color=BLUE) for i in range(5)])
-        self.play(FadeIn(term_explanation), Create(arrow), Create(pipe))
-        self.play(dots.animate.shift(RIGHT*3).scale(0.8), run_time=2)
-        self.play(dots.animate.shift(RIGHT*2).scale(1.5), run_time=1)
-        self.play(dots.animate.shift(RIGHT*3).scale(1), run_time=2)
+        fluid = StableFluids(**PANEL)
+        X, Y = fluid.grid()
+        fluid.velocity[..., 0] = np.tanh((0.9 - np.abs(Y + 1.75)) / 0.08)
+        fluid.velocity[..., 1] = 0.1 * np.sin(PI * X)
+        fluid.dye[...] = np.abs(Y + 1.75) < 0.9
+        panel = FluidImage(fluid, colors=(BLACK, BLUE, WHITE), running=False)
+        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(panel))
+        panel.start()
+        self.wait(5)
+        panel.stop()
         self.wait(1)
-        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(pipe), FadeOut(dots))
+        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(panel))
         self.play(eq_full[1].animate.set_color(WHITE))
 
-        # Pressure
+        # Pressure: two jets collide, pressure builds between them and turns the flow aside
+        self.checkpoint("pressure")
         self.play(eq_full[2].animate.set_color(YELLOW))
         term_explanation = terms[2].next_to(eq_full, DOWN, buff=1)
         arrow = Arrow(eq_full[2].get_bottom(), term_explanation.get_top(), buff=0.2)
-        
-        pressure_rect = Rectangle(height=3, width=6).set_fill(color=[RED, BLUE], opacity=0.5)
-        high_pressure = Tex("High P", font_size=36).move_to(LEFT*4)
-        low_pressure = Tex("Low P", font_size=36).move_to(RIGHT*4)
-        dots = VGroup(*[Dot(point=LEFT*2.5 + (UP*1 - UP*i*0.5), radius=0.1, color=WHITE) for i in range(5)])
-        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(pressure_rect), FadeIn(high_pressure), FadeIn(low_pressure), FadeIn(dots))
-        self.play(dots.animate.shift(RIGHT*5), run_time=3)
+        fluid = StableFluids(**PANEL)
+        fluid.add_body_force((-2.5, -1.75), 0.4, (3, 0)).add_body_force((2.5, -1.75), 0.4, (-3, 0))
+        panel = FluidImage(fluid, "pressure", colors=(BLUE, BLACK, RED), vmin=-0.8, vmax=0.8, running=False)
+        tracers = ParticleField(
+            ParticleSystem.random_box(3000, (-4, -3.5, 0), (4, 0, 0), seed=2)
+            .add_flow(fluid.flow()).wrap_to((-4, -3.5), (4, 0)),
+            stroke_width=2, running=False,
+        )
+        high_pressure = Tex("High P", font_size=36, color=RED).next_to(panel, DOWN, buff=0.1).shift(LEFT*3)
+        low_pressure = Tex("Low P", font_size=36, color=BLUE).next_to(panel, DOWN, buff=0.1).shift(RIGHT*3)
+        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(panel), FadeIn(high_pressure), FadeIn(low_pressure), tracers.fade_in())
+        panel.start()
+        tracers.start()
+        self.wait(4)
+        panel.stop()
+        tracers.stop()
         self.wait(1)
-        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(pressure_rect), FadeOut(high_pressure), FadeOut(low_pressure), FadeOut(dots))
+        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(panel), FadeOut(high_pressure), FadeOut(low_pressure), tracers.fade_out())
+        self.remove(tracers)
         self.play(eq_full[2].animate.set_color(WHITE))
 
-        # Viscosity
+        # Viscosity: the same vortex in honey and in water
+        self.checkpoint("viscosity")
         self.play(eq_full[3].animate.set_color(YELLOW))
         term_explanation = terms[3].next_to(eq_full, DOWN, buff=1)
         arrow = Arrow(eq_full[3].get_bottom(), term_explanation.get_top(), buff=0.2)
-        
-        honey = Rectangle(height=3, width=3, color=YELLOW, fill_opacity=0.5).move_to(LEFT*2)
-        water = Rectangle(height=3, width=3, color=BLUE, fill_opacity=0.5).move_to(RIGHT*2)
+
+        panels = []
+        for center_x, viscosity, color in ((-2, 0.2, YELLOW), (2, 0.0, BLUE)):
+            fluid = StableFluids((96, 96), x_range=(center_x - 1.5, center_x + 1.5), y_range=(-3.25, -0.25),
+                                 viscosity=viscosity)
+            X, Y = fluid.grid()
+            x, y = X - center_x, Y + 1.75
+            swirl = 3 * np.exp(-(x ** 2 + y ** 2))
+            fluid.velocity[..., 0] = -y * swirl
+            fluid.velocity[..., 1] = x * swirl
+            fluid.dye[...] = np.sin(2 * PI * Y / 0.75) > 0
+            panels.append(FluidImage(fluid, colors=(BLACK, color), running=False))
+        honey, water = panels
         honey_label = Tex("High Viscosity").next_to(honey, DOWN)
         water_label = Tex("Low Viscosity").next_to(water, DOWN)
-        
-        sphere_honey = Sphere(radius=0.2, color=RED).move_to(LEFT*2 + UP*1)
-        sphere_water = Sphere(radius=0.2, color=RED).move_to(RIGHT*2 + UP*1)
 
-        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(honey), FadeIn(water), FadeIn(honey_label), FadeIn(water_label), FadeIn(sphere_honey), FadeIn(sphere_water))
-        self.play(sphere_honey.animate.shift(DOWN*2), run_time=4)
-        self.play(sphere_water.animate.shift(DOWN*2), run_time=1)
+        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(honey), FadeIn(water), FadeIn(honey_label), FadeIn(water_label))
+        honey.start()
+        water.start()
+        self.wait(4)
+        honey.stop()
+        water.stop()
         self.wait(1)
-        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(honey), FadeOut(water), FadeOut(honey_label), FadeOut(water_label), FadeOut(sphere_honey), FadeOut(sphere_water))
+        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(honey), FadeOut(water), FadeOut(honey_label), FadeOut(water_label))
         self.play(eq_full[3].animate.set_color(WHITE))
 
-        # External Forces
+        # External Forces: gravity pulls a dense blob down through a closed tank
+        self.checkpoint("external_forces")
         self.play(eq_full[4].animate.set_color(YELLOW))
         term_explanation = terms[4].next_to(eq_full, DOWN, buff=1)
         arrow = Arrow(eq_full[4].get_bottom(), term_explanation.get_top(), buff=0.2)
-        
-        dots = VGroup(*[Dot(point=np.random.rand(3)*4-2, radius=0.1, color=BLUE) for i in range(20)])
-        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(dots))
-        self.play(dots.animate.shift(DOWN*3), run_time=2)
+
+        fluid = StableFluids((112, 160), x_range=(-2.5, 2.5), y_range=(-3.5, 0), boundary="walls", buoyancy=-4)
+        fluid.splat((0, -0.8), 0.45, dye=1.0)
+        panel = FluidImage(fluid, colors=(BLACK, BLUE, WHITE), running=False)
+        tank = Rectangle(width=5, height=3.5, color=WHITE, stroke_width=2).move_to(panel)
+        self.play(FadeIn(term_explanation), Create(arrow), FadeIn(panel), Create(tank))
+        panel.start()
+        self.wait(4)
+        panel.stop()
         self.wait(1)
-        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(dots))
+        self.play(FadeOut(term_explanation), FadeOut(arrow), FadeOut(panel), FadeOut(tank))
         self.play(eq_full[4].animate.set_color(WHITE))
 
         # 3. Outro
+        self.checkpoint("outro")
         self.play(FadeOut(eq_full))
         
         outro_text = Tex("These terms combine to create the beautiful motion of fluids", font_size=48)
         self.play(Write(outro_text))
         self.wait(2)
 
-        # Dynamic vortex animation
-        dots = VGroup(*[Dot(radius=0.05, color=BLUE).move_to(point) for point in self.get_vortex_points(200, 3)])
-        self.play(ReplacementTransform(outro_text, dots))
-        self.play(
-            Rotate(dots, angle=4*PI, about_point=ORIGIN, run_time=10, rate_func=linear),
-            dots.animate.scale(0.2).set_opacity(0)
+        # Dynamic vortex animation: 100k particles advected by a vortex that draws them inward
+        vortex_cloud = ParticleField(
+            ParticleSystem.spiral(100_000, max_radius=3, jitter=0.04, color=color_to_rgba(BLUE))
+            .add_flow(vortex(strength=2.5, core=0.3, inflow=0.4)),
+            running=False,
         )
+        self.play(FadeOut(outro_text), vortex_cloud.fade_in())
+        vortex_cloud.start()
+        self.play(vortex_cloud.fade_out(run_time=10, rate_func=linear))
+        vortex_cloud.stop()
+        self.remove(vortex_cloud)
         self.wait(1)
 
         final_text = Tex("Visualized with Manim", font_size=48)
         self.play(FadeIn(final_text))
         self.wait(2)
         self.play(FadeOut(final_text))
-
-    def get_vortex_points(self, n_points, max_radius=2):
-        return [
-            np.array([
-                r * np.cos(2 * PI * r / max_radius + 2 * PI * i / n_points),
-                r * np.sin(2 * PI * r / max_radius + 2 * PI * i / n_points),
-                0
-            ])
-            for i, r in enumerate(np.linspace(0.1, max_radius, n_points))
-        ]
-
-
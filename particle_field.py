@@ -0,0 +1,63 @@
+"""
+입자계 mobject
+particle_system.ParticleSystem을 PMobject 하나로 그립니다. 입자 배열이 곧 mobject의 points/rgbas라서
+cairo 카메라가 점 구름 전체를 배열 연산 한 번으로 픽셀에 찍습니다 (입자마다 Dot을 만들지 않음).
+씬에 추가되어 있는 동안 updater가 매 프레임 흐름장을 적분합니다.
+"""
+
+from manim import *
+
+from particle_system import ParticleSystem
+
+
+class ParticleField(PMobject):
+    """
+    ParticleSystem을 그리는 점 구름. stroke_width는 점 하나의 픽셀 두께입니다.
+    set_opacity는 배경색과 미리 섞은 색으로 표현합니다 (점 구름은 픽셀을 덮어쓰므로).
+    """
+
+    def __init__(self, system: ParticleSystem, stroke_width: float = 1, background=BLACK,
+                 running: bool = True, **kwargs):
+        super().__init__(stroke_width=stroke_width, **kwargs)
+        self.system = system
+        self.background = np.array(color_to_rgba(background))
+        self.opacity = 1.0
+        self.sync()
+        if running:
+            self.start()
+
+    def sync(self) -> "ParticleField":
+        """입자 배열을 points(참조, 복사 없음)와 rgbas에 반영"""
+        self.points = self.system.positions
+        self.rgbas = self.system.display_rgbas(self.background, self.opacity)
+        return self
+
+    def advance(self, dt: float) -> "ParticleField":
+        self.system.step(dt)
+        return self.sync()
+
+    def start(self) -> "ParticleField":
+        """updater로 매 프레임 적분 시작"""
+        system = self.system
+
+        # 흐름장 목록과 입자 속도를 기본값으로 쥐어 segment_cache 해시가 흐름장 인자(세기, 중심 등)와
+        # 관성 입자의 속도를 읽게 함 (속도 배열은 제자리에서 바뀌므로 해시할 때의 내용이 들어감)
+        def advance(mob, dt, fields=(system.flows, system.forces), velocities=system.velocities):
+            return mob.advance(dt)
+
+        self.stop()
+        return self.add_updater(advance)
+
+    def stop(self) -> "ParticleField":
+        return self.clear_updaters()
+
+    def set_opacity(self, opacity: float, family: bool = True) -> "ParticleField":
+        self.opacity = opacity
+        return self.sync()
+
+    def fade_out(self, **kwargs) -> Animation:
+        """입자가 계속 흐르는 동안 사라지는 애니메이션 (UpdateFromAlphaFunc은 updater를 멈추지 않음)"""
+        return UpdateFromAlphaFunc(self, lambda mob, alpha: mob.set_opacity(1 - alpha), **kwargs)
+
+    def fade_in(self, **kwargs) -> Animation:
+        return UpdateFromAlphaFunc(self, lambda mob, alpha: mob.set_opacity(alpha), **kwargs)
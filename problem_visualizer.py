@@ -5,7 +5,9 @@ AI-powered Coding Problem Visualizer with Manim
 
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
+from cached_tts_service import CachedTTSService
+from tree_widget import TreeWidget
+from cached_text import CachedText
 from typing import Dict, List, Tuple
 import json
 
@@ -22,15 +24,17 @@ class ProblemVisualizer:
     def generate_visualization(self) -> Dict:
         """문제 유형별로 시각화 데이터를 생성"""
         if self.problem_type == "array_hashmap":
-            return self._generate_two_sum_viz()
+            data = self._generate_two_sum_viz()
         elif self.problem_type == "tree_bfs":
-            return self._generate_tree_level_order_viz()
+            data = self._generate_tree_level_order_viz()
         elif self.problem_type == "dp":
-            return self._generate_dp_viz()
+            data = self._generate_dp_viz()
         elif self.problem_type == "sort":
-            return self._generate_sort_viz()
+            data = self._generate_sort_viz()
         else:
             raise ValueError(f"Unknown problem type: {self.problem_type}")
+        data["problem_type"] = self.problem_type  # trace_engine.compile_visualization에서 사용
+        return data
 
     def _generate_two_sum_viz(self) -> Dict:
         """Two Sum 문제 시각화 데이터"""
@@ -158,7 +162,7 @@ class TwoSumVisualization(VoiceoverScene):
     """Two Sum 문제 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 문제 제목
         title = Text("LeetCode 1번 - Two Sum", font_size=48, font="NanumGothic").to_edge(UP)
@@ -203,7 +207,7 @@ class TwoSumVisualization(VoiceoverScene):
                 with self.voiceover(text=f"첫 번째 요소 {num}을 확인합니다. 목표에서 {num}을 뺀 {complement}를 찾아야 합니다."):
                     self.play(array_elements[i].animate.set_color(YELLOW))
                     self.wait(0.5)
-                    new_hashmap_text = Text(f"HashMap: {{{num}: 0}}", font_size=28, font="NanumGothic").move_to(DOWN * 2)
+                    new_hashmap_text = CachedText(f"HashMap: {{{num}: 0}}", font_size=28, font="NanumGothic").move_to(DOWN * 2)
                     self.play(Transform(hashmap_label, new_hashmap_text))
                     hashmap[num] = i
                     self.wait(0.5)
@@ -215,7 +219,7 @@ class TwoSumVisualization(VoiceoverScene):
                     self.wait(0.5)
                     self.wait(1)
 
-                    result_text = Text(f"답: 인덱스 {hashmap[complement]}와 {i}", font_size=32, font="NanumGothic").move_to(ORIGIN)
+                    result_text = CachedText(f"답: 인덱스 {hashmap[complement]}와 {i}", font_size=32, font="NanumGothic").move_to(ORIGIN)
                     self.play(Write(result_text))
                     self.wait(1)
                     break
@@ -228,7 +232,7 @@ class BinaryTreeLevelOrderVisualization(VoiceoverScene):
     """Binary Tree Level Order Traversal 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 제목
         title = Text("LeetCode 102번 - Binary Tree Level Order", font_size=40, font="NanumGothic").to_edge(UP)
@@ -240,43 +244,24 @@ class BinaryTreeLevelOrderVisualization(VoiceoverScene):
 
         self.play(FadeOut(title), FadeOut(subtitle))
 
-        # 트리 구조 표현
+        # 트리 구조 표현 (레벨별 간선/노드/라벨 묶음)
+        tree = TreeWidget([3, 9, 20, None, None, 15, 7], radius=0.4, level_colors=[RED, BLUE, GREEN])
+        root, level_2, level_3 = tree.levels
+
         with self.voiceover(text="루트 노드 3부터 시작하여 각 레벨의 노드들을 순회합니다."):
-            # 루트
-            root = Circle(radius=0.4, color=RED).move_to(UP * 2)
-            root_label = Text("3", font_size=24, font="NanumGothic").move_to(UP * 2)
-            self.play(Create(root), Write(root_label))
+            self.play(Create(root[1]), Write(root[2]))
             self.wait(0.5)
 
         with self.voiceover(text="레벨 2의 노드들입니다."):
-            # 레벨 2
-            left_child = Circle(radius=0.4, color=BLUE).move_to(LEFT * 2 + UP * 0.5)
-            right_child = Circle(radius=0.4, color=BLUE).move_to(RIGHT * 2 + UP * 0.5)
-            left_label = Text("9", font_size=24, font="NanumGothic").move_to(LEFT * 2 + UP * 0.5)
-            right_label = Text("20", font_size=24, font="NanumGothic").move_to(RIGHT * 2 + UP * 0.5)
-
-            # 선
-            line_left = Line(root.get_center(), left_child.get_center(), color=WHITE)
-            line_right = Line(root.get_center(), right_child.get_center(), color=WHITE)
-
-            self.play(Create(line_left), Create(line_right))
-            self.play(Create(left_child), Create(right_child))
-            self.play(Write(left_label), Write(right_label))
+            self.play(Create(level_2[0]))
+            self.play(Create(level_2[1]))
+            self.play(Write(level_2[2]))
             self.wait(0.5)
 
         with self.voiceover(text="그리고 레벨 3의 노드들입니다."):
-            # 레벨 3
-            left_grandchild = Circle(radius=0.4, color=GREEN).move_to(RIGHT * 1.5 + DOWN * 1)
-            right_grandchild = Circle(radius=0.4, color=GREEN).move_to(RIGHT * 3.5 + DOWN * 1)
-            left_gc_label = Text("15", font_size=24, font="NanumGothic").move_to(RIGHT * 1.5 + DOWN * 1)
-            right_gc_label = Text("7", font_size=24, font="NanumGothic").move_to(RIGHT * 3.5 + DOWN * 1)
-
-            line_left_gc = Line(right_child.get_center(), left_grandchild.get_center(), color=WHITE)
-            line_right_gc = Line(right_child.get_center(), right_grandchild.get_center(), color=WHITE)
-
-            self.play(Create(line_left_gc), Create(line_right_gc))
-            self.play(Create(left_grandchild), Create(right_grandchild))
-            self.play(Write(left_gc_label), Write(right_gc_label))
+            self.play(Create(level_3[0]))
+            self.play(Create(level_3[1]))
+            self.play(Write(level_3[2]))
             self.wait(0.5)
 
         with self.voiceover(text="최종 결과는 [[3], [9, 20], [15, 7]]입니다."):
@@ -292,7 +277,7 @@ class DPMakeOneVisualization(VoiceoverScene):
     """1로 만들기 - DP 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 제목
         title = Text("백준 1463번 - 1로 만들기", font_size=44, font="NanumGothic").to_edge(UP)
@@ -341,7 +326,7 @@ class SortVisualization(VoiceoverScene):
     """수 정렬하기 - 버블 정렬 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 제목
         title = Text("백준 2750번 - 수 정렬하기", font_size=44, font="NanumGothic").to_edge(UP)
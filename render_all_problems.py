@@ -4,13 +4,29 @@
 4가지 문제의 Manim 애니메이션을 생성합니다.
 """
 
+import argparse
 import subprocess
 import os
 import sys
 from pathlib import Path
 
+from build_manifest import BuildManifest, output_path
+from render_scheduler import RenderJob, build_command, job_count, run_jobs, DEFAULT_REPORT_PATH
+from render_server import client_command_builder
+from scene_profiler import DEFAULT_PROFILE_DIR, print_ranking, profile_command_builder
+from tts_cache import prefetch_scenes
 
-def render_scene(scene_file: str, scene_class: str, quality: str = "medium_quality"):
+
+# 렌더링할 씬 목록: (파일명, 클래스명, 설명)
+SCENES_TO_RENDER = [
+    ("two_sum_visualization", "TwoSumVisualization", "Two Sum (배열/HashMap)"),
+    ("tree_level_order_visualization", "BinaryTreeLevelOrderVisualization", "Binary Tree Level Order (BFS)"),
+    ("dp_make_one_visualization", "DPMakeOneVisualization", "1로 만들기 (DP)"),
+    ("sort_visualization", "SortVisualization", "수 정렬하기 (정렬)"),
+]
+
+
+def render_scene(scene_file: str, scene_class: str, quality: str = "medium_quality", command_builder=build_command):
     """
     Manim 씬을 렌더링합니다.
 
@@ -18,17 +34,9 @@ def render_scene(scene_file: str, scene_class: str, quality: str = "medium_quali
         scene_file: Python 파일명 (확장자 제외)
         scene_class: 렌더링할 Scene 클래스명
         quality: 렌더링 품질 (l=low, m=medium, h=high, p=4k, k=8k)
+        command_builder: 실행할 명령어를 만드는 함수 (렌더링 서버 사용 시 submit 클라이언트)
     """
-    # Manim Community v0.19.0+ 포맷
-    quality_code = "l" if quality == "low_quality" else "m" if quality == "medium_quality" else "h"
-
-    cmd = [
-        "manim",
-        "render",
-        f"{scene_file}.py",
-        scene_class,
-        "-q", quality_code,
-    ]
+    cmd = command_builder(scene_file, scene_class, quality)
 
     print(f"\n{'='*60}")
     print(f"렌더링: {scene_file} - {scene_class}")
@@ -44,28 +52,102 @@ def render_scene(scene_file: str, scene_class: str, quality: str = "medium_quali
         return False
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="모든 코딩 문제 시각화를 렌더링합니다.")
+    parser.add_argument(
+        "-j", "--jobs", type=job_count, default=1,
+        help="동시에 실행할 렌더링 작업 수 (1: 순차 실행, auto: CPU 코어 수)",
+    )
+    parser.add_argument(
+        "-q", "--quality", default="medium_quality",
+        choices=["low_quality", "medium_quality", "high_quality"],
+        help="렌더링 품질",
+    )
+    parser.add_argument(
+        "--report", default=DEFAULT_REPORT_PATH,
+        help="병렬 실행 시 작성할 요약 리포트(JSON) 경로",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="입력이 바뀌지 않은 씬도 다시 렌더링",
+    )
+    parser.add_argument(
+        "--no-prefetch", action="store_true",
+        help="렌더링 전에 나레이션 음성을 미리 합성하지 않음",
+    )
+    parser.add_argument(
+        "--server", metavar="SOCKET",
+        help="manim 프로세스 대신 상주 렌더링 서버(render_server.py serve)로 작업을 보냄",
+    )
+    parser.add_argument(
+        "--profile", metavar="DIR", nargs="?", const=DEFAULT_PROFILE_DIR,
+        help=f"씬마다 프로파일(Chrome trace, 요약)을 DIR(기본: {DEFAULT_PROFILE_DIR})에 쓰고 끝에 느린 씬 순위 출력",
+    )
+    args = parser.parse_args(argv)
+    if args.profile and args.server:
+        parser.error("--profile은 --server와 함께 쓸 수 없습니다 (서버 프로세스는 계측되지 않음)")
+    return args
+
+
+def main(argv=None):
     """모든 시각화를 렌더링"""
-
-    # 렌더링할 씬 목록
-    scenes_to_render = [
-        ("two_sum_visualization", "TwoSumVisualization", "Two Sum (배열/HashMap)"),
-        ("tree_level_order_visualization", "BinaryTreeLevelOrderVisualization", "Binary Tree Level Order (BFS)"),
-        ("dp_make_one_visualization", "DPMakeOneVisualization", "1로 만들기 (DP)"),
-        ("sort_visualization", "SortVisualization", "수 정렬하기 (정렬)"),
-    ]
+    args = parse_args(argv)
+    scenes_to_render = SCENES_TO_RENDER
 
     print("\n" + "="*60)
     print("AI-Powered 코딩 문제 시각화 렌더링")
     print("="*60)
     print(f"총 {len(scenes_to_render)}개의 씬을 렌더링합니다.\n")
 
-    # 각 씬 렌더링
-    results = []
+    # 소스/에셋/품질이 그대로이고 MP4가 남아 있는 씬은 건너뜀
+    manifest = BuildManifest()
+    pending = []
+    skipped = []
     for file_name, class_name, description in scenes_to_render:
-        print(f"\n[{len(results)+1}/{len(scenes_to_render)}] {description}")
-        success = render_scene(file_name, class_name, quality="medium_quality")
-        results.append((description, success))
+        if not args.force and manifest.is_up_to_date(file_name, class_name, args.quality):
+            skipped.append(description)
+        else:
+            pending.append((file_name, class_name, description))
+    if skipped:
+        print(f"변경 없음, 건너뜀: {len(skipped)}개 (--force로 다시 렌더링)")
+
+    # 나레이션 음성을 미리 병렬 합성하여 렌더링 중에는 캐시만 읽도록 함
+    if pending and not args.no_prefetch:
+        summary = prefetch_scenes(f"{file_name}.py" for file_name, _, _ in pending)
+        print(f"나레이션 프리페치: 캐시 {summary['cached']}, 합성 {summary['synthesized']}, "
+              f"실패 {len(summary['failed'])}")
+
+    command_builder = client_command_builder(args.server) if args.server else build_command
+    if args.profile:
+        command_builder = profile_command_builder(command_builder, args.profile)
+
+    rendered = []
+    if args.jobs == 1:
+        # 각 씬을 하나씩 렌더링 (출력은 콘솔로)
+        for file_name, class_name, description in pending:
+            print(f"\n[{len(rendered)+1}/{len(pending)}] {description}")
+            success = render_scene(file_name, class_name, quality=args.quality, command_builder=command_builder)
+            rendered.append((file_name, class_name, description, success))
+    elif pending:
+        # 여러 씬을 동시에 렌더링 (출력은 작업별 로그로)
+        jobs = [
+            RenderJob(file_name, class_name, args.quality, description)
+            for file_name, class_name, description in pending
+        ]
+        job_results = run_jobs(jobs, max_workers=args.jobs, report_path=args.report,
+                               command_builder=command_builder)
+        rendered = [(r["file"], r["class"], r["description"], r["success"]) for r in job_results]
+        print(f"\n리포트: {args.report}")
+
+    for file_name, class_name, _, success in rendered:
+        if success:
+            manifest.record(file_name, class_name, args.quality)
+    manifest.save()
+
+    status_by_description = {description: "skipped" for description in skipped}
+    for _, _, description, success in rendered:
+        status_by_description[description] = success
+    results = [(description, status_by_description[description]) for _, _, description in scenes_to_render]
 
     # 결과 요약
     print("\n" + "="*60)
@@ -74,20 +156,22 @@ def main():
 
     success_count = 0
     for description, success in results:
-        status = "✓ 성공" if success else "✗ 실패"
+        status = "- 건너뜀" if success == "skipped" else "✓ 성공" if success else "✗ 실패"
         print(f"{status}: {description}")
         if success:
             success_count += 1
 
     print(f"\n총 {success_count}/{len(results)} 완료")
 
+    if args.profile and rendered:
+        print(f"\n느린 씬 순위 ({args.profile}):")
+        print_ranking(args.profile)
+
     if success_count == len(results):
         print("\n🎉 모든 시각화 렌더링이 완료되었습니다!")
         print("\n생성된 비디오 파일:")
-        print("  - media/videos/two_sum_visualization/medium_quality/TwoSumVisualization.mp4")
-        print("  - media/videos/tree_level_order_visualization/medium_quality/BinaryTreeLevelOrderVisualization.mp4")
-        print("  - media/videos/dp_make_one_visualization/medium_quality/DPMakeOneVisualization.mp4")
-        print("  - media/videos/sort_visualization/medium_quality/SortVisualization.mp4")
+        for file_name, class_name, _ in scenes_to_render:
+            print(f"  - {output_path(file_name, class_name, args.quality)}")
         return 0
     else:
         print("\n⚠️  일부 시각화 렌더링에 실패했습니다.")
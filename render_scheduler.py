@@ -0,0 +1,216 @@
+"""
+Manim 렌더링 작업 스케줄러
+여러 씬 렌더링을 동시에 실행하고 작업별 로그와 리포트를 남깁니다.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+DEFAULT_LOG_DIR = "media/render_logs"
+DEFAULT_HISTORY_PATH = "media/render_history.json"
+DEFAULT_REPORT_PATH = "media/render_report.json"
+
+
+def quality_code(quality: str) -> str:
+    """품질 이름을 manim `-q` 플래그로 변환 (low/medium 외에는 high)"""
+    return "l" if quality == "low_quality" else "m" if quality == "medium_quality" else "h"
+
+
+def build_command(scene_file: str, scene_class: str, quality: str) -> List[str]:
+    """manim render 명령어 생성 (Manim Community v0.19.0+ 포맷)"""
+    return [
+        "manim",
+        "render",
+        f"{scene_file}.py",
+        scene_class,
+        "-q", quality_code(quality),
+    ]
+
+
+def job_count(value: str) -> Optional[int]:
+    """`-j` 인자 파싱: 1 이상의 정수, 또는 CPU 코어 수를 뜻하는 "auto"(None)"""
+    if value == "auto":
+        return None
+    try:
+        count = int(value)
+    except ValueError:
+        count = 0
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"1 이상의 정수 또는 auto여야 합니다: {value!r}")
+    return count
+
+
+class RenderJob:
+    """렌더링 작업 하나 (파일, 씬 클래스, 품질)"""
+
+    def __init__(self, scene_file: str, scene_class: str, quality: str = "medium_quality", description: str = ""):
+        self.scene_file = scene_file
+        self.scene_class = scene_class
+        self.quality = quality
+        self.description = description or f"{scene_file} - {scene_class}"
+
+    @property
+    def key(self) -> str:
+        """이력/리포트에서 작업을 식별하는 키"""
+        return f"{self.scene_file}:{self.scene_class}:{self.quality}"
+
+    @property
+    def log_name(self) -> str:
+        return f"{self.scene_file}.{self.scene_class}.{self.quality}.log"
+
+
+def load_history(history_path: str) -> Dict[str, float]:
+    """이전 실행의 작업별 소요 시간(초)을 읽음. 파일이 없거나 깨졌으면 빈 dict"""
+    try:
+        with open(history_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return {key: float(value) for key, value in data.items()}
+
+
+def order_jobs(jobs: List[RenderJob], history: Dict[str, float]) -> List[RenderJob]:
+    """
+    오래 걸리는 작업부터 시작하도록 정렬합니다.
+    이력이 없는 작업은 길이를 알 수 없으므로 가장 먼저 시작합니다.
+    """
+    def sort_key(indexed):
+        index, job = indexed
+        return (-history.get(job.key, float("inf")), index)
+
+    return [job for _, job in sorted(enumerate(jobs), key=sort_key)]
+
+
+def _write_json(path: str, data, indent: Optional[int] = 2) -> None:
+    """임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 파일이 깨지지 않게 함 (indent=None: 한 줄로)"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(tmp_path, path)
+
+
+def _run_and_measure(cmd: List[str], log_path: Path) -> Dict:
+    """
+    명령어를 실행하고 stdout/stderr를 로그 파일로 흘려보냅니다.
+    POSIX에서는 wait4()로 자식 프로세스의 CPU 시간과 최대 RSS를 측정합니다.
+    """
+    cpu_time = None
+    peak_rss_kb = None
+    start = time.perf_counter()
+    with open(log_path, "wb") as log:
+        log.write(f"$ {' '.join(cmd)}\n".encode("utf-8"))
+        log.flush()
+        try:
+            proc = subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT)
+        except OSError as e:
+            log.write(f"{e}\n".encode("utf-8"))
+            return {"returncode": None, "wall_time": time.perf_counter() - start,
+                    "cpu_time": None, "peak_rss_kb": None}
+
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            cpu_time = usage.ru_utime + usage.ru_stime
+            # macOS는 바이트, Linux는 KB 단위
+            peak_rss_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+        else:
+            proc.wait()
+
+    return {
+        "returncode": proc.returncode,
+        "wall_time": time.perf_counter() - start,
+        "cpu_time": cpu_time,
+        "peak_rss_kb": peak_rss_kb,
+    }
+
+
+def run_job(job: RenderJob, log_dir: str = DEFAULT_LOG_DIR,
+            command_builder: Callable[[str, str, str], List[str]] = build_command) -> Dict:
+    """작업 하나를 실행하고 결과(리포트 항목)를 반환"""
+    log_path = Path(log_dir) / job.log_name
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    cmd = command_builder(job.scene_file, job.scene_class, job.quality)
+    measured = _run_and_measure(cmd, log_path)
+
+    return {
+        "file": job.scene_file,
+        "class": job.scene_class,
+        "quality": job.quality,
+        "description": job.description,
+        "success": measured["returncode"] == 0,
+        "log": str(log_path),
+        **measured,
+    }
+
+
+def run_jobs(
+    jobs: List[RenderJob],
+    max_workers: Optional[int] = None,
+    log_dir: str = DEFAULT_LOG_DIR,
+    history_path: str = DEFAULT_HISTORY_PATH,
+    report_path: Optional[str] = DEFAULT_REPORT_PATH,
+    command_builder: Callable[[str, str, str], List[str]] = build_command,
+) -> List[Dict]:
+    """
+    렌더링 작업들을 동시에 실행합니다.
+
+    각 작업은 별도의 manim 프로세스이므로 스레드는 자식 프로세스를 기다리는
+    역할만 합니다. 결과는 입력 순서대로 반환되며, 성공한 작업의 소요 시간은
+    다음 실행의 정렬을 위해 history_path에 기록됩니다.
+
+    Args:
+        jobs: 렌더링 작업 목록
+        max_workers: 동시에 실행할 작업 수 (None이면 CPU 코어 수)
+        log_dir: 작업별 로그 디렉터리
+        history_path: 작업별 소요 시간 이력 파일
+        report_path: 요약 리포트(JSON) 경로, None이면 작성하지 않음
+        command_builder: (파일, 클래스, 품질)로 실행할 명령어를 만드는 함수
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    history = load_history(history_path)
+    position = {id(job): index for index, job in enumerate(jobs)}
+    ordered = order_jobs(jobs, history)
+
+    started_at = time.time()
+    start = time.perf_counter()
+    results: List[Optional[Dict]] = [None] * len(jobs)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(run_job, job, log_dir, command_builder): job
+            for job in ordered
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            job = futures[future]
+            result = future.result()
+            results[position[id(job)]] = result
+            status = "✓" if result["success"] else "✗"
+            print(f"[{done}/{len(jobs)}] {status} {job.description} "
+                  f"({result['wall_time']:.1f}s, 로그: {result['log']})")
+
+    for job, result in zip(jobs, results):
+        if result["success"]:
+            history[job.key] = round(result["wall_time"], 3)
+    _write_json(history_path, history)
+
+    if report_path:
+        _write_json(report_path, {
+            "started_at": started_at,
+            "wall_time": time.perf_counter() - start,
+            "max_workers": max_workers,
+            "succeeded": sum(1 for r in results if r["success"]),
+            "failed": sum(1 for r in results if not r["success"]),
+            "jobs": results,
+        })
+
+    return results
@@ -0,0 +1,428 @@
+"""
+상주 렌더링 서버 (warm worker pool)
+manim, manim_voiceover, numpy, cv2를 미리 import한 forkserver에서 워커를 fork하여
+작업마다 `manim render` 프로세스를 새로 띄우는 시작 비용을 없앱니다.
+요청은 Unix 소켓으로 한 줄짜리 JSON(JSON-RPC 형태)을 주고받습니다.
+
+사용법:
+    python render_server.py serve -w 4 --max-jobs 20
+    python render_server.py submit two_sum_visualization TwoSumVisualization -q low_quality
+    python render_server.py stats
+    python render_server.py shutdown
+    python render_all_problems.py -j 4 --server media/render_server.sock
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import multiprocessing
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+DEFAULT_SOCKET_PATH = "media/render_server.sock"
+DEFAULT_LOG_DIR = "media/render_logs/server"
+DEFAULT_MAX_JOBS_PER_WORKER = 20
+DEFAULT_PRELOAD = ["numpy", "manim", "manim_voiceover", "cv2", "cached_tts_service"]
+WARM_FONTS = ["NanumGothic"]
+
+
+# --- 워커 프로세스 ---
+
+def _forget_local_modules(root: str) -> None:
+    """
+    root 아래의 모듈(씬 파일이 import하는 array_widget 등)을 sys.modules에서 지워
+    다음 작업이 수정된 소스를 다시 읽게 합니다. 다음 모듈은 그대로 둡니다.
+    - 미리 import한 라이브러리와 그 하위 모듈, root 아래 가상 환경(site-packages)의 패키지
+    - install_*()로 manim을 이미 감싼 모듈 (_installed가 채워짐): 다시 import하면 빈 _installed로
+      감싼 함수를 한 번 더 감싸서, 작업마다 래퍼가 겹겹이 쌓임 (소스를 바꿨다면 워커 교체 후 반영)
+    """
+    root = os.path.abspath(root)
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if not path or not os.path.abspath(path).startswith(root + os.sep):
+            continue
+        if name.partition(".")[0] in DEFAULT_PRELOAD or _is_installed_package(path) or getattr(module, "_installed", None):
+            continue
+        del sys.modules[name]
+
+
+def _is_installed_package(path: str) -> bool:
+    parts = Path(path).parts
+    return "site-packages" in parts or "dist-packages" in parts
+
+
+def render_in_process(job: Dict) -> str:
+    """워커 안에서 씬 하나를 렌더링하고 MP4 경로를 반환"""
+    from manim import tempconfig
+
+    path = job["module"] if job["module"].endswith(".py") else f"{job['module']}.py"
+    _forget_local_modules(os.getcwd())
+    settings = {
+        "input_file": path,
+        "quality": job.get("quality", "medium_quality"),
+        "scene_names": [job["scene_class"]],
+    }
+    if job.get("output"):
+        settings["output_file"] = job["output"]
+
+    with tempconfig(settings):
+        spec = importlib.util.spec_from_file_location(Path(path).stem, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        scene = getattr(module, job["scene_class"])()
+        scene.render()
+        return str(scene.renderer.file_writer.movie_file_path)
+
+
+def _warm_worker() -> None:
+    """fork 직후 한 번: 폰트 목록과 Pango 레이아웃을 데워 둠"""
+    try:
+        import manimpango
+        from manim import Text
+    except ImportError:
+        return
+    manimpango.list_fonts()
+    for font in WARM_FONTS:
+        Text("가0", font=font)
+
+
+def _usage():
+    if resource is None:
+        return None, None
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # macOS는 바이트, Linux는 KB 단위
+    peak_rss_kb = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return usage.ru_utime + usage.ru_stime, peak_rss_kb
+
+
+def _run_job(renderer: Callable[[Dict], str], job: Dict, log_dir: str) -> Dict:
+    """작업 하나를 실행. 워커의 stdout/stderr는 작업별 로그 파일로 돌림"""
+    log_path = Path(log_dir) / f"{job['module']}.{job['scene_class']}.{job.get('quality', 'medium_quality')}.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = os.dup(1), os.dup(2)
+    cpu_before, _ = _usage()
+    start = time.perf_counter()
+    output = None
+    error = None
+    with open(log_path, "wb") as log:
+        os.dup2(log.fileno(), 1)
+        os.dup2(log.fileno(), 2)
+        try:
+            output = renderer(job)
+        except BaseException as e:
+            traceback.print_exc()
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            os.close(saved[0])
+            os.close(saved[1])
+
+    # ru_maxrss는 줄어들지 않는 프로세스 평생 최댓값이라, 상주 워커에서는 이 작업이 아니라
+    # 지금까지 이 워커가 처리한 작업 전체의 최대 메모리임
+    cpu_after, worker_peak_rss_kb = _usage()
+    return {
+        "success": error is None,
+        "error": error,
+        "output": output,
+        "log": str(log_path),
+        "render_time": time.perf_counter() - start,
+        "cpu_time": None if cpu_before is None else cpu_after - cpu_before,
+        "worker_peak_rss_kb": worker_peak_rss_kb,
+        "worker_pid": os.getpid(),
+    }
+
+
+def _worker_main(conn, renderer, max_jobs: int, log_dir: str) -> None:
+    _warm_worker()
+    for _ in range(max_jobs):
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+        conn.send(_run_job(renderer, job, log_dir))
+    conn.close()
+
+
+# --- 서버 ---
+
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.jobs = 0
+
+
+class WorkerPool:
+    """
+    미리 import된 워커 프로세스 풀.
+    워커는 max_jobs_per_worker개의 작업을 처리하면 종료되고 새 워커로 교체되어
+    렌더링 중 쌓이는 메모리가 계속 늘어나지 않습니다.
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_jobs_per_worker: int = DEFAULT_MAX_JOBS_PER_WORKER,
+        log_dir: str = DEFAULT_LOG_DIR,
+        preload: Optional[List[str]] = None,
+        renderer: Callable[[Dict], str] = render_in_process,
+    ):
+        self.size = size
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.log_dir = log_dir
+        self.renderer = renderer
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context("forkserver")
+            # forkserver가 한 번만 import하고, 이후 워커는 여기서 fork되어 import 비용이 없음
+            self._context.set_forkserver_preload(_importable(DEFAULT_PRELOAD if preload is None else preload))
+        else:
+            self._context = multiprocessing.get_context("spawn")
+
+        self.stats = {"jobs": 0, "failed": 0, "recycled": 0, "busy_time": 0.0}
+        self._lock = threading.Lock()
+        self._idle = queue.Queue()
+        self._workers = []
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.renderer, self.max_jobs_per_worker, self.log_dir),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _retire(self, worker: _Worker) -> None:
+        try:
+            worker.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        worker.conn.close()
+        worker.process.join(timeout=10)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        with self._lock:
+            self._workers.remove(worker)
+
+    def submit(self, job: Dict) -> Dict:
+        """작업을 빈 워커에 보내고 결과를 기다림 (여러 스레드에서 동시에 호출 가능)"""
+        queued = time.perf_counter()
+        worker = self._idle.get()
+        queue_time = time.perf_counter() - queued
+        try:
+            worker.conn.send(job)
+            result = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            result = {"success": False, "error": f"worker {worker.process.pid} died: {e}", "output": None}
+            worker.jobs = self.max_jobs_per_worker
+        worker.jobs += 1
+
+        if worker.jobs >= self.max_jobs_per_worker:
+            self._retire(worker)
+            worker = self._spawn()
+            with self._lock:
+                self.stats["recycled"] += 1
+        self._idle.put(worker)
+
+        result["queue_time"] = queue_time
+        result["wall_time"] = time.perf_counter() - queued
+        with self._lock:
+            self.stats["jobs"] += 1
+            self.stats["failed"] += 0 if result["success"] else 1
+            self.stats["busy_time"] += result.get("render_time") or 0.0
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            self._retire(worker)
+
+
+def _importable(modules: List[str]) -> List[str]:
+    """설치되지 않은 선택 모듈(cv2 등)은 preload 목록에서 뺌"""
+    return [name for name in modules if importlib.util.find_spec(name) is not None]
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """연결 하나에서 요청 줄을 읽어 응답 줄을 씀"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            request_id = None
+            try:
+                request = json.loads(line)
+                request_id = request.get("id")
+                result = self.server.dispatch(request.get("method"), request.get("params") or {})
+                response = {"id": request_id, "result": result}
+            except Exception as e:
+                response = {"id": request_id, "error": {"message": f"{type(e).__name__}: {e}"}}
+            self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+            self.wfile.flush()
+
+
+class RenderServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix 소켓 렌더링 서버. 메서드:
+        render {module, scene_class, quality, output}: 렌더링 결과와 시간 측정값
+        stats: 처리한 작업 수, 실패 수, 교체된 워커 수
+        shutdown: 서버 종료
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, pool: Optional[WorkerPool] = None, **pool_options):
+        Path(socket_path).parent.mkdir(parents=True, exist_ok=True)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        self.socket_path = socket_path
+        self.pool = pool or WorkerPool(**pool_options)
+        self.started_at = time.time()
+        super().__init__(socket_path, _Handler)
+
+    def dispatch(self, method: str, params: Dict):
+        if method == "render":
+            for key in ("module", "scene_class"):
+                if key not in params:
+                    raise ValueError(f"render requires '{key}'")
+            result = self.pool.submit(params)
+            status = "✓" if result["success"] else "✗"
+            print(f"{status} {params['module']} - {params['scene_class']} "
+                  f"(대기 {result['queue_time']:.2f}s, 렌더링 {result.get('render_time') or 0:.2f}s)", flush=True)
+            return result
+        if method == "stats":
+            return {**self.pool.stats, "workers": self.pool.size, "uptime": time.time() - self.started_at}
+        if method == "shutdown":
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return {"ok": True}
+        raise ValueError(f"Unknown method: {method}")
+
+    def server_close(self):
+        super().server_close()
+        self.pool.close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+# --- 클라이언트 ---
+
+def call(method: str, params: Optional[Dict] = None, socket_path: str = DEFAULT_SOCKET_PATH,
+         timeout: Optional[float] = None):
+    """서버에 요청 하나를 보내고 result를 반환. 서버 오류는 RuntimeError"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        request = {"id": os.getpid(), "method": method, "params": params or {}}
+        sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    if not line:
+        raise RuntimeError("Render server closed the connection")
+    response = json.loads(line)
+    if "error" in response:
+        raise RuntimeError(response["error"]["message"])
+    return response["result"]
+
+
+def client_command_builder(socket_path: str = DEFAULT_SOCKET_PATH) -> Callable[[str, str, str], List[str]]:
+    """
+    render_scheduler.run_jobs의 command_builder 대체: manim 대신 가벼운 submit 클라이언트를 실행.
+    클라이언트는 manim을 import하지 않으므로 작업마다 드는 시작 비용은 파이썬 인터프리터뿐입니다.
+    """
+    script = os.path.abspath(__file__)
+
+    def build(scene_file: str, scene_class: str, quality: str) -> List[str]:
+        return [sys.executable, script, "submit", "--socket", socket_path, scene_file, scene_class, "-q", quality]
+
+    return build
+
+
+def _submit(args) -> int:
+    params = {"module": args.module, "scene_class": args.scene_class, "quality": args.quality}
+    if args.output:
+        params["output"] = args.output
+    result = call("render", params, args.socket)
+
+    # 워커 로그를 그대로 출력하여 run_jobs의 작업별 로그에 남김
+    try:
+        with open(result["log"], "r", encoding="utf-8", errors="replace") as f:
+            sys.stdout.write(f.read())
+    except (KeyError, OSError):
+        pass
+    print(json.dumps({key: value for key, value in result.items() if key != "log"}, ensure_ascii=False))
+    return 0 if result["success"] else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="미리 import된 워커로 manim 씬을 렌더링하는 상주 서버")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix 소켓 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="서버 실행")
+    serve.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    serve.add_argument("--max-jobs", type=int, default=DEFAULT_MAX_JOBS_PER_WORKER,
+                       help="워커 하나가 처리할 작업 수 (이후 새 워커로 교체)")
+    serve.add_argument("--log-dir", default=DEFAULT_LOG_DIR)
+
+    submit = sub.add_parser("submit", help="렌더링 작업 보내기")
+    submit.add_argument("--socket", default=argparse.SUPPRESS)
+    submit.add_argument("module", help="씬 파일 (확장자 제외 가능)")
+    submit.add_argument("scene_class")
+    submit.add_argument("-q", "--quality", default="medium_quality")
+    submit.add_argument("-o", "--output", help="출력 파일 이름")
+
+    sub.add_parser("stats", help="서버 통계")
+    sub.add_parser("shutdown", help="서버 종료")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        server = RenderServer(args.socket, size=args.workers, max_jobs_per_worker=args.max_jobs, log_dir=args.log_dir)
+        print(f"렌더링 서버: {args.socket} (워커 {args.workers}개, 워커당 {args.max_jobs}개 작업)", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+        return 0
+    if args.command == "submit":
+        return _submit(args)
+    print(json.dumps(call(args.command, socket_path=args.socket), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+씬 모듈 정적 분석 도구
+씬 파일을 실행하지 않고 AST로 나레이션, 폰트, 로컬 import를 추출합니다.
+"""
+
+import ast
+from pathlib import Path
+from typing import List, Optional, Set
+
+
+def parse_module(path) -> ast.Module:
+    """파이썬 파일을 읽어 AST로 변환"""
+    with open(path, "r", encoding="utf-8") as f:
+        return ast.parse(f.read(), filename=str(path))
+
+
+def _scope(tree: ast.Module, scene_class: Optional[str]) -> ast.AST:
+    """scene_class가 주어지면 해당 클래스 정의만, 아니면 모듈 전체를 반환"""
+    if scene_class is None:
+        return tree
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == scene_class:
+            return node
+    raise ValueError(f"Scene class not found: {scene_class}")
+
+
+def _keyword_strings(scope: ast.AST, keyword: str, method: Optional[str] = None) -> List[str]:
+    """
+    `keyword="..."` 형태로 전달된 문자열 리터럴을 소스 순서대로 모읍니다.
+    method가 주어지면 해당 이름의 메서드/함수 호출만 봅니다.
+    f-string처럼 실행해야 값을 알 수 있는 인자는 건너뜁니다.
+    """
+    values = []
+    for node in ast.walk(scope):
+        if not isinstance(node, ast.Call):
+            continue
+        if method is not None:
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+            if name != method:
+                continue
+        for kw in node.keywords:
+            if kw.arg == keyword and isinstance(kw.value, ast.Constant) and isinstance(kw.value.value, str):
+                values.append((kw.value.lineno, kw.value.col_offset, kw.value.value))
+    return [value for _, _, value in sorted(values)]
+
+
+def extract_narrations(path, scene_class: Optional[str] = None) -> List[str]:
+    """`self.voiceover(text="...")`의 나레이션 문자열 목록"""
+    return _keyword_strings(_scope(parse_module(path), scene_class), "text", method="voiceover")
+
+
+def extract_fonts(path, scene_class: Optional[str] = None) -> List[str]:
+    """`font="..."`로 지정된 폰트 이름(또는 경로) 목록, 중복 제거"""
+    fonts = _keyword_strings(_scope(parse_module(path), scene_class), "font")
+    return list(dict.fromkeys(fonts))
+
+
+# 수식을 다르게 조판하게 만들어 정적으로 재현할 수 없는 인자
+_TEX_UNSUPPORTED_KEYWORDS = {"substrings_to_isolate", "tex_to_color_map", "tex_template", "isolate"}
+
+
+def extract_tex(path, scene_class: Optional[str] = None) -> List[dict]:
+    """
+    `Tex(...)`, `MathTex(...)` 호출 중 인자가 모두 문자열 리터럴인 것.
+    {"kind", "strings", "arg_separator", "tex_environment"} 목록을 소스 순서대로 반환하며,
+    arg_separator/tex_environment는 리터럴로 지정된 경우에만 들어 있습니다.
+    """
+    calls = []
+    for node in ast.walk(_scope(parse_module(path), scene_class)):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        kind = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if kind not in ("Tex", "MathTex") or not node.args:
+            continue
+        if not all(isinstance(arg, ast.Constant) and isinstance(arg.value, str) for arg in node.args):
+            continue
+        entry = {"kind": kind, "strings": [arg.value for arg in node.args]}
+        supported = True
+        for kw in node.keywords:
+            if kw.arg in _TEX_UNSUPPORTED_KEYWORDS or kw.arg is None:
+                supported = False
+            elif kw.arg in ("arg_separator", "tex_environment"):
+                if isinstance(kw.value, ast.Constant) and (kw.value.value is None or isinstance(kw.value.value, str)):
+                    entry[kw.arg] = kw.value.value
+                else:
+                    supported = False
+        # "{{ }}"는 MathTex가 부분 문자열로 나누므로 조판되는 식이 달라짐
+        if supported and not any("{{" in string for string in entry["strings"]):
+            calls.append((node.lineno, node.col_offset, entry))
+    return [entry for _, _, entry in sorted(calls, key=lambda call: call[:2])]
+
+
+# Text() 기본값 (manim.constants의 DEFAULT_FONT_SIZE, NORMAL)
+TEXT_DEFAULTS = {"font": "", "font_size": 48.0, "weight": "NORMAL"}
+_WEIGHT_NAMES = {"THIN", "ULTRALIGHT", "LIGHT", "SEMILIGHT", "BOOK", "NORMAL", "MEDIUM",
+                 "SEMIBOLD", "BOLD", "ULTRABOLD", "HEAVY", "ULTRAHEAVY"}
+
+
+def _module_constants(tree: ast.Module) -> dict:
+    """모듈 최상위의 `NAME = 리터럴` 대입 (FONT = "NanumGothic" 등)"""
+    constants = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    constants[target.id] = node.value.value
+    return constants
+
+
+def _literal(node: ast.AST, constants: dict):
+    """리터럴이나 모듈 상수/굵기 상수 이름의 값. 정적으로 알 수 없으면 None"""
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id in constants:
+            return constants[node.id]
+        if node.id in _WEIGHT_NAMES:
+            return node.id
+    return None
+
+
+def extract_text(path, scene_class: Optional[str] = None) -> List[dict]:
+    """
+    `Text(...)`, `CachedText(...)` 호출의 글자 정보.
+    {"strings", "dynamic", "font", "font_size", "weight"} 목록을 소스 순서대로 반환합니다.
+    f-string은 고정된 부분만 strings에 담고 dynamic을 True로 표시하며,
+    font/font_size/weight를 정적으로 알 수 없는 호출은 건너뜁니다.
+    """
+    tree = parse_module(path)
+    constants = _module_constants(tree)
+    calls = []
+    for node in ast.walk(_scope(tree, scene_class)):
+        if not isinstance(node, ast.Call) or not node.args:
+            continue
+        func = node.func
+        kind = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+        if kind not in ("Text", "CachedText"):
+            continue
+        arg = node.args[0]
+        if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+            entry = {"strings": [arg.value], "dynamic": False}
+        elif isinstance(arg, ast.JoinedStr):
+            parts = [value.value for value in arg.values if isinstance(value, ast.Constant)]
+            entry = {"strings": parts, "dynamic": True}
+        else:
+            continue
+        entry.update(TEXT_DEFAULTS)
+        resolved = True
+        for kw in node.keywords:
+            if kw.arg in TEXT_DEFAULTS:
+                value = _literal(kw.value, constants)
+                if value is None or (kw.arg == "font_size" and not isinstance(value, (int, float))):
+                    resolved = False
+                else:
+                    entry[kw.arg] = float(value) if kw.arg == "font_size" else value
+        if resolved:
+            calls.append((node.lineno, node.col_offset, entry))
+    return [entry for _, _, entry in sorted(calls, key=lambda call: call[:2])]
+
+
+def _imported_names(tree: ast.Module) -> Set[str]:
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def local_imports(path, root=None) -> List[Path]:
+    """
+    씬 파일이 (간접적으로) import하는 저장소 내부 모듈 파일 목록.
+    root 디렉터리에 `<이름>.py`가 있는 import만 따라갑니다.
+    """
+    path = Path(path).resolve()
+    root = Path(root).resolve() if root is not None else path.parent
+    seen = {path}
+    found = []
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        for name in sorted(_imported_names(parse_module(current))):
+            candidate = root / f"{name}.py"
+            if candidate.exists() and candidate.resolve() not in seen:
+                seen.add(candidate.resolve())
+                found.append(candidate)
+                stack.append(candidate.resolve())
+    return sorted(found)
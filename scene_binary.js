@@ -0,0 +1,71 @@
+// Reader for scene_binary.py files (scene_data.bin, web_export.py output).
+// "MSD1" | uint32 header length | header JSON | 4-byte aligned little-endian blocks.
+// Every block decodes to a flat Float32Array of x,y,z triples.
+function decodePoints(spec, buffer, base) {
+    const { count, components, encoding } = spec;
+    const start = base + spec.offset;
+    const n = count * components;
+    if (encoding === 'float32' && components === 3) {
+        return new Float32Array(buffer, start, n); // No copy at all
+    }
+    const values = encoding === 'float32' ? new Float32Array(buffer, start, n)
+        : encoding === 'quantized' ? new Uint16Array(buffer, start, n)
+        : new Int32Array(buffer, start, n);
+    const points = new Float32Array(count * 3);
+    const running = [0, 0, 0];
+    for (let i = 0; i < count; i++) {
+        for (let c = 0; c < components; c++) {
+            let v = values[i * components + c];
+            if (encoding === 'quantized') {
+                v = spec.origin[c] + v * spec.step[c];
+            } else if (encoding === 'delta') {
+                running[c] += v;
+                v = spec.origin[c] + running[c] * spec.step[c];
+            }
+            points[i * 3 + c] = v;
+        }
+        if (components === 2) points[i * 3 + 2] = spec.z;
+    }
+    return points;
+}
+
+function unpackScene(buffer) {
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== 'MSD1') throw new Error('Not a scene_data.bin file');
+    const headerLength = new DataView(buffer).getUint32(4, true);
+    const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 8, headerLength)));
+    const base = 8 + headerLength;
+    const arrays = header.arrays.map(spec => decodePoints(spec, buffer, base));
+    const resolve = node => {
+        if (Array.isArray(node)) return node.map(resolve);
+        if (node === null || typeof node !== 'object') return node;
+        if ('$array' in node) return arrays[node.$array];
+        return Object.fromEntries(Object.entries(node).map(([key, value]) => [key, resolve(value)]));
+    };
+    return resolve(header.scene);
+}
+
+async function fetchBuffer(url, gzipped = false) {
+    const response = await fetch(url);
+    if (!response.ok) return null;
+    if (gzipped) {
+        return new Response(response.body.pipeThrough(new DecompressionStream('gzip'))).arrayBuffer();
+    }
+    return response.arrayBuffer();
+}
+
+// <url>.gz (when the browser can gunzip), then <url>; null when neither loads.
+// A server that sends <url>.br/.gz with Content-Encoding serves the plain URL compressed.
+async function loadSceneBinary(url) {
+    const candidates = [[url, false]];
+    if ('DecompressionStream' in window) candidates.unshift([url + '.gz', true]);
+    for (const [candidate, gzipped] of candidates) {
+        try {
+            const buffer = await fetchBuffer(candidate, gzipped);
+            if (buffer) return unpackScene(buffer);
+        } catch (error) {
+            console.warn(`Could not load ${candidate}:`, error);
+        }
+    }
+    return null;
+}
@@ -0,0 +1,181 @@
+"""
+Binary, columnar container for web scene data (scene_data.bin).
+JSON spends most of its bytes on whitespace, digits and z = 0.0, and the browser
+has to parse every coordinate. Here every NumPy array in the scene dict becomes
+a typed block the front end reads straight into a Float32Array. Everything else
+(colors, radii, short point lists) stays in a small JSON header.
+
+Layout (little-endian, blocks 4-byte aligned):
+
+    b"MSD1" | uint32 header length | header JSON (space padded) | block | block | ...
+
+In the header tree each array is replaced by {"$array": i}. header["arrays"][i]
+describes block i:
+- offset and nbytes: where the block sits, counted from the end of the header.
+- count: the number of points.
+- components: 2 when z was constant (dropped and stored as "z"), else 3.
+- encoding: one of
+  - "float32": raw values.
+  - "quantized": uint16 per component, value = origin + q * step.
+  - "delta": int32 first differences of round((value - origin) / step). A
+    smooth curve then needs a few bits per step, which gzip/brotli shrink well.
+
+Decoding always yields (count, 3) float32 points (main.js: unpackScene).
+"""
+
+import gzip
+import json
+import struct
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import brotli
+except ImportError:  # optional: only needed for the .br sidecar
+    brotli = None
+
+MAGIC = b"MSD1"
+ENCODINGS = ("float32", "quantized", "delta")
+COMPRESSIONS = ("gzip", "brotli")
+
+# Grid step of the "delta" encoding in scene units (Manim's frame is 8 units high)
+DEFAULT_STEP = 1e-4
+
+
+def _pad(data: bytes, fill: bytes = b"\0") -> bytes:
+    return data + fill * (-len(data) % 4)
+
+
+def encode_points(points: np.ndarray, encoding: str = "float32", step: float = DEFAULT_STEP) -> Tuple[dict, bytes]:
+    """One (N, 2|3) point array as a block descriptor (without offset) and its bytes."""
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown encoding: {encoding!r} (expected one of {ENCODINGS})")
+    points = np.asarray(points, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] not in (2, 3):
+        raise ValueError(f"Expected an (N, 2) or (N, 3) point array, got shape {points.shape}")
+
+    spec = {"count": len(points), "encoding": encoding, "z": 0.0}
+    if points.shape[1] == 3:
+        if len(points) and np.all(points[:, 2] == points[0, 2]):
+            spec["z"] = float(points[0, 2])
+            points = points[:, :2]
+        else:
+            spec["z"] = None
+    spec["components"] = points.shape[1]
+
+    if encoding == "float32":
+        block = points.astype("<f4")
+    elif encoding == "quantized":
+        low = points.min(axis=0) if len(points) else np.zeros(points.shape[1])
+        span = (points.max(axis=0) - low) if len(points) else np.zeros(points.shape[1])
+        scale = np.where(span > 0, span / 65535, 1.0)
+        spec.update(origin=low.tolist(), step=scale.tolist())
+        block = np.round((points - low) / scale).astype("<u2")
+    else:
+        origin = points[0] if len(points) else np.zeros(points.shape[1])
+        grid = np.round((points - origin) / step).astype(np.int64)
+        deltas = np.diff(grid, axis=0, prepend=np.zeros((1, points.shape[1]), dtype=np.int64))
+        if len(deltas) and np.abs(deltas).max() >= 2 ** 31:
+            raise ValueError(f"Delta step {step} is too fine for this point range")
+        spec.update(origin=origin.tolist(), step=[step] * points.shape[1])
+        block = deltas.astype("<i4")
+    return spec, block.tobytes()
+
+
+def decode_points(spec: dict, data: bytes) -> np.ndarray:
+    """Inverse of encode_points: (count, 3) float32 points."""
+    count, components = spec["count"], spec["components"]
+    dtype = {"float32": "<f4", "quantized": "<u2", "delta": "<i4"}[spec["encoding"]]
+    values = np.frombuffer(data, dtype=dtype, count=count * components).reshape(count, components)
+    if spec["encoding"] == "quantized":
+        values = spec["origin"] + values * np.asarray(spec["step"])
+    elif spec["encoding"] == "delta":
+        values = spec["origin"] + np.cumsum(values, axis=0) * np.asarray(spec["step"])
+
+    points = np.empty((count, 3), dtype=np.float32)
+    points[:, :components] = values
+    if components == 2:
+        points[:, 2] = spec["z"]
+    return points
+
+
+def pack_scene(data: Any, encoding: str = "float32", step: float = DEFAULT_STEP) -> bytes:
+    """Serializes a scene dict; NumPy arrays become binary blocks, everything else header JSON."""
+    specs: List[dict] = []
+    blocks: List[bytes] = []
+
+    def walk(node):
+        if isinstance(node, np.ndarray):
+            spec, block = encode_points(node, encoding, step)
+            specs.append(spec)
+            blocks.append(_pad(block))
+            return {"$array": len(specs) - 1}
+        if isinstance(node, dict):
+            return {key: walk(value) for key, value in node.items()}
+        if isinstance(node, (list, tuple)):
+            return [walk(value) for value in node]
+        if isinstance(node, np.generic):
+            return node.item()
+        return node
+
+    tree = walk(data)
+    offset = 0
+    for spec, block in zip(specs, blocks):
+        spec.update(offset=offset, nbytes=len(block))
+        offset += len(block)
+    header = _pad(json.dumps({"scene": tree, "arrays": specs}, separators=(",", ":")).encode(), b" ")
+    return MAGIC + struct.pack("<I", len(header)) + header + b"".join(blocks)
+
+
+def unpack_scene(blob: bytes) -> Any:
+    """Inverse of pack_scene; arrays come back as (N, 3) float32 points."""
+    if blob[:4] != MAGIC:
+        raise ValueError("Not a scene_data.bin file (bad magic)")
+    (header_length,) = struct.unpack_from("<I", blob, 4)
+    header = json.loads(blob[8:8 + header_length])
+    base = 8 + header_length
+    arrays = [
+        decode_points(spec, blob[base + spec["offset"]:base + spec["offset"] + spec["nbytes"]])
+        for spec in header["arrays"]
+    ]
+
+    def walk(node):
+        if isinstance(node, dict):
+            if set(node) == {"$array"}:
+                return arrays[node["$array"]]
+            return {key: walk(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [walk(value) for value in node]
+        return node
+
+    return walk(header["scene"])
+
+
+def compress(blob: bytes, method: str) -> bytes:
+    if method == "gzip":
+        return gzip.compress(blob, compresslevel=9, mtime=0)
+    if method == "brotli":
+        if brotli is None:
+            raise ValueError("brotli compression needs the 'brotli' package")
+        return brotli.compress(blob)
+    raise ValueError(f"Unknown compression: {method!r} (expected one of {COMPRESSIONS})")
+
+
+def write_scene(path: str, data: Any, encoding: str = "float32", compressions: Sequence[str] = (),
+                step: float = DEFAULT_STEP) -> List[str]:
+    """
+    Writes <path> and one sidecar per compression (<path>.gz, <path>.br).
+    Returns the written paths.
+    """
+    blob = pack_scene(data, encoding, step)
+    written = [path]
+    with open(path, "wb") as f:
+        f.write(blob)
+    for method in compressions:
+        sidecar = path + {"gzip": ".gz", "brotli": ".br"}.get(method, "")
+        payload = compress(blob, method)
+        with open(sidecar, "wb") as f:
+            f.write(payload)
+        written.append(sidecar)
+    return written
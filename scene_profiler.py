@@ -0,0 +1,461 @@
+"""
+씬 렌더링 프로파일러
+렌더링이 느릴 때 시간이 어디에 쓰이는지 play()/voiceover() 단위로 기록합니다.
+- play / wait: play() 호출 하나 (애니메이션 이름, 화면의 mobject 수와 점 수, 프레임 수, 세그먼트 캐시 적중)
+  - interpolate: 애니메이션 보간과 updater (Scene.update_to_time)
+  - rasterize: cairo로 프레임 그리기 (CairoRenderer.update_frame)
+  - encode: 프레임을 ffmpeg/PyAV로 쓰기 (SceneFileWriter.write_frame), 최종 영상 합치기
+- text: Text/MarkupText 조판 (Pango)
+- tex: MathTex/Tex 생성과 LaTeX 컴파일
+- voiceover / tts: voiceover() 블록과 음성 합성 (manim_voiceover가 있을 때)
+- construct: 위 어디에도 속하지 않는 construct() 자체 시간 (mobject 생성, 계산 등)
+구간이 겹치면 안쪽 구간 시간을 바깥에서 빼므로(self time), 카테고리 합계가 씬 전체 시간과 같습니다.
+
+씬마다 media/profiles/<씬>.trace.json (chrome://tracing, https://ui.perfetto.dev 에서 열기)과
+<씬>.summary.json (카테고리 합계, 느린 play 순위, 캐시 적중/실패)을 씁니다.
+
+사용법:
+    python scene_profiler.py run -- render -ql two_sum_visualization.py TwoSumVisualization
+    python render_all_problems.py --profile
+    python scene_profiler.py report media/profiles --limit 20
+씬 모듈에서 직접 켜려면:
+    from scene_profiler import install_profiler
+    install_profiler()
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from render_scheduler import _write_json
+
+
+DEFAULT_PROFILE_DIR = "media/profiles"
+PROFILE_DIR_ENV = "MANIM_PROFILE_DIR"
+TOP_PLAYS = 10
+# 카테고리 순서 (요약 표의 열 순서)
+CATEGORIES = ("construct", "play", "wait", "interpolate", "rasterize", "encode", "text", "tex", "voiceover", "tts")
+
+_installed: Dict[str, object] = {}
+
+
+def count_mobjects(mobjects: Iterable) -> Tuple[int, int]:
+    """
+    mobject 트리 전체의 (mobject 수, 점 수). 점도 자식도 없는 빈 mobject는 그려지지 않으므로 세지 않음
+    (wait()마다 씬에 남는 Wait의 자리표시 Mobject 등)
+    """
+    n_mobjects = n_points = 0
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            points = len(getattr(member, "points", ()))
+            if points or member.submobjects:
+                n_mobjects += 1
+                n_points += points
+    return n_mobjects, n_points
+
+
+def segment_cached(renderer, caching: bool = True) -> Optional[bool]:
+    """
+    방금 끝난 play()가 세그먼트 캐시를 썼는지. 건너뛴 play(-n, 구간 병렬 렌더링의 빨리 감기)나
+    캐시를 끈 렌더링(--disable_caching)은 적중/실패가 없으므로 None
+    """
+    if not caching or renderer.animations_hashes[-1] is None:
+        return None
+    # 캐시 파일이 있으면 CairoRenderer.play가 그 play만 skip_animations를 켬
+    return bool(renderer.skip_animations and not renderer._original_skipping_status)
+
+
+# --- 기록 ---
+
+class SceneProfile:
+    """
+    씬 하나의 측정 기록. span()은 겹쳐 쓸 수 있는 구간이고, phase()는 프레임마다 반복되는
+    짧은 단계로, 이벤트 없이 합계에만 더합니다 (trace가 프레임 수만큼 커지지 않게).
+    """
+
+    def __init__(self, name: str, clock: Callable[[], float] = time.perf_counter):
+        self.name = name
+        self.clock = clock
+        self.origin = clock()
+        self.events: List[Dict] = []
+        self.plays: List[Dict] = []
+        self.totals: Dict[str, float] = {}
+        self.cache: Dict[str, Dict[str, int]] = {}
+        self.wall_time = 0.0
+        self._stack: List[Dict] = []
+
+    def now(self) -> float:
+        return self.clock() - self.origin
+
+    @contextmanager
+    def span(self, name: str, category: str, **args):
+        """
+        구간 하나를 기록. yield하는 dict에 넣은 값은 trace 이벤트의 args가 됩니다.
+        끝날 때 자기 시간(안쪽 구간 제외)을 category 합계에 더합니다.
+        """
+        frame = {"name": name, "category": category, "start": self.now(), "children": 0.0, "args": dict(args)}
+        self._stack.append(frame)
+        try:
+            yield frame["args"]
+        finally:
+            self._stack.pop()
+            duration = self.now() - frame["start"]
+            self._add_total(frame["category"], duration - frame["children"])
+            if self._stack:
+                self._stack[-1]["children"] += duration
+            self.events.append({
+                "name": frame["name"], "cat": frame["category"], "ph": "X", "ts": round(frame["start"] * 1e6, 1),
+                "dur": round(duration * 1e6, 1), "pid": 1, "tid": 1, "args": frame["args"],
+            })
+
+    def relabel(self, name: Optional[str] = None, category: Optional[str] = None) -> None:
+        """가장 안쪽의 열린 구간 이름/카테고리를 바꿈 (끝나 봐야 알 수 있는 경우, 예: wait만 있던 play)"""
+        frame = self._stack[-1]
+        frame["name"] = name or frame["name"]
+        frame["category"] = category or frame["category"]
+
+    @contextmanager
+    def phase(self, category: str, count: bool = False):
+        """
+        프레임마다 반복되는 짧은 단계: trace 이벤트 없이 category 합계와, 열려 있는 play의
+        단계별 시간(phases)에만 더합니다. count=True면 그 play의 프레임 수도 셉니다.
+        """
+        frame = {"category": category, "start": self.now(), "children": 0.0, "args": None}
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+            duration = self.now() - frame["start"]
+            own = duration - frame["children"]
+            self._add_total(category, own)
+            if self._stack:
+                self._stack[-1]["children"] += duration
+            play = next((f["args"] for f in reversed(self._stack) if f["args"] and "phases" in f["args"]), None)
+            if play is not None:
+                play["phases"][category] = play["phases"].get(category, 0.0) + own
+                if count:
+                    play["frames"] = play.get("frames", 0) + 1
+
+    def _add_total(self, category: str, seconds: float) -> None:
+        self.totals[category] = self.totals.get(category, 0.0) + seconds
+
+    def counter(self, name: str, **values) -> None:
+        """trace의 카운터 그래프 한 점 (화면의 mobject 수, 점 수 등)"""
+        self.events.append({"name": name, "ph": "C", "ts": round(self.now() * 1e6, 1), "pid": 1, "args": values})
+
+    def add_play(self, record: Dict) -> None:
+        self.plays.append(record)
+
+    # --- 출력 ---
+
+    def chrome_trace(self) -> Dict:
+        """Chrome trace event 형식 (시간 단위 µs)"""
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.name}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "construct"}},
+        ]
+        events = sorted(self.events, key=lambda event: event["ts"])
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms", "otherData": {"cache": self.cache}}
+
+    def summary(self, top: int = TOP_PLAYS) -> Dict:
+        plays = sorted(self.plays, key=lambda play: -play["duration"])
+        segments = [play["cached"] for play in self.plays if play["cached"] is not None]
+        cache = dict(self.cache)
+        if segments:
+            cache["segments"] = {"hits": sum(segments), "misses": len(segments) - sum(segments)}
+        return {
+            "scene": self.name,
+            "wall_time": round(self.wall_time, 6),
+            "totals": {category: round(seconds, 6) for category, seconds in sorted(self.totals.items())},
+            "plays": len(self.plays),
+            "frames": sum(play["frames"] for play in self.plays),
+            "peak_mobjects": max((play["mobjects"] for play in self.plays), default=0),
+            "peak_points": max((play["points"] for play in self.plays), default=0),
+            "cache": cache,
+            "slowest_plays": plays[:top],
+        }
+
+    def save(self, directory) -> Tuple[Path, Path]:
+        directory = Path(directory)
+        trace_path = directory / f"{self.name}.trace.json"
+        summary_path = directory / f"{self.name}.summary.json"
+        _write_json(trace_path, self.chrome_trace(), indent=None)
+        _write_json(summary_path, self.summary(), indent=None)
+        return trace_path, summary_path
+
+
+# --- 여러 씬 순위 ---
+
+def load_summaries(directory) -> List[Dict]:
+    summaries = []
+    for path in sorted(Path(directory).glob("*.summary.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                summaries.append(json.load(f))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return summaries
+
+
+def dominant_category(summary: Dict) -> str:
+    totals = summary.get("totals", {})
+    return max(totals, key=totals.get) if totals else "-"
+
+
+def rank(summaries: List[Dict], by: str = "wall_time") -> List[Dict]:
+    """by가 "wall_time"이면 씬 전체 시간, 카테고리 이름이면 그 카테고리 합계가 큰 순"""
+    def key(summary):
+        return summary.get("wall_time", 0.0) if by == "wall_time" else summary.get("totals", {}).get(by, 0.0)
+    return sorted(summaries, key=key, reverse=True)
+
+
+def format_ranking(summaries: List[Dict], limit: Optional[int] = None) -> List[str]:
+    """느린 씬 순위 표. 각 카테고리는 씬 전체 시간 대비 비율"""
+    columns = [category for category in CATEGORIES if any(category in s.get("totals", {}) for s in summaries)]
+    lines = [f"{'#':>3} | {'scene':<36} | {'time':>8} | {'plays':>5} | {'frames':>6} | "
+             + " | ".join(f"{category[:9]:>9}" for category in columns) + f" | {'slowest play':<30}"]
+    lines.append("-" * len(lines[0]))
+    for index, summary in enumerate(summaries[:limit], 1):
+        wall_time = summary.get("wall_time", 0.0) or 1e-9
+        shares = [f"{summary['totals'].get(category, 0.0) / wall_time:>8.0%} " for category in columns]
+        slowest = summary["slowest_plays"][0] if summary.get("slowest_plays") else None
+        slowest_text = f"#{slowest['index']} {slowest['name'][:18]} {slowest['duration']:.2f}s" if slowest else "-"
+        lines.append(f"{index:>3} | {summary['scene'][:36]:<36} | {summary['wall_time']:>7.2f}s | "
+                     f"{summary['plays']:>5} | {summary['frames']:>6} | " + " | ".join(shares) + f" | {slowest_text:<30}")
+    return lines
+
+
+# --- manim 연결 ---
+
+def _current() -> Optional[SceneProfile]:
+    return _installed.get("profile")
+
+
+def _timed(category: str, original: Callable, count: bool = False) -> Callable:
+    """호출 하나를 열린 씬 기록의 phase로 재는 래퍼 (trace 이벤트 없음)"""
+    def wrapper(*args, **kwargs):
+        profile = _current()
+        if profile is None:
+            return original(*args, **kwargs)
+        with profile.phase(category, count):
+            return original(*args, **kwargs)
+    wrapper.__wrapped__ = original
+    return wrapper
+
+
+def _spanned(category: str, original: Callable, describe: Callable) -> Callable:
+    """호출 하나를 trace 구간으로 기록하는 래퍼. describe(args, kwargs) -> (이름, args)"""
+    def wrapper(*args, **kwargs):
+        profile = _current()
+        if profile is None:
+            return original(*args, **kwargs)
+        name, span_args = describe(args, kwargs)
+        with profile.span(name, category, **span_args):
+            return original(*args, **kwargs)
+    wrapper.__wrapped__ = original
+    return wrapper
+
+
+def _short(text, limit: int = 60) -> str:
+    text = " ".join(str(text).split())
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def _describe_text(args, kwargs):
+    mobject, text = args[0], (args[1:] or [kwargs.get("text", "")])[0]
+    return type(mobject).__name__, {"text": _short(text)}
+
+
+def _describe_tex(args, kwargs):
+    return type(args[0]).__name__, {"tex": _short(" ".join(map(str, args[1:])))}
+
+
+def _describe_latex(args, kwargs):
+    return "latex", {"tex": _short(args[0] if args else kwargs.get("expression", ""))}
+
+
+def _describe_tts(args, kwargs):
+    return "tts", {"text": _short(args[1] if len(args) > 1 else kwargs.get("text", ""))}
+
+
+def cache_counters(scene) -> Dict[str, Dict[str, int]]:
+    """이 저장소 캐시들의 현재 적중/실패 수 (설치/사용된 것만)"""
+    counters = {}
+    tex_cache = sys.modules.get("tex_cache")
+    cache = getattr(tex_cache, "_installed", {}).get("cache") if tex_cache else None
+    if cache is not None:
+        counters["tex"] = {"hits": cache.hits, "misses": cache.misses}
+    glyph_cache = sys.modules.get("glyph_cache")
+    if glyph_cache is not None and glyph_cache.GlyphStore._shared:
+        stores = glyph_cache.GlyphStore._shared.values()
+        counters["glyph"] = {"hits": sum(s.hits for s in stores), "misses": sum(s.misses for s in stores)}
+    tts_cache = getattr(getattr(scene, "speech_service", None), "tts_cache", None)
+    if tts_cache is not None:
+        counters["tts"] = {"hits": tts_cache.hits, "misses": tts_cache.misses}
+    return counters
+
+
+def _counter_delta(before: Dict, after: Dict) -> Dict:
+    """씬 렌더링 동안 늘어난 적중/실패 수 (음성 서비스처럼 도중에 생긴 캐시는 0에서 시작)"""
+    empty = {"hits": 0, "misses": 0}
+    return {name: {key: value - before.get(name, empty)[key] for key, value in counts.items()}
+            for name, counts in after.items()}
+
+
+def install_profiler(directory: Optional[str] = None) -> None:
+    """
+    manim의 Scene.render, 렌더러의 play, 프레임 단계, Text/MathTex 생성, voiceover에 계측을 겁니다
+    (여러 번 호출해도 한 번만). 씬 렌더링이 끝날 때마다 directory(기본: MANIM_PROFILE_DIR 또는 media/profiles)에 씁니다.
+    """
+    import manim.mobject.text.tex_mobject as tex_mobject
+    from manim import MarkupText, MathTex, Scene, Text, config, logger
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    if _installed:
+        return
+    _installed["directory"] = directory or os.environ.get(PROFILE_DIR_ENV, DEFAULT_PROFILE_DIR)
+    original_render = Scene.render
+    original_play = CairoRenderer.play
+
+    def render(scene, *args, **kwargs):
+        if _current() is not None: # 씬 안에서 다른 씬을 렌더링하는 경우 바깥 기록만 유지
+            return original_render(scene, *args, **kwargs)
+        profile = SceneProfile(type(scene).__name__)
+        _installed["profile"] = profile
+        before = cache_counters(scene)
+        try:
+            with profile.span(profile.name, "construct"):
+                return original_render(scene, *args, **kwargs)
+        finally:
+            _installed["profile"] = None
+            profile.wall_time = profile.now()
+            profile.cache = _counter_delta(before, cache_counters(scene))
+            trace_path, _ = profile.save(_installed["directory"])
+            logger.info(f"Profile written to {trace_path}")
+
+    def play(renderer, scene, *args, **kwargs):
+        profile = _current()
+        if profile is None:
+            return original_play(renderer, scene, *args, **kwargs)
+        before = count_mobjects(scene.mobjects)
+        start = profile.now()
+        with profile.span("play", "play", phases={}, frames=0) as span_args:
+            result = original_play(renderer, scene, *args, **kwargs)
+            after = count_mobjects(scene.mobjects)
+            names = [type(animation).__name__ for animation in scene.animations or ()]
+            record = {
+                "index": len(profile.plays), "name": ", ".join(names) or "play", "start": round(start, 6),
+                "run_time": round(scene.duration, 6), "mobjects": max(before[0], after[0]),
+                "points": max(before[1], after[1]), "frames": span_args["frames"],
+                "skipped": renderer.animations_hashes[-1] is None, # -n, 구간 병렬 렌더링의 빨리 감기
+                "cached": segment_cached(renderer, not config.disable_caching),
+            }
+            span_args.update({key: value for key, value in record.items() if key not in ("index", "name", "start")})
+            waiting = bool(names) and all(name == "Wait" for name in names)
+            profile.relabel(record["name"], "wait" if waiting else "play")
+        record["duration"] = round(profile.now() - start, 6)
+        record["phases"] = {key: round(value, 6) for key, value in span_args["phases"].items()}
+        profile.add_play(record)
+        profile.counter("screen", mobjects=after[0], points=after[1])
+        return result
+
+    CairoRenderer.play = play
+    Scene.render = render
+    Scene.update_to_time = _timed("interpolate", Scene.update_to_time)
+    CairoRenderer.update_frame = _timed("rasterize", CairoRenderer.update_frame)
+    SceneFileWriter.write_frame = _timed("encode", SceneFileWriter.write_frame, count=True)
+    SceneFileWriter.combine_to_movie = _spanned(
+        "encode", SceneFileWriter.combine_to_movie, lambda args, kwargs: ("combine_to_movie", {}))
+    Text.__init__ = _spanned("text", Text.__init__, _describe_text)
+    MarkupText.__init__ = _spanned("text", MarkupText.__init__, _describe_text)
+    MathTex.__init__ = _spanned("tex", MathTex.__init__, _describe_tex)
+    # 모듈 전역을 바꾸므로 install_tex_cache보다 먼저 걸면 캐시 실패(실제 컴파일)만, 나중이면 캐시 조회까지 잼
+    tex_mobject.tex_to_svg_file = _spanned("tex", tex_mobject.tex_to_svg_file, _describe_latex)
+    _install_voiceover()
+
+
+def _install_voiceover() -> None:
+    """manim_voiceover가 있으면 voiceover() 블록과 음성 합성을 구간으로 기록"""
+    try:
+        from manim_voiceover import VoiceoverScene
+        from manim_voiceover.services.base import SpeechService
+    except ImportError:
+        return
+    original_voiceover = VoiceoverScene.voiceover
+
+    @contextmanager
+    def voiceover(scene, *args, **kwargs):
+        profile = _current()
+        if profile is None:
+            with original_voiceover(scene, *args, **kwargs) as tracker:
+                yield tracker
+            return
+        text = kwargs.get("text") or kwargs.get("ssml") or (args[0] if args else "")
+        with profile.span("voiceover", "voiceover", text=_short(text)):
+            with original_voiceover(scene, *args, **kwargs) as tracker:
+                yield tracker
+
+    VoiceoverScene.voiceover = voiceover
+    SpeechService._wrap_generate_from_text = _spanned("tts", SpeechService._wrap_generate_from_text, _describe_tts)
+
+
+def profile_command_builder(command_builder: Callable[[str, str, str], List[str]],
+                            directory: str = DEFAULT_PROFILE_DIR) -> Callable[[str, str, str], List[str]]:
+    """
+    render_scheduler.run_jobs의 command_builder 감싸기: `manim ...` 명령을
+    `python scene_profiler.py run --dir DIR -- ...`로 바꿔 같은 렌더링을 계측한 채 실행합니다.
+    """
+    script = os.path.abspath(__file__)
+
+    def build(scene_file: str, scene_class: str, quality: str) -> List[str]:
+        command = command_builder(scene_file, scene_class, quality)
+        if Path(command[0]).name != "manim":
+            raise ValueError(f"cannot profile a non-manim command: {command[0]}")
+        return [sys.executable, script, "run", "--dir", directory, "--", *command[1:]]
+
+    return build
+
+
+def print_ranking(directory, by: str = "wall_time", limit: Optional[int] = None) -> List[Dict]:
+    summaries = rank(load_summaries(directory), by)
+    if not summaries:
+        print(f"프로파일 없음: {directory}")
+        return summaries
+    for line in format_ranking(summaries, limit):
+        print(line)
+    return summaries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="manim 씬 렌더링 프로파일러")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="계측을 켠 채 manim CLI를 실행 (-- 뒤는 manim 인자)")
+    run.add_argument("--dir", default=None, help=f"결과 디렉터리 (기본: ${PROFILE_DIR_ENV} 또는 {DEFAULT_PROFILE_DIR})")
+    run.add_argument("manim_args", nargs=argparse.REMAINDER)
+
+    report = subparsers.add_parser("report", help="저장된 요약으로 느린 씬 순위 출력")
+    report.add_argument("directory", nargs="?", default=DEFAULT_PROFILE_DIR)
+    report.add_argument("--by", default="wall_time", help="정렬 기준: wall_time 또는 카테고리 이름 (tex, encode 등)")
+    report.add_argument("--limit", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if args.command == "report":
+        print_ranking(args.directory, args.by, args.limit)
+        return 0
+
+    manim_args = args.manim_args[1:] if args.manim_args[:1] == ["--"] else args.manim_args
+    install_profiler(args.dir)
+    from manim.__main__ import main as manim_main
+    return manim_main(args=manim_args, prog_name="manim")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
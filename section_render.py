@@ -0,0 +1,286 @@
+"""
+긴 씬 하나를 구간(section)별로 여러 프로세스에서 동시에 렌더링하고 재인코딩 없이 이어 붙입니다.
+
+씬은 SectionCheckpointMixin을 섞고 구간 경계마다 self.checkpoint("이름")을 호출합니다.
+경계에서 남기는 체크포인트(JSON)는 재생 위치(play 수, 씬 시간)와 화면 상태 digest입니다.
+Tex나 updater가 달린 mobject는 pickle할 수 없으므로, 상태 자체는 직렬화하지 않습니다.
+대신 각 워커가 앞 구간을 manim의 skip 모드(프레임 없이 최종 상태만 계산)로 빨리 감아 체크포인트에 도착합니다.
+
+1. 계획: 모든 구간을 건너뛰는 dry run 한 번으로 구간 목록과 경계별 상태 digest를 얻습니다.
+2. 워커: 구간마다 manim 프로세스 하나가 자기 구간만 partial movie로 렌더링합니다.
+   도착한 상태 digest가 계획과 다르면 실패로 처리합니다 (시드 없는 난수 등으로 이음매가 어긋나는 경우).
+3. 합치기: 구간 순서대로 partial movie 패킷을 그대로 옮겨 담습니다 (stream copy).
+
+사용법:
+    python section_render.py navier_stokes_scene NavierStokesScene -q low_quality -j 4
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from render_scheduler import _write_json, build_command, job_count
+from segment_cache import mobjects_key
+
+
+SECTION_ENV = "MANIM_SECTION" # 렌더링할 구간 번호, "plan"이면 전부 건너뛰고 계획만 기록
+SECTION_DIR_ENV = "MANIM_SECTION_DIR" # 체크포인트 JSON을 쓸 디렉터리
+PLAN_NAME = "plan.json"
+DEFAULT_WORK_DIR = "media/sections"
+
+
+def section_file(work_dir, index: int) -> Path:
+    return Path(work_dir) / f"section_{index:02}.json"
+
+
+class SectionCheckpointMixin:
+    """
+    Scene 앞에 섞어 씁니다 (class NavierStokesScene(SectionCheckpointMixin, Scene)).
+    환경 변수가 없으면 checkpoint()는 manim의 next_section()과 같아서 평소 렌더링은 그대로입니다.
+    """
+
+    # 모든 프로세스가 같은 상태를 재현하도록 random_seed가 없으면 이 값으로 시드를 고정
+    section_seed = 0
+
+    def setup(self):
+        super().setup()
+        if getattr(self, "random_seed", None) is None:
+            random.seed(self.section_seed)
+            np.random.seed(self.section_seed)
+        self._section_index = 0
+        self._section_target = os.environ.get(SECTION_ENV)
+        self._section_dir = Path(os.environ.get(SECTION_DIR_ENV, DEFAULT_WORK_DIR))
+        self._section_plan: List[dict] = []
+        if self._section_target is None:
+            return
+        # 워커는 자기 구간의 partial movie만 남기고, 합치기와 정리는 조정 프로세스가 함
+        writer = self.renderer.file_writer
+        writer.combine_to_movie = lambda: None
+        writer.clean_cache = lambda: None
+        self._mark_checkpoint("start")
+
+    def _is_target(self, index: int) -> bool:
+        return self._section_target == str(index)
+
+    def _mark_checkpoint(self, name: str):
+        checkpoint = {
+            "index": self._section_index,
+            "name": name,
+            "num_plays": self.renderer.num_plays,
+            "time": round(self.renderer.time, 6),
+            "state": mobjects_key(self.mobjects),
+        }
+        # 현재 구간을 렌더링할지 정함 (skip이면 프레임 없이 상태만 진행)
+        self.renderer.file_writer.sections[-1].skip_animations = not self._is_target(self._section_index)
+        if self._section_target == "plan":
+            self._section_plan.append(checkpoint)
+        elif self._is_target(self._section_index):
+            self._section_checkpoint = checkpoint
+
+    def checkpoint(self, name: str):
+        """구간 경계: 여기서부터 name 구간이 시작됨"""
+        if self._section_target is None:
+            self.next_section(name)
+            return
+        if self._is_target(self._section_index):
+            self._finish_section()
+            from manim.utils.exceptions import EndSceneEarlyException
+            raise EndSceneEarlyException()
+        self.next_section(name, skip_animations=True)
+        self._section_index += 1
+        self._mark_checkpoint(name)
+
+    def _finish_section(self):
+        segments = [str(path) for path in self.renderer.file_writer.partial_movie_files if path is not None]
+        _write_json(section_file(self._section_dir, self._section_index),
+                    {**self._section_checkpoint, "end_time": round(self.renderer.time, 6),
+                     "end_state": mobjects_key(self.mobjects), "segments": segments})
+        self._section_target = "done"
+
+    def tear_down(self):
+        if self._section_target == "plan":
+            _write_json(self._section_dir / PLAN_NAME,
+                        {"sections": self._section_plan, "duration": round(self.renderer.time, 6)})
+        elif self._section_target is not None and self._is_target(self._section_index):
+            self._finish_section()
+        super().tear_down()
+
+
+def _run(cmd: List[str], env: Dict[str, str], log_path: Path) -> Dict:
+    """명령어를 실행하고 출력을 로그 파일로 보냄"""
+    start = time.perf_counter()
+    with open(log_path, "wb") as log:
+        log.write(f"$ {' '.join(cmd)}\n".encode("utf-8"))
+        log.flush()
+        try:
+            returncode = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT, env={**os.environ, **env}).returncode
+        except OSError as e:
+            log.write(f"{e}\n".encode("utf-8"))
+            returncode = None
+    return {"returncode": returncode, "wall_time": time.perf_counter() - start, "log": str(log_path)}
+
+
+def order_sections(plan: dict) -> List[int]:
+    """긴 구간(씬 시간 기준)부터 시작하도록 구간 번호를 정렬"""
+    sections = plan["sections"]
+    ends = [section["time"] for section in sections[1:]] + [plan["duration"]]
+    lengths = [end - section["time"] for section, end in zip(sections, ends)]
+    return sorted(range(len(sections)), key=lambda index: (-lengths[index], index))
+
+
+def check_sections(plan: dict, results: List[Optional[dict]]) -> List[str]:
+    """
+    워커가 도착한 체크포인트가 계획과 같은지, 그리고 앞 구간을 실제로 렌더링한 끝 상태와 같은지 확인합니다.
+    (dt를 쓰는 updater는 빨리 감기와 프레임별 진행의 결과가 달라 이음매가 어긋날 수 있음)
+    문제를 설명하는 문자열 목록을 반환합니다.
+    """
+    problems = []
+    previous = None
+    for expected, result in zip(plan["sections"], results):
+        label = f"section {expected['index']} ({expected['name']})"
+        if result is None:
+            problems.append(f"{label}: no checkpoint written")
+        else:
+            for key in ("num_plays", "state"):
+                if result[key] != expected[key]:
+                    problems.append(f"{label}: {key} {result[key]!r} != planned {expected[key]!r}")
+            if previous is not None and previous["end_state"] != result["state"]:
+                problems.append(f"{label}: starts from a different state than the previous section ended in")
+        previous = result
+    return problems
+
+
+def join_segments(segments: List[str], output: str) -> None:
+    """partial movie들을 재인코딩 없이 순서대로 이어 붙임 (manim combine_files와 같은 concat 방식)"""
+    import av
+
+    output_path = Path(output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    list_path = output_path.with_name(f"{output_path.stem}_segments.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for segment in segments:
+            f.write(f"file 'file:{Path(segment).as_posix()}'\n")
+
+    with av.open(str(list_path), options={"safe": "0"}, format="concat") as source, \
+            av.open(str(output_path), mode="w") as target:
+        source_stream = source.streams.video[0]
+        target_stream = target.add_stream(codec_name=None, template=source_stream)
+        for packet in source.demux(source_stream):
+            if packet.dts is None:
+                continue
+            packet.stream = target_stream
+            target.mux(packet)
+    list_path.unlink()
+
+
+def render_sections(
+    scene_file: str,
+    scene_class: str,
+    quality: str = "medium_quality",
+    max_workers: Optional[int] = None,
+    work_dir: Optional[str] = None,
+    output: Optional[str] = None,
+    command_builder: Callable[[str, str, str], List[str]] = build_command,
+    joiner: Callable[[List[str], str], None] = join_segments,
+) -> Dict:
+    """
+    계획 → 구간별 워커 동시 실행 → 체크포인트 확인 → 합치기 순서로 실행하고 리포트를 반환합니다.
+
+    Args:
+        scene_file: 씬 모듈 이름 (.py 제외)
+        scene_class: SectionCheckpointMixin을 쓰는 씬 클래스
+        quality: 렌더링 품질
+        max_workers: 동시에 실행할 워커 수 (None이면 CPU 코어 수)
+        work_dir: 체크포인트와 로그 디렉터리 (기본: media/sections/<씬 클래스>)
+        output: 합친 영상 경로 (기본: work_dir/<씬 클래스>.mp4)
+        command_builder: (파일, 클래스, 품질)로 manim 명령어를 만드는 함수
+        joiner: (partial movie 목록, 출력 경로)로 영상을 합치는 함수
+    """
+    work = Path(work_dir or Path(DEFAULT_WORK_DIR) / scene_class)
+    work.mkdir(parents=True, exist_ok=True)
+    output = output or str(work / f"{scene_class}.mp4")
+    env = {SECTION_DIR_ENV: str(work.resolve())}
+    command = command_builder(scene_file, scene_class, quality)
+
+    start = time.perf_counter()
+    for stale in [work / PLAN_NAME, *work.glob("section_*.json")]:
+        stale.unlink(missing_ok=True)
+    planned = _run(command + ["--dry_run"], {**env, SECTION_ENV: "plan"}, work / "plan.log")
+    if not (work / PLAN_NAME).exists():
+        raise RuntimeError(f"Planning run wrote no {PLAN_NAME}; see {planned['log']}")
+    with open(work / PLAN_NAME, "r", encoding="utf-8") as f:
+        plan = json.load(f)
+
+    runs: List[Optional[Dict]] = [None] * len(plan["sections"])
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+        futures = {
+            executor.submit(_run, command, {**env, SECTION_ENV: str(index)}, work / f"section_{index:02}.log"): index
+            for index in order_sections(plan)
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            runs[index] = future.result()
+            status = "✓" if runs[index]["returncode"] == 0 else "✗"
+            print(f"[{done}/{len(futures)}] {status} {plan['sections'][index]['name']} "
+                  f"({runs[index]['wall_time']:.1f}s, 로그: {runs[index]['log']})")
+
+    results = []
+    for index in range(len(runs)):
+        try:
+            with open(section_file(work, index), "r", encoding="utf-8") as f:
+                results.append(json.load(f))
+        except FileNotFoundError:
+            results.append(None)
+    problems = check_sections(plan, results)
+    problems += [f"section {index}: exit code {run['returncode']}" for index, run in enumerate(runs)
+                 if run["returncode"] != 0]
+
+    if not problems:
+        joiner([segment for result in results for segment in result["segments"]], output)
+    report = {
+        "scene": f"{scene_file}:{scene_class}",
+        "quality": quality,
+        "success": not problems,
+        "problems": problems,
+        "output": output if not problems else None,
+        "plan_time": planned["wall_time"],
+        "wall_time": time.perf_counter() - start,
+        "sections": [
+            {**section, "wall_time": run["wall_time"], "log": run["log"],
+             "segments": len(result["segments"]) if result else 0}
+            for section, run, result in zip(plan["sections"], runs, results)
+        ],
+    }
+    _write_json(work / "report.json", report)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="긴 씬 하나를 구간별로 동시에 렌더링하고 재인코딩 없이 합치기")
+    parser.add_argument("scene_file", help="씬 모듈 이름 (.py 제외)")
+    parser.add_argument("scene_class", help="SectionCheckpointMixin을 쓰는 씬 클래스")
+    parser.add_argument("-q", "--quality", default="medium_quality",
+                        choices=["low_quality", "medium_quality", "high_quality"])
+    parser.add_argument("-j", "--jobs", type=job_count, default=None, help="동시에 실행할 워커 수 (기본/auto: CPU 코어 수)")
+    parser.add_argument("--work-dir", default=None, help="체크포인트/로그 디렉터리 (기본: media/sections/<씬>)")
+    parser.add_argument("-o", "--output", default=None, help="합친 영상 경로")
+    args = parser.parse_args(argv)
+
+    report = render_sections(args.scene_file, args.scene_class, args.quality, args.jobs, args.work_dir, args.output)
+    for problem in report["problems"]:
+        print(f"✗ {problem}")
+    if report["success"]:
+        print(f"✓ {report['output']} ({len(report['sections'])}개 구간, {report['wall_time']:.1f}s)")
+    return 0 if report["success"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,286 @@
+"""
+play() 단위 부분 영상(partial movie) 캐시
+manim 기본 해시는 씬에 올라온 mobject 전체를 get_json으로 직렬화합니다. 그래서 화면과 상관없는 속성이나
+앞쪽 코드 변경에도 값이 바뀌고, 앞에 애니메이션 하나를 끼워 넣으면 그 뒤 세그먼트가 모두 다시 렌더링됩니다.
+
+이 모듈은 세그먼트 키를 "그 play()가 그리는 것"으로만 계산합니다.
+- 카메라: 해상도, 프레임 크기, 프레임레이트, 배경
+- 애니메이션: 클래스, 인자(run_time, rate_func 코드, 대상 mobject의 모양 등)
+- 화면 상태: 씬 mobject 트리의 점, 색(점 구름의 점별 색 포함), 두께, z_index, updater 코드
+호출 순서나 파이썬 객체 id는 들어가지 않으므로, 화면이 같으면 어느 위치의 play()든 같은 파일을 재사용합니다.
+
+partial_movie_files/<Scene>/ 디렉터리는 segment_manifest.json에 최근 렌더들의 세그먼트 목록을 남겨 관리합니다.
+- 세그먼트 목록이 직전 렌더와 같고 결과 영상이 있으면 합치기(ffmpeg concat)를 건너뜁니다.
+- 최근 keep_renders번의 렌더 어디에도 쓰이지 않은 세그먼트는 지웁니다.
+  (manim의 max_files_cached 방식은 atime 순이라 긴 씬의 세그먼트를 지울 수 있어 대신합니다)
+
+씬 모듈에서:
+    from segment_cache import install_segment_cache
+    install_segment_cache()
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from render_scheduler import _write_json
+
+
+DEFAULT_KEEP_RENDERS = 3
+MANIFEST_NAME = "segment_manifest.json"
+# manim이 partial 디렉터리에 같이 두는 파일 (세그먼트가 아님)
+NON_SEGMENT_FILES = {MANIFEST_NAME, "partial_movie_file_list.txt"}
+
+# 좌표/색을 이 자릿수로 반올림해 부동소수 잡음이 키를 바꾸지 않게 함
+DECIMALS = 6
+# 함수 클로저, 애니메이션 속성 등을 따라 들어가는 최대 깊이 (순환 참조 방지)
+MAX_DEPTH = 6
+
+CAMERA_ATTRIBUTES = (
+    "pixel_width", "pixel_height", "frame_width", "frame_height", "frame_rate",
+    "frame_center", "background_color", "background_opacity",
+)
+
+_installed: Dict[str, object] = {}
+
+
+# --- 내용 해시 ---
+
+def _feed_array(h, array: np.ndarray, depth: int = 0, seen: Optional[set] = None) -> None:
+    if array.dtype.kind in "biuf":
+        array = np.round(np.asarray(array, dtype=float), DECIMALS) + 0.0 # + 0.0: -0.0을 0.0으로
+        h.update(repr(array.shape).encode())
+        h.update(array.astype(np.float64).tobytes())
+    else:
+        _feed(h, array.tolist(), depth + 1, set() if seen is None else seen) # AnimationGroup의 타이밍 표 등
+
+
+def _feed_function(h, function, depth: int, seen: set) -> None:
+    """이름, 바이트코드, 상수, 기본값, 클로저 값 (lambda도 내용이 같으면 같은 키)"""
+    code = function.__code__
+    h.update(getattr(function, "__qualname__", "").encode())
+    h.update(code.co_code)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            h.update(const.co_code)
+        else:
+            _feed(h, const, depth + 1, seen)
+    _feed(h, function.__defaults__, depth + 1, seen)
+    for cell in function.__closure__ or ():
+        try:
+            _feed(h, cell.cell_contents, depth + 1, seen)
+        except ValueError: # 아직 채워지지 않은 셀
+            h.update(b"<empty cell>")
+
+
+def feed_mobject(h, mobject) -> None:
+    """mobject 트리의 화면에 보이는 상태만 해시에 넣음"""
+    for member in mobject.get_family():
+        h.update(type(member).__qualname__.encode())
+        h.update(str(len(member.submobjects)).encode())
+        _feed_array(h, np.asarray(getattr(member, "points", ())))
+        for getter in ("get_stroke_rgbas", "get_fill_rgbas", "get_stroke_width"):
+            try:
+                value = getattr(member, getter)()
+            except AttributeError:
+                # Mobject.__getattr__이 get_*를 만들어 주므로 hasattr은 항상 참이고, 호출해야
+                # 속성이 없음을 압니다 (Wait의 빈 Mobject, PMobject, ImageMobject, Group 등)
+                continue
+            _feed_array(h, np.asarray(value))
+        rgbas = getattr(member, "rgbas", None) # PMobject의 점별 색
+        if rgbas is not None:
+            _feed_array(h, np.asarray(rgbas))
+        h.update(repr(getattr(member, "z_index", 0)).encode())
+        pixel_array = getattr(member, "pixel_array", None)
+        if pixel_array is not None:
+            h.update(hashlib.blake2b(np.ascontiguousarray(pixel_array).tobytes(), digest_size=16).digest())
+        for updater in getattr(member, "updaters", ()):
+            _feed(h, updater, 0, set())
+
+
+def _feed(h, value, depth: int, seen: set) -> None:
+    """값 하나를 타입별로 해시에 넣음. 알 수 없는 객체는 타입 이름만 씀"""
+    if depth > MAX_DEPTH:
+        h.update(b"<deep>")
+    elif value is None or isinstance(value, (bool, int, str, bytes)):
+        h.update(repr(value).encode())
+    elif isinstance(value, float):
+        h.update(repr(round(value, DECIMALS) + 0.0).encode())
+    elif isinstance(value, np.ndarray):
+        _feed_array(h, value, depth, seen)
+    elif isinstance(value, np.generic):
+        _feed(h, value.item(), depth, seen)
+    elif isinstance(value, (list, tuple)):
+        h.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _feed(h, item, depth + 1, seen)
+    elif isinstance(value, dict):
+        for key in sorted(value, key=repr):
+            _feed(h, key, depth + 1, seen)
+            _feed(h, value[key], depth + 1, seen)
+    elif isinstance(value, (set, frozenset)):
+        h.update("|".join(sorted(map(repr, value))).encode())
+    elif id(value) in seen:
+        h.update(b"<seen>")
+    elif hasattr(value, "get_family") and hasattr(value, "submobjects"):
+        seen.add(id(value))
+        feed_mobject(h, value)
+    elif hasattr(value, "interpolate_mobject"):
+        seen.add(id(value))
+        _feed_animation(h, value, depth, seen)
+    elif hasattr(value, "__code__"):
+        _feed_function(h, value, depth, seen)
+    elif hasattr(value, "__func__"): # 바운드 메서드
+        _feed(h, value.__func__, depth + 1, seen)
+        _feed(h, value.__self__, depth + 1, seen)
+    elif hasattr(value, "func") and hasattr(value, "keywords"): # functools.partial
+        _feed(h, (value.func, value.args, value.keywords), depth + 1, seen)
+    elif hasattr(value, "to_rgba"): # ManimColor
+        _feed_array(h, np.asarray(value.to_rgba()))
+    else:
+        h.update(f"<{type(value).__qualname__}>".encode())
+
+
+def _feed_animation(h, animation, depth: int, seen: set) -> None:
+    h.update(type(animation).__qualname__.encode())
+    for key in sorted(vars(animation)):
+        h.update(key.encode())
+        _feed(h, vars(animation)[key], depth + 1, seen)
+
+
+def _digest(feed) -> str:
+    h = hashlib.blake2b(digest_size=8)
+    feed(h)
+    return h.hexdigest()
+
+
+def camera_key(camera) -> str:
+    def feed(h):
+        for name in CAMERA_ATTRIBUTES:
+            h.update(name.encode())
+            _feed(h, getattr(camera, name, None), 0, set())
+    return _digest(feed)
+
+
+def animations_key(animations) -> str:
+    def feed(h):
+        for animation in animations:
+            _feed(h, animation, 0, set())
+    return _digest(feed)
+
+
+def mobjects_key(mobjects) -> str:
+    def feed(h):
+        for mobject in mobjects:
+            h.update(b"/")
+            feed_mobject(h, mobject)
+    return _digest(feed)
+
+
+def play_hash(scene_object, camera_object, animations_list, current_mobjects_list) -> str:
+    """get_hash_from_play_call 대체: manim과 같은 "카메라_애니메이션_화면" 3단 형식"""
+    return "_".join((
+        camera_key(camera_object),
+        animations_key(animations_list),
+        mobjects_key(current_mobjects_list),
+    ))
+
+
+# --- partial 디렉터리 관리 ---
+
+class SegmentDirectory:
+    """씬 하나의 partial_movie_files 디렉터리와 최근 렌더 기록(segment_manifest.json)"""
+
+    def __init__(self, directory, keep_renders: int = DEFAULT_KEEP_RENDERS):
+        self.directory = Path(directory)
+        self.keep_renders = keep_renders
+        self.manifest_path = self.directory / MANIFEST_NAME
+
+    def renders(self) -> List[dict]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)["renders"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return []
+
+    def segment_files(self) -> List[Path]:
+        return [path for path in self.directory.iterdir()
+                if path.is_file() and path.name not in NON_SEGMENT_FILES and not path.name.endswith(".tmp")]
+
+    def record(self, segments: List[str], output: Optional[str] = None) -> None:
+        """이번 렌더의 세그먼트 파일 이름 목록을 기록하고 최근 keep_renders개만 남김"""
+        renders = self.renders() + [{"time": time.time(), "segments": list(segments), "output": output}]
+        _write_json(self.manifest_path, {"renders": renders[-self.keep_renders:]})
+
+    def is_unchanged(self, segments: List[str], output) -> bool:
+        """직전 렌더와 세그먼트가 같고, 결과 영상이 모든 세그먼트보다 새로우면 True"""
+        renders = self.renders()
+        if not renders or renders[-1]["segments"] != list(segments):
+            return False
+        if any(name.startswith("uncached_") for name in segments): # 캐시를 끈 렌더는 이름이 재사용됨
+            return False
+        try:
+            output_mtime = os.stat(output).st_mtime_ns
+            return all(os.stat(self.directory / name).st_mtime_ns <= output_mtime for name in segments)
+        except FileNotFoundError:
+            return False
+
+    def stale(self) -> List[Path]:
+        """기록된 최근 렌더 어디에도 쓰이지 않은 세그먼트"""
+        used = {name for render in self.renders() for name in render["segments"]}
+        return [path for path in self.segment_files() if path.name not in used]
+
+    def evict(self) -> List[Path]:
+        removed = []
+        for path in self.stale():
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            removed.append(path)
+        return removed
+
+
+def install_segment_cache(keep_renders: int = DEFAULT_KEEP_RENDERS) -> None:
+    """
+    manim의 play() 해시를 play_hash로, partial 디렉터리 정리를 SegmentDirectory로 교체합니다
+    (여러 번 호출해도 한 번만).
+    """
+    import manim.renderer.cairo_renderer as cairo_renderer
+    import manim.utils.caching as caching
+    from manim import config, logger
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    if _installed:
+        return
+    _installed["keep_renders"] = keep_renders
+    _installed["combine_to_movie"] = SceneFileWriter.combine_to_movie
+    cairo_renderer.get_hash_from_play_call = play_hash
+    caching.get_hash_from_play_call = play_hash # OpenGL 렌더러
+
+    def segment_names(writer) -> List[str]:
+        return [Path(path).name for path in writer.partial_movie_files if path is not None]
+
+    def combine_to_movie(writer):
+        segments = segment_names(writer)
+        directory = SegmentDirectory(writer.partial_movie_directory, _installed["keep_renders"])
+        output = writer.movie_file_path
+        # 소리나 gif는 결과 파일이 따로 생기므로 항상 다시 합침
+        if not writer.includes_sound and config.format != "gif" and directory.is_unchanged(segments, output):
+            logger.info(f"Segments unchanged, reusing {output}")
+        else:
+            _installed["combine_to_movie"](writer)
+        directory.record(segments, str(output))
+
+    def clean_cache(writer):
+        removed = SegmentDirectory(writer.partial_movie_directory, _installed["keep_renders"]).evict()
+        if removed:
+            logger.info(f"Removed {len(removed)} stale partial movie file(s)")
+
+    SceneFileWriter.combine_to_movie = combine_to_movie
+    SceneFileWriter.clean_cache = clean_cache
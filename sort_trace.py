@@ -0,0 +1,217 @@
+"""
+정렬 알고리즘 이벤트 기록과 프레임 배치
+실제 정렬(버블/선택/삽입/병합)을 실행하며 비교/교환/쓰기 이벤트를 int 배열로 기록하고,
+영상 프레임 수에 맞춰 여러 이벤트를 한 프레임으로 묶은 상태 스냅샷을 만듭니다.
+n=1000 버블 정렬(이벤트 약 75만 개)도 play 한 번으로 재생할 수 있습니다.
+"""
+
+from array import array
+from collections import namedtuple
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+
+# 이벤트 종류: (kind, a, b)
+COMPARE = 0  # a, b 인덱스 비교
+SWAP = 1     # a, b 인덱스 교환
+WRITE = 2    # a 인덱스에 값 b 쓰기
+
+SortFrames = namedtuple("SortFrames", ["frames", "touched", "comparisons", "swaps", "writes"])
+
+
+class EventLog:
+    """정렬 이벤트를 평평한 int 버퍼에 기록 (이벤트당 튜플을 만들지 않음)"""
+
+    def __init__(self):
+        self._buffer = array("q")
+
+    def compare(self, i: int, j: int) -> None:
+        self._buffer.extend((COMPARE, i, j))
+
+    def swap(self, i: int, j: int) -> None:
+        self._buffer.extend((SWAP, i, j))
+
+    def write(self, i: int, value: int) -> None:
+        self._buffer.extend((WRITE, i, value))
+
+    def __len__(self):
+        return len(self._buffer) // 3
+
+    def to_array(self) -> np.ndarray:
+        """(이벤트 수, 3) int64 배열"""
+        return np.frombuffer(self._buffer, dtype=np.int64).reshape(-1, 3).copy()
+
+
+def bubble_sort(values: List[int], log: EventLog) -> None:
+    n = len(values)
+    for end in range(n - 1, 0, -1):
+        swapped = False
+        for j in range(end):
+            log.compare(j, j + 1)
+            if values[j] > values[j + 1]:
+                values[j], values[j + 1] = values[j + 1], values[j]
+                log.swap(j, j + 1)
+                swapped = True
+        if not swapped:
+            break
+
+
+def selection_sort(values: List[int], log: EventLog) -> None:
+    n = len(values)
+    for i in range(n - 1):
+        smallest = i
+        for j in range(i + 1, n):
+            log.compare(smallest, j)
+            if values[j] < values[smallest]:
+                smallest = j
+        if smallest != i:
+            values[i], values[smallest] = values[smallest], values[i]
+            log.swap(i, smallest)
+
+
+def insertion_sort(values: List[int], log: EventLog) -> None:
+    for i in range(1, len(values)):
+        key = values[i]
+        j = i - 1
+        while j >= 0:
+            log.compare(j, j + 1)
+            if values[j] <= key:
+                break
+            values[j + 1] = values[j]
+            log.write(j + 1, values[j])
+            j -= 1
+        values[j + 1] = key
+        log.write(j + 1, key)
+
+
+def merge_sort(values: List[int], log: EventLog) -> None:
+    """bottom-up 병합 정렬 (재귀 없이 길이 1, 2, 4, ... 구간을 병합)"""
+    n = len(values)
+    width = 1
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            mid = lo + width
+            hi = min(lo + 2 * width, n)
+            left, right = values[lo:mid], values[mid:hi]
+            i = j = 0
+            k = lo
+            while i < len(left) and j < len(right):
+                log.compare(lo + i, mid + j)
+                if left[i] <= right[j]:
+                    values[k] = left[i]
+                    i += 1
+                else:
+                    values[k] = right[j]
+                    j += 1
+                log.write(k, values[k])
+                k += 1
+            for value in left[i:] + right[j:]:
+                values[k] = value
+                log.write(k, value)
+                k += 1
+        width *= 2
+
+
+ALGORITHMS: Dict[str, Callable[[List[int], EventLog], None]] = {
+    "bubble": bubble_sort,
+    "selection": selection_sort,
+    "insertion": insertion_sort,
+    "merge": merge_sort,
+}
+
+# SortSelectionVisualization과 같은 이름
+ALGORITHM_NAMES = {
+    "bubble": "버블 정렬",
+    "selection": "선택 정렬",
+    "insertion": "삽입 정렬",
+    "merge": "병합 정렬",
+}
+
+
+def record_sort(values: Sequence[int], algorithm: str = "bubble") -> np.ndarray:
+    """정렬을 실행하고 이벤트 배열을 반환 (입력은 바꾸지 않음)"""
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown sort algorithm: {algorithm} (available: {', '.join(ALGORITHMS)})")
+    log = EventLog()
+    ALGORITHMS[algorithm](list(values), log)
+    return log.to_array()
+
+
+def frame_budget(n_events: int, run_time: float, fps: float) -> int:
+    """재생 시간 동안 그릴 프레임 수. 이벤트가 적으면 이벤트마다 한 프레임"""
+    return max(1, min(n_events, int(round(run_time * fps))))
+
+
+def batch_frames(values: Sequence[int], events: np.ndarray, n_frames: int) -> SortFrames:
+    """
+    이벤트를 n_frames개의 묶음으로 나누고, 각 묶음을 적용한 뒤의 배열 상태를 기록합니다.
+
+    Returns:
+        SortFrames(frames: (n_frames + 1, n) 상태 스냅샷,
+                   touched: 프레임별로 접근한 인덱스 배열 목록,
+                   comparisons, swaps, writes: 이벤트 개수)
+    """
+    n_frames = max(1, n_frames)
+    state = list(values)
+    frames = np.empty((n_frames + 1, len(state)), dtype=np.int64)
+    frames[0] = state
+    bounds = np.linspace(0, len(events), n_frames + 1).astype(np.int64)
+
+    kinds = events[:, 0] if len(events) else np.empty(0, dtype=np.int64)
+    touched = []
+    event_list = events.tolist()
+    for f in range(n_frames):
+        lo, hi = bounds[f], bounds[f + 1]
+        for kind, a, b in event_list[lo:hi]:
+            if kind == SWAP:
+                state[a], state[b] = state[b], state[a]
+            elif kind == WRITE:
+                state[a] = b
+        frames[f + 1] = state
+
+        chunk = events[lo:hi]
+        index_pairs = chunk[chunk[:, 0] != WRITE, 1:3].ravel()
+        touched.append(np.unique(np.concatenate([index_pairs, chunk[chunk[:, 0] == WRITE, 1]])))
+
+    return SortFrames(
+        frames=frames,
+        touched=touched,
+        comparisons=int(np.count_nonzero(kinds == COMPARE)),
+        swaps=int(np.count_nonzero(kinds == SWAP)),
+        writes=int(np.count_nonzero(kinds == WRITE)),
+    )
+
+
+def bar_points(values, width: float, height: float, baseline: float = 0.0, gap: float = 0.15) -> np.ndarray:
+    """
+    막대그래프 전체를 하나의 VMobject로 그리기 위한 점 배열.
+    막대마다 닫힌 사각형 하나(직선 4개 = 3차 베지어 4개 = 점 16개)를 벡터 연산으로 만듭니다.
+    높이는 값의 최솟값~최댓값을 (0, height]에 대응시킵니다. 음수 값도 그릴 수 있습니다.
+
+    Returns:
+        (len(values) * 16, 3) 배열. 가로 중심이 x=0, 막대 바닥이 y=baseline
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if n == 0:
+        return np.zeros((0, 3))
+    low, high = values.min(), values.max()
+    span = high - low
+    heights = height * ((values - low + span / n) / (span + span / n) if span else np.ones(n))
+
+    step = width / n
+    left = -width / 2 + np.arange(n) * step + step * gap / 2
+    right = left + step * (1 - gap)
+    top = baseline + heights
+    bottom = np.full(n, baseline)
+
+    # 꼭짓점: 왼쪽 아래 → 오른쪽 아래 → 오른쪽 위 → 왼쪽 위 → 왼쪽 아래
+    corners = np.zeros((n, 5, 3))
+    corners[:, :, 0] = np.stack([left, right, right, left, left], axis=1)
+    corners[:, :, 1] = np.stack([bottom, bottom, top, top, bottom], axis=1)
+
+    starts, ends = corners[:, :-1], corners[:, 1:]
+    t = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, None, :, None]
+    curves = starts[:, :, None, :] + (ends - starts)[:, :, None, :] * t
+    return curves.reshape(-1, 3)
@@ -1,11 +1,19 @@
 """
 백준 2750번 - 수 정렬하기
 버블 정렬 알고리즘의 단계별 시각화
+
+큰 배열 (SortBarsVisualization, 기본 n=1000):
+    manim sort_visualization.py BubbleSortBars -ql
+    SORT_N=300 manim sort_visualization.py MergeSortBars -ql
 """
 
+import os
+
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
+from cached_tts_service import CachedTTSService
+from array_widget import ArrayWidget, BarArray
+from sort_trace import ALGORITHM_NAMES, batch_frames, frame_budget, record_sort
 import numpy as np
 
 
@@ -13,7 +21,7 @@ class SortVisualization(VoiceoverScene):
     """수 정렬하기 - 버블 정렬 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 제목
         title = Text("백준 2750번 - 수 정렬하기", font_size=44, font="NanumGothic").to_edge(UP)
@@ -119,28 +127,18 @@ class SortVisualization(VoiceoverScene):
 
     def _create_array_visual(self, nums, y_pos):
         """배열을 시각화하는 헬퍼 함수"""
-        group = VGroup()
-        for i, num in enumerate(nums):
-            box = Rectangle(width=0.8, height=0.8, color=BLUE, stroke_width=2)
-            text = Text(str(num), font_size=28, font="NanumGothic", color=WHITE)
-            element = VGroup(box, text)
-            element.shift((i * 1.0 - 2.0) * RIGHT + y_pos * UP)
-            group.add(element)
-        return group
+        return ArrayWidget(nums, cell_size=0.8, font_size=28, buff=0.2).move_to(y_pos * UP)
 
     def _get_current_boxes(self, array_group):
         """현재 배열의 박스들을 반환"""
-        boxes = []
-        for element in array_group:
-            boxes.append(element)
-        return boxes
+        return list(array_group.cells)
 
 
 class SortSelectionVisualization(VoiceoverScene):
     """선택 정렬로도 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         title = Text("정렬 알고리즘 비교", font_size=44, font="NanumGothic").to_edge(UP)
 
@@ -175,3 +173,60 @@ class SortSelectionVisualization(VoiceoverScene):
             y_pos -= DOWN * 1.2
 
         self.wait(1)
+
+
+class SortBarsVisualization(VoiceoverScene):
+    """
+    실제 정렬 알고리즘을 막대그래프로 시각화.
+    비교/교환 이벤트를 프레임 단위로 묶어 정렬 전체를 play 한 번으로 재생합니다.
+    """
+
+    algorithm = "bubble"
+    sort_run_time = 20
+    seed = 2750
+
+    def construct(self):
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
+
+        n = int(os.environ.get("SORT_N", 1000))
+        name = ALGORITHM_NAMES[self.algorithm]
+        values = np.random.default_rng(self.seed).permutation(np.arange(1, n + 1)).tolist()
+
+        events = record_sort(values, self.algorithm)
+        trace = batch_frames(values, events, frame_budget(len(events), self.sort_run_time, config.frame_rate))
+
+        title = Text(f"{name} (n = {n})", font_size=36, font="NanumGothic").to_edge(UP)
+        bars = BarArray(values, width=config.frame_width - 1.5, height=5.0).shift(DOWN * 0.5)
+
+        with self.voiceover(text=f"{n}개의 수를 {name}로 정렬해봅시다."):
+            self.play(Write(title), FadeIn(bars))
+
+        stats = f"비교 {trace.comparisons}번, 교환 {trace.swaps}번"
+        if trace.writes:
+            stats = f"비교 {trace.comparisons}번, 쓰기 {trace.writes}번"
+        stats_text = Text(stats, font_size=24, font="NanumGothic", color=YELLOW).next_to(title, DOWN)
+
+        with self.voiceover(text=f"{name}은 모두 {stats}을 수행합니다."):
+            self.play(Write(stats_text))
+            self.play(bars.play_frames(trace.frames, trace.touched), run_time=self.sort_run_time)
+
+        with self.voiceover(text="정렬이 완료되었습니다."):
+            self.play(bars.finish())
+            self.wait(1)
+
+
+class BubbleSortBars(SortBarsVisualization):
+    algorithm = "bubble"
+
+
+class SelectionSortBars(SortBarsVisualization):
+    algorithm = "selection"
+
+
+class InsertionSortBars(SortBarsVisualization):
+    algorithm = "insertion"
+
+
+class MergeSortBars(SortBarsVisualization):
+    algorithm = "merge"
+    sort_run_time = 8
@@ -0,0 +1,118 @@
+import os
+
+import pytest
+
+from build_manifest import BuildManifest, compute_fingerprint, output_path
+from scene_analysis import extract_fonts, extract_narrations, local_imports
+
+
+SCENE_SOURCE = '''
+from manim import *
+from helper_module import make_title
+
+
+class DemoScene(VoiceoverScene):
+    def construct(self):
+        with self.voiceover(text="첫 번째 문장"):
+            title = Text("제목", font="NanumGothic")
+        for i in range(2):
+            with self.voiceover(text=f"동적 문장 {i}"):
+                pass
+        with self.voiceover(text="두 번째 문장"):
+            pass
+
+
+class OtherScene(VoiceoverScene):
+    def construct(self):
+        with self.voiceover(text="다른 씬"):
+            pass
+'''
+
+
+@pytest.fixture
+def project(tmpdir):
+    root = str(tmpdir)
+    with open(os.path.join(root, "demo_scene.py"), "w", encoding="utf-8") as f:
+        f.write(SCENE_SOURCE)
+    with open(os.path.join(root, "helper_module.py"), "w", encoding="utf-8") as f:
+        f.write("def make_title():\n    return 'a'\n")
+    return root
+
+
+def write_video(root, quality="low_quality", content=b"mp4"):
+    video = output_path("demo_scene", "DemoScene", quality, os.path.join(root, "media"))
+    video.parent.mkdir(parents=True, exist_ok=True)
+    video.write_bytes(content)
+    return video
+
+
+def make_manifest(root):
+    return BuildManifest(
+        path=os.path.join(root, "media", "manifest.json"),
+        root=root,
+        media_dir=os.path.join(root, "media"),
+    )
+
+# --- Test Cases ---
+
+def test_extract_narrations_literals_only(project):
+    """Only literal narration strings of the requested class are returned, in order."""
+    path = os.path.join(project, "demo_scene.py")
+    assert extract_narrations(path, "DemoScene") == ["첫 번째 문장", "두 번째 문장"]
+    assert extract_narrations(path, "OtherScene") == ["다른 씬"]
+
+def test_extract_fonts_and_local_imports(project):
+    """Fonts and repo-local imports are found; third-party imports are ignored."""
+    path = os.path.join(project, "demo_scene.py")
+    assert extract_fonts(path, "DemoScene") == ["NanumGothic"]
+    assert [p.name for p in local_imports(path)] == ["helper_module.py"]
+
+def test_output_path_matches_manim_layout():
+    """Quality names map to manim's resolution directories."""
+    assert str(output_path("a", "A", "medium_quality")) == os.path.join("media", "videos", "a", "720p30", "A.mp4")
+    assert str(output_path("a", "A", "low_quality")) == os.path.join("media", "videos", "a", "480p15", "A.mp4")
+
+def test_fingerprint_changes_with_inputs(project):
+    """Source, imported modules and quality all feed the fingerprint."""
+    base, _ = compute_fingerprint("demo_scene", "DemoScene", "low_quality", project)
+    assert compute_fingerprint("demo_scene", "DemoScene", "low_quality", project)[0] == base
+    assert compute_fingerprint("demo_scene", "DemoScene", "high_quality", project)[0] != base
+
+    with open(os.path.join(project, "helper_module.py"), "a", encoding="utf-8") as f:
+        f.write("# edited\n")
+    assert compute_fingerprint("demo_scene", "DemoScene", "low_quality", project)[0] != base
+
+def test_manifest_up_to_date_cycle(project):
+    """A recorded render is skipped until its source or output changes."""
+    manifest = make_manifest(project)
+    assert not manifest.is_up_to_date("demo_scene", "DemoScene", "low_quality")
+
+    write_video(project)
+    assert manifest.record("demo_scene", "DemoScene", "low_quality") is not None
+    manifest.save()
+
+    reloaded = make_manifest(project)
+    assert reloaded.is_up_to_date("demo_scene", "DemoScene", "low_quality")
+    assert not reloaded.is_up_to_date("demo_scene", "DemoScene", "medium_quality")
+
+    with open(os.path.join(project, "demo_scene.py"), "a", encoding="utf-8") as f:
+        f.write("# edited\n")
+    assert not reloaded.is_up_to_date("demo_scene", "DemoScene", "low_quality")
+
+def test_manifest_detects_replaced_output(project):
+    """A missing or replaced MP4 invalidates the entry."""
+    manifest = make_manifest(project)
+    video = write_video(project)
+    manifest.record("demo_scene", "DemoScene", "low_quality")
+
+    video.write_bytes(b"different video")
+    assert not manifest.is_up_to_date("demo_scene", "DemoScene", "low_quality")
+
+    video.unlink()
+    assert not manifest.is_up_to_date("demo_scene", "DemoScene", "low_quality")
+
+def test_record_without_output_is_ignored(project):
+    """Nothing is recorded when manim produced no video."""
+    manifest = make_manifest(project)
+    assert manifest.record("demo_scene", "DemoScene", "low_quality") is None
+    assert manifest.entries == {}
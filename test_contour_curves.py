@@ -0,0 +1,95 @@
+import cv2
+import numpy as np
+import pytest
+
+from contour_curves import (
+    _bernstein,
+    extract_curves,
+    fit_beziers,
+    path_length,
+    select_longest_paths,
+    smooth_closed,
+    trace_contours,
+)
+
+
+def sample(path, n=50):
+    u = np.linspace(0, 1, n)
+    return np.concatenate([_bernstein(u) @ bezier for bezier in path])
+
+
+def max_distance(points, path):
+    """Largest distance from an input point to the densely sampled curve."""
+    curve = sample(path, 1000)
+    return np.sqrt(((points[:, None] - curve[None]) ** 2).sum(axis=-1)).min(axis=1).max()
+
+# --- Test Cases ---
+
+def test_fit_beziers_reproduces_cubic():
+    """Points sampled from one cubic are fitted by a single curve."""
+    control = np.array([[0, 0], [30, 60], [70, -20], [100, 30]], dtype=float)
+    points = _bernstein(np.linspace(0, 1, 80)) @ control
+    path = fit_beziers(points, max_error=0.5)
+    assert path.shape == (1, 4, 2)
+    assert max_distance(points, path) < 0.5
+
+
+def test_fit_beziers_splits_at_corner():
+    """A sharp corner needs at least two curves that share the corner point."""
+    points = np.vstack([np.stack([np.arange(0, 50), np.zeros(50)], axis=1),
+                        np.stack([np.full(50, 50), np.arange(0, 50)], axis=1)]).astype(float)
+    path = fit_beziers(points, max_error=0.5)
+    assert len(path) >= 2
+    np.testing.assert_allclose(path[1:, 0], path[:-1, 3])
+    assert max_distance(points, path) < 1.0
+
+
+def test_fit_beziers_closed_circle():
+    """A closed circle is fitted with a few curves that end where they start."""
+    angles = np.linspace(0, 2 * np.pi, 400, endpoint=False)
+    points = np.stack([np.cos(angles), np.sin(angles)], axis=1) * 100 + 150
+    path = fit_beziers(points, max_error=0.5, closed=True)
+    assert 2 <= len(path) <= 8
+    np.testing.assert_allclose(path[0, 0], path[-1, 3])
+    assert max_distance(points, path) < 1.0
+
+
+def test_fit_beziers_degenerate_input():
+    assert fit_beziers(np.zeros((1, 2))).shape == (0, 4, 2)
+    assert fit_beziers(np.array([[0, 0], [3, 4]])).shape == (1, 4, 2)
+
+
+def test_trace_contours_either_polarity():
+    """Light-on-dark and dark-on-light drawings give the same contours."""
+    image = np.zeros((120, 120), dtype=np.uint8)
+    cv2.circle(image, (60, 60), 40, 255, 3)
+    light = trace_contours(image)
+    dark = trace_contours(255 - image)
+    assert len(light) == len(dark) == 2
+    assert sorted(map(len, light)) == sorted(map(len, dark))
+
+
+def test_smooth_closed_keeps_centroid():
+    points = np.array([[0, 0], [10, 0], [10, 10], [0, 10]], dtype=float)
+    np.testing.assert_allclose(smooth_closed(points, 3).mean(axis=0), [5, 5])
+    assert smooth_closed(points, 1) is points
+
+
+def test_select_longest_paths():
+    short = np.array([[0, 0], [1, 0]], dtype=float)
+    long = np.array([[0, 0], [10, 0], [10, 10]], dtype=float)
+    assert select_longest_paths([short, long], 1)[0] is long
+    assert path_length(long) == pytest.approx(20)
+
+
+def test_extract_curves_stages():
+    """Stages report contours traced and selected and the number of fitted curves."""
+    image = np.zeros((200, 300), dtype=np.uint8)
+    cv2.circle(image, (80, 100), 50, 255, 2)
+    cv2.rectangle(image, (180, 50), (260, 150), 255, 2)
+    cv2.circle(image, (150, 20), 4, 255, 1)
+    paths, stages = extract_curves(image, max_paths=4)
+    assert [stage["stage"] for stage in stages] == ["trace", "select", "fit"]
+    assert stages[0]["segments"] == 6 and stages[1]["segments"] == 4
+    assert len(paths) == 4
+    assert stages[2]["segments"] == sum(len(path) for path in paths)
@@ -0,0 +1,90 @@
+import random
+import time
+
+import numpy as np
+import pytest
+
+from dp_engine import backtrack, grid_min_path, min_ops_table, path_of, stream_schedule
+
+
+def reference_min_ops(n):
+    """The straightforward Baekjoon 1463 loop."""
+    dp = [0] * (n + 1)
+    parent = [-1] * (n + 1)
+    for i in range(2, n + 1):
+        dp[i], parent[i] = dp[i - 1] + 1, i - 1
+        if i % 2 == 0 and dp[i // 2] + 1 < dp[i]:
+            dp[i], parent[i] = dp[i // 2] + 1, i // 2
+        if i % 3 == 0 and dp[i // 3] + 1 < dp[i]:
+            dp[i], parent[i] = dp[i // 3] + 1, i // 3
+    return dp, parent
+
+# --- Test Cases ---
+
+def test_min_ops_matches_reference_loop():
+    """The blocked NumPy table equals the Python loop, back pointers included."""
+    dp, parent = min_ops_table(3000)
+    ref_dp, ref_parent = reference_min_ops(3000)
+    assert dp[1:].tolist() == ref_dp[1:]
+    assert parent[2:].tolist() == ref_parent[2:]
+
+def test_min_ops_known_answers():
+    """Baekjoon 1463 samples: dp[2] = 1, dp[10] = 3."""
+    dp, parent = min_ops_table(10)
+    assert dp[2] == 1 and dp[10] == 3
+    assert path_of(parent, 10) == [10, 9, 3, 1]
+
+def test_min_ops_rejects_bad_input():
+    """n < 1 and divisor 1 are rejected."""
+    with pytest.raises(ValueError):
+        min_ops_table(0)
+    with pytest.raises(ValueError):
+        min_ops_table(10, divisors=(1, 2))
+
+def test_million_is_fast():
+    """N = 10^6 computes and backtracks well under a second."""
+    start = time.perf_counter()
+    dp, parent = min_ops_table(10 ** 6)
+    path = path_of(parent, 10 ** 6)
+    assert time.perf_counter() - start < 2
+    assert len(path) == dp[10 ** 6] + 1
+    assert path[-1] == 1
+
+def test_backtrack_many_starts():
+    """All starts are followed at once; finished paths are padded with -1."""
+    _, parent = min_ops_table(10)
+    paths = backtrack(parent, [1, 4, 10])
+    assert paths.tolist() == [
+        [1, -1, -1, -1],
+        [4, 3, 1, -1],
+        [10, 9, 3, 1],
+    ]
+
+def test_grid_min_path():
+    """LeetCode 64 example: minimum path sum 7 via 1 → 3 → 1 → 1 → 1."""
+    grid = np.array([[1, 3, 1], [1, 5, 1], [4, 2, 1]])
+    dp, parent = grid_min_path(grid)
+    assert dp[-1, -1] == 7
+    assert [grid.flat[i] for i in path_of(parent, grid.size - 1)] == [1, 1, 1, 3, 1]
+
+def test_grid_min_path_matches_loop():
+    """Vectorized rows match the cell-by-cell recurrence on random grids."""
+    rng = random.Random(3)
+    for _ in range(30):
+        rows, cols = rng.randint(1, 7), rng.randint(1, 7)
+        grid = np.array([[rng.randint(0, 9) for _ in range(cols)] for _ in range(rows)])
+        expected = np.zeros_like(grid)
+        for r in range(rows):
+            for c in range(cols):
+                options = [expected[r - 1, c]] if r else []
+                options += [expected[r, c - 1]] if c else []
+                expected[r, c] = grid[r, c] + (min(options) if options else 0)
+        assert (grid_min_path(grid)[0] == expected).all()
+
+def test_stream_schedule():
+    """The cursor is increasing, starts one cell at a time and ends at n."""
+    schedule = stream_schedule(10 ** 6, 180)
+    assert schedule[0] == 1 and schedule[-1] == 10 ** 6
+    assert np.all(np.diff(schedule) > 0)
+    assert schedule[:5].tolist() == [1, 2, 3, 4, 5]
+    assert stream_schedule(8, 100).tolist() == list(range(1, 9))
@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+
+from fluid_solver import StableFluids, _dct, _idct, _wall_transform, colorize
+from particle_system import ParticleSystem
+
+
+def jets(**kwargs):
+    """Two opposing jets pushing into the middle of a 2 x 1 box."""
+    fluid = StableFluids((64, 128), x_range=(-2, 2), y_range=(-1, 1), **kwargs)
+    fluid.add_body_force((-1, 0), 0.2, (4, 0)).add_body_force((1, 0), 0.2, (-4, 0))
+    return fluid
+
+
+def spectral_divergence(fluid):
+    """Divergence measured the way the FFT projection defines it."""
+    spectrum = np.fft.rfft2(fluid.velocity, axes=(0, 1))
+    return np.abs(fluid._kx * spectrum[..., 0] + fluid._ky * spectrum[..., 1]).max()
+
+def wall_divergence(fluid):
+    """Divergence in the sine/cosine basis the DCT projection uses."""
+    a_hat = _wall_transform(_wall_transform(fluid.velocity[..., 0], 1, True), 0, False)
+    b_hat = _wall_transform(_wall_transform(fluid.velocity[..., 1], 1, False), 0, True)
+    return np.abs(fluid._kx * a_hat + fluid._ky * b_hat).max()
+
+# --- Test Cases ---
+
+def test_fft_projection_is_divergence_free():
+    fluid = StableFluids((64, 64), convection=False)
+    rng = np.random.default_rng(0)
+    fluid.velocity[...] = rng.normal(size=fluid.velocity.shape)
+    before = spectral_divergence(fluid)
+    fluid.step(0.1)
+    assert spectral_divergence(fluid) < before * 1e-4
+
+
+def test_dct_projection_is_divergence_free():
+    for n in (7, 8):
+        x = np.random.default_rng(n).normal(size=(3, n))
+        m = np.arange(n)
+        basis = np.cos(np.pi * m[:, None] * (2 * m[None, :] + 1) / (2 * n))
+        assert np.allclose(_dct(x, 1), 2 * x @ basis.T)
+        assert np.allclose(_idct(_dct(x.T, 0), 0), x.T)
+
+    fluid = StableFluids((48, 64), boundary="walls", convection=False)
+    fluid.velocity[...] = np.random.default_rng(0).normal(size=fluid.velocity.shape)
+    before = wall_divergence(fluid)
+    fluid.step(0.1)
+    assert wall_divergence(fluid) < before * 1e-4
+
+
+def test_all_solvers_agree_on_colliding_jets():
+    """Pressure peaks where the jets meet and turns the flow up and down, with every solver."""
+    for kwargs in (dict(), dict(boundary="walls"), dict(boundary="walls", solver="jacobi", iterations=200)):
+        fluid = jets(**kwargs)
+        for _ in range(30):
+            fluid.step(1 / 30)
+        middle = fluid.pressure[32, 64]
+        assert middle > 0.2 and middle > 3 * abs(fluid.pressure[32, 0])
+        assert fluid.velocity[50, 64, 1] > 0.05 # Above the collision the fluid moves up
+        assert fluid.velocity[14, 64, 1] < -0.05
+
+
+def test_walls_block_normal_flow():
+    """Nothing crosses the walls, so the net flux through every column and row of the box is zero."""
+    for solver in ("dct", "jacobi"):
+        fluid = jets(boundary="walls", solver=solver, viscosity=0.01).splat((0.5, 0.3), 0.3, velocity=(2, 1))
+        for _ in range(10):
+            fluid.step(1 / 30)
+        u, v = fluid.velocity[..., 0], fluid.velocity[..., 1]
+        if solver == "jacobi": # Its walls are the edge cell centres
+            assert np.all(u[:, [0, -1]] == 0) and np.all(v[[0, -1], :] == 0)
+        else:
+            assert np.abs(u.sum(axis=0)).max() < 1e-4 * np.abs(u).sum(axis=0).max()
+            assert np.abs(v.sum(axis=1)).max() < 1e-4 * np.abs(v).sum(axis=1).max()
+    with pytest.raises(ValueError):
+        StableFluids(boundary="walls", solver="fft")
+    with pytest.raises(ValueError):
+        StableFluids(solver="dct")
+
+
+def test_uniform_flow_carries_dye():
+    """Semi-Lagrangian advection shifts dye by whole cells exactly and wraps around."""
+    fluid = StableFluids((16, 32), x_range=(0, 32), y_range=(0, 16), pressure=False, convection=False)
+    fluid.velocity[..., 0] = 3.0
+    fluid.dye[5, 30] = 1.0
+    fluid.step(1.0)
+    assert fluid.dye[5, 1] == pytest.approx(1.0)
+    assert fluid.dye.sum() == pytest.approx(1.0)
+
+
+def test_viscosity_decays_a_shear_wave():
+    """The FFT diffusion divides each mode by 1 + nu dt k^2; without viscosity it is kept."""
+    for viscosity in (0.0, 0.05):
+        fluid = StableFluids((32, 32), x_range=(0, 2 * np.pi), y_range=(0, 2 * np.pi), viscosity=viscosity)
+        _, Y = fluid.grid()
+        fluid.velocity[..., 0] = np.sin(2 * Y)
+        energy = fluid.kinetic_energy()
+        for _ in range(10):
+            fluid.step(0.1)
+        assert fluid.kinetic_energy() == pytest.approx(energy / (1 + viscosity * 0.1 * 4) ** 20, rel=1e-3)
+
+
+def test_buoyancy_sinks_dense_dye():
+    fluid = StableFluids((48, 32), x_range=(-1, 1), y_range=(-1.5, 1.5), boundary="walls", buoyancy=-4)
+    fluid.splat((0, 0.8), 0.3, dye=1.0)
+    _, Y = fluid.grid()
+    start = (fluid.dye * Y).sum() / fluid.dye.sum()
+    for _ in range(30):
+        fluid.step(1 / 30)
+    assert (fluid.dye * Y).sum() / fluid.dye.sum() < start - 0.3
+
+
+def test_sampling_matches_grid_and_drives_particles():
+    fluid = StableFluids((16, 16), x_range=(-1, 1), y_range=(-1, 1))
+    X, Y = fluid.grid()
+    fluid.velocity[..., 0] = -Y
+    fluid.velocity[..., 1] = X
+    points = np.stack([X[3:6, 4], Y[3:6, 4], np.zeros(3)], axis=1)
+    assert np.allclose(fluid.sample(points), fluid.velocity[3:6, 4], atol=1e-6)
+    assert np.allclose(fluid.velocity_function()(points[0]), [*fluid.velocity[3, 4], 0], atol=1e-6)
+
+    particles = ParticleSystem(points).add_flow(fluid.flow())
+    radii = np.linalg.norm(points[:, :2], axis=1)
+    particles.step(0.5)
+    assert np.allclose(np.linalg.norm(particles.positions[:, :2], axis=1), radii, atol=0.02)
+    assert particles.positions[0, 2] == 0
+
+
+def test_colorize_flips_rows_and_interpolates():
+    values = np.array([[0.0, 0.5], [1.0, 2.0]]) # Row 0 is the bottom of the grid
+    image = colorize(values, colors=[(0, 0, 0), (1, 0, 0), (1, 1, 1)], vmin=0, vmax=1, opacity=0.5)
+    assert image.shape == (2, 2, 4) and image.dtype == np.uint8
+    assert image[1, 0].tolist() == [0, 0, 0, 128]
+    assert image[1, 1].tolist() == [255, 0, 0, 128]
+    assert image[0, 0].tolist() == [255, 255, 255, 128]
+    assert image[0, 1].tolist() == [255, 255, 255, 128] # Clipped at vmax
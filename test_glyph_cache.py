@@ -0,0 +1,178 @@
+import json
+
+import numpy as np
+import pytest
+
+from glyph_cache import (
+    DYNAMIC_CHARSET,
+    Glyph,
+    GlyphStore,
+    glyphs_from_reference_line,
+    prewarm,
+    reference_line,
+    text_requirements,
+)
+from scene_analysis import extract_text
+
+
+def box(x0, x1, y0=0.0, y1=1.0):
+    """Four corner points standing in for a glyph outline."""
+    return np.array([[x0, y0, 0], [x1, y0, 0], [x1, y1, 0], [x0, y1, 0]], dtype=float)
+
+
+def fake_glyph(char):
+    return Glyph(box(0, 0.5) + ord(char) % 7, 0.6)
+
+
+def fake_typeset(chars, font, font_size, weight):
+    fake_typeset.calls.append(list(chars))
+    return {char: fake_glyph(char) for char in chars}, {"line_height": 1.2}
+
+
+@pytest.fixture
+def root(tmp_path):
+    fake_typeset.calls = []
+    GlyphStore._shared.clear()
+    yield str(tmp_path / "glyphs")
+    GlyphStore._shared.clear()
+
+
+SCENE_SOURCE = '''
+FONT = "NanumGothic"
+
+class Demo:
+    def construct(self):
+        Text("가나", font=FONT, font_size=28)
+        CachedText(f"값: {value}", font=FONT, font_size=28)
+        Text("굵게", font=FONT, font_size=28, weight=BOLD)
+        Text("모름", font=FONT, font_size=self.size)
+        Text(label)
+'''
+
+# --- Test Cases ---
+
+def test_put_and_reload(root):
+    """Glyphs written by one store are read back by a fresh store via index.json."""
+    store = GlyphStore("NanumGothic", 28, "NORMAL", root)
+    store.put({"가": fake_glyph("가"), " ": Glyph(np.zeros((0, 3)), 0.2)}, {"line_height": 1.5})
+
+    fresh = GlyphStore("NanumGothic", 28, "NORMAL", root)
+    assert len(fresh) == 2
+    assert fresh.line_height == 1.5
+    assert np.allclose(fresh.glyph("가").points, fake_glyph("가").points)
+    assert fresh.glyph(" ").advance == pytest.approx(0.2)
+    with pytest.raises(KeyError):
+        fresh.glyph("나")
+
+
+def test_keys_are_separate(root):
+    """Different sizes or weights use different directories."""
+    GlyphStore("NanumGothic", 28, "NORMAL", root).put({"a": fake_glyph("a")})
+    assert "a" not in GlyphStore("NanumGothic", 32, "NORMAL", root)
+    assert "a" not in GlyphStore("NanumGothic", 28, "BOLD", root)
+    assert "a" in GlyphStore("NanumGothic", 28.0, "NORMAL", root)
+
+
+def test_missing_skips_cached_and_newlines(root):
+    """missing() lists each uncached character once, in order."""
+    store = GlyphStore("", 48, "NORMAL", root)
+    store.put({"a": fake_glyph("a")})
+    assert store.missing("banana\nab") == ["b", "n"]
+
+
+def test_layout_accumulates_advances(root):
+    """Each glyph is placed at the sum of the previous advances."""
+    store = GlyphStore("", 48, "NORMAL", root)
+    store.put({"a": Glyph(box(0, 1), 1.0), "b": Glyph(box(0, 2), 2.5)})
+    placed, width = store.layout("aba")
+    assert [x for _, x in placed] == [0.0, 1.0, 3.5]
+    assert width == pytest.approx(4.5)
+
+
+def test_index_is_bounded(root):
+    """Beyond max_glyphs the least recently used glyphs and their files are removed."""
+    store = GlyphStore("", 48, "NORMAL", root, max_glyphs=3)
+    store.put({char: fake_glyph(char) for char in "abc"})
+    store.index["glyphs"]["a"]["used"] += 10  # "b" is now the least recently used
+    store.index["glyphs"]["c"]["used"] += 5
+    store.put({"d": fake_glyph("d")})
+
+    index = json.loads(store.index_path.read_text(encoding="utf-8"))
+    assert sorted(index["glyphs"]) == ["a", "c", "d"]
+    assert len(list(store.directory.glob("*.npy"))) == 3
+
+
+def test_writes_merge_with_other_processes(root):
+    """A store writing its index keeps glyphs another store added meanwhile."""
+    first = GlyphStore("", 48, "NORMAL", root)
+    second = GlyphStore("", 48, "NORMAL", root)
+    first.put({"a": fake_glyph("a")})
+    second.put({"b": fake_glyph("b")})
+    assert sorted(GlyphStore("", 48, "NORMAL", root).index["glyphs"]) == ["a", "b"]
+
+
+def test_reference_line_extraction():
+    """Advances and outlines are measured relative to the reference bars."""
+    chars = ["a", " ", "b"]
+    assert reference_line(chars) == "||a| |b|"
+    bar = 0.2   # bar advance: bars are 0.1 wide with 0.1 spacing
+    parts = [
+        box(0.0, 0.1, -1, 1),          # |
+        box(0.2, 0.3, -1, 1),          # |
+        box(0.45, 0.85, 0, 0.5),       # a (pen at 0.4)
+        box(0.9, 1.0, -1, 1),          # |
+        box(1.5, 1.6, -1, 1),          # | after a space of 0.4
+        box(1.7, 2.0, 0, 0.7),         # b (pen at 1.7)
+        box(2.1, 2.2, -1, 1),          # |
+    ]
+    glyphs, metrics = glyphs_from_reference_line(chars, parts)
+    assert glyphs["a"].advance == pytest.approx(0.9 - (0.2 + bar))
+    assert glyphs[" "].advance == pytest.approx(1.5 - (0.9 + bar))
+    assert len(glyphs[" "].points) == 0
+    assert glyphs["b"].points[:, 0].min() == pytest.approx(0.0)
+    assert glyphs["a"].points[:, 0].min() == pytest.approx(0.05)
+    assert glyphs["a"].points[:, 1].min() == pytest.approx(0.0)
+    assert metrics["line_height"] == pytest.approx(2.4)
+
+
+def test_reference_line_count_mismatch():
+    """A typeset result with the wrong number of glyphs is rejected."""
+    with pytest.raises(ValueError):
+        glyphs_from_reference_line(["a"], [box(0, 1)] * 3)
+
+
+def test_extract_text(tmp_path):
+    """Literal and f-string Text calls are found; unresolved keywords are skipped."""
+    path = tmp_path / "scene.py"
+    path.write_text(SCENE_SOURCE, encoding="utf-8")
+    calls = extract_text(path)
+    assert [call["strings"] for call in calls] == [["가나"], ["값: "], ["굵게"]]
+    assert [call["dynamic"] for call in calls] == [False, True, False]
+    assert calls[0]["font"] == "NanumGothic" and calls[0]["font_size"] == 28.0
+    assert calls[2]["weight"] == "BOLD"
+
+
+def test_text_requirements(tmp_path):
+    """Characters are grouped per (font, size, weight); f-strings add the digit charset."""
+    path = tmp_path / "scene.py"
+    path.write_text(SCENE_SOURCE, encoding="utf-8")
+    required = text_requirements([path])
+    assert set(required) == {("NanumGothic", 28.0, "NORMAL"), ("NanumGothic", 28.0, "BOLD")}
+    normal = required[("NanumGothic", 28.0, "NORMAL")]
+    assert set(normal) == set("가나값: ") | set(DYNAMIC_CHARSET)
+    assert len(normal) == len(set(normal))
+
+
+def test_prewarm_typesets_only_missing(tmp_path, root):
+    """A second prewarm of the same modules finds everything cached."""
+    path = tmp_path / "scene.py"
+    path.write_text(SCENE_SOURCE, encoding="utf-8")
+    first = prewarm([path], root, typeset=fake_typeset)
+    assert first["typeset"] == first["requested"] > 0
+    assert len(fake_typeset.calls) == 2
+
+    GlyphStore._shared.clear()
+    second = prewarm([path], root, typeset=fake_typeset)
+    assert second["typeset"] == 0
+    assert second["cached"] == second["requested"]
+    assert len(fake_typeset.calls) == 2
@@ -1,10 +1,11 @@
 import pytest
 import os
+import textwrap
 import cv2
 import numpy as np
 from manim import *
 
-from image_to_manim import ImageToManim
+from image_to_manim import ImageToManim, class_name_for, convert_directory, select_longest
 
 # Fixture to create a temporary directory for test files
 @pytest.fixture
@@ -37,6 +38,24 @@ def test_load_image_not_found():
     with pytest.raises(FileNotFoundError):
         converter._load_image()
 
+def test_load_image_reduced_decode(tmp_path):
+    """decode_scale decodes straight to grayscale at 1/n resolution; other values are rejected."""
+    img_path = os.path.join(tmp_path, "line.png")
+    create_test_image(img_path)
+    gray_image = ImageToManim(image_path=img_path, decode_scale=4)._load_image()
+    assert gray_image.shape == (25, 50)
+    with pytest.raises(ValueError):
+        ImageToManim(image_path=img_path, decode_scale=3)._load_image()
+
+def test_detect_lines_tiled(tmp_path):
+    """Tiled detection still finds the diagonal line across tile seams."""
+    img_path = os.path.join(tmp_path, "line.png")
+    create_test_image(img_path, with_line=True)
+    converter = ImageToManim(image_path=img_path, tile_size=64, tile_overlap=8, detect_workers=2)
+    lines = converter._detect_lines(converter._load_image())
+    assert lines.shape[1] == 4
+    assert np.hypot(lines[:, 2] - lines[:, 0], lines[:, 3] - lines[:, 1]).max() > 150
+
 def test_detect_lines_found(tmp_path):
     """Test that lines are detected in an image that has them."""
     img_path = os.path.join(tmp_path, "line.png")
@@ -44,7 +63,8 @@ def test_detect_lines_found(tmp_path):
     converter = ImageToManim(image_path=img_path)
     gray_image = converter._load_image()
     lines = converter._detect_lines(gray_image)
-    assert isinstance(lines, list)
+    assert isinstance(lines, np.ndarray)
+    assert lines.shape[1] == 4
     assert len(lines) > 0
 
 def test_detect_lines_none(tmp_path):
@@ -54,8 +74,8 @@ def test_detect_lines_none(tmp_path):
     converter = ImageToManim(image_path=img_path)
     gray_image = converter._load_image()
     lines = converter._detect_lines(gray_image)
-    assert isinstance(lines, list)
-    assert len(lines) == 0
+    assert isinstance(lines, np.ndarray)
+    assert lines.shape == (0, 4)
 
 def test_transform_coordinates():
     """Test the coordinate transformation logic with predictable values."""
@@ -104,3 +124,189 @@ def test_generate_script_no_lines(tmp_path):
     with open(script_path, "r") as f:
         content = f.read()
         assert 'Text("No lines detected in the image."' in content
+
+
+def test_transform_coordinates_array():
+    """An (N, 4) array is transformed into an (N, 2, 3) array in one step."""
+    converter = ImageToManim(image_path="dummy.png")
+    lines = np.array([[10, 10, 190, 90], [100, 50, 100, 0]], dtype=np.float32)
+    transformed = converter._transform_coordinates(lines, 100, 200)
+    assert transformed.shape == (2, 2, 3)
+    np.testing.assert_allclose(transformed[1], [[0, 0, 0], [0, 4, 0]], atol=1e-6)
+
+
+def test_select_longest_matches_full_sort():
+    """argpartition top-k gives the same lines, in the same order, as a full sort."""
+    rng = np.random.default_rng(0)
+    lines = rng.uniform(0, 1000, size=(5000, 4))
+    lengths = np.hypot(lines[:, 2] - lines[:, 0], lines[:, 3] - lines[:, 1])
+    expected = lines[np.argsort(lengths)[::-1][:300]]
+    np.testing.assert_array_equal(select_longest(lines, 300), expected)
+    assert len(select_longest(lines[:10], 300)) == 10
+
+
+def test_class_name_for():
+    """Scene class names are valid identifiers derived from file names."""
+    assert class_name_for("/tmp/my-drawing.png") == "MyDrawingScene"
+    assert class_name_for("2024_scan.jpg") == "Image2024ScanScene"
+
+
+def test_convert_directory(tmp_path):
+    """Every image in a directory becomes a script; results stream back per image."""
+    image_dir = os.path.join(tmp_path, "images")
+    os.makedirs(image_dir)
+    create_test_image(os.path.join(image_dir, "line.png"))
+    create_test_image(os.path.join(image_dir, "blank.png"), with_line=False)
+    with open(os.path.join(image_dir, "notes.txt"), "w") as f:
+        f.write("not an image")
+
+    out_dir = os.path.join(tmp_path, "scenes")
+    results = sorted(convert_directory(image_dir, out_dir, workers=2), key=lambda r: r.image_path)
+    assert [os.path.basename(r.output_path) for r in results] == ["blank.py", "line.py"]
+    assert all(r.error is None for r in results)
+    assert results[0].n_lines == 0 and results[1].n_lines > 0
+    with open(results[1].output_path) as f:
+        assert "class LineScene(Scene):" in f.read()
+
+
+def test_generate_script_npy_sidecar(tmp_path):
+    """The npy format writes a float32 sidecar and a script that memory-maps it."""
+    img_path = os.path.join(tmp_path, "line.png")
+    script_path = os.path.join(tmp_path, "gen_scene.py")
+    create_test_image(img_path)
+
+    converter = ImageToManim(image_path=img_path, line_data_format="npy")
+    converter.generate_script(output_path=script_path)
+
+    data = np.load(os.path.join(tmp_path, "gen_scene.npy"))
+    assert data.dtype == np.float32
+    assert data.shape == (len(converter.lines_data), 2, 3)
+    np.testing.assert_allclose(data, converter.lines_data, atol=1e-5)
+
+    with open(script_path) as f:
+        content = f.read()
+    compile(content, script_path, "exec")
+    assert "np.array([" not in content
+    assert 'mmap_mode="r"' in content
+
+    # Run only the generated line_data statement, as the scene would at load time
+    namespace = {"np": np, "os": os, "__file__": script_path}
+    exec(textwrap.dedent(converter.line_data_source("gen_scene.npy")), namespace)
+    np.testing.assert_array_equal(namespace["line_data"], data)
+
+
+def test_generate_script_unknown_format(tmp_path):
+    """An unknown line_data_format is rejected before any work is done."""
+    converter = ImageToManim(image_path="dummy.png", line_data_format="csv")
+    with pytest.raises(ValueError):
+        converter.generate_script(os.path.join(tmp_path, "out.py"))
+
+
+class RecordingVMobject:
+    """Records the points handed to VMobject.set_points by the generated code."""
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.points = None
+
+    def set_points(self, points):
+        self.points = points
+        return self
+
+
+def test_batched_lines_single_vmobject():
+    """Batched mode builds one VMobject with one straight cubic curve per segment."""
+    converter = ImageToManim(image_path="dummy.png", line_mode="batched")
+    converter.lines_data = np.array([[[0, 0, 0], [3, 0, 0]], [[1, 1, 0], [1, 4, 0]]], dtype=float)
+    script = converter.render_script()
+    compile(script, "gen_scene.py", "exec")
+    assert "Line(" not in script
+    assert "VGroup" not in script
+
+    namespace = {"np": np, "VMobject": RecordingVMobject, "line_data": converter.lines_data}
+    exec(textwrap.dedent(converter.lines_source()), namespace)
+    points = namespace["lines"].points
+    assert points.shape == (8, 3)
+    np.testing.assert_allclose(points[:4, 0], [0, 1, 2, 3])
+    np.testing.assert_allclose(points[4:, 1], [1, 2, 3, 4])
+
+
+def test_manim_color_is_emitted_as_string_literal():
+    """A Manim color object is written as a quoted hex string, not a bare '#...' comment."""
+    converter = ImageToManim(image_path="dummy.png", line_color=ManimColor("#FF0000"))
+    converter.lines_data = np.zeros((1, 2, 3))
+    assert "color='#FF0000'" in converter.render_script()
+
+
+def test_unknown_line_mode(tmp_path):
+    """An unknown line_mode is rejected."""
+    converter = ImageToManim(image_path="dummy.png", line_mode="polyline")
+    with pytest.raises(ValueError):
+        converter.generate_script(os.path.join(tmp_path, "out.py"))
+
+
+def test_simplify_stage_report(tmp_path):
+    """With simplify on, per-stage segment counts and timings are recorded."""
+    img_path = os.path.join(tmp_path, "line.png")
+    create_test_image(img_path)
+
+    converter = ImageToManim(image_path=img_path, simplify=True, simplify_options={"chain_epsilon": 1.0})
+    converter.process()
+    names = [stage["stage"] for stage in converter.stages]
+    assert names == ["detect", "dedupe", "merge", "chain", "select"]
+    counts = [stage["segments"] for stage in converter.stages]
+    assert counts[-1] == len(converter.lines_data) <= counts[0]
+    assert all(stage["seconds"] >= 0 for stage in converter.stages)
+
+
+def create_curve_image(path):
+    img = np.zeros((200, 300, 3), dtype=np.uint8)
+    cv2.circle(img, (100, 100), 60, (255, 255, 255), 3)
+    cv2.ellipse(img, (220, 100), (50, 25), 30, 0, 360, (255, 255, 255), 2)
+    cv2.imwrite(path, img)
+    return path
+
+def test_curves_engine_paths(tmp_path):
+    """The curves engine yields closed Bezier paths in Manim coordinates, far fewer pieces than LSD."""
+    img_path = create_curve_image(os.path.join(tmp_path, "curves.png"))
+    converter = ImageToManim(image_path=img_path, engine="curves")
+    paths = converter.process()
+    assert len(paths) == 4 # inner and outer boundary of each stroke
+    assert [stage["stage"] for stage in converter.stages] == ["trace", "select", "fit"]
+    for path in paths:
+        assert path.shape[1:] == (4, 3)
+        np.testing.assert_allclose(path[0, 0], path[-1, -1], atol=1e-6)
+        assert np.abs(path[..., :2]).max() < 6.1 and not path[..., 2].any()
+    n_curves = sum(len(path) for path in paths)
+    lines = ImageToManim(image_path=img_path).process()
+    assert n_curves < len(lines)
+
+@pytest.mark.parametrize("line_mode", ["group", "batched"])
+@pytest.mark.parametrize("data_format", ["inline", "npy"])
+def test_curves_engine_script(tmp_path, line_mode, data_format):
+    """Generated curve scripts rebuild the same control points, per path or as one VMobject."""
+    img_path = create_curve_image(os.path.join(tmp_path, "curves.png"))
+    output_path = os.path.join(tmp_path, "curves_scene.py")
+    converter = ImageToManim(image_path=img_path, engine="curves", line_mode=line_mode, line_data_format=data_format)
+    converter.generate_script(output_path, verbose=False)
+    script = open(output_path).read()
+    compile(script, output_path, "exec")
+    assert "self.play(Create(paths)" in script
+    assert os.path.exists(os.path.splitext(output_path)[0] + ".npy") == (data_format == "npy")
+
+    data_file = os.path.basename(os.path.splitext(output_path)[0] + ".npy") if data_format == "npy" else None
+    namespace = {"np": np, "os": os, "__file__": output_path, "VMobject": RecordingVMobject,
+                 "VGroup": lambda *items: list(items)}
+    exec(textwrap.dedent(converter.curve_data_source(data_file) + "\n" + converter.curves_source()), namespace)
+    expected = converter.curve_points()
+    if line_mode == "batched":
+        np.testing.assert_allclose(namespace["paths"].points, expected, atol=1e-4)
+    else:
+        assert len(namespace["paths"]) == len(converter.curve_data)
+        np.testing.assert_allclose(np.concatenate([p.points for p in namespace["paths"]]), expected, atol=1e-4)
+
+def test_unknown_engine(tmp_path):
+    """An unknown engine is rejected."""
+    converter = ImageToManim(image_path="dummy.png", engine="potrace")
+    with pytest.raises(ValueError):
+        converter.generate_script(os.path.join(tmp_path, "out.py"))
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from line_simplify import (
+    chain_polylines,
+    connected_components,
+    douglas_peucker,
+    format_stages,
+    grid_pairs,
+    merge_collinear,
+    polylines_to_segments,
+    remove_duplicates,
+    simplify_lines,
+)
+
+
+def brute_force_close_pairs(points, radius):
+    pairs = set()
+    for i in range(len(points)):
+        for j in range(i + 1, len(points)):
+            if np.hypot(*(points[i] - points[j])) < radius:
+                pairs.add((i, j))
+    return pairs
+
+
+def as_set(lines, decimals=3):
+    """Segments as a set of direction-independent rounded tuples."""
+    result = set()
+    for x1, y1, x2, y2 in np.round(lines, decimals):
+        result.add(min((x1, y1, x2, y2), (x2, y2, x1, y1)))
+    return result
+
+# --- Test Cases ---
+
+def test_grid_pairs_cover_close_points():
+    """Every pair closer than one cell is reported, each exactly once."""
+    rng = np.random.default_rng(1)
+    points = rng.uniform(0, 50, size=(300, 2))
+    i, j = grid_pairs(points, 3.0)
+    found = {(min(a, b), max(a, b)) for a, b in zip(i.tolist(), j.tolist())}
+    assert len(found) == len(i)
+    assert brute_force_close_pairs(points, 3.0) <= found
+
+
+def test_connected_components():
+    """Labels are the smallest index in each component."""
+    labels = connected_components(6, np.array([4, 1, 3]), np.array([5, 2, 1]))
+    assert labels.tolist() == [0, 1, 1, 1, 4, 4]
+
+
+def test_remove_duplicates_keeps_longest():
+    """Near-identical segments (in either direction) collapse to the longest one."""
+    lines = np.array([
+        [0, 0, 10, 0],
+        [10.5, 0.5, 0.2, 0],     # reversed near-duplicate, shorter
+        [0, 0, 10.4, 0.3],       # near-duplicate, longer
+        [0, 5, 10, 5],           # distinct
+    ])
+    result = remove_duplicates(lines, tol=1.0)
+    assert as_set(result) == as_set([[0, 0, 10.4, 0.3], [0, 5, 10, 5]])
+
+
+def test_merge_collinear_fragments():
+    """Collinear fragments with small gaps become one segment; parallel lines stay apart."""
+    lines = np.array([
+        [0, 0, 10, 0],
+        [12, 0.2, 20, 0.2],
+        [19, 0, 30, 0.1],        # overlaps the previous fragment
+        [0, 10, 30, 10],         # parallel but far away
+        [40, 0, 50, 0],          # collinear but beyond the gap tolerance
+    ])
+    result = merge_collinear(lines, angle_tol=2.0, distance_tol=1.0, gap_tol=3.0)
+    assert len(result) == 3
+    longest = result[np.argmax(np.hypot(result[:, 2] - result[:, 0], result[:, 3] - result[:, 1]))]
+    xs = sorted([longest[0], longest[2]])
+    assert xs[0] == pytest.approx(0, abs=0.1) and xs[1] == pytest.approx(30, abs=0.1)
+
+
+def test_merge_collinear_ignores_crossing_lines():
+    """Segments that touch at an angle are not merged."""
+    lines = np.array([[0, 0, 10, 0], [10, 0, 20, 5]])
+    assert as_set(merge_collinear(lines)) == as_set(lines)
+
+
+def test_merge_collinear_keeps_bending_chain():
+    """A gently curving chain whose best fit misses its endpoints is left unmerged."""
+    angles = np.deg2rad(np.arange(0, 60, 1.5))
+    points = np.stack([np.cos(angles), np.sin(angles)], axis=1) * 100
+    lines = np.hstack([points[:-1], points[1:]])
+    result = merge_collinear(lines, angle_tol=2.0, distance_tol=1.0, gap_tol=2.0)
+    assert len(result) == len(lines)
+
+
+def test_chain_polylines_and_simplify():
+    """An L-shaped path made of collinear pieces simplifies to its two legs."""
+    lines = np.array([
+        [0, 0, 5, 0], [5, 0, 10, 0.1], [10, 0.1, 10, 5], [10, 5, 10, 10],
+        [30, 30, 40, 30],   # unconnected
+    ])
+    polylines = chain_polylines(lines, join_tol=0.5)
+    assert sorted(len(p) for p in polylines) == [2, 5]
+    segments = polylines_to_segments(polylines, epsilon=0.5)
+    assert as_set(segments, 1) == as_set([[0, 0, 10, 0.1], [10, 0.1, 10, 10], [30, 30, 40, 30]], 1)
+
+
+def test_chain_polylines_stops_at_junctions():
+    """Three ends meeting at a point are not chained through."""
+    lines = np.array([[0, 0, 5, 0], [5, 0, 10, 0], [5, 0, 5, 5]])
+    assert [len(p) for p in chain_polylines(lines)] == [2, 2, 2]
+
+
+def test_chain_polylines_closed_loop():
+    """A square of four segments becomes one closed polyline."""
+    square = np.array([[0, 0, 10, 0], [10, 0, 10, 10], [10, 10, 0, 10], [0, 10, 0, 0]])
+    polylines = chain_polylines(square)
+    assert len(polylines) == 1
+    assert len(polylines[0]) == 5
+    np.testing.assert_allclose(polylines[0][0], polylines[0][-1])
+
+
+def test_douglas_peucker():
+    """Vertices within epsilon of the chord are dropped."""
+    points = np.array([[0, 0], [1, 0.05], [2, -0.05], [3, 2], [4, 0]])
+    assert douglas_peucker(points, 0.1).tolist() == [True, False, True, True, True]
+    assert douglas_peucker(points, 5).tolist() == [True, False, False, False, True]
+
+
+def test_simplify_lines_report():
+    """Each stage reports its segment count and time; chaining is optional."""
+    lines = np.array([[0, 0, 5, 0], [5.5, 0, 10, 0], [0, 0, 5, 0.05], [20, 0, 20, 10]])
+    result, stages = simplify_lines(lines)
+    assert [stage["stage"] for stage in stages] == ["input", "dedupe", "merge"]
+    assert [stage["segments"] for stage in stages] == [4, 3, 2]
+    assert len(result) == 2
+
+    _, stages = simplify_lines(lines, chain_epsilon=1.0)
+    assert stages[-1]["stage"] == "chain"
+    assert "dedupe" in format_stages(stages)
+
+
+def test_empty_input():
+    """All stages accept zero segments."""
+    result, stages = simplify_lines(np.zeros((0, 4)), chain_epsilon=1.0)
+    assert result.shape == (0, 4)
+    assert [stage["segments"] for stage in stages] == [0, 0, 0, 0]
@@ -0,0 +1,93 @@
+import time
+
+import numpy as np
+import pytest
+
+from particle_system import ParticleSystem, gravity, grid_flow, uniform_flow, vortex
+
+# --- Test Cases ---
+
+def test_seeded_layouts_repeat():
+    """The same seed gives the same particles; a different seed does not."""
+    first = ParticleSystem.random_disk(500, radius=2, seed=3)
+    assert np.array_equal(first.positions, ParticleSystem.random_disk(500, radius=2, seed=3).positions)
+    assert not np.array_equal(first.positions, ParticleSystem.random_disk(500, radius=2, seed=4).positions)
+    assert np.all(np.linalg.norm(first.positions, axis=1) <= 2)
+
+    box = ParticleSystem.random_box(500, (-1, 0, 0), (1, 2, 0))
+    assert np.all(box.positions[:, 2] == 0)
+    assert box.positions[:, 0].min() >= -1 and box.positions[:, 1].max() <= 2
+
+
+def test_spiral_matches_point_list():
+    """Without jitter the spiral is the old per-point vortex layout."""
+    n, max_radius = 200, 3
+    expected = np.array([
+        [r * np.cos(2 * np.pi * r / max_radius + 2 * np.pi * i / n),
+         r * np.sin(2 * np.pi * r / max_radius + 2 * np.pi * i / n), 0]
+        for i, r in enumerate(np.linspace(0.1, max_radius, n))
+    ])
+    assert np.allclose(ParticleSystem.spiral(n, max_radius).positions, expected)
+
+
+def test_vortex_rotates_and_inflow_pulls_in():
+    """A pure vortex keeps radii; inflow shrinks them."""
+    start = ParticleSystem.random_disk(1000, radius=2, seed=1).positions.copy()
+    spinning = ParticleSystem(start).add_flow(vortex(strength=1.0, core=0.2))
+    spinning.step(1.0)
+    assert np.allclose(np.linalg.norm(spinning.positions, axis=1), np.linalg.norm(start, axis=1), atol=0.02)
+    assert not np.allclose(spinning.positions, start)
+
+    sinking = ParticleSystem(start).add_flow(vortex(strength=1.0, core=0.2, inflow=0.5))
+    sinking.step(1.0)
+    assert np.all(np.linalg.norm(sinking.positions, axis=1) < np.linalg.norm(start, axis=1))
+
+
+def test_forces_and_substeps():
+    """Gravity builds up velocity; one long step equals many short ones."""
+    drop = ParticleSystem(np.zeros((4, 3))).add_force(gravity((0, -2, 0)))
+    drop.step(1.0)
+    assert np.allclose(drop.velocities[:, 1], -2)
+    assert np.allclose(drop.positions[:, 1], -1, atol=0.05)
+
+    long_step = ParticleSystem(np.ones((4, 3))).add_force(gravity()).add_flow(uniform_flow((1, 0, 0)))
+    short_steps = ParticleSystem(np.ones((4, 3))).add_force(gravity()).add_flow(uniform_flow((1, 0, 0)))
+    long_step.step(0.5)
+    for _ in range(30):
+        short_steps.step(0.5 / 30)
+    assert np.allclose(long_step.positions, short_steps.positions)
+    assert long_step.time == pytest.approx(0.5)
+
+
+def test_grid_flow_is_bilinear_and_live():
+    """Samples interpolate the grid, clamp at its edge and follow in-place updates."""
+    velocity = np.zeros((2, 3, 2))
+    velocity[:, :, 0] = [0.0, 1.0, 2.0] # vx grows with x
+    velocity[1, :, 1] = 4.0 # vy is 4 on the top row only
+    field = grid_flow(velocity, (0, 2), (0, 1))
+    points = np.array([[0.5, 0.25, 0], [1.5, 0.5, 0], [5.0, -1.0, 0]])
+    assert np.allclose(field(points, 0), [[0.5, 1.0, 0], [1.5, 2.0, 0], [2.0, 0.0, 0]])
+
+    velocity *= 2
+    assert np.allclose(field(points, 0)[0], [1.0, 2.0, 0])
+
+
+def test_display_rgbas_premultiplies_over_background():
+    system = ParticleSystem(np.zeros((2, 3)), colors=[[1, 0.5, 0, 1], [1, 1, 1, 0.5]])
+    rgbas = system.display_rgbas(background=(0, 0, 0), opacity=0.5)
+    assert np.allclose(rgbas, [[0.5, 0.25, 0, 1], [0.25, 0.25, 0.25, 1]])
+    assert np.allclose(system.display_rgbas(background=(1, 1, 1, 1), opacity=0), 1)
+
+    system.add_flow(uniform_flow((3, 4, 0))).color_by_speed((0, 0, 0), (1, 1, 1), max_speed=10)
+    assert np.allclose(system.colors[:, :3], 0.5)
+    assert np.allclose(system.colors[:, 3], [1, 0.5])
+
+
+def test_hundred_thousand_particles_step_quickly():
+    """A frame of the 100k-particle outro (vortex + colours) stays well under a second."""
+    system = ParticleSystem.spiral(100_000, max_radius=3, jitter=0.05).add_flow(vortex(strength=2, inflow=0.3))
+    start = time.perf_counter()
+    system.step(1 / 15)
+    system.display_rgbas()
+    assert time.perf_counter() - start < 1.0
+    assert np.isfinite(system.positions).all()
@@ -0,0 +1,94 @@
+import json
+import os
+import sys
+
+import pytest
+
+from render_scheduler import RenderJob, build_command, job_count, load_history, order_jobs, run_jobs
+
+
+# Command builder that runs a tiny Python process instead of manim.
+# Scene class "Fail" exits with a non-zero code.
+def fake_command(scene_file, scene_class, quality):
+    if scene_class == "Fail":
+        return [sys.executable, "-c", "import sys; print('boom'); sys.exit(3)"]
+    return [sys.executable, "-c", f"print('rendered {scene_class} at {quality}')"]
+
+
+def run_fake(tmp_path, jobs, **kwargs):
+    return run_jobs(
+        jobs,
+        max_workers=kwargs.pop("max_workers", 2),
+        log_dir=os.path.join(tmp_path, "logs"),
+        history_path=os.path.join(tmp_path, "history.json"),
+        report_path=os.path.join(tmp_path, "report.json"),
+        command_builder=fake_command,
+        **kwargs,
+    )
+
+# --- Test Cases ---
+
+def test_build_command_quality_codes():
+    """Quality names map to the same manim flags as before."""
+    assert build_command("a", "A", "low_quality")[-1] == "l"
+    assert build_command("a", "A", "medium_quality")[-1] == "m"
+    assert build_command("a", "A", "high_quality")[-1] == "h"
+    assert build_command("a", "A", "medium_quality")[:4] == ["manim", "render", "a.py", "A"]
+
+def test_job_count_rejects_values_below_one(capsys):
+    """-j accepts positive counts or auto; zero and negatives fail in argparse, not in the thread pool."""
+    from render_all_problems import parse_args
+
+    assert job_count("3") == 3
+    assert job_count("auto") is None
+    assert parse_args(["-j", "4"]).jobs == 4
+    assert parse_args([]).jobs == 1
+    for value in ("0", "-2", "many"):
+        with pytest.raises(SystemExit):
+            parse_args(["-j", value])
+        assert "1 이상의 정수" in capsys.readouterr().err
+
+def test_order_jobs_longest_first_unknown_first():
+    """Jobs without history start first, then the longest known jobs."""
+    jobs = [RenderJob("a", "Short"), RenderJob("b", "Long"), RenderJob("c", "New")]
+    history = {jobs[0].key: 5.0, jobs[1].key: 60.0}
+    ordered = order_jobs(jobs, history)
+    assert [job.scene_class for job in ordered] == ["New", "Long", "Short"]
+
+def test_run_jobs_results_in_input_order(tmp_path):
+    """Results keep the input order and record success per job."""
+    jobs = [RenderJob("a", "Ok1"), RenderJob("b", "Fail"), RenderJob("c", "Ok2")]
+    results = run_fake(str(tmp_path), jobs)
+    assert [r["class"] for r in results] == ["Ok1", "Fail", "Ok2"]
+    assert [r["success"] for r in results] == [True, False, True]
+    assert results[1]["returncode"] == 3
+
+def test_run_jobs_writes_logs(tmp_path):
+    """Each job's stdout goes to its own log file."""
+    jobs = [RenderJob("a", "Ok1", "low_quality")]
+    results = run_fake(str(tmp_path), jobs)
+    with open(results[0]["log"], "r", encoding="utf-8") as f:
+        assert "rendered Ok1 at low_quality" in f.read()
+
+def test_run_jobs_report_and_history(tmp_path):
+    """The report has timing data per job; only successful jobs enter the history."""
+    jobs = [RenderJob("a", "Ok1"), RenderJob("b", "Fail")]
+    run_fake(str(tmp_path), jobs)
+
+    with open(os.path.join(tmp_path, "report.json"), "r", encoding="utf-8") as f:
+        report = json.load(f)
+    assert report["succeeded"] == 1
+    assert report["failed"] == 1
+    for entry in report["jobs"]:
+        assert entry["wall_time"] >= 0
+        assert {"file", "class", "quality", "cpu_time", "peak_rss_kb"} <= set(entry)
+
+    history = load_history(os.path.join(tmp_path, "history.json"))
+    assert list(history) == [jobs[0].key]
+
+@pytest.mark.skipif(not hasattr(os, "wait4"), reason="rusage is only collected on POSIX")
+def test_run_jobs_measures_rusage(tmp_path):
+    """CPU time and peak RSS are collected for the child process."""
+    results = run_fake(str(tmp_path), [RenderJob("a", "Ok1")])
+    assert results[0]["cpu_time"] is not None
+    assert results[0]["peak_rss_kb"] > 0
@@ -0,0 +1,110 @@
+import sys
+import threading
+import types
+
+import pytest
+
+from render_scheduler import RenderJob, run_jobs
+from render_server import RenderServer, WorkerPool, _forget_local_modules, call, client_command_builder
+
+
+# Renderer that stands in for manim inside the workers.
+# Scene class "Fail" raises, every other class "renders" by printing.
+def fake_renderer(job):
+    if job["scene_class"] == "Fail":
+        raise RuntimeError("boom")
+    print(f"rendered {job['scene_class']} at {job.get('quality')}")
+    return f"{job['scene_class']}.mp4"
+
+
+@pytest.fixture
+def server(tmp_path):
+    def start(**pool_options):
+        pool_options.setdefault("size", 1)
+        pool = WorkerPool(log_dir=str(tmp_path / "logs"), preload=[], renderer=fake_renderer, **pool_options)
+        instance = RenderServer(str(tmp_path / "render.sock"), pool=pool)
+        thread = threading.Thread(target=instance.serve_forever, daemon=True)
+        thread.start()
+        started.append((instance, thread))
+        return instance
+
+    started = []
+    yield start
+    for instance, thread in started:
+        instance.shutdown()
+        thread.join()
+        instance.server_close()
+
+# --- Test Cases ---
+
+def test_render_reports_timing_and_log(server):
+    """A render call returns the output, timings and the worker's log."""
+    instance = server()
+    result = call("render", {"module": "a", "scene_class": "Ok", "quality": "low_quality"}, instance.socket_path)
+    assert result["success"] and result["output"] == "Ok.mp4"
+    for key in ("render_time", "queue_time", "wall_time", "worker_pid", "worker_peak_rss_kb"):
+        assert key in result
+    with open(result["log"], "r", encoding="utf-8") as f:
+        assert "rendered Ok at low_quality" in f.read()
+
+def test_failed_render_keeps_server_alive(server):
+    """Renderer exceptions become failed results; the next job still runs."""
+    instance = server()
+    failed = call("render", {"module": "a", "scene_class": "Fail"}, instance.socket_path)
+    assert not failed["success"] and "boom" in failed["error"]
+    assert call("render", {"module": "a", "scene_class": "Ok"}, instance.socket_path)["success"]
+    assert call("stats", socket_path=instance.socket_path)["failed"] == 1
+
+def test_workers_are_recycled(server):
+    """A worker is replaced after max_jobs_per_worker jobs."""
+    instance = server(max_jobs_per_worker=2)
+    pids = [
+        call("render", {"module": "a", "scene_class": "Ok"}, instance.socket_path)["worker_pid"]
+        for _ in range(5)
+    ]
+    assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
+    assert call("stats", socket_path=instance.socket_path)["recycled"] == 2
+
+def test_bad_requests_raise(server):
+    """Unknown methods and missing parameters are reported as errors."""
+    instance = server()
+    with pytest.raises(RuntimeError):
+        call("explode", socket_path=instance.socket_path)
+    with pytest.raises(RuntimeError):
+        call("render", {"module": "a"}, instance.socket_path)
+
+def test_run_jobs_through_server(server, tmp_path):
+    """render_scheduler can route its jobs through the server's submit client."""
+    instance = server(size=2)
+    jobs = [RenderJob("a", "Ok1"), RenderJob("b", "Fail"), RenderJob("c", "Ok2")]
+    results = run_jobs(
+        jobs,
+        max_workers=2,
+        log_dir=str(tmp_path / "job_logs"),
+        history_path=str(tmp_path / "history.json"),
+        report_path=None,
+        command_builder=client_command_builder(instance.socket_path),
+    )
+    assert [r["success"] for r in results] == [True, False, True]
+    with open(results[0]["log"], "r", encoding="utf-8") as f:
+        assert "rendered Ok1" in f.read()
+
+
+def test_forget_local_modules_keeps_patches_and_packages(tmp_path, monkeypatch):
+    """Scene helpers are re-imported; manim patches and packages in a venv under the project are kept."""
+    files = {
+        "scene_helper": "scene_helper.py",
+        "patching_cache": "patching_cache.py",
+        "idle_cache": "idle_cache.py",
+        "manim.mobject.fake": "venv/lib/python3.11/site-packages/manim/mobject/fake.py",
+        "other_dependency": "venv/lib/python3.11/site-packages/other_dependency.py",
+    }
+    for name, path in files.items():
+        module = types.ModuleType(name)
+        module.__file__ = str(tmp_path / path)
+        monkeypatch.setitem(sys.modules, name, module)
+    sys.modules["patching_cache"]._installed = {"cache": object()}
+    sys.modules["idle_cache"]._installed = {}
+
+    _forget_local_modules(str(tmp_path))
+    assert [name for name in files if name in sys.modules] == ["patching_cache", "manim.mobject.fake", "other_dependency"]
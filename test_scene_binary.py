@@ -0,0 +1,109 @@
+import gzip
+import json
+
+import numpy as np
+import pytest
+
+import scene_binary
+from scene_binary import ENCODINGS, decode_points, encode_points, pack_scene, unpack_scene, write_scene
+
+
+def sine_points(n=361, z=0.0):
+    angles = np.arange(n) / (n - 1) * 2 * np.pi
+    points = np.full((n, 3), z)
+    points[:, 0] = 1 + angles
+    points[:, 1] = np.sin(angles) * 1.5
+    return points
+
+
+SCENE = {
+    "unit_circle": {"center": [-4.0, 0.0, 0.0], "radius": 1.5},
+    "sine_graph": {"origin": [1, 0, 0], "points": sine_points()},
+}
+
+# --- Test Cases ---
+
+@pytest.mark.parametrize("encoding,tolerance", [("float32", 1e-6), ("quantized", 1e-4), ("delta", 5e-5)])
+def test_round_trip(encoding, tolerance):
+    """Arrays come back as (N, 3) float32 within the encoding's precision; other values are untouched."""
+    scene = unpack_scene(pack_scene(SCENE, encoding))
+    points = scene["sine_graph"]["points"]
+    assert points.dtype == np.float32 and points.shape == (361, 3)
+    np.testing.assert_allclose(points, SCENE["sine_graph"]["points"], atol=tolerance)
+    assert scene["unit_circle"] == SCENE["unit_circle"]
+    assert scene["sine_graph"]["origin"] == [1, 0, 0]
+
+
+def test_constant_z_is_dropped():
+    """A constant z is stored once in the descriptor; varying z keeps three components."""
+    spec, data = encode_points(sine_points(z=0.5))
+    assert spec["components"] == 2 and spec["z"] == 0.5
+    assert len(data) == 361 * 2 * 4
+    np.testing.assert_allclose(decode_points(spec, data)[:, 2], 0.5)
+
+    varying = sine_points()
+    varying[:, 2] = np.arange(361)
+    spec, data = encode_points(varying, "delta")
+    assert spec["components"] == 3 and spec["z"] is None
+    np.testing.assert_allclose(decode_points(spec, data), varying, atol=5e-5)
+
+
+def test_layout_is_aligned():
+    """Header and blocks start on 4-byte boundaries so the browser can view them as typed arrays."""
+    blob = pack_scene({"a": sine_points(5), "b": sine_points(7)}, "quantized")
+    assert blob[:4] == b"MSD1"
+    header_length = int.from_bytes(blob[4:8], "little")
+    assert header_length % 4 == 0
+    header = json.loads(blob[8:8 + header_length])
+    assert [spec["offset"] % 4 for spec in header["arrays"]] == [0, 0]
+    assert header["scene"] == {"a": {"$array": 0}, "b": {"$array": 1}}
+
+
+def test_smaller_than_json():
+    """Even raw float32 is several times smaller than indented JSON; delta + gzip is smaller still."""
+    json_size = len(json.dumps({"points": SCENE["sine_graph"]["points"].tolist()}, indent=4))
+    raw = pack_scene(SCENE, "float32")
+    delta = gzip.compress(pack_scene(SCENE, "delta"))
+    assert len(raw) * 5 < json_size
+    assert len(delta) * 2 < len(raw)
+
+
+def test_empty_array():
+    scene = unpack_scene(pack_scene({"points": np.zeros((0, 3))}, "delta"))
+    assert scene["points"].shape == (0, 3)
+
+
+def test_write_scene_sidecars(tmp_path):
+    """write_scene writes the file plus a .gz sidecar holding the same bytes."""
+    path = str(tmp_path / "scene_data.bin")
+    written = write_scene(path, SCENE, "delta", ["gzip"])
+    assert written == [path, path + ".gz"]
+    with open(path, "rb") as f, gzip.open(path + ".gz", "rb") as g:
+        assert f.read() == g.read()
+
+
+def test_brotli_requires_package(tmp_path, monkeypatch):
+    monkeypatch.setattr(scene_binary, "brotli", None)
+    with pytest.raises(ValueError):
+        write_scene(str(tmp_path / "scene_data.bin"), SCENE, compressions=["brotli"])
+
+
+def test_rejects_bad_input():
+    with pytest.raises(ValueError):
+        encode_points(np.zeros((3, 4)))
+    with pytest.raises(ValueError):
+        encode_points(np.zeros((3, 3)), "float16")
+    with pytest.raises(ValueError):
+        unpack_scene(b"JSON" + bytes(8))
+    assert set(ENCODINGS) == {"float32", "quantized", "delta"}
+
+
+def test_export_options_need_binary(capsys):
+    """--encoding and --compress without --binary are a usage error, not silently ignored."""
+    pytest.importorskip("manim")
+    from export_scene import main
+
+    for argv in (["--encoding", "delta"], ["--compress", "gzip"], ["--compress"]):
+        with pytest.raises(SystemExit):
+            main(argv)
+        assert "--binary" in capsys.readouterr().err
@@ -0,0 +1,174 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from scene_profiler import (
+    SceneProfile, _counter_delta, count_mobjects, format_ranking, load_summaries, main,
+    profile_command_builder, rank, segment_cached,
+)
+
+
+class FakeClock:
+    """Manually advanced clock so every duration is exact."""
+
+    def __init__(self):
+        self.time = 100.0
+
+    def __call__(self):
+        return self.time
+
+    def tick(self, seconds):
+        self.time += seconds
+
+
+class FakeMobject:
+    def __init__(self, n_points, submobjects=()):
+        self.points = np.zeros((n_points, 3))
+        self.submobjects = list(submobjects)
+
+    def get_family(self):
+        family = [self]
+        for child in self.submobjects:
+            family += child.get_family()
+        return family
+
+
+def play(profile, clock, index, name, frames, frame_time=0.01, cached=False):
+    """Mimics the installed play wrapper: interpolate/rasterize/encode phases per frame."""
+    start = profile.now()
+    with profile.span("play", "play", phases={}, frames=0) as args:
+        for _ in range(frames):
+            with profile.phase("interpolate"):
+                clock.tick(frame_time)
+            with profile.phase("rasterize"):
+                clock.tick(2 * frame_time)
+            with profile.phase("encode", count=True):
+                clock.tick(frame_time)
+        profile.relabel(name, "wait" if name == "Wait" else "play")
+    profile.add_play({
+        "index": index, "name": name, "start": start, "run_time": frames / 10, "mobjects": 3, "points": 12,
+        "frames": args["frames"], "skipped": False, "cached": cached,
+        "duration": profile.now() - start, "phases": args["phases"],
+    })
+    return args
+
+
+def sample_profile():
+    clock = FakeClock()
+    profile = SceneProfile("SampleScene", clock)
+    with profile.span("SampleScene", "construct"):
+        clock.tick(0.5) # Building mobjects
+        with profile.span("MathTex", "tex", tex="x^2"):
+            clock.tick(0.2)
+            with profile.span("latex", "tex"):
+                clock.tick(1.0)
+        play(profile, clock, 0, "Create", frames=10)
+        play(profile, clock, 1, "Wait", frames=5, cached=True)
+        play(profile, clock, 2, "Transform", frames=30)
+    profile.wall_time = profile.now()
+    return profile
+
+# --- Test Cases ---
+
+def test_self_times_add_up_to_wall_time():
+    profile = sample_profile()
+    assert profile.wall_time == pytest.approx(3.5)
+    assert sum(profile.totals.values()) == pytest.approx(profile.wall_time)
+    assert profile.totals["construct"] == pytest.approx(0.5)
+    assert profile.totals["tex"] == pytest.approx(1.2)
+    assert profile.totals["rasterize"] == pytest.approx(0.9)
+    assert profile.totals["play"] == pytest.approx(0.0)
+
+
+def test_phases_and_frames_go_to_the_open_play():
+    clock = FakeClock()
+    profile = SceneProfile("Scene", clock)
+    args = play(profile, clock, 0, "Wait", frames=4)
+    assert args["frames"] == 4
+    assert args["phases"] == pytest.approx({"interpolate": 0.04, "rasterize": 0.08, "encode": 0.04})
+    with profile.phase("encode", count=True): # Outside any play: only the total grows
+        clock.tick(1.0)
+    assert profile.totals["encode"] == pytest.approx(1.04)
+    event = profile.events[0]
+    assert (event["name"], event["cat"]) == ("Wait", "wait")
+
+
+def test_chrome_trace_format():
+    trace = sample_profile().chrome_trace()
+    events = trace["traceEvents"]
+    assert {event["ph"] for event in events[:2]} == {"M"}
+    spans = [event for event in events if event["ph"] == "X"]
+    assert [event["ts"] for event in spans] == sorted(event["ts"] for event in spans)
+    latex = next(event for event in spans if event["name"] == "latex")
+    assert latex["dur"] == pytest.approx(1e6)
+    outer = next(event for event in spans if event["name"] == "SampleScene")
+    assert outer["ts"] == 0 and outer["dur"] == pytest.approx(3.5e6)
+    assert next(event for event in spans if event["name"] == "MathTex")["args"] == {"tex": "x^2"}
+    json.dumps(trace)
+
+
+def test_summary_ranks_plays_and_counts_segment_hits():
+    profile = sample_profile()
+    profile.cache = {"tex": {"hits": 2, "misses": 1}}
+    summary = profile.summary(top=2)
+    assert [play["name"] for play in summary["slowest_plays"]] == ["Transform", "Create"]
+    assert summary["plays"] == 3 and summary["frames"] == 45
+    assert summary["cache"] == {"tex": {"hits": 2, "misses": 1}, "segments": {"hits": 1, "misses": 2}}
+    assert summary["peak_points"] == 12
+
+
+def test_save_load_and_rank(tmp_path, capsys):
+    slow = sample_profile()
+    fast = SceneProfile("FastScene", FakeClock())
+    with fast.span("FastScene", "construct"):
+        fast.clock.tick(0.1)
+    fast.wall_time = fast.now()
+    for profile in (fast, slow):
+        trace_path, summary_path = profile.save(tmp_path)
+        assert trace_path.exists() and summary_path.exists()
+    (tmp_path / "Broken.summary.json").write_text("{")
+
+    summaries = load_summaries(tmp_path)
+    assert [s["scene"] for s in rank(summaries)] == ["SampleScene", "FastScene"]
+    assert [s["scene"] for s in rank(summaries, by="tex")][0] == "SampleScene"
+    lines = format_ranking(rank(summaries), limit=1)
+    assert len(lines) == 3 and "SampleScene" in lines[2] and "#2 Transform" in lines[2]
+
+    assert main(["report", str(tmp_path), "--by", "construct"]) == 0
+    assert capsys.readouterr().out.splitlines()[2].split("|")[1].strip() == "SampleScene"
+
+
+def test_count_mobjects_walks_families():
+    """Empty leaves (like the Mobject every wait() leaves in the scene) are not drawn and not counted."""
+    scene = [FakeMobject(4, [FakeMobject(8), FakeMobject(0, [FakeMobject(2)])]), FakeMobject(1)]
+    assert count_mobjects(scene) == (5, 15)
+    assert count_mobjects(scene + [FakeMobject(0), FakeMobject(0)]) == (5, 15)
+    assert count_mobjects([]) == (0, 0)
+
+
+def test_segment_cached_needs_caching_and_a_hash():
+    def renderer(play_hash, skip):
+        return SimpleNamespace(animations_hashes=[play_hash], skip_animations=skip, _original_skipping_status=False)
+
+    assert segment_cached(renderer("abc", True)) is True
+    assert segment_cached(renderer("abc", False)) is False
+    assert segment_cached(renderer(None, True)) is None # Skipped play
+    assert segment_cached(renderer("uncached_00001", False), caching=False) is None
+
+
+def test_counter_delta_starts_new_caches_at_zero():
+    before = {"tex": {"hits": 5, "misses": 2}}
+    after = {"tex": {"hits": 9, "misses": 2}, "tts": {"hits": 1, "misses": 3}}
+    assert _counter_delta(before, after) == {"tex": {"hits": 4, "misses": 0}, "tts": {"hits": 1, "misses": 3}}
+
+
+def test_profile_command_builder_wraps_manim_only():
+    build = profile_command_builder(lambda f, c, q: ["manim", "render", f"{f}.py", c, "-q", "l"], "out/profiles")
+    command = build("two_sum_visualization", "TwoSumVisualization", "low_quality")
+    assert command[1].endswith("scene_profiler.py")
+    assert command[2:] == ["run", "--dir", "out/profiles", "--", "render", "two_sum_visualization.py",
+                           "TwoSumVisualization", "-q", "l"]
+    with pytest.raises(ValueError):
+        profile_command_builder(lambda f, c, q: ["python", "client.py"])("a", "B", "low_quality")
@@ -0,0 +1,182 @@
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from section_render import (PLAN_NAME, SECTION_DIR_ENV, SECTION_ENV, SectionCheckpointMixin, check_sections, main,
+                            order_sections, render_sections, section_file)
+
+
+class FakeMobject:
+    def __init__(self, x):
+        self.points = np.array([[x, 0.0, 0.0]])
+        self.submobjects = []
+
+    def get_family(self):
+        return [self]
+
+
+class FakeScene:
+    """The renderer/file-writer surface the mixin touches, with skip-aware plays."""
+
+    def __init__(self):
+        self.mobjects = []
+        self.renderer = SimpleNamespace(num_plays=0, time=0.0, file_writer=SimpleNamespace(
+            sections=[SimpleNamespace(name="autocreated", skip_animations=False)], partial_movie_files=[]))
+
+    def setup(self):
+        pass
+
+    def tear_down(self):
+        pass
+
+    def next_section(self, name, skip_animations=False):
+        self.renderer.file_writer.sections.append(SimpleNamespace(name=name, skip_animations=skip_animations))
+
+    def play(self, x, run_time=1.0):
+        writer = self.renderer.file_writer
+        skipped = writer.sections[-1].skip_animations
+        writer.partial_movie_files.append(None if skipped else f"play{self.renderer.num_plays}.mp4")
+        self.mobjects = [FakeMobject(x)]
+        self.renderer.num_plays += 1
+        self.renderer.time += run_time
+
+
+class ThreeSections(SectionCheckpointMixin, FakeScene):
+    def construct(self):
+        self.play(0)
+        self.checkpoint("convection")
+        self.play(1, 2.0)
+        self.play(np.random.rand())
+        self.checkpoint("pressure")
+        self.play(3)
+
+
+# Stands in for a manim process: writes the plan or its section's checkpoint like the mixin would
+FAKE_WORKER = """
+import json, os, sys
+from pathlib import Path
+from section_render import PLAN_NAME, SECTION_DIR_ENV, SECTION_ENV, _write_json, section_file
+work, target = Path(os.environ[SECTION_DIR_ENV]), os.environ[SECTION_ENV]
+sections = [{"index": i, "name": name, "num_plays": 2 * i, "time": 2.0 * i, "state": f"s{i}"}
+            for i, name in enumerate(["start", "convection", "pressure"])]
+if target == "plan":
+    assert sys.argv[-1] == "--dry_run"
+    _write_json(work / PLAN_NAME, {"sections": sections, "duration": 7.0})
+else:
+    i = int(target)
+    _write_json(section_file(work, i), {**sections[i], "end_time": 2.0 * i + 2, "end_state": f"s{i + 1}",
+                                        "segments": [f"section{i}_play{n}.mp4" for n in range(2)]})
+"""
+
+
+def run(monkeypatch, tmp_path, target):
+    monkeypatch.setenv(SECTION_DIR_ENV, str(tmp_path))
+    if target is None:
+        monkeypatch.delenv(SECTION_ENV, raising=False)
+    else:
+        monkeypatch.setenv(SECTION_ENV, target)
+    scene = ThreeSections()
+    scene.setup()
+    scene.construct()
+    scene.tear_down()
+    return scene
+
+# --- Test Cases ---
+
+def test_plan_skips_everything(monkeypatch, tmp_path):
+    """The planning pass renders nothing and records every boundary with its scene time."""
+    scene = run(monkeypatch, tmp_path, "plan")
+    assert scene.renderer.file_writer.partial_movie_files == [None] * 4
+    plan = json.loads((tmp_path / PLAN_NAME).read_text())
+    assert [(s["index"], s["name"], s["num_plays"], s["time"]) for s in plan["sections"]] == [
+        (0, "start", 0, 0.0), (1, "convection", 1, 1.0), (2, "pressure", 3, 4.0)]
+    assert plan["duration"] == 5.0
+    assert order_sections(plan) == [1, 0, 2]
+
+
+def test_worker_renders_only_its_section(monkeypatch, tmp_path):
+    """The last-section worker fast-forwards (seeded) to its checkpoint and matches the plan."""
+    run(monkeypatch, tmp_path, "plan")
+    plan = json.loads((tmp_path / PLAN_NAME).read_text())
+    scene = run(monkeypatch, tmp_path, "2")
+    assert scene.renderer.file_writer.partial_movie_files == [None, None, None, "play3.mp4"]
+    result = json.loads(section_file(tmp_path, 2).read_text())
+    assert result["segments"] == ["play3.mp4"] and result["end_time"] == 5.0
+    assert result["state"] == plan["sections"][2]["state"]
+
+
+def test_plain_render_uses_manim_sections(monkeypatch, tmp_path):
+    scene = run(monkeypatch, tmp_path, None)
+    assert [s.name for s in scene.renderer.file_writer.sections] == ["autocreated", "convection", "pressure"]
+    assert all(path is not None for path in scene.renderer.file_writer.partial_movie_files)
+
+
+def test_check_sections_reports_seams():
+    plan = {"sections": [{"index": 0, "name": "a", "num_plays": 0, "state": "s0"},
+                         {"index": 1, "name": "b", "num_plays": 2, "state": "s1"}], "duration": 3.0}
+    good = [{"num_plays": 0, "state": "s0", "end_state": "s1"}, {"num_plays": 2, "state": "s1", "end_state": "s2"}]
+    assert check_sections(plan, good) == []
+
+    drifted = [dict(good[0], end_state="other"), good[1]]
+    assert check_sections(plan, drifted) == ["section 1 (b): starts from a different state than the previous section ended in"]
+    unseeded = [good[0], dict(good[1], state="other")]
+    assert len(check_sections(plan, unseeded)) == 2
+    assert check_sections(plan, [good[0], None]) == ["section 1 (b): no checkpoint written"]
+
+
+def test_render_sections_end_to_end(monkeypatch, tmp_path):
+    """Plan, workers, seam check and join in a fresh work dir, then again over its stale files."""
+    monkeypatch.setenv("PYTHONPATH", str(Path(__file__).parent))
+    joined = []
+
+    def command_builder(scene_file, scene_class, quality):
+        return [sys.executable, "-c", FAKE_WORKER]
+
+    for _ in range(2):
+        report = render_sections("scene", "Scene", work_dir=str(tmp_path / "fresh"), max_workers=2,
+                                 command_builder=command_builder, joiner=lambda *args: joined.append(args))
+        assert report["success"], report["problems"]
+    segments, output = joined[-1]
+    assert segments == [f"section{i}_play{n}.mp4" for i in range(3) for n in range(2)]
+    assert output == str(tmp_path / "fresh" / "Scene.mp4") == report["output"]
+    assert [section["segments"] for section in report["sections"]] == [2, 2, 2]
+
+
+def test_real_manim_checkpoints_after_waits(monkeypatch, tmp_path):
+    """Checkpoints hash scene.mobjects, which hold the placeholder Mobject of a static wait()."""
+    manim = pytest.importorskip("manim")
+
+    class WaitingScene(SectionCheckpointMixin, manim.Scene):
+        def construct(self):
+            circle = manim.Circle()
+            self.play(manim.Create(circle), run_time=0.5)
+            self.wait(0.5)
+            self.checkpoint("shift")
+            self.play(circle.animate.shift(manim.RIGHT), run_time=0.5)
+            self.wait(0.25)
+            self.checkpoint("fade")
+            self.play(manim.FadeOut(circle), run_time=0.5)
+
+    monkeypatch.setenv(SECTION_DIR_ENV, str(tmp_path))
+    with manim.tempconfig({"dry_run": True, "disable_caching": True, "progress_bar": "none",
+                           "media_dir": str(tmp_path / "media")}):
+        monkeypatch.setenv(SECTION_ENV, "plan")
+        WaitingScene().render()
+        plan = json.loads((tmp_path / PLAN_NAME).read_text())
+        assert [section["num_plays"] for section in plan["sections"]] == [0, 2, 4]
+        monkeypatch.setenv(SECTION_ENV, "2")
+        WaitingScene().render()
+    result = json.loads(section_file(tmp_path, 2).read_text())
+    assert result["state"] == plan["sections"][2]["state"]
+
+
+def test_main_rejects_job_counts_below_one(capsys):
+    """A zero or negative -j is a usage error rather than a ThreadPoolExecutor crash."""
+    for value in ("0", "-1"):
+        with pytest.raises(SystemExit):
+            main(["scene", "Scene", "-j", value])
+        assert "1 이상의 정수" in capsys.readouterr().err
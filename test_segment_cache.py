@@ -0,0 +1,216 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+from segment_cache import SegmentDirectory, animations_key, mobjects_key, play_hash
+
+
+class FakeMobject:
+    """get_family/points/colour surface that the hash reads."""
+
+    def __init__(self, points, color=(1, 1, 1, 1), submobjects=()):
+        self.points = np.asarray(points, dtype=float)
+        self.color = color
+        self.submobjects = list(submobjects)
+        self.updaters = []
+        self.name = f"mob{id(self)}" # Not drawn; must not affect the key
+
+    def get_family(self):
+        family = [self]
+        for child in self.submobjects:
+            family += child.get_family()
+        return family
+
+    def get_stroke_rgbas(self):
+        return np.array([self.color])
+
+    def get_fill_rgbas(self):
+        return np.array([[0, 0, 0, 0]])
+
+    def get_stroke_width(self):
+        return 4
+
+
+class BareMobject:
+    """Like manim's plain Mobject: __getattr__ makes up any get_*, which raises when called."""
+
+    def __init__(self, points=()):
+        self.points = np.asarray(points, dtype=float).reshape(-1, 3)
+        self.submobjects = []
+        self.updaters = []
+
+    def get_family(self):
+        return [self]
+
+    def __getattr__(self, name):
+        if name.startswith("get_"):
+            return lambda: getattr(self, name[4:])
+        raise AttributeError(name)
+
+
+def fluid_image(viscosity=0.01, boundary="periodic", force=0.0, swirl=0.0):
+    """FluidImage whose body force and velocity are set after start(), the way scenes edit them."""
+    from fluid_image import FluidImage
+    from fluid_solver import StableFluids
+
+    fluid = StableFluids((16, 32), x_range=(-2, 2), y_range=(-1, 1), viscosity=viscosity, boundary=boundary)
+    image = FluidImage(fluid.splat((0, 0), 0.3, dye=1.0))
+    fluid.body_force[..., 0] = force
+    fluid.velocity[..., 1] = swirl
+    return image
+
+
+def particle_field(strength=2.5, core=0.3, push=0.0):
+    from particle_field import ParticleField
+    from particle_system import ParticleSystem, vortex
+
+    system = ParticleSystem.spiral(300, max_radius=2, seed=1).add_flow(vortex(strength=strength, core=core))
+    field = ParticleField(system)
+    system.velocities[:, 0] = push
+    return field
+
+
+def fluid_tracers(swirl=0.0):
+    """Tracers on a solver's flow(): the flow closes over the solver, so its velocity must reach the key."""
+    from fluid_solver import StableFluids
+    from particle_field import ParticleField
+    from particle_system import ParticleSystem
+
+    fluid = StableFluids((16, 32), x_range=(-2, 2), y_range=(-1, 1))
+    field = ParticleField(ParticleSystem.spiral(300, max_radius=1, seed=1).add_flow(fluid.flow()))
+    fluid.velocity[..., 1] = swirl
+    return field
+
+
+class FakeAnimation:
+    def __init__(self, mobject, run_time=1.0, rate_func=lambda t: t):
+        self.mobject = mobject
+        self.run_time = run_time
+        self.rate_func = rate_func
+
+    def interpolate_mobject(self, alpha):
+        pass
+
+
+class FakeCamera:
+    pixel_width, pixel_height, frame_rate = 854, 480, 15
+
+
+def square(x=0.0):
+    return FakeMobject([[x, 0, 0], [x + 1, 0, 0], [x + 1, 1, 0], [x, 1, 0]])
+
+
+def touch(path, mtime=None):
+    path.write_bytes(b"segment")
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+# --- Test Cases ---
+
+def test_key_depends_on_drawn_state_only():
+    """Equal-looking scenes built from fresh objects share a key; a colour change does not."""
+    first = play_hash(None, FakeCamera(), [FakeAnimation(square())], [square(), square(3)])
+    second = play_hash(None, FakeCamera(), [FakeAnimation(square())], [square(), square(3)])
+    assert first == second
+    assert len(first.split("_")) == 3
+
+    recoloured = square(3)
+    recoloured.color = (1, 1, 0, 1)
+    third = play_hash(None, FakeCamera(), [FakeAnimation(square())], [square(), recoloured])
+    assert third.split("_")[:2] == first.split("_")[:2]
+    assert third.split("_")[2] != first.split("_")[2]
+
+
+def test_animation_arguments_change_the_key():
+    base = animations_key([FakeAnimation(square())])
+    assert animations_key([FakeAnimation(square(), run_time=2.0)]) != base
+    assert animations_key([FakeAnimation(square(), rate_func=lambda t: t * t)]) != base
+    assert animations_key([FakeAnimation(square(1))]) != base
+    assert animations_key([FakeAnimation(square())]) == base
+
+
+def test_nested_family_and_updaters():
+    group = FakeMobject(np.zeros((0, 3)), submobjects=[square(), square(2)])
+    key = mobjects_key([group])
+    group.submobjects[1].points += 0.5
+    assert mobjects_key([group]) != key
+
+    shifted = mobjects_key([group])
+    group.updaters.append(lambda mob, dt: mob)
+    assert mobjects_key([group]) != shifted
+
+
+def test_mobjects_without_stroke_or_fill():
+    """A Wait's placeholder Mobject, point clouds and images have no stroke/fill getters to call."""
+    key = mobjects_key([square(), BareMobject()])
+    assert key == mobjects_key([square(), BareMobject()])
+    assert mobjects_key([square(), BareMobject([[1, 0, 0]])]) != key
+
+
+def test_real_manim_mobjects_hash():
+    manim = pytest.importorskip("manim")
+    cloud = manim.PMobject().add_points(np.zeros((4, 3)))
+    image = manim.ImageMobject(np.zeros((4, 4, 4), dtype=np.uint8))
+    wait = manim.Wait(0.5)
+    on_screen = [manim.Circle(), cloud, image, manim.Group(manim.ValueTracker(1)), wait.mobject]
+    key = play_hash(None, FakeCamera(), [wait], on_screen)
+    assert key == play_hash(None, FakeCamera(), [manim.Wait(0.5)], on_screen)
+    assert animations_key([manim.Wait(1.0)]) != animations_key([wait])
+
+    points_key = mobjects_key(on_screen)
+    cloud.points += 1
+    assert mobjects_key(on_screen) != points_key
+
+
+@pytest.mark.parametrize("build, changes", [
+    (fluid_image, [{"viscosity": 0.2}, {"boundary": "walls"}, {"force": 0.8}, {"swirl": 0.5}]),
+    (particle_field, [{"strength": 1.0}, {"core": 0.5}, {"push": 0.5}]),
+    (fluid_tracers, [{"swirl": 0.5}]),
+])
+def test_simulation_keys_follow_their_inputs(build, changes):
+    """Real simulation mobjects hash without stroke/fill getters, and every input that drives them changes the key."""
+    pytest.importorskip("manim")
+    key = mobjects_key([build()])
+    assert mobjects_key([build()]) == key
+    for change in changes:
+        assert mobjects_key([build(**change)]) != key, change
+
+
+def test_manifest_keeps_recent_renders(tmp_path):
+    """Only segments no recent render used are evicted; the manifest keeps keep_renders entries."""
+    directory = SegmentDirectory(tmp_path, keep_renders=2)
+    for name in ("a.mp4", "b.mp4", "c.mp4", "partial_movie_file_list.txt"):
+        touch(tmp_path / name)
+    directory.record(["a.mp4", "b.mp4"])
+    directory.record(["b.mp4", "c.mp4"])
+    assert directory.stale() == []
+
+    touch(tmp_path / "d.mp4")
+    directory.record(["c.mp4", "d.mp4"])
+    assert len(directory.renders()) == 2
+    removed = directory.evict()
+    assert [path.name for path in removed] == ["a.mp4"]
+    assert sorted(os.listdir(tmp_path)) == ["b.mp4", "c.mp4", "d.mp4", "partial_movie_file_list.txt",
+                                            "segment_manifest.json"]
+
+
+def test_unchanged_segments_skip_combine(tmp_path):
+    directory = SegmentDirectory(tmp_path)
+    now = time.time()
+    touch(tmp_path / "a.mp4", now - 10)
+    output = tmp_path / "scene.mp4"
+    assert not directory.is_unchanged(["a.mp4"], output)
+    directory.record(["a.mp4"], str(output))
+    assert not directory.is_unchanged(["a.mp4"], output) # No movie yet
+
+    touch(output, now)
+    assert directory.is_unchanged(["a.mp4"], output)
+    assert not directory.is_unchanged(["a.mp4", "b.mp4"], output)
+    touch(tmp_path / "a.mp4", now + 10) # Re-rendered after the movie was combined
+    assert not directory.is_unchanged(["a.mp4"], output)
+
+    directory.record(["uncached_00000.mp4"], str(output))
+    touch(tmp_path / "uncached_00000.mp4", now - 10)
+    assert not directory.is_unchanged(["uncached_00000.mp4"], output)
@@ -0,0 +1,70 @@
+import random
+import time
+
+import numpy as np
+import pytest
+
+from sort_trace import ALGORITHMS, COMPARE, SWAP, bar_points, batch_frames, frame_budget, record_sort
+
+# --- Test Cases ---
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+def test_replay_sorts(algorithm):
+    """Replaying the recorded events on the input yields the sorted array."""
+    values = [random.Random(7).randint(-1000, 1000) for _ in range(60)]
+    events = record_sort(values, algorithm)
+    trace = batch_frames(values, events, 25)
+    assert trace.frames.shape == (26, 60)
+    assert trace.frames[0].tolist() == values
+    assert trace.frames[-1].tolist() == sorted(values)
+
+def test_record_sort_keeps_input():
+    """The input list is not modified."""
+    values = [3, 1, 2]
+    record_sort(values, "merge")
+    assert values == [3, 1, 2]
+
+def test_bubble_sort_event_counts():
+    """Bubble sort on a reversed array compares and swaps every pair once."""
+    n = 10
+    events = record_sort(list(range(n, 0, -1)), "bubble")
+    pairs = n * (n - 1) // 2
+    assert np.count_nonzero(events[:, 0] == COMPARE) == pairs
+    assert np.count_nonzero(events[:, 0] == SWAP) == pairs
+
+def test_unknown_algorithm():
+    """Unknown algorithm names are rejected."""
+    with pytest.raises(ValueError):
+        record_sort([1], "bogo")
+
+def test_frame_budget():
+    """Frames are capped by run time * fps and by the number of events."""
+    assert frame_budget(10**6, 20, 15) == 300
+    assert frame_budget(40, 20, 15) == 40
+    assert frame_budget(0, 20, 15) == 1
+
+def test_touched_indices():
+    """Each frame reports the indices its events accessed."""
+    events = record_sort([2, 1, 3], "bubble")
+    trace = batch_frames([2, 1, 3], events, len(events))
+    assert [t.tolist() for t in trace.touched] == [[0, 1], [0, 1], [1, 2], [0, 1]]
+    assert (trace.comparisons, trace.swaps, trace.writes) == (3, 1, 0)
+
+def test_bar_points_shape_and_heights():
+    """One closed 16-point outline per bar; the largest value fills the height."""
+    points = bar_points([1, 3, 2], width=6.0, height=4.0)
+    assert points.shape == (48, 3)
+    bars = points.reshape(3, 16, 3)
+    assert np.allclose(bars[:, 0], bars[:, -1])
+    assert bars[1, :, 1].max() == pytest.approx(4.0)
+    assert bars[0, :, 1].max() < bars[2, :, 1].max() < bars[1, :, 1].max()
+    assert points[:, 0].min() >= -3.0 and points[:, 0].max() <= 3.0
+
+def test_thousand_element_bubble_sort_is_fast():
+    """n=1000 bubble sort records and batches well under the render budget."""
+    values = np.random.default_rng(0).permutation(1000).tolist()
+    start = time.perf_counter()
+    events = record_sort(values, "bubble")
+    trace = batch_frames(values, events, frame_budget(len(events), 20, 15))
+    assert time.perf_counter() - start < 30
+    assert trace.frames[-1].tolist() == sorted(values)
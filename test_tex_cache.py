@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from scene_analysis import extract_tex
+from tex_cache import BATCH_DOCUMENTCLASS, TexCache, batch_document
+
+
+class FakeTemplate:
+    """Mirrors the parts of manim's TexTemplate that batch_document uses."""
+
+    documentclass = r"\documentclass[preview]{standalone}"
+    preamble = r"\usepackage{amsmath}"
+    post_doc_commands = ""
+    _body = ""
+
+    def get_texcode_for_expression_in_env(self, expression, environment):
+        return "\n".join([
+            self.documentclass, self.preamble, r"\begin{document}",
+            rf"\begin{{{environment}}}", expression, rf"\end{{{environment}}}", r"\end{document}",
+        ])
+
+    def get_texcode_for_expression(self, expression):
+        return "\n".join([self.documentclass, self.preamble, r"\begin{document}", expression, r"\end{document}"])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TexCache(str(tmp_path / "tex"), max_bytes=1000)
+
+
+def write_svg(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(b"<svg>" + b"x" * (size - 5))
+    return path
+
+# --- Test Cases ---
+
+def test_put_and_get(cache, tmp_path):
+    """Stored SVGs are found again by key and counted as hits."""
+    assert cache.get("abc") is None
+    stored = cache.put_file("abc", write_svg(tmp_path, "a.svg", 100))
+    assert cache.get("abc") == stored
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_evicts_least_recently_used(cache, tmp_path):
+    """Going over max_bytes removes the SVGs used longest ago."""
+    for i, key in enumerate(["old", "used", "new"]):
+        path = cache.put_file(key, write_svg(tmp_path, f"{key}.svg", 400))
+        os.utime(path, ns=(i * 10 ** 9, i * 10 ** 9))
+    os.utime(cache.path_for("used"), ns=(5 * 10 ** 9, 5 * 10 ** 9))
+    cache.put_file("newest", write_svg(tmp_path, "newest.svg", 400))
+    assert sorted(p.stem for p in cache.root.glob("*.svg")) == ["newest", "used"]
+
+def test_extract_tex_literals(tmp_path):
+    """Only literal Tex/MathTex calls that manim typesets verbatim are collected."""
+    scene = tmp_path / "scene.py"
+    scene.write_text(
+        'a = MathTex(r"x^2", "+ 1", font_size=60)\n'
+        'b = Tex("Hello", tex_environment="flushleft")\n'
+        'c = MathTex(f"{n}")\n'
+        'd = MathTex("a", "b", substrings_to_isolate=["a"])\n'
+        'e = MathTex("{{a}} + b")\n',
+        encoding="utf-8",
+    )
+    assert extract_tex(scene) == [
+        {"kind": "MathTex", "strings": ["x^2", "+ 1"]},
+        {"kind": "Tex", "strings": ["Hello"], "tex_environment": "flushleft"},
+    ]
+
+def test_batch_document_one_page_per_formula():
+    """Each formula becomes its own multi-page environment in one document."""
+    document = batch_document([("x^2", "align*"), ("y", "center")], FakeTemplate())
+    assert document.startswith(BATCH_DOCUMENTCLASS)
+    assert document.count(r"\begin{manimpage}") == 2
+    assert document.count(r"\begin{document}") == 1
+    assert "\\begin{align*}\nx^2\n\\end{align*}" in document
+
+def test_batch_document_rejects_custom_template():
+    """Templates with their own document class are compiled one by one instead."""
+    template = FakeTemplate()
+    template.documentclass = r"\documentclass{article}"
+    with pytest.raises(ValueError):
+        batch_document([("x", "align*")], template)
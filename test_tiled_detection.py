@@ -0,0 +1,77 @@
+import cv2
+import numpy as np
+import pytest
+
+from tiled_detection import Tile, detect_lines, detect_lines_tiled, detect_tile, stitch_seams, tile_grid
+
+
+def lengths(lines):
+    return np.hypot(lines[:, 2] - lines[:, 0], lines[:, 3] - lines[:, 1])
+
+
+def drawing(height=300, width=400):
+    """A horizontal and a vertical line crossing the seams of a 128-pixel grid, plus a short stroke."""
+    image = np.zeros((height, width), dtype=np.uint8)
+    cv2.line(image, (20, 60), (380, 60), 255, 3)
+    cv2.line(image, (200, 20), (200, 280), 255, 3)
+    cv2.line(image, (30, 200), (70, 240), 255, 3)
+    return image
+
+# --- Test Cases ---
+
+def test_tile_grid_cores_partition_image():
+    """Cores cover every pixel exactly once; tiles extend them by the overlap."""
+    tiles = tile_grid(250, 300, 100, 10)
+    assert len(tiles) == 9
+    coverage = np.zeros((250, 300), dtype=int)
+    for tile in tiles:
+        coverage[tile.core_y0:tile.core_y1, tile.core_x0:tile.core_x1] += 1
+        assert tile.x0 == max(tile.core_x0 - 10, 0) and tile.x1 == min(tile.core_x1 + 10, 300)
+    assert (coverage == 1).all()
+    assert tiles[-1] == Tile(190, 190, 300, 250, 200, 200, 300, 250)
+
+
+def test_tile_grid_rejects_bad_sizes():
+    with pytest.raises(ValueError):
+        tile_grid(100, 100, 0, 10)
+
+
+def test_detect_tile_keeps_segments_centred_in_core():
+    """Coordinates are shifted to the full image and only core-owned segments remain."""
+    image = drawing()
+    tile = tile_grid(300, 400, 128, 16)[0]   # holds only part of the horizontal line
+    lines = detect_tile(image, tile)
+    assert len(lines)
+    mid = (lines[:, :2] + lines[:, 2:]) / 2
+    assert (mid[:, 0] >= tile.core_x0).all() and (mid[:, 0] < tile.core_x1).all()
+    assert (mid[:, 1] >= tile.core_y0).all() and (mid[:, 1] < tile.core_y1).all()
+    assert np.abs(lines[:, [1, 3]] - 60).max() < 3
+
+
+def test_stitch_seams_joins_split_segment():
+    """Overlapping pieces on both sides of a seam become one segment; others are untouched."""
+    tiles = tile_grid(100, 200, 100, 10)
+    lines = np.array([[20, 50, 110, 50], [90, 50.5, 180, 50.5], [20, 10, 40, 30]])
+    result = stitch_seams(lines, tiles, band=10)
+    assert len(result) == 2
+    assert lengths(result).max() == pytest.approx(160, abs=0.5)
+    assert [20, 10, 40, 30] in result.tolist()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_tiled_matches_full_detection(workers):
+    """Tiling across a pool recovers the long lines whole, like a single LSD pass."""
+    image = drawing()
+    full = detect_lines(image)
+    tiled = detect_lines_tiled(image, tile_size=128, overlap=16, workers=workers)
+    assert tiled.dtype == np.float32 and tiled.shape[1] == 4
+    assert lengths(tiled).max() == pytest.approx(lengths(full).max(), abs=3)
+    long_tiled = np.sort(lengths(tiled)[lengths(tiled) > 100])
+    long_full = np.sort(lengths(full)[lengths(full) > 100])
+    assert len(long_tiled) == len(long_full)
+    np.testing.assert_allclose(long_tiled, long_full, atol=3)
+
+
+def test_single_tile_is_plain_detection():
+    image = drawing()
+    np.testing.assert_array_equal(detect_lines_tiled(image, tile_size=1024), detect_lines(image))
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+from trace_engine import (
+    Op, Tracer, compact, compile_visualization, dump_ops, load_ops, split_blocks,
+    trace_bubble_sort, trace_level_order, trace_make_one, trace_two_sum, tree_links,
+)
+
+
+def kinds(ops):
+    return [op.kind for op in ops]
+
+# --- Test Cases ---
+
+def test_trace_two_sum_result_and_ops():
+    """The real algorithm runs and records the hashmap insert and the answer."""
+    tracer = Tracer()
+    assert trace_two_sum(tracer, [2, 7, 11, 15], 9) == [0, 1]
+    assert Op("set", "seen", (((2, 0),),)) in tracer.ops
+    assert Op("mark", "nums", ((0, 1), "GREEN")) in tracer.ops
+
+def test_trace_bubble_sort_sorts():
+    """Swaps recorded by the trace reproduce the sorted array."""
+    tracer = Tracer()
+    nums = [5, 2, 8, 1, 9]
+    assert trace_bubble_sort(tracer, nums) == sorted(nums)
+
+    replay = list(nums)
+    for op in tracer.ops:
+        if op.kind == "swap":
+            i, j = op.args
+            replay[i], replay[j] = replay[j], replay[i]
+    assert replay == sorted(nums)
+
+def test_tree_links_with_nulls():
+    """LeetCode level-order arrays keep left/right positions across nulls."""
+    assert tree_links([3, 9, 20, None, None, 15, 7]) == {
+        0: (1, 2), 1: (None, None), 2: (5, 6), 5: (None, None), 6: (None, None),
+    }
+    assert tree_links([1, None, 2, 3]) == {0: (None, 2), 2: (3, None), 3: (None, None)}
+    assert tree_links([]) == {}
+
+def test_trace_level_order_levels():
+    """BFS highlights one whole level per step."""
+    tracer = Tracer()
+    assert trace_level_order(tracer, [3, 9, 20, None, None, 15, 7]) == [[3], [9, 20], [15, 7]]
+    highlights = [op.args[0] for op in tracer.ops if op.kind == "highlight"]
+    assert highlights == [(0,), (1, 2), (5, 6)]
+
+def test_trace_make_one_matches_known_answers():
+    """dp[n] matches Baekjoon 1463 sample answers."""
+    assert trace_make_one(Tracer(), 2) == 1
+    assert trace_make_one(Tracer(), 10) == 3
+
+def test_compact_merges_consecutive_ops():
+    """Consecutive mergeable ops on the same widget collapse into one op."""
+    ops = [
+        Op("highlight", "a", ((0,), "YELLOW")),
+        Op("highlight", "a", ((1,), "YELLOW")),
+        Op("highlight", "a", ((2,), "RED")),
+        Op("set", "a", (((0, 1),),)),
+        Op("set", "a", (((1, 2),),)),
+        Op("set", "b", (((0, 3),),)),
+    ]
+    assert compact(ops) == [
+        Op("highlight", "a", ((0, 1), "YELLOW")),
+        Op("highlight", "a", ((2,), "RED")),
+        Op("set", "a", (((0, 1), (1, 2)),)),
+        Op("set", "b", (((0, 3),),)),
+    ]
+
+def test_split_blocks_groups_by_narration():
+    """Ops are grouped under the preceding narration."""
+    ops = [Op("wait", None, (1,)), Op("say", None, ("a",)), Op("wait", None, (2,)), Op("say", None, ("b",))]
+    assert split_blocks(ops) == [
+        (None, [Op("wait", None, (1,))]),
+        ("a", [Op("wait", None, (2,))]),
+        ("b", []),
+    ]
+
+def test_compile_visualization_uses_narration():
+    """Intro/outro narration from the data wrap the algorithm trace."""
+    data = {
+        "problem_name": "Two Sum",
+        "problem_type": "array_hashmap",
+        "algorithm": "HashMap",
+        "example": {"nums": [2, 7, 11, 15], "target": 9},
+        "narration": {"ko": ["시작", "중간", "끝"]},
+    }
+    ops = compile_visualization(data)
+    assert ops[0] == Op("say", None, ("시작",))
+    assert ops[1] == Op("title", None, ("Two Sum", "HashMap"))
+    assert Op("say", None, ("끝",)) in ops
+    assert "중간" not in [op.args[0] for op in ops if op.kind == "say"]
+
+def test_compile_visualization_unknown_type():
+    """Unknown problem types are rejected."""
+    with pytest.raises(ValueError):
+        compile_visualization({"problem_name": "x", "example": {}}, "graph")
+
+def test_dump_and_load_roundtrip(tmp_path):
+    """Ops survive a JSON round trip unchanged."""
+    data = {"problem_name": "정렬", "example": {"numbers": [3, 1, 2]}}
+    ops = compile_visualization(data, "sort")
+    path = os.path.join(str(tmp_path), "ops.json")
+    dump_ops(ops, path)
+    assert load_ops(path) == ops
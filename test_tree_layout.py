@@ -0,0 +1,73 @@
+import random
+import time
+
+import numpy as np
+import pytest
+
+from tree_layout import layout_levels, layout_tree
+
+
+def random_tree(n, density, seed):
+    """LeetCode level-order array with n nodes and random nulls."""
+    rng = random.Random(seed)
+    values = [0]
+    count = 1
+    while count < n:
+        if rng.random() < density:
+            values.append(count)
+            count += 1
+        else:
+            values.append(None)
+    return values
+
+def assert_no_overlap(layout, separation=1.0):
+    for level in layout_levels(layout):
+        xs = np.sort(layout.x[level])
+        assert np.all(np.diff(xs) >= separation - 1e-9)
+
+# --- Test Cases ---
+
+def test_example_tree_layout():
+    """[3, 9, 20, null, null, 15, 7]: parents sit midway between their children."""
+    layout = layout_tree([3, 9, 20, None, None, 15, 7])
+    assert layout.order == [0, 1, 2, 5, 6]
+    assert layout.x.tolist() == [0.5, 0.0, 1.0, 0.5, 1.5]
+    assert layout.depth.tolist() == [0, 1, 1, 2, 2]
+    assert layout.parent.tolist() == [-1, 0, 0, 2, 2]
+
+def test_single_child_keeps_side():
+    """A lone left child is drawn left of its parent, a lone right child to the right."""
+    layout = layout_tree([1, 2, None, 3, None, None, 4])
+    x = dict(zip(layout.order, layout.x))
+    assert x[3] < x[1] < x[0]
+    assert x[6] > x[3]
+
+def test_empty_tree():
+    """Empty arrays and a null root produce an empty layout."""
+    assert layout_tree([]).order == []
+    assert layout_tree([None]).order == []
+    assert layout_levels(layout_tree([])) == []
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_trees_do_not_overlap(seed):
+    """Nodes on the same level are at least one unit apart."""
+    values = random_tree(random.Random(seed).randint(1, 80), 0.6, seed)
+    assert_no_overlap(layout_tree(values))
+
+def test_levels_follow_bfs():
+    """layout_levels groups layout positions by depth."""
+    layout = layout_tree([3, 9, 20, None, None, 15, 7])
+    assert [level.tolist() for level in layout_levels(layout)] == [[0], [1, 2], [3, 4]]
+
+@pytest.mark.parametrize("values", [
+    random_tree(10000, 0.6, 1),
+    [0] + [None, 0] * 9999,
+    list(range(10000)),
+], ids=["random", "right-chain", "complete"])
+def test_ten_thousand_nodes_is_linear(values):
+    """10k-node trees, including a 10k-deep chain, lay out quickly without recursion."""
+    start = time.perf_counter()
+    layout = layout_tree(values)
+    assert time.perf_counter() - start < 5
+    assert len(layout.order) == 10000
+    assert_no_overlap(layout)
@@ -0,0 +1,106 @@
+import io
+import os
+import threading
+import time
+import wave
+
+import pytest
+
+from tts_cache import SilentEngine, TTSCache, get_engine, prefetch, prefetch_scenes
+
+
+class CountingEngine(SilentEngine):
+    """Silent engine that counts calls and fails on demand."""
+
+    def __init__(self, fail_on=()):
+        super().__init__()
+        self.calls = 0
+        self.fail_on = set(fail_on)
+        self._lock = threading.Lock()
+
+    def synthesize(self, text, lang, tld):
+        with self._lock:
+            self.calls += 1
+        if text in self.fail_on:
+            raise ConnectionError("offline")
+        return super().synthesize(text, lang, tld)
+
+
+@pytest.fixture
+def cache(tmpdir):
+    return TTSCache(root=os.path.join(str(tmpdir), "tts"))
+
+# --- Test Cases ---
+
+def test_silent_engine_produces_wav():
+    """The offline engine returns a WAV whose length follows the text length."""
+    engine = SilentEngine(seconds_per_char=0.1, min_seconds=0.5)
+    data = engine.synthesize("가" * 20, "ko", "com")
+    with wave.open(io.BytesIO(data)) as wav:
+        assert wav.getnframes() / wav.getframerate() == pytest.approx(2.0)
+
+def test_get_engine_from_env(monkeypatch):
+    """MANIM_TTS_ENGINE selects the engine; unknown names are rejected."""
+    monkeypatch.setenv("MANIM_TTS_ENGINE", "silent")
+    assert get_engine().name == "silent"
+    with pytest.raises(ValueError):
+        get_engine("nope")
+
+def test_cache_key_covers_lang_tld_engine():
+    """Each part of (text, lang, tld, engine) changes the key."""
+    base = TTSCache.key("안녕", "ko", "com", "gtts")
+    assert TTSCache.key("안녕", "en", "com", "gtts") != base
+    assert TTSCache.key("안녕", "ko", "co.kr", "gtts") != base
+    assert TTSCache.key("안녕", "ko", "com", "silent") != base
+
+def test_fetch_synthesizes_once(cache):
+    """The second fetch of the same narration is a cache hit."""
+    engine = CountingEngine()
+    first = cache.fetch("안녕하세요", "ko", "com", engine)
+    second = cache.fetch("안녕하세요", "ko", "com", engine)
+    assert first == second and first.exists()
+    assert engine.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_evict_least_recently_used(tmpdir):
+    """When over budget, the least recently used clips are removed first."""
+    engine = SilentEngine(min_seconds=0.1, seconds_per_char=0)
+    clip_size = len(engine.synthesize("x", "ko", "com"))
+    cache = TTSCache(root=str(tmpdir), max_bytes=clip_size * 2)
+
+    a = cache.fetch("a", "ko", "com", engine)
+    b = cache.fetch("b", "ko", "com", engine)
+    # Make "a" older than "b", then use "a" again so "b" becomes the LRU entry.
+    os.utime(a, (time.time() - 100, time.time() - 100))
+    os.utime(b, (time.time() - 50, time.time() - 50))
+    cache.get("a", "ko", "com", engine)
+    c = cache.fetch("c", "ko", "com", engine)
+
+    assert a.exists() and c.exists()
+    assert not b.exists()
+
+def test_prefetch_dedups_and_reports(cache):
+    """Duplicate narrations are synthesized once; failures are reported, not raised."""
+    engine = CountingEngine(fail_on={"실패"})
+    summary = prefetch(["하나", "둘", "하나", "실패"], engine=engine, cache=cache, max_workers=4)
+    assert summary["requested"] == 3
+    assert summary["synthesized"] == 2
+    assert [text for text, _ in summary["failed"]] == ["실패"]
+
+    again = prefetch(["하나", "둘"], engine=engine, cache=cache)
+    assert again["cached"] == 2 and again["synthesized"] == 0
+
+def test_prefetch_scenes_reads_narrations(tmpdir, cache):
+    """Literal voiceover texts are pulled out of scene files."""
+    scene = os.path.join(str(tmpdir), "scene.py")
+    with open(scene, "w", encoding="utf-8") as f:
+        f.write(
+            "class S(VoiceoverScene):\n"
+            "    def construct(self):\n"
+            "        with self.voiceover(text='첫 문장'):\n"
+            "            pass\n"
+        )
+    engine = SilentEngine()
+    summary = prefetch_scenes([scene], engine=engine, cache=cache)
+    assert summary["synthesized"] == 1
+    assert cache.get("첫 문장", "ko", "com", engine) is not None
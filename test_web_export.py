@@ -0,0 +1,314 @@
+import numpy as np
+import pytest
+
+from scene_binary import pack_scene, unpack_scene
+from web_export import RATE_FUNCTIONS, SceneGraphRecorder, TrackRecorder, WebExportMixin, drawn_fraction, _split_left
+
+
+class FakeVMobject:
+    """Just the VMobject surface the recorder reads."""
+
+    def __init__(self, points=None, stroke=(1, 1, 1, 1), fill=(0, 0, 0, 0), width=4.0, submobjects=()):
+        self.points = np.zeros((0, 3)) if points is None else np.asarray(points, dtype=float)
+        self.stroke = stroke
+        self.fill = fill
+        self.width = width
+        self.submobjects = list(submobjects)
+
+    def get_stroke_rgbas(self):
+        return np.array([self.stroke])
+
+    def get_fill_rgbas(self):
+        return np.array([self.fill])
+
+    def get_stroke_width(self):
+        return self.width
+
+    def shift(self, dx, dy):
+        self.points = self.points + [dx, dy, 0]
+
+
+class BareMobject:
+    """Like an ImageMobject, PMobject or ValueTracker: points, but every made-up get_* raises."""
+
+    def __init__(self, points):
+        self.points = np.asarray(points, dtype=float)
+        self.submobjects = []
+
+    def __getattr__(self, name):
+        if name.startswith("get_"):
+            return lambda: getattr(self, name[4:])
+        raise AttributeError(name)
+
+
+def square(x=0.0, y=0.0, side=1.0):
+    corners = np.array([[0, 0], [side, 0], [side, side], [0, side], [0, 0]], dtype=float) + [x, y]
+    points = []
+    for start, end in zip(corners[:-1], corners[1:]):
+        points += [start + (end - start) * t for t in (0, 1 / 3, 2 / 3, 1)]
+    return np.hstack([np.array(points), np.zeros((len(points), 1))])
+
+
+class FakeScene:
+    """
+    Follows Scene.play: frames go through update_to_time and advance the clock, while a
+    wait() is a frozen frame that only advances the clock (no play_internal).
+    """
+
+    frame_time = 0.25
+
+    def __init__(self):
+        self.mobjects = []
+        self.animations = []
+        self.time = 0.0
+
+    def setup(self):
+        pass
+
+    def tear_down(self):
+        pass
+
+    def update_to_time(self, t):
+        for animation in self.animations:
+            animation(t)
+
+    def play_internal(self, skip_rendering=False):
+        for t in np.arange(0, self.duration, self.frame_time):
+            self.update_to_time(t)
+            self.time += self.frame_time
+        for animation in self.animations:
+            animation(self.duration)
+
+    def play(self, animation, run_time):
+        self.duration = run_time
+        if animation is None:
+            self.time += run_time
+            return
+        self.animations = [animation]
+        self.play_internal()
+        self.animations = []
+
+    def wait(self, run_time):
+        self.play(None, run_time)
+
+
+class RecordedScene(WebExportMixin, FakeScene):
+    pass
+
+
+class TrackedScene(WebExportMixin, FakeScene):
+    web_recorder_class = TrackRecorder
+
+
+def partial(full, a):
+    """New-style VMobject.pointwise_become_partial(full, 0, a): the undrawn curves are dropped."""
+    curves = full.reshape(-1, 4, 3)
+    index = min(int(a * len(curves)), len(curves) - 1)
+    return np.vstack([*curves[:index], _split_left(curves[index], a * len(curves) - index)])
+
+# --- Test Cases ---
+
+def test_shared_geometry_is_stored_once():
+    """Equal shapes at different places share one geometry; each node keeps its own centre."""
+    recorder = SceneGraphRecorder()
+    group = FakeVMobject(submobjects=[FakeVMobject(square(0, 0)), FakeVMobject(square(3, 1))])
+    recorder.capture([group], 0.0)
+    assert len(recorder.geometries) == 1
+    assert [node["parent"] for node in recorder.nodes] == [None, 0, 0]
+
+    keyframe = recorder.keyframes[0]
+    assert keyframe["order"] == [1, 2] # the group has no points and is not drawn
+    centres = {row[0]: row[2:4] for row in keyframe["changes"]}
+    assert centres == {1: [0.5, 0.5], 2: [3.5, 1.5]}
+
+
+def test_keyframes_only_on_change():
+    """Unchanged frames add nothing; a style change records only the changed node."""
+    recorder = SceneGraphRecorder()
+    a, b = FakeVMobject(square(0, 0)), FakeVMobject(square(2, 0, side=2))
+    for t in (0.0, 0.1, 0.2):
+        recorder.capture([a, b], t)
+    assert len(recorder.keyframes) == 1
+
+    b.fill = (1, 0, 0, 0.5)
+    recorder.capture([a, b], 0.3)
+    assert len(recorder.keyframes) == 2
+    last = recorder.keyframes[-1]
+    assert "order" not in last
+    assert [row[0] for row in last["changes"]] == [1]
+    assert last["changes"][0][-4:] == [1, 0, 0, 0.5]
+
+
+def test_order_tracks_added_and_removed_mobjects():
+    recorder = SceneGraphRecorder()
+    a, b = FakeVMobject(square()), FakeVMobject(square(5, 5))
+    recorder.capture([a], 0.0)
+    recorder.capture([a, b], 1.0)
+    recorder.capture([b], 2.0)
+    assert [keyframe.get("order") for keyframe in recorder.keyframes] == [[0], [0, 1], [1]]
+    assert recorder.keyframes[2]["changes"] == []
+
+
+def test_mobjects_without_stroke_or_fill_are_not_drawn():
+    """Point clouds and images keep their node but never reach a keyframe, in either recorder."""
+    for recorder in (SceneGraphRecorder(), TrackRecorder()):
+        cloud = BareMobject(square(4, 4))
+        recorder.capture([FakeVMobject(square()), FakeVMobject(submobjects=[cloud])], 0.0)
+        assert [node["type"] for node in recorder.nodes] == ["FakeVMobject", "FakeVMobject", "BareMobject"]
+        assert recorder.keyframes[0]["order"] == [0]
+
+
+def test_mixin_records_plays_and_waits():
+    """Frames of every play() are captured on the scene clock; waits add no keyframes."""
+    scene = RecordedScene()
+    scene.setup()
+    mob = FakeVMobject(square())
+    scene.mobjects.append(mob)
+    scene.wait(1.0)
+    start = mob.points.copy()
+    scene.play(lambda t: setattr(mob, "points", start + [t, 0, 0]), 1.0)
+    scene.wait(0.5)
+    scene.tear_down()
+
+    recorder = scene.web_recorder
+    assert recorder.clock == pytest.approx(2.5)
+    times = [keyframe["t"] for keyframe in recorder.keyframes]
+    assert times == [0.0, 1.25, 1.5, 1.75, 2.0]
+    assert len(recorder.geometries) == 1
+    assert recorder.keyframes[-1]["changes"][0][2] == pytest.approx(1.5)
+
+
+def test_static_waits_advance_the_timeline():
+    """wait(2), play(1), wait(1), play(1): waits are frozen frames but still take scene time."""
+    scene = RecordedScene()
+    scene.setup()
+    mob = FakeVMobject(square())
+    scene.mobjects.append(mob)
+    start = mob.points.copy()
+    scene.wait(2.0)
+    scene.play(lambda t: setattr(mob, "points", start + [t, 0, 0]), 1.0)
+    scene.wait(1.0)
+    added = FakeVMobject(square(5, 5))
+    scene.mobjects.append(added)
+    scene.play(lambda t: setattr(added, "width", 4 + t), 1.0)
+    scene.tear_down()
+
+    data = scene.web_recorder.to_dict()
+    assert data["duration"] == pytest.approx(5.0)
+    times = [keyframe["t"] for keyframe in data["keyframes"]]
+    assert times[:2] == [0.0, 2.25] # The first play starts after the 2 s wait
+    assert data["keyframes"][times.index(4.0)]["order"] == [0, 1]
+
+
+def test_export_round_trip():
+    """The scene graph dict survives scene_binary with geometries as flat float32 points."""
+    recorder = SceneGraphRecorder()
+    recorder.capture([FakeVMobject(square(1, 1))], 0.0)
+    recorder.clock = 1.0
+    data = unpack_scene(pack_scene(recorder.to_dict()))
+    assert data["duration"] == 1.0
+    assert data["state"][:2] == ["node", "geometry"]
+    geometry = data["geometries"][0]
+    assert geometry.shape == (16, 3)
+    np.testing.assert_allclose(geometry[0], [-0.5, -0.5, 0])
+    assert data["keyframes"][0]["changes"][0][:4] == [0, 0, 1.5, 1.5]
+
+
+def test_morph_track_replaces_keyframes():
+    """A smooth shift becomes one named-rate track; only its start and end states are keyframed."""
+    scene = TrackedScene()
+    scene.setup()
+    mob = FakeVMobject(square())
+    scene.mobjects.append(mob)
+    start = mob.points.copy()
+    scene.play(lambda t: setattr(mob, "points", start + [2 * RATE_FUNCTIONS["smooth"](t), 0, 0]), 1.0)
+    scene.tear_down()
+
+    recorder = scene.web_recorder
+    assert [keyframe["t"] for keyframe in recorder.keyframes] == [0.0, 1.0]
+    assert len(recorder.geometries) == 1
+    (track,) = recorder.tracks
+    assert (track["kind"], track["t0"], track["t1"]) == ("morph", 0.0, 1.0)
+    assert recorder.rates[track["rate"]] == {"name": "smooth"}
+    assert track["from"][1:3] == [0.5, 0.5] and track["to"][1:3] == [2.5, 0.5]
+    data = recorder.to_dict()
+    assert data["version"] == 2 and data["tracks"] == [track]
+
+
+def test_tracks_start_after_static_waits():
+    """Track times follow the scene clock across waits that never reach play_internal."""
+    scene = TrackedScene()
+    scene.setup()
+    mob = FakeVMobject(square())
+    scene.mobjects.append(mob)
+    start = mob.points.copy()
+    scene.wait(1.5)
+    scene.play(lambda t: setattr(mob, "points", start + [2 * RATE_FUNCTIONS["smooth"](t), 0, 0]), 1.0)
+    scene.wait(0.5)
+    scene.tear_down()
+
+    recorder = scene.web_recorder
+    (track,) = recorder.tracks
+    assert (track["kind"], track["t0"], track["t1"]) == ("morph", 1.5, 2.5)
+    assert [keyframe["t"] for keyframe in recorder.keyframes] == [0.0, 2.5]
+    assert recorder.to_dict()["duration"] == pytest.approx(3.0)
+
+
+def test_there_and_back_and_sampled_rates():
+    """Rates are shared by name; unknown curves are sampled once and deduplicated."""
+    scene = TrackedScene()
+    scene.setup()
+    a, b, c = FakeVMobject(square()), FakeVMobject(square(3, 0)), FakeVMobject(square(6, 0))
+    scene.mobjects += [a, b, c]
+
+    def animate(t):
+        a.fill = (RATE_FUNCTIONS["there_and_back"](t), 0, 0, 1)
+        b.width = 4 + np.sqrt(t)
+        c.width = 4 + np.sqrt(t)
+    scene.play(animate, 1.0)
+
+    recorder = scene.web_recorder
+    rates = [recorder.rates[track["rate"]] for track in recorder.tracks]
+    assert rates[0] == {"name": "there_and_back"}
+    assert rates[1] == rates[2] and rates[1]["samples"][:2] == [0.0, 0.5]
+    assert len(recorder.rates) == 2
+    assert recorder.tracks[0]["to"][-4] == 1.0 # Peak colour, back to black at t1
+
+
+def test_partial_track_for_create():
+    """Drawing a prefix of a shape (Create) becomes a partial track of the full shape."""
+    full = square()
+    scene = TrackedScene()
+    scene.setup()
+    mob = FakeVMobject(partial(full, 0.0))
+    scene.mobjects.append(mob)
+    scene.play(lambda t: setattr(mob, "points", partial(full, t)), 1.0)
+
+    recorder = scene.web_recorder
+    (track,) = recorder.tracks
+    assert track["kind"] == "partial" and "from" not in track
+    assert recorder.rates[track["rate"]] == {"name": "linear"}
+    assert recorder.geometries[track["to"][0]].shape == (16, 3)
+
+
+def test_drawn_fraction_layouts():
+    full = square()
+    for a in (0.0, 0.3, 0.5, 0.95, 1.0):
+        assert drawn_fraction(partial(full, a), full) == pytest.approx(a, abs=1e-6)
+    collapsed = np.vstack([partial(full, 0.6), np.repeat(partial(full, 0.6)[-1:], 4, axis=0)])
+    assert drawn_fraction(collapsed, full) == pytest.approx(0.6, abs=1e-6)
+    assert drawn_fraction(square(side=2), full) is None
+
+
+def test_nonlinear_motion_falls_back_to_keyframes():
+    """A move along an arc (Swap) has no single track, so every frame stays a keyframe."""
+    scene = TrackedScene()
+    scene.setup()
+    mob = FakeVMobject(square())
+    scene.mobjects.append(mob)
+    start = mob.points.copy()
+    scene.play(lambda t: setattr(mob, "points", start + [np.cos(np.pi * t), np.sin(np.pi * t), 0]), 1.0)
+
+    recorder = scene.web_recorder
+    assert recorder.tracks == []
+    assert [keyframe["t"] for keyframe in recorder.keyframes] == [0.0, 0.25, 0.5, 0.75, 1.0]
@@ -0,0 +1,314 @@
+"""
+공유 LaTeX(Tex/MathTex) SVG 캐시와 일괄 컴파일
+프로젝트마다 media/Tex/에 따로 쌓이던 수식 SVG를 한 디렉터리에서 공유하고,
+씬 모듈의 수식 리터럴을 미리 모아 없는 것만 여러 페이지짜리 문서 하나로 컴파일합니다.
+(수식마다 latex + dvisvgm을 따로 실행하지 않음)
+
+캐시 키는 manim과 같은 tex_hash(완성된 .tex 소스)라 템플릿이 같으면 어느 프로젝트든 재사용됩니다.
+
+사용법:
+    python tex_cache.py korean_math_problem.py navier_stokes_scene.py -j 8
+
+씬 모듈에서:
+    from tex_cache import install_tex_cache
+    install_tex_cache(__file__)
+"""
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from scene_analysis import extract_tex
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "manim_agent", "tex")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# manim 기본값 (MathTex, Tex 생성자)
+TEX_DEFAULTS = {
+    "MathTex": {"arg_separator": " ", "tex_environment": "align*"},
+    "Tex": {"arg_separator": "", "tex_environment": "center"},
+}
+
+STANDALONE_PREVIEW = r"\documentclass[preview]{standalone}"
+# standalone의 multi 옵션: 이 환경마다 (preview로 잘린) 페이지 하나
+BATCH_DOCUMENTCLASS = r"\documentclass[preview,multi=manimpage]{standalone}"
+
+
+class TexCache:
+    """
+    {tex_hash}.svg 파일을 담는 공유 캐시.
+    조회할 때 mtime을 갱신하고, 전체 크기가 max_bytes를 넘으면 오래 쓰지 않은 SVG부터 지웁니다.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root or os.environ.get("MANIM_TEX_CACHE", DEFAULT_CACHE_DIR))
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> Path:
+        return self.root / f"{key}.svg"
+
+    def get(self, key: str) -> Optional[Path]:
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return path
+
+    def put_file(self, key: str, source) -> Path:
+        """SVG 파일을 캐시로 원자적으로 복사"""
+        path = self.path_for(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.copyfile(source, tmp_path)
+        size = tmp_path.stat().st_size
+        os.replace(tmp_path, path)
+
+        # 디렉터리 크기는 처음 한 번만 세고 이후에는 누적
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in self.root.glob("*.svg"))
+            else:
+                self._size += size
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+        return path
+
+    def evict(self) -> int:
+        """max_bytes 이하가 될 때까지 mtime이 오래된 SVG부터 삭제"""
+        with self._lock:
+            entries = []
+            for path in self.root.glob("*.svg"):
+                try:
+                    entries.append((path, path.stat()))
+                except FileNotFoundError:
+                    continue
+            total = sum(stat.st_size for _, stat in entries)
+            removed = 0
+            for path, stat in sorted(entries, key=lambda entry: entry[1].st_mtime_ns):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= stat.st_size
+                removed += 1
+            self._size = total
+        return removed
+
+
+# --- manim과 같은 방식으로 식과 키 계산 ---
+
+def expression_for(call: Dict) -> Tuple[str, Optional[str]]:
+    """extract_tex 항목을 manim이 실제로 조판하는 (식, 환경)으로 변환"""
+    from manim.mobject.text.tex_mobject import SingleStringMathTex
+
+    defaults = TEX_DEFAULTS[call["kind"]]
+    separator = call.get("arg_separator", defaults["arg_separator"])
+    environment = call.get("tex_environment", defaults["tex_environment"])
+    # _modify_special_strings는 인스턴스 속성을 쓰지 않으므로 빈 인스턴스로 호출
+    modifier = SingleStringMathTex.__new__(SingleStringMathTex)
+    return modifier._get_modified_expression(separator.join(call["strings"])), environment
+
+
+def texcode(expression: str, environment: Optional[str], template) -> str:
+    """manim generate_tex_file과 같은 .tex 소스"""
+    if environment is not None:
+        return template.get_texcode_for_expression_in_env(expression, environment)
+    return template.get_texcode_for_expression(expression)
+
+
+def tex_key(expression: str, environment: Optional[str], template) -> str:
+    from manim.utils.tex_file_writing import tex_hash
+
+    return tex_hash(texcode(expression, environment, template))
+
+
+def batch_document(items: List[Tuple[str, Optional[str]]], template) -> str:
+    """
+    (식, 환경) 목록을 한 페이지에 하나씩 담은 문서.
+    기본 standalone 템플릿만 지원하며, 각 페이지는 단독 컴파일과 같은 크기로 잘립니다.
+    """
+    if getattr(template, "_body", "") or template.documentclass != STANDALONE_PREVIEW:
+        raise ValueError("Batch compilation needs the default standalone TeX template")
+    pages = []
+    for expression, environment in items:
+        if environment is not None:
+            body = template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            body = template.get_texcode_for_expression(expression)
+        # 단독 문서의 \begin{document} ... \end{document} 사이에서 post_doc_commands 뒤 부분만 사용
+        inner = body.split(r"\begin{document}", 1)[1].rsplit(r"\end{document}", 1)[0]
+        if template.post_doc_commands:
+            inner = inner.replace(template.post_doc_commands, "", 1)
+        pages.append("\\begin{manimpage}\n" + inner.strip("\n") + "\n\\end{manimpage}")
+    return "\n".join(filter(None, [
+        BATCH_DOCUMENTCLASS,
+        template.preamble,
+        r"\begin{document}",
+        template.post_doc_commands,
+        "\n".join(pages),
+        r"\end{document}",
+    ])) + "\n"
+
+
+def _page_number(path: Path) -> int:
+    return int(re.search(r"-(\d+)$", path.stem).group(1))
+
+
+def compile_batch(items: List[Tuple[str, Optional[str]]], template, workdir, name: str = "batch") -> List[Path]:
+    """
+    문서 하나를 latex 한 번, dvisvgm 한 번으로 변환하여 페이지(=식)별 SVG 목록을 반환.
+    페이지 수가 식 개수와 다르면 ValueError
+    """
+    from manim.utils.tex_file_writing import make_tex_compilation_command
+
+    workdir = Path(workdir)
+    tex_file = workdir / f"{name}.tex"
+    tex_file.write_text(batch_document(items, template), encoding="utf-8")
+
+    command = make_tex_compilation_command(template.tex_compiler, template.output_format, tex_file, workdir)
+    if subprocess.run(command, stdout=subprocess.DEVNULL, cwd=workdir).returncode != 0:
+        raise ValueError(f"{template.tex_compiler} failed on batch {tex_file}")
+
+    output = tex_file.with_suffix(template.output_format)
+    subprocess.run([
+        "dvisvgm",
+        *(["--pdf"] if template.output_format == ".pdf" else []),
+        "--page=1-",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={(workdir / name).as_posix()}-%p.svg",
+        output.as_posix(),
+    ], stdout=subprocess.DEVNULL)
+
+    svgs = sorted(workdir.glob(f"{name}-*.svg"), key=_page_number)
+    if len(svgs) != len(items):
+        raise ValueError(f"Batch {name}: expected {len(items)} pages, got {len(svgs)}")
+    return svgs
+
+
+def prefetch_tex(
+    paths: Iterable,
+    cache: Optional[TexCache] = None,
+    template=None,
+    max_workers: Optional[int] = None,
+) -> Dict:
+    """
+    씬 모듈들의 Tex/MathTex 리터럴 중 캐시에 없는 식을 코어 수만큼의 묶음으로 나눠
+    묶음마다 latex 한 번으로 동시에 컴파일합니다. 실패한 묶음은 건너뜁니다 (렌더링 때 개별 컴파일).
+
+    Returns:
+        {"requested", "cached", "compiled", "failed": [오류 메시지, ...]}
+    """
+    from manim import config
+
+    cache = cache or TexCache()
+    template = template or config["tex_template"]
+
+    wanted = {}
+    for path in paths:
+        for call in extract_tex(path):
+            expression, environment = expression_for(call)
+            wanted.setdefault(tex_key(expression, environment, template), (expression, environment))
+
+    missing = [(key, item) for key, item in wanted.items() if cache.get(key) is None]
+    summary = {"requested": len(wanted), "cached": len(wanted) - len(missing), "compiled": 0, "failed": []}
+    if not missing:
+        return summary
+
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, len(missing)))
+    chunks = [missing[i::max_workers] for i in range(max_workers)]
+
+    with tempfile.TemporaryDirectory(prefix="tex_batch_") as workdir:
+        def compile_chunk(index_chunk):
+            index, chunk = index_chunk
+            try:
+                svgs = compile_batch([item for _, item in chunk], template, workdir, name=f"batch{index}")
+            except (OSError, ValueError) as e:
+                return 0, str(e)
+            for (key, _), svg in zip(chunk, svgs):
+                cache.put_file(key, svg)
+            return len(chunk), None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for compiled, error in executor.map(compile_chunk, enumerate(chunks)):
+                summary["compiled"] += compiled
+                if error:
+                    summary["failed"].append(error)
+    return summary
+
+
+# --- manim 연결 ---
+
+_installed = {}
+
+
+def install_tex_cache(module_path=None, cache: Optional[TexCache] = None) -> TexCache:
+    """
+    manim의 tex_to_svg_file을 공유 캐시를 거치도록 교체합니다 (여러 번 호출해도 한 번만).
+    module_path가 주어지면 그 모듈의 수식을 먼저 일괄 컴파일합니다.
+    """
+    import manim.mobject.text.tex_mobject as tex_mobject
+    from manim import config, logger
+
+    if "cache" not in _installed:
+        _installed["cache"] = cache or TexCache()
+        _installed["original"] = tex_mobject.tex_to_svg_file
+
+        def cached_tex_to_svg_file(expression, environment=None, tex_template=None):
+            tex_template = tex_template or config["tex_template"]
+            key = tex_key(expression, environment, tex_template)
+            shared = _installed["cache"]
+            path = shared.get(key)
+            if path is not None:
+                return path
+            return shared.put_file(key, _installed["original"](expression, environment, tex_template))
+
+        tex_mobject.tex_to_svg_file = cached_tex_to_svg_file
+
+    if module_path is not None:
+        try:
+            summary = prefetch_tex([module_path], _installed["cache"])
+        except (OSError, ValueError) as e:
+            logger.warning(f"Tex prefetch skipped: {e}")
+        else:
+            if summary["compiled"] or summary["failed"]:
+                logger.info(f"Tex prefetch: {summary}")
+    return _installed["cache"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="씬 모듈의 Tex/MathTex 수식을 공유 캐시에 미리 컴파일")
+    parser.add_argument("paths", nargs="+", help="씬 파일 경로")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="동시에 실행할 latex 수 (기본: CPU 코어 수)")
+    parser.add_argument("--cache-dir", default=None, help="캐시 디렉터리 (기본: MANIM_TEX_CACHE 또는 ~/.cache)")
+    args = parser.parse_args(argv)
+
+    summary = prefetch_tex(args.paths, TexCache(args.cache_dir), max_workers=args.jobs)
+    print(f"수식 {summary['requested']}개: 캐시 {summary['cached']}, 컴파일 {summary['compiled']}, "
+          f"실패 묶음 {len(summary['failed'])}")
+    for error in summary["failed"]:
+        print(f"  {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Tiled LSD line detection for large raster inputs.
+The image is cut into a grid of tiles. Each tile is a "core" region plus an
+`overlap` margin on every side. Worker processes detect each tile on its own
+and keep the segments whose midpoint lies in the tile's core, so the overlap
+margins do not yield duplicates. A segment that crosses a seam comes back as
+two overlapping pieces, one from each side. stitch_seams rejoins those pieces
+with line_simplify.
+
+Workers read their tiles from a memory-mapped .npy copy of the image, so each
+process only holds about one tile in memory. All coordinates are in pixels of
+the full image.
+"""
+
+import os
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+from line_simplify import merge_collinear, remove_duplicates
+
+# Pixel box of a tile (x1/y1 exclusive) and of its core, the part it owns
+Tile = namedtuple("Tile", ["x0", "y0", "x1", "y1", "core_x0", "core_y0", "core_x1", "core_y1"])
+
+
+def tile_grid(height: int, width: int, tile_size: int, overlap: int) -> List[Tile]:
+    """Tiles in row-major order. Cores partition the image; tiles add `overlap` around them."""
+    if tile_size <= 0 or overlap < 0:
+        raise ValueError(f"tile_size must be positive and overlap non-negative (got {tile_size}, {overlap})")
+    tiles = []
+    for core_y0 in range(0, height, tile_size):
+        core_y1 = min(core_y0 + tile_size, height)
+        for core_x0 in range(0, width, tile_size):
+            core_x1 = min(core_x0 + tile_size, width)
+            tiles.append(Tile(
+                max(core_x0 - overlap, 0), max(core_y0 - overlap, 0),
+                min(core_x1 + overlap, width), min(core_y1 + overlap, height),
+                core_x0, core_y0, core_x1, core_y1,
+            ))
+    return tiles
+
+
+def detect_lines(image: np.ndarray) -> np.ndarray:
+    """LSD on a grayscale image; an (N, 4) float32 array of [x1, y1, x2, y2] rows."""
+    lsd = cv2.createLineSegmentDetector(0)
+    lines = lsd.detect(image)[0] # lines is an array of shape (N, 1, 4)
+    if lines is None:
+        return np.empty((0, 4), dtype=np.float32)
+    return lines.reshape(-1, 4)
+
+
+def detect_tile(image: np.ndarray, tile: Tile) -> np.ndarray:
+    """Segments of one tile in full-image coordinates, limited to those centred in its core."""
+    crop = np.ascontiguousarray(image[tile.y0:tile.y1, tile.x0:tile.x1])
+    lines = detect_lines(crop) + np.array([tile.x0, tile.y0, tile.x0, tile.y0], dtype=np.float32)
+    mid_x = (lines[:, 0] + lines[:, 2]) / 2
+    mid_y = (lines[:, 1] + lines[:, 3]) / 2
+    owned = (
+        (mid_x >= tile.core_x0) & (mid_x < tile.core_x1)
+        & (mid_y >= tile.core_y0) & (mid_y < tile.core_y1)
+    )
+    return lines[owned]
+
+
+def _detect_tile_from_file(job) -> np.ndarray:
+    path, tile = job
+    return detect_tile(np.load(path, mmap_mode="r"), tile)
+
+
+def init_worker():
+    # One OpenCV thread per process; the pool already uses every core
+    cv2.setNumThreads(1)
+
+
+def stitch_seams(lines: np.ndarray, tiles: List[Tile], band: float, **merge_options) -> np.ndarray:
+    """
+    Rejoins segments split at internal tile seams. Only segments with an endpoint
+    within `band` pixels of a seam go through remove_duplicates/merge_collinear; the
+    rest are returned unchanged.
+    """
+    lines = np.asarray(lines, dtype=float).reshape(-1, 4)
+    seams_x = np.unique([tile.core_x0 for tile in tiles if tile.core_x0 > 0])
+    seams_y = np.unique([tile.core_y0 for tile in tiles if tile.core_y0 > 0])
+    if not len(lines) or not (len(seams_x) or len(seams_y)):
+        return lines
+
+    def near(values, seams):
+        if not len(seams):
+            return np.zeros(values.shape, dtype=bool)
+        return np.abs(values[..., None] - seams).min(axis=-1) <= band
+
+    at_seam = (near(lines[:, [0, 2]], seams_x) | near(lines[:, [1, 3]], seams_y)).any(axis=1)
+    stitched = merge_collinear(remove_duplicates(lines[at_seam]), **merge_options)
+    return np.concatenate([lines[~at_seam], stitched])
+
+
+def detect_lines_tiled(
+    image: np.ndarray,
+    tile_size: int = 2048,
+    overlap: int = 32,
+    workers: Optional[int] = None,
+    **merge_options,
+) -> np.ndarray:
+    """
+    LSD over a tile grid, in a process pool when workers != 1, with segments
+    stitched across seams. An image that fits in one tile is detected directly.
+    """
+    height, width = image.shape[:2]
+    tiles = tile_grid(height, width, tile_size, overlap)
+    if len(tiles) == 1:
+        return detect_lines(image)
+
+    workers = min(workers or os.cpu_count() or 1, len(tiles))
+    if workers == 1:
+        parts = [detect_tile(image, tile) for tile in tiles]
+    else:
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "image.npy")
+            np.save(path, image)
+            with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+                parts = list(pool.map(_detect_tile_from_file, [(path, tile) for tile in tiles]))
+    return stitch_seams(np.concatenate(parts), tiles, band=overlap, **merge_options).astype(np.float32)
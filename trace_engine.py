@@ -0,0 +1,347 @@
+"""
+선언형 스텝 트레이스 엔진
+ProblemVisualizer 데이터(또는 실제 알고리즘 실행 기록)를
+씬이 재생할 수 있는 간단한 애니메이션 op 목록으로 컴파일합니다.
+
+op는 (kind, target, args) 튜플이며 JSON으로 저장할 수 있습니다.
+manim에 의존하지 않으므로 대량 생성/프로파일링을 렌더링 없이 할 수 있습니다.
+
+사용법:
+    python trace_engine.py array_hashmap -o ops/two_sum.json
+"""
+
+import argparse
+import json
+import sys
+from collections import deque, namedtuple
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+Op = namedtuple("Op", ["kind", "target", "args"])
+
+# op 종류
+#   title       (None, (title, subtitle))
+#   say         (None, (text,))               이후 op들은 다음 say까지 이 나레이션 안에서 재생
+#   array       (name, (values, label))       배열 위젯 생성
+#   hashmap     (name, (label,))              해시맵 위젯 생성
+#   tree        (name, (level_order,))        트리 위젯 생성 (LeetCode 형식, None 허용)
+#   dp          (name, (size, label))         DP 테이블 위젯 생성 (인덱스 0..size-1)
+#   highlight   (name, (indices, color))      일시 강조
+#   unhighlight (name, (indices,))            강조 해제 (마지막 mark 색 또는 기본 색으로)
+#   mark        (name, (indices, color))      지속 색 변경 (예: 정렬 완료)
+#   swap        (name, (i, j))
+#   set         (name, (pairs,))              ((인덱스/키, 값), ...)
+#   caption     (name, (text,))               캡션 생성/변경
+#   wait        (None, (seconds,))
+WIDGET_KINDS = ("array", "hashmap", "tree", "dp")
+
+# 연속으로 나오면 하나의 play로 합칠 수 있는 op
+MERGEABLE_KINDS = ("highlight", "unhighlight", "mark", "set")
+
+
+class Tracer:
+    """알고리즘 실행 중 시각화 이벤트를 기록하는 객체"""
+
+    def __init__(self):
+        self.ops: List[Op] = []
+
+    def emit(self, kind: str, target: Optional[str] = None, *args) -> None:
+        self.ops.append(Op(kind, target, tuple(args)))
+
+    def title(self, title: str, subtitle: str = "") -> None:
+        self.emit("title", None, title, subtitle)
+
+    def say(self, text: str) -> None:
+        self.emit("say", None, text)
+
+    def array(self, name: str, values: Sequence, label: str = "") -> None:
+        self.emit("array", name, tuple(values), label)
+
+    def hashmap(self, name: str, label: str = "HashMap") -> None:
+        self.emit("hashmap", name, label)
+
+    def tree(self, name: str, level_order: Sequence) -> None:
+        self.emit("tree", name, tuple(level_order))
+
+    def dp(self, name: str, size: int, label: str = "dp") -> None:
+        self.emit("dp", name, size, label)
+
+    def highlight(self, name: str, indices: Sequence, color: str = "YELLOW") -> None:
+        self.emit("highlight", name, tuple(indices), color)
+
+    def unhighlight(self, name: str, indices: Sequence) -> None:
+        self.emit("unhighlight", name, tuple(indices))
+
+    def mark(self, name: str, indices: Sequence, color: str = "GREEN") -> None:
+        self.emit("mark", name, tuple(indices), color)
+
+    def swap(self, name: str, i: int, j: int) -> None:
+        self.emit("swap", name, i, j)
+
+    def set(self, name: str, key, value) -> None:
+        self.emit("set", name, ((key, value),))
+
+    def caption(self, name: str, text: str) -> None:
+        self.emit("caption", name, text)
+
+    def wait(self, seconds: float = 0.5) -> None:
+        self.emit("wait", None, seconds)
+
+
+def compact(ops: Sequence[Op]) -> List[Op]:
+    """
+    같은 위젯에 대한 연속된 highlight/unhighlight/mark/set op를 하나로 합칩니다.
+    합쳐진 op는 씬에서 한 번의 play로 재생됩니다.
+    """
+    result: List[Op] = []
+    for op in ops:
+        prev = result[-1] if result else None
+        if (
+            prev is not None
+            and op.kind in MERGEABLE_KINDS
+            and prev.kind == op.kind
+            and prev.target == op.target
+        ):
+            if op.kind in ("highlight", "mark") and prev.args[1] == op.args[1]:
+                merged = tuple(dict.fromkeys(prev.args[0] + op.args[0]))
+                result[-1] = Op(op.kind, op.target, (merged, op.args[1]))
+                continue
+            if op.kind == "unhighlight":
+                merged = tuple(dict.fromkeys(prev.args[0] + op.args[0]))
+                result[-1] = Op(op.kind, op.target, (merged,))
+                continue
+            if op.kind == "set":
+                result[-1] = Op(op.kind, op.target, (prev.args[0] + op.args[0],))
+                continue
+        result.append(op)
+    return result
+
+
+def split_blocks(ops: Sequence[Op]) -> List[tuple]:
+    """
+    op 목록을 나레이션 단위 블록으로 나눕니다.
+    첫 say 이전의 op들은 나레이션 없는 블록(None)이 됩니다.
+
+    Returns:
+        [(나레이션 또는 None, [op, ...]), ...]
+    """
+    blocks: List[tuple] = []
+    text, current = None, []
+    for op in ops:
+        if op.kind == "say":
+            if current or text is not None:
+                blocks.append((text, current))
+            text, current = op.args[0], []
+        else:
+            current.append(op)
+    if current or text is not None:
+        blocks.append((text, current))
+    return blocks
+
+
+# ==============================================================================
+# 실제 알고리즘 트레이스
+# ==============================================================================
+
+def trace_two_sum(tracer: Tracer, nums: Sequence[int], target: int) -> Optional[List[int]]:
+    """HashMap 기반 Two Sum을 실행하며 기록"""
+    tracer.say(f"주어진 배열은 {list(nums)}이고, 목표 합은 {target}입니다.")
+    tracer.array("nums", nums, "nums")
+    tracer.say("빈 HashMap을 생성합니다.")
+    tracer.hashmap("seen", "HashMap")
+
+    seen: Dict[int, int] = {}
+    for i, num in enumerate(nums):
+        complement = target - num
+        tracer.say(f"{num}을 확인합니다. {target} - {num} = {complement}를 HashMap에서 찾습니다.")
+        tracer.highlight("nums", [i])
+        if complement in seen:
+            tracer.say(f"{complement}가 HashMap에 있습니다! 답은 인덱스 {seen[complement]}와 {i}입니다.")
+            tracer.mark("nums", [seen[complement], i])
+            tracer.caption("result", f"답: [{seen[complement]}, {i}]")
+            return [seen[complement], i]
+        tracer.set("seen", num, i)
+        tracer.unhighlight("nums", [i])
+        seen[num] = i
+
+    tracer.say("합이 목표가 되는 두 수가 없습니다.")
+    tracer.caption("result", "답 없음")
+    return None
+
+
+def tree_links(level_order: Sequence) -> Dict[int, tuple]:
+    """
+    LeetCode 형식 배열(None 포함)에서 각 노드의 (왼쪽, 오른쪽) 자식 인덱스를 계산합니다.
+    노드는 level_order 배열의 인덱스로 식별하며, 자식이 없으면 None입니다.
+    """
+    links: Dict[int, tuple] = {}
+    if not level_order or level_order[0] is None:
+        return links
+    queue = deque([0])
+    pos = 1
+    while queue:
+        node = queue.popleft()
+        kids = []
+        for _ in range(2):
+            child = None
+            if pos < len(level_order):
+                if level_order[pos] is not None:
+                    child = pos
+                    queue.append(pos)
+                pos += 1
+            kids.append(child)
+        links[node] = tuple(kids)
+    return links
+
+
+def tree_children(level_order: Sequence) -> Dict[int, List[int]]:
+    """각 노드의 (존재하는) 자식 인덱스 목록"""
+    return {
+        node: [child for child in kids if child is not None]
+        for node, kids in tree_links(level_order).items()
+    }
+
+
+def trace_level_order(tracer: Tracer, level_order: Sequence) -> List[List]:
+    """큐를 이용한 BFS 레벨 순회를 실행하며 기록 (노드는 level_order 인덱스로 식별)"""
+    tracer.say("트리를 그리고 루트 노드부터 BFS를 시작합니다.")
+    tracer.tree("tree", level_order)
+    if not level_order or level_order[0] is None:
+        tracer.caption("result", "결과: []")
+        return []
+
+    children = tree_children(level_order)
+    result = []
+    level = [0]
+    depth = 1
+    while level:
+        values = [level_order[i] for i in level]
+        result.append(values)
+        tracer.say(f"레벨 {depth}의 노드들: {', '.join(map(str, values))}")
+        tracer.highlight("tree", level)
+        tracer.caption("result", f"결과: {result}")
+        tracer.mark("tree", level, "GREEN")
+        level = [child for node in level for child in children[node]]
+        depth += 1
+
+    tracer.say(f"최종 결과는 {result}입니다.")
+    return result
+
+
+def trace_make_one(tracer: Tracer, n: int) -> int:
+    """백준 1463 (1로 만들기) bottom-up DP를 실행하며 기록"""
+    tracer.say(f"N이 {n}인 경우입니다. dp[i]는 i를 1로 만드는 최소 연산 횟수입니다.")
+    tracer.dp("dp", n + 1, "dp")
+    dp = [0] * (n + 1)
+    parent = [0] * (n + 1)
+    tracer.set("dp", 1, 0)
+
+    tracer.say(f"2부터 {n}까지 차례대로 계산합니다.")
+    for i in range(2, n + 1):
+        dp[i], parent[i] = dp[i - 1] + 1, i - 1
+        if i % 2 == 0 and dp[i // 2] + 1 < dp[i]:
+            dp[i], parent[i] = dp[i // 2] + 1, i // 2
+        if i % 3 == 0 and dp[i // 3] + 1 < dp[i]:
+            dp[i], parent[i] = dp[i // 3] + 1, i // 3
+        tracer.highlight("dp", [parent[i]])
+        tracer.set("dp", i, dp[i])
+        tracer.unhighlight("dp", [parent[i]])
+
+    path = [n]
+    while path[-1] > 1:
+        path.append(parent[path[-1]])
+    tracer.say(f"역추적하면 {' → '.join(map(str, path))}, 총 {dp[n]}번의 연산이 필요합니다.")
+    tracer.mark("dp", path)
+    tracer.caption("result", f"{' → '.join(map(str, path))} ({dp[n]}번 연산)")
+    return dp[n]
+
+
+def trace_bubble_sort(tracer: Tracer, nums: Sequence[int]) -> List[int]:
+    """버블 정렬을 실행하며 기록 (나레이션은 패스 단위)"""
+    values = list(nums)
+    tracer.say(f"배열 {values}를 오름차순으로 정렬합니다.")
+    tracer.array("nums", values, "nums")
+
+    n = len(values)
+    for end in range(n - 1, 0, -1):
+        tracer.say(f"{n - end}번째 패스: 인접한 두 수를 비교하여 큰 수를 오른쪽으로 보냅니다.")
+        swapped = False
+        for j in range(end):
+            tracer.highlight("nums", [j, j + 1])
+            if values[j] > values[j + 1]:
+                values[j], values[j + 1] = values[j + 1], values[j]
+                tracer.swap("nums", j, j + 1)
+                swapped = True
+            tracer.unhighlight("nums", [j, j + 1])
+        tracer.mark("nums", [end])
+        if not swapped:
+            break
+    tracer.mark("nums", range(n))
+    tracer.say(f"정렬이 완료되었습니다. 최종 결과는 {values}입니다.")
+    tracer.caption("result", f"정렬 완료: {values}")
+    return values
+
+
+# problem_type → 예제 데이터로 트레이스를 실행하는 함수
+TRACERS: Dict[str, Callable[[Tracer, Dict], object]] = {
+    "array_hashmap": lambda t, ex: trace_two_sum(t, ex["nums"], ex["target"]),
+    "tree_bfs": lambda t, ex: trace_level_order(t, ex["tree"]),
+    "dp": lambda t, ex: trace_make_one(t, ex["n"]),
+    "sort": lambda t, ex: trace_bubble_sort(t, ex["numbers"]),
+}
+
+
+def compile_visualization(data: Dict, problem_type: Optional[str] = None, language: str = "ko") -> List[Op]:
+    """
+    ProblemVisualizer.generate_visualization()의 결과를 op 목록으로 컴파일합니다.
+
+    data의 example로 실제 알고리즘을 실행해 단계를 기록하고,
+    narration의 첫 문장은 도입부, 마지막 문장은 마무리로 사용합니다.
+    """
+    problem_type = problem_type or data.get("problem_type")
+    if problem_type not in TRACERS:
+        raise ValueError(f"Unknown problem type: {problem_type}")
+
+    narration = data.get("narration", {}).get(language, [])
+    tracer = Tracer()
+    if narration:
+        tracer.say(narration[0])
+    tracer.title(data["problem_name"], data.get("algorithm", ""))
+    TRACERS[problem_type](tracer, data["example"])
+    if len(narration) > 1:
+        tracer.say(narration[-1])
+        tracer.wait(1)
+    return compact(tracer.ops)
+
+
+def dump_ops(ops: Sequence[Op], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([[op.kind, op.target, op.args] for op in ops], f, ensure_ascii=False)
+
+
+def _to_tuple(value):
+    return tuple(_to_tuple(v) for v in value) if isinstance(value, list) else value
+
+
+def load_ops(path: str) -> List[Op]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [Op(kind, target, _to_tuple(args)) for kind, target, args in json.load(f)]
+
+
+def main(argv=None):
+    from problem_visualizer import ProblemVisualizer
+
+    parser = argparse.ArgumentParser(description="ProblemVisualizer 데이터를 op 목록(JSON)으로 컴파일합니다.")
+    parser.add_argument("problem_type", choices=sorted(TRACERS))
+    parser.add_argument("-o", "--output", required=True)
+    args = parser.parse_args(argv)
+
+    data = ProblemVisualizer(args.problem_type, args.problem_type).generate_visualization()
+    ops = compile_visualization(data, args.problem_type)
+    dump_ops(ops, args.output)
+    print(f"{len(ops)}개의 op를 {args.output}에 저장했습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""
+트레이스 기반 범용 씬
+trace_engine이 만든 op 목록을 공용 위젯(배열/해시맵/트리/DP 테이블)으로 재생합니다.
+문제마다 construct()를 새로 작성하는 대신 데이터만 바꿔서 렌더링합니다.
+
+사용법:
+    manim trace_scene.py TwoSumTraceScene -ql
+    TRACE_OPS_FILE=ops/two_sum.json manim trace_scene.py TraceScene -ql
+"""
+
+import os
+
+from manim import *
+from manim_voiceover import VoiceoverScene
+from cached_tts_service import CachedTTSService
+
+from array_widget import ArrayWidget, GlyphAtlas, GlyphLabel
+from cached_text import CachedText
+from problem_visualizer import ProblemVisualizer
+from trace_engine import compile_visualization, load_ops, split_blocks
+from tree_widget import TreeWidget
+
+
+FONT = "NanumGothic"
+
+# 위젯이 생성되는 순서대로 배치되는 위치
+WIDGET_SLOTS = [UP * 1.0, DOWN * 1.0, DOWN * 2.2]
+CAPTION_POSITION = DOWN * 3.2
+
+
+def _color(name: str):
+    """op의 색 이름("YELLOW")을 manim 색으로 변환"""
+    return globals().get(name.upper(), WHITE)
+
+
+def _fit_width(mobject: Mobject, margin: float = 1.0) -> Mobject:
+    max_width = config.frame_width - margin
+    if mobject.width > max_width:
+        mobject.scale_to_fit_width(max_width)
+    return mobject
+
+
+class ArrayView(ArrayWidget):
+    """배열 위젯: ArrayWidget 왼쪽에 이름 표시"""
+
+    def __init__(self, values, label: str = "", cell_size: float = 0.8, font_size: int = 28, color=BLUE):
+        super().__init__(values, cell_size=cell_size, font_size=font_size, color=color)
+        if label:
+            self.add(Text(label, font_size=font_size - 4, font=FONT).next_to(self.cells, LEFT, buff=0.3))
+        _fit_width(self)
+
+
+class HashMapView(VGroup):
+    """해시맵 위젯: "HashMap: {k: v, ...}" 한 줄 텍스트"""
+
+    def __init__(self, label: str = "HashMap", font_size: int = 28):
+        super().__init__()
+        self.label = label
+        self.font_size = font_size
+        self.entries = {}
+        self.text = self._make_text()
+        self.add(self.text)
+
+    def _make_text(self):
+        body = ", ".join(f"{key}: {value}" for key, value in self.entries.items())
+        return _fit_width(CachedText(f"{self.label}: {{{body}}}", font_size=self.font_size, font=FONT))
+
+    def set_values(self, pairs):
+        self.entries.update(pairs)
+        new_text = self._make_text().move_to(self.text)
+        return [Transform(self.text, new_text)]
+
+    def highlight(self, keys, color):
+        return [self.text.animate.set_color(color)]
+
+    def unhighlight(self, keys):
+        return [self.text.animate.set_color(WHITE)]
+
+    mark = highlight
+
+
+class DPTableView(ArrayView):
+    """DP 테이블 위젯: dp[1..size-1] 칸, 아래에 인덱스 표시"""
+
+    def __init__(self, size: int, label: str = "dp", cell_size: float = 0.6, font_size: int = 20):
+        super().__init__(["-"] * (size - 1), label=label, cell_size=cell_size, font_size=font_size)
+        index_atlas = GlyphAtlas.get(FONT, font_size - 6)
+        self.index_labels = VGroup(*[
+            GlyphLabel(index_atlas, len(str(i)), str(i), color=GRAY).next_to(self.cells[i - 1], DOWN, buff=0.1)
+            for i in range(1, size)
+        ])
+        self.add(self.index_labels)
+
+    # dp[i]는 (i - 1)번째 칸
+    def highlight(self, indices, color):
+        return super().highlight([i - 1 for i in indices if i >= 1], color)
+
+    def unhighlight(self, indices):
+        return super().unhighlight([i - 1 for i in indices if i >= 1])
+
+    def mark(self, indices, color):
+        return super().mark([i - 1 for i in indices if i >= 1], color)
+
+    def set_values(self, pairs):
+        return super().set_values([(i - 1, value) for i, value in pairs if i >= 1])
+
+
+class TraceScene(VoiceoverScene):
+    """
+    op 목록을 재생하는 범용 씬.
+    TRACE_OPS_FILE 환경 변수가 있으면 해당 JSON을, 없으면 problem_type의
+    ProblemVisualizer 데이터를 컴파일해서 사용합니다.
+    """
+
+    problem_type = None
+    step_run_time = 0.4
+
+    def get_ops(self):
+        path = os.environ.get("TRACE_OPS_FILE")
+        if path:
+            return load_ops(path)
+        if self.problem_type is None:
+            raise ValueError("Set TRACE_OPS_FILE or use a scene class with problem_type")
+        data = ProblemVisualizer(self.problem_type, self.problem_type).generate_visualization()
+        return compile_visualization(data, self.problem_type)
+
+    def construct(self):
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
+        self.widgets = {}
+        self.captions = {}
+
+        for text, ops in split_blocks(self.get_ops()):
+            if text is None:
+                self.play_ops(ops)
+            else:
+                with self.voiceover(text=text):
+                    self.play_ops(ops)
+
+    def play_ops(self, ops):
+        for op in ops:
+            getattr(self, f"op_{op.kind}")(op.target, *op.args)
+
+    def add_widget(self, name, widget):
+        if not isinstance(widget, TreeWidget):
+            widget.move_to(WIDGET_SLOTS[min(len(self.widgets), len(WIDGET_SLOTS) - 1)])
+        self.widgets[name] = widget
+        self.play(Create(widget))
+
+    # --- op 처리 ---
+
+    def op_title(self, target, title, subtitle):
+        title_text = Text(title, font_size=44, font=FONT).to_edge(UP)
+        group = VGroup(title_text)
+        if subtitle:
+            group.add(Text(subtitle, font_size=28, font=FONT).next_to(title_text, DOWN))
+        self.play(*[Write(m) for m in group])
+        self.wait(1)
+        self.play(FadeOut(group))
+
+    def op_array(self, name, values, label):
+        self.add_widget(name, ArrayView(values, label))
+
+    def op_hashmap(self, name, label):
+        self.add_widget(name, HashMapView(label))
+
+    def op_tree(self, name, level_order):
+        self.add_widget(name, TreeWidget(level_order))
+
+    def op_dp(self, name, size, label):
+        self.add_widget(name, DPTableView(size, label))
+
+    def op_highlight(self, name, indices, color):
+        self.play(*self.widgets[name].highlight(indices, _color(color)), run_time=self.step_run_time)
+
+    def op_unhighlight(self, name, indices):
+        self.play(*self.widgets[name].unhighlight(indices), run_time=self.step_run_time)
+
+    def op_mark(self, name, indices, color):
+        self.play(*self.widgets[name].mark(indices, _color(color)), run_time=self.step_run_time)
+
+    def op_swap(self, name, i, j):
+        self.play(*self.widgets[name].swap(i, j), run_time=self.step_run_time)
+
+    def op_set(self, name, pairs):
+        self.play(*self.widgets[name].set_values(pairs), run_time=self.step_run_time)
+
+    def op_caption(self, name, text):
+        new_caption = _fit_width(CachedText(text, font_size=28, font=FONT)).move_to(CAPTION_POSITION)
+        if name in self.captions:
+            self.play(Transform(self.captions[name], new_caption))
+        else:
+            self.captions[name] = new_caption
+            self.play(Write(new_caption))
+
+    def op_wait(self, target, seconds):
+        self.wait(seconds)
+
+
+class TwoSumTraceScene(TraceScene):
+    problem_type = "array_hashmap"
+
+
+class TreeBFSTraceScene(TraceScene):
+    problem_type = "tree_bfs"
+
+
+class DPTraceScene(TraceScene):
+    problem_type = "dp"
+
+
+class SortTraceScene(TraceScene):
+    problem_type = "sort"
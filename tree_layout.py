@@ -0,0 +1,132 @@
+"""
+이진 트리 자동 배치 (Reingold–Tilford)
+LeetCode 형식 배열(None 포함)을 받아 겹치지 않는 노드 좌표를 선형 시간에 계산합니다.
+재귀 없이 순회하므로 한쪽으로 치우친 10,000 노드 트리도 재귀 한도에 걸리지 않습니다.
+"""
+
+from collections import namedtuple
+from typing import List, Sequence
+
+import numpy as np
+
+from trace_engine import tree_links
+
+
+# order: BFS 순서의 노드(level_order 인덱스), x/depth/parent: order와 같은 순서의 배열 (루트의 parent는 -1)
+TreeLayout = namedtuple("TreeLayout", ["order", "x", "depth", "parent"])
+
+
+def layout_tree(level_order: Sequence, separation: float = 1.0) -> TreeLayout:
+    """
+    Reingold–Tilford 배치. 부모는 두 자식의 가운데에 오고, 같은 깊이의 이웃 노드는
+    최소 separation만큼 떨어집니다. 자식이 하나면 separation / 2만큼 그쪽으로 치우쳐
+    왼쪽/오른쪽 자식이 구분됩니다. x는 최솟값이 0이 되도록 옮긴 값입니다.
+    """
+    links = tree_links(level_order)
+    if not links:
+        empty = np.zeros(0)
+        return TreeLayout([], empty, empty.astype(int), empty.astype(int))
+
+    # BFS 순서 (뒤에서부터 보면 자식이 항상 부모보다 먼저 나오는 후위 순서)
+    order = [0]
+    for node in order:
+        order.extend(child for child in links[node] if child is not None)
+
+    rel = {0: 0.0}      # 부모 기준 x 오프셋
+    thread = {}         # 윤곽선이 끊긴 잎 노드 -> (이어지는 노드, x 차이)
+    # 서브트리의 가장 깊은 레벨의 (왼쪽 끝 노드, x, 높이), (오른쪽 끝 노드, x, 높이)
+    extreme_left = {}
+    extreme_right = {}
+
+    def next_left(node):
+        left, right = links[node]
+        child = left if left is not None else right
+        if child is not None:
+            return child, rel[child]
+        return thread.get(node, (None, 0.0))
+
+    def next_right(node):
+        left, right = links[node]
+        child = right if right is not None else left
+        if child is not None:
+            return child, rel[child]
+        return thread.get(node, (None, 0.0))
+
+    for node in reversed(order):
+        left, right = links[node]
+        if left is None and right is None:
+            extreme_left[node] = extreme_right[node] = (node, 0.0, 0)
+            continue
+
+        if left is None or right is None:
+            child = left if left is not None else right
+            rel[child] = -separation / 2 if child == left else separation / 2
+            ln, lx, lh = extreme_left[child]
+            rn, rx, rh = extreme_right[child]
+            extreme_left[node] = (ln, lx + rel[child], lh + 1)
+            extreme_right[node] = (rn, rx + rel[child], rh + 1)
+            continue
+
+        # 왼쪽 서브트리의 오른쪽 윤곽과 오른쪽 서브트리의 왼쪽 윤곽을 같은 깊이끼리 비교
+        root_sep = separation
+        inner_left, inner_left_x = left, 0.0     # 왼쪽 서브트리 루트 기준
+        inner_right, inner_right_x = right, 0.0  # 오른쪽 서브트리 루트 기준
+        while True:
+            gap = root_sep + inner_right_x - inner_left_x
+            if gap < separation:
+                root_sep += separation - gap
+            next_l, dl = next_right(inner_left)
+            next_r, dr = next_left(inner_right)
+            if next_l is None or next_r is None:
+                break
+            inner_left, inner_left_x = next_l, inner_left_x + dl
+            inner_right, inner_right_x = next_r, inner_right_x + dr
+
+        rel[left] = -root_sep / 2
+        rel[right] = root_sep / 2
+
+        ll, llx, lh = extreme_left[left]
+        lr, lrx, _ = extreme_right[left]
+        rl, rlx, rh = extreme_left[right]
+        rr, rrx, _ = extreme_right[right]
+
+        # 얕은 쪽 서브트리의 바깥 끝 잎을 깊은 쪽 윤곽의 다음 노드로 연결
+        if lh < rh:
+            target_x = rel[right] + inner_right_x + dr
+            thread[ll] = (next_r, target_x - (rel[left] + llx))
+        elif rh < lh:
+            target_x = rel[left] + inner_left_x + dl
+            thread[rr] = (next_l, target_x - (rel[right] + rrx))
+
+        if rh > lh:
+            extreme_left[node] = (rl, rlx + rel[right], rh + 1)
+        else:
+            extreme_left[node] = (ll, llx + rel[left], lh + 1)
+        if lh > rh:
+            extreme_right[node] = (lr, lrx + rel[left], lh + 1)
+        else:
+            extreme_right[node] = (rr, rrx + rel[right], rh + 1)
+
+    # 부모 좌표에 오프셋을 더해 절대 좌표 계산
+    position = {node: i for i, node in enumerate(order)}
+    x = np.zeros(len(order))
+    depth = np.zeros(len(order), dtype=int)
+    parent = np.full(len(order), -1, dtype=int)
+    for i, node in enumerate(order):
+        for child in links[node]:
+            if child is not None:
+                j = position[child]
+                x[j] = x[i] + rel[child]
+                depth[j] = depth[i] + 1
+                parent[j] = i
+    x -= x.min()
+    return TreeLayout(order, x, depth, parent)
+
+
+def layout_levels(layout: TreeLayout) -> List[np.ndarray]:
+    """깊이별 노드 위치(layout 배열 인덱스) 목록"""
+    if not len(layout.order):
+        return []
+    # BFS 순서라 같은 깊이의 노드는 연속해 있음
+    bounds = np.flatnonzero(np.diff(layout.depth)) + 1
+    return np.split(np.arange(len(layout.order)), bounds)
@@ -5,14 +5,15 @@ BFS를 이용한 레벨 순서 순회 시각화
 
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
+from cached_tts_service import CachedTTSService
+from tree_widget import TreeWidget
 
 
 class BinaryTreeLevelOrderVisualization(VoiceoverScene):
     """Binary Tree Level Order Traversal 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 제목
         title = Text("LeetCode 102번 - Binary Tree Level Order", font_size=40, font="NanumGothic").to_edge(UP)
@@ -24,69 +25,36 @@ class BinaryTreeLevelOrderVisualization(VoiceoverScene):
 
         self.play(FadeOut(title), FadeOut(subtitle))
 
-        # 트리 구조 생성
-        # 루트 노드
-        root_circle = Circle(radius=0.35, color=RED, fill_opacity=0.5)
-        root_circle.move_to(UP * 2.5)
-        root_label = Text("3", font_size=24, font="NanumGothic", color=WHITE)
-        root_label.move_to(UP * 2.5)
+        # 트리 구조 생성 (레벨별 간선/노드/라벨 묶음)
+        tree = TreeWidget([3, 9, 20, None, None, 15, 7], level_colors=[RED, BLUE, GREEN])
+        tree.move_to(UP * 0.65)
+        root, level_2, level_3 = tree.levels
 
         with self.voiceover(text="루트 노드 3부터 시작합니다."):
-            self.play(Create(root_circle), Write(root_label))
+            self.play(Create(root[1]), Write(root[2]))
             self.wait(0.5)
 
-        # 레벨 2 노드들
-        left_circle = Circle(radius=0.35, color=BLUE, fill_opacity=0.5)
-        left_circle.move_to(LEFT * 2 + UP * 0.8)
-        left_label = Text("9", font_size=24, font="NanumGothic", color=WHITE)
-        left_label.move_to(LEFT * 2 + UP * 0.8)
-
-        right_circle = Circle(radius=0.35, color=BLUE, fill_opacity=0.5)
-        right_circle.move_to(RIGHT * 2 + UP * 0.8)
-        right_label = Text("20", font_size=24, font="NanumGothic", color=WHITE)
-        right_label.move_to(RIGHT * 2 + UP * 0.8)
-
-        # 루트에서 자식으로 가는 선
-        line_left = Line(root_circle.get_center(), left_circle.get_center(), color=WHITE)
-        line_right = Line(root_circle.get_center(), right_circle.get_center(), color=WHITE)
-
         with self.voiceover(text="레벨 2의 노드들: 9와 20입니다."):
-            self.play(Create(line_left), Create(line_right))
-            self.play(Create(left_circle), Create(right_circle))
-            self.play(Write(left_label), Write(right_label))
+            self.play(Create(level_2[0]))
+            self.play(Create(level_2[1]))
+            self.play(Write(level_2[2]))
             self.wait(0.5)
 
-        # 레벨 3 노드들
-        left_grand = Circle(radius=0.35, color=GREEN, fill_opacity=0.5)
-        left_grand.move_to(RIGHT * 0.8 + DOWN * 1.2)
-        left_grand_label = Text("15", font_size=24, font="NanumGothic", color=WHITE)
-        left_grand_label.move_to(RIGHT * 0.8 + DOWN * 1.2)
-
-        right_grand = Circle(radius=0.35, color=GREEN, fill_opacity=0.5)
-        right_grand.move_to(RIGHT * 3.2 + DOWN * 1.2)
-        right_grand_label = Text("7", font_size=24, font="NanumGothic", color=WHITE)
-        right_grand_label.move_to(RIGHT * 3.2 + DOWN * 1.2)
-
-        # 20에서 자식으로 가는 선
-        line_left_grand = Line(right_circle.get_center(), left_grand.get_center(), color=WHITE)
-        line_right_grand = Line(right_circle.get_center(), right_grand.get_center(), color=WHITE)
-
         with self.voiceover(text="레벨 3의 노드들: 15와 7입니다. 이들은 노드 20의 자식입니다."):
-            self.play(Create(line_left_grand), Create(line_right_grand))
-            self.play(Create(left_grand), Create(right_grand))
-            self.play(Write(left_grand_label), Write(right_grand_label))
+            self.play(Create(level_3[0]))
+            self.play(Create(level_3[1]))
+            self.play(Write(level_3[2]))
             self.wait(0.5)
 
         # 순회 결과
         with self.voiceover(text="BFS 방식으로 순회하면 각 레벨별로 노드들을 처리합니다."):
+            # 레벨 하나를 한 번에 강조
+            for depth in range(len(tree.levels)):
+                self.play(*tree.highlight(tree.level_nodes[depth], YELLOW), run_time=0.4)
+                self.play(*tree.unhighlight(tree.level_nodes[depth]), run_time=0.4)
+
             # 트리 전체 제거
-            self.play(FadeOut(root_circle), FadeOut(root_label),
-                     FadeOut(left_circle), FadeOut(right_circle),
-                     FadeOut(left_label), FadeOut(right_label),
-                     FadeOut(line_left), FadeOut(line_right),
-                     FadeOut(left_grand), FadeOut(right_grand),
-                     FadeOut(left_grand_label), FadeOut(right_grand_label),
-                     FadeOut(line_left_grand), FadeOut(line_right_grand))
+            self.play(FadeOut(tree))
 
             queue_text = Text("Queue 기반 순회", font_size=24, font="NanumGothic").move_to(DOWN * 1.5)
             self.play(Write(queue_text))
@@ -106,7 +74,7 @@ class BinaryTreeBFSDetailed(VoiceoverScene):
     """BFS 알고리즘 상세 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         title = Text("BFS 알고리즘 상세 분석", font_size=44, font="NanumGothic").to_edge(UP)
 
@@ -0,0 +1,189 @@
+"""
+자동 배치 이진 트리 위젯
+tree_layout의 Reingold–Tilford 좌표로 노드를 배치하고, 깊이마다 간선/노드/라벨을
+각각 VMobject 하나로 묶어 그립니다. 노드마다 Circle + Text를 만들지 않으므로
+10,000 노드 트리도 mobject 수는 (깊이 수 × 3)개입니다.
+"""
+
+from manim import *
+
+from array_widget import GlyphAtlas
+from tree_layout import layout_levels, layout_tree
+
+
+FONT = "NanumGothic"
+MIN_LABEL_FONT_SIZE = 8
+
+# 원을 근사하는 3차 베지어 4개의 제어점 상수
+_KAPPA = 4 * (np.sqrt(2) - 1) / 3
+
+
+def _unit_circle_points() -> np.ndarray:
+    """반지름 1 원의 점 16개 (3차 베지어 4개, 오른쪽에서 반시계 방향)"""
+    anchors = np.array([[1, 0], [0, 1], [-1, 0], [0, -1], [1, 0]], dtype=float)
+    tangents = np.array([[0, 1], [-1, 0], [0, -1], [1, 0], [0, 1]], dtype=float)
+    points = []
+    for k in range(4):
+        points += [anchors[k], anchors[k] + _KAPPA * tangents[k], anchors[k + 1] - _KAPPA * tangents[k + 1], anchors[k + 1]]
+    points = np.array(points)
+    return np.hstack([points, np.zeros((16, 1))])
+
+
+UNIT_CIRCLE = _unit_circle_points()
+
+
+def circle_points(centers: np.ndarray, radius: float) -> np.ndarray:
+    """원 여러 개를 닫힌 서브패스로 이어 붙인 점 배열"""
+    return (centers[:, None, :] + radius * UNIT_CIRCLE[None]).reshape(-1, 3)
+
+
+def segment_points(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """선분 여러 개 (선분마다 직선 3차 베지어 하나)"""
+    t = np.array([0.0, 1 / 3, 2 / 3, 1.0])[None, :, None]
+    return (starts[:, None, :] + (ends - starts)[:, None, :] * t).reshape(-1, 3)
+
+
+class TreeWidget(VGroup):
+    """
+    이진 트리 위젯 (LeetCode 형식 배열).
+    노드는 level_order 배열의 인덱스로 식별합니다.
+    levels[d]는 깊이 d의 VGroup(간선, 노드, 라벨)이라 레벨 단위로 등장/강조할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        level_order,
+        width: float = 10.0,
+        height: float = 5.5,
+        level_height: float = 1.2,
+        radius: float = 0.35,
+        color=BLUE,
+        level_colors=None,
+        font_size: float = 24,
+        label_color=WHITE,
+    ):
+        super().__init__()
+        layout = layout_tree(level_order)
+        self.layout = layout
+        self.marks = {}
+        self.overlays = {}
+        self.level_of = {node: int(depth) for node, depth in zip(layout.order, layout.depth)}
+        self.level_nodes = [[layout.order[i] for i in level] for level in layout_levels(layout)]
+        # 노드 -> 레벨 VMobject 안에서의 순번
+        self._slot = {node: k for nodes in self.level_nodes for k, node in enumerate(nodes)}
+        self.level_colors = [
+            level_colors[d] if level_colors and d < len(level_colors) else color
+            for d in range(len(self.level_nodes))
+        ]
+
+        # 형제 간격(배치 단위 1)과 레벨 간격을 화면에 맞춤
+        span = layout.x.max() if len(layout.order) else 0.0
+        unit = min(2 * radius / 0.8, width / span) if span else 2 * radius / 0.8
+        depth_max = len(self.level_nodes) - 1
+        self.level_height = min(level_height, height / depth_max) if depth_max > 0 else level_height
+        self.radius = min(radius, 0.4 * unit, 0.4 * self.level_height)
+        scale = self.radius / radius
+
+        centers = np.zeros((len(layout.order), 3))
+        centers[:, 0] = (layout.x - span / 2) * unit
+        centers[:, 1] = -layout.depth * self.level_height
+
+        label_size = font_size * scale
+        atlas = GlyphAtlas.get(FONT, label_size) if label_size >= MIN_LABEL_FONT_SIZE else None
+        stroke_width = DEFAULT_STROKE_WIDTH * scale
+
+        self.levels = VGroup()
+        for depth, level in enumerate(layout_levels(layout)):
+            edges = VMobject(stroke_color=WHITE, stroke_width=stroke_width)
+            nodes = VMobject(
+                stroke_color=self.level_colors[depth], fill_color=self.level_colors[depth],
+                fill_opacity=0.5, stroke_width=stroke_width,
+            )
+            labels = VMobject(fill_color=label_color, fill_opacity=1.0, stroke_width=0)
+
+            nodes.set_points(circle_points(centers[level], self.radius))
+            if depth > 0:
+                edges.set_points(self._edge_points(centers[layout.parent[level]], centers[level]))
+            if atlas is not None:
+                labels.set_points(self._label_points(atlas, [level_order[layout.order[i]] for i in level], centers[level]))
+            self.levels.add(VGroup(edges, nodes, labels))
+
+        self.add(self.levels)
+        if len(layout.order):
+            self.move_to(UP * 0.3)
+
+    def _edge_points(self, parents: np.ndarray, children: np.ndarray) -> np.ndarray:
+        # 원 안쪽은 그리지 않도록 양 끝을 반지름만큼 줄임
+        direction = children - parents
+        direction /= np.linalg.norm(direction, axis=1, keepdims=True)
+        return segment_points(parents + direction * self.radius, children - direction * self.radius)
+
+    @staticmethod
+    def _label_points(atlas: GlyphAtlas, values, centers: np.ndarray) -> np.ndarray:
+        chunks = [
+            template.points + np.array([center[0] + x, center[1], 0.0])
+            for value, center in zip(values, centers)
+            for template, x in atlas.layout(str(value))
+        ]
+        return np.concatenate(chunks) if chunks else np.zeros((0, 3))
+
+    def node_points(self, node: int) -> np.ndarray:
+        """노드 원의 현재 점 16개 (위젯 이동/크기 변경 반영)"""
+        depth = self.level_of[node]
+        k = self._slot[node]
+        return self.levels[depth][1].points[16 * k:16 * (k + 1)]
+
+    def node_center(self, node: int) -> np.ndarray:
+        # 원의 점들은 중심에 대해 대칭
+        return self.node_points(node).mean(axis=0)
+
+    # --- 애니메이션 (TraceScene 위젯 인터페이스) ---
+
+    def _split_levels(self, indices):
+        """레벨 전체가 선택된 깊이와 일부만 선택된 노드로 분리"""
+        by_level = {}
+        for node in indices:
+            by_level.setdefault(self.level_of[node], []).append(node)
+        whole = [d for d, nodes in by_level.items() if len(set(nodes)) == len(self.level_nodes[d])]
+        partial = [node for d, nodes in by_level.items() if d not in whole for node in nodes]
+        return whole, partial
+
+    def _overlay(self, nodes, color) -> VMobject:
+        overlay = VMobject(stroke_color=color, fill_color=color, fill_opacity=0.5,
+                           stroke_width=self.levels[0][1].get_stroke_width())
+        return overlay.set_points(np.concatenate([self.node_points(node) for node in nodes]))
+
+    def highlight(self, indices, color):
+        whole, partial = self._split_levels(indices)
+        animations = [self.levels[d][1].animate.set_color(color) for d in whole]
+        if partial:
+            overlay = self._overlay(partial, color)
+            self.overlays[tuple(partial)] = overlay
+            self.add(overlay)
+            animations.append(FadeIn(overlay))
+        return animations
+
+    def unhighlight(self, indices):
+        whole, partial = self._split_levels(indices)
+        animations = [
+            self.levels[d][1].animate.set_color(self.marks.get(d, self.level_colors[d]))
+            for d in whole
+        ]
+        partial = set(partial)
+        for key in [key for key in self.overlays if partial & set(key)]:
+            overlay = self.overlays.pop(key)
+            self.remove(overlay)
+            animations.append(FadeOut(overlay))
+        return animations
+
+    def mark(self, indices, color):
+        whole, partial = self._split_levels(indices)
+        for d in whole:
+            self.marks[d] = color
+        animations = [self.levels[d][1].animate.set_color(color) for d in whole]
+        if partial:
+            # 일부 노드 표시는 강조 해제에 지워지지 않도록 overlays에 넣지 않음
+            overlay = self._overlay(partial, color)
+            self.add(overlay)
+            animations.append(FadeIn(overlay))
+        return animations
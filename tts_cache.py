@@ -0,0 +1,253 @@
+"""
+공유 TTS 오디오 캐시와 병렬 프리페치
+나레이션 음성을 (text, lang, tld, engine) 키로 디스크에 저장하고,
+렌더링 전에 씬의 나레이션을 스레드 풀로 미리 합성합니다.
+
+사용법:
+    python tts_cache.py two_sum_visualization.py sort_visualization.py -j 8
+    MANIM_TTS_ENGINE=silent python tts_cache.py two_sum_visualization.py  # 오프라인
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from scene_analysis import extract_narrations
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "manim_agent", "tts")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class GTTSEngine:
+    """Google TTS 엔진 (네트워크 필요)"""
+
+    name = "gtts"
+    extension = "mp3"
+
+    def synthesize(self, text: str, lang: str, tld: str) -> bytes:
+        from gtts import gTTS
+
+        buffer = io.BytesIO()
+        gTTS(text, lang=lang, tld=tld).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class SilentEngine:
+    """
+    네트워크 없이 테스트하기 위한 대체 엔진.
+    글자 수에 비례하는 길이의 무음 WAV를 만듭니다.
+    """
+
+    name = "silent"
+    extension = "wav"
+
+    def __init__(self, seconds_per_char: float = 0.08, min_seconds: float = 0.5, sample_rate: int = 16000):
+        self.seconds_per_char = seconds_per_char
+        self.min_seconds = min_seconds
+        self.sample_rate = sample_rate
+
+    def duration(self, text: str) -> float:
+        return max(self.min_seconds, len(text) * self.seconds_per_char)
+
+    def synthesize(self, text: str, lang: str, tld: str) -> bytes:
+        n_frames = int(self.duration(text) * self.sample_rate)
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(self.sample_rate)
+            wav.writeframes(b"\x00\x00" * n_frames)
+        return buffer.getvalue()
+
+
+ENGINES = {
+    GTTSEngine.name: GTTSEngine,
+    SilentEngine.name: SilentEngine,
+}
+
+
+def get_engine(name: Optional[str] = None):
+    """이름으로 엔진 생성. 이름이 없으면 MANIM_TTS_ENGINE 환경 변수, 기본값은 gtts"""
+    name = name or os.environ.get("MANIM_TTS_ENGINE", GTTSEngine.name)
+    try:
+        return ENGINES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown TTS engine: {name} (available: {', '.join(ENGINES)})")
+
+
+class TTSCache:
+    """
+    여러 프로젝트가 공유하는 디스크 TTS 캐시.
+
+    오디오 파일의 mtime을 마지막 사용 시각으로 사용하므로 별도 인덱스 없이
+    여러 프로세스가 같은 디렉터리를 함께 쓸 수 있습니다. 전체 크기가
+    max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 지웁니다.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root or os.environ.get("MANIM_TTS_CACHE", DEFAULT_CACHE_DIR))
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text: str, lang: str, tld: str, engine_name: str) -> str:
+        data = json.dumps([text, lang, tld, engine_name], ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def path_for(self, text: str, lang: str, tld: str, engine) -> Path:
+        return self.root / f"{self.key(text, lang, tld, engine.name)}.{engine.extension}"
+
+    def get(self, text: str, lang: str, tld: str, engine) -> Optional[Path]:
+        """캐시된 오디오 경로. 있으면 사용 시각을 갱신"""
+        path = self.path_for(text, lang, tld, engine)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, text: str, lang: str, tld: str, engine, data: bytes) -> Path:
+        """오디오를 원자적으로 저장하고 필요하면 오래된 항목을 제거"""
+        path = self.path_for(text, lang, tld, engine)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+        return path
+
+    def fetch(self, text: str, lang: str, tld: str, engine) -> Path:
+        """캐시에 있으면 그대로, 없으면 합성해서 저장한 뒤 경로를 반환"""
+        path = self.get(text, lang, tld, engine)
+        with self._lock:
+            if path is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if path is not None:
+            return path
+        return self.put(text, lang, tld, engine, engine.synthesize(text, lang, tld))
+
+    def _entries(self) -> List[Tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.root.iterdir():
+            if path.suffix == ".tmp" or not path.is_file():
+                continue
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(stat.st_size for _, stat in self._entries())
+
+    def evict(self) -> int:
+        """max_bytes 이하가 될 때까지 오래된 파일부터 삭제하고 삭제한 개수를 반환"""
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[1].st_mtime_ns)
+            total = sum(stat.st_size for _, stat in entries)
+            removed = 0
+            for path, stat in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= stat.st_size
+                removed += 1
+            self._size = total
+        return removed
+
+
+def prefetch(
+    texts: Iterable[str],
+    lang: str = "ko",
+    tld: str = "com",
+    engine=None,
+    cache: Optional[TTSCache] = None,
+    max_workers: int = 8,
+) -> Dict:
+    """
+    나레이션 문자열들을 동시에 합성하여 캐시에 채웁니다.
+    합성에 실패한 문장은 건너뛰고 결과에 기록합니다 (렌더링 시 다시 시도).
+
+    Returns:
+        {"requested", "cached", "synthesized", "failed": [(text, error), ...]}
+    """
+    engine = engine or get_engine()
+    cache = cache or TTSCache()
+    unique_texts = list(dict.fromkeys(texts))
+    missing = [text for text in unique_texts if cache.get(text, lang, tld, engine) is None]
+
+    def synthesize(text):
+        try:
+            cache.fetch(text, lang, tld, engine)
+            return None
+        except Exception as e:  # 네트워크 오류 등은 렌더링을 막지 않음
+            return (text, f"{type(e).__name__}: {e}")
+
+    failed = []
+    if missing:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            failed = [error for error in executor.map(synthesize, missing) if error is not None]
+
+    return {
+        "requested": len(unique_texts),
+        "cached": len(unique_texts) - len(missing),
+        "synthesized": len(missing) - len(failed),
+        "failed": failed,
+    }
+
+
+def prefetch_scenes(scene_paths: Iterable[str], **kwargs) -> Dict:
+    """씬 파일들의 리터럴 나레이션을 모아 한 번에 프리페치"""
+    texts = []
+    for path in scene_paths:
+        texts.extend(extract_narrations(path))
+    return prefetch(texts, **kwargs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="씬 나레이션을 TTS 캐시에 미리 합성합니다.")
+    parser.add_argument("scenes", nargs="+", help="씬 파이썬 파일")
+    parser.add_argument("--lang", default="ko")
+    parser.add_argument("--tld", default="com")
+    parser.add_argument("--engine", default=None, help=f"TTS 엔진 ({', '.join(ENGINES)})")
+    parser.add_argument("-j", "--jobs", type=int, default=8, help="동시 합성 수")
+    args = parser.parse_args(argv)
+
+    summary = prefetch_scenes(
+        args.scenes, lang=args.lang, tld=args.tld,
+        engine=get_engine(args.engine), max_workers=args.jobs,
+    )
+    print(f"나레이션 {summary['requested']}개: 캐시 {summary['cached']}, "
+          f"합성 {summary['synthesized']}, 실패 {len(summary['failed'])}")
+    for text, error in summary["failed"]:
+        print(f"  ✗ {text[:40]}: {error}")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,14 +5,15 @@ HashMap을 이용한 O(n) 해법 시각화
 
 from manim import *
 from manim_voiceover import VoiceoverScene
-from manim_voiceover.services.gtts import GTTSService
+from cached_tts_service import CachedTTSService
+from array_widget import ArrayWidget
 
 
 class TwoSumVisualization(VoiceoverScene):
     """Two Sum 문제 시각화"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 제목
         title = Text("LeetCode 1번 - Two Sum", font_size=48, font="NanumGothic").to_edge(UP)
@@ -36,15 +37,8 @@ class TwoSumVisualization(VoiceoverScene):
 
         with self.voiceover(text="배열은 2, 7, 11, 15이고, 목표 합은 9입니다."):
             # 배열 상자 만들기
-            array_group = VGroup()
-            boxes = []
-            for i, num in enumerate(nums):
-                box = Rectangle(width=0.8, height=0.8, color=BLUE, stroke_width=2)
-                text = Text(str(num), font_size=32, font="NanumGothic", color=WHITE)
-                element = VGroup(box, text)
-                element.shift((i * 1.2 - 1.8) * RIGHT + DOWN * 0.5)
-                array_group.add(element)
-                boxes.append(element)
+            array_group = ArrayWidget(nums, cell_size=0.8, font_size=32, buff=0.4).move_to(DOWN * 0.5)
+            boxes = list(array_group.cells)
 
             self.play(Create(array_group))
             self.wait(1)
@@ -93,7 +87,7 @@ class TwoSumVisualizationExtended(VoiceoverScene):
     """Two Sum 문제 확장 시각화 - 여러 예제"""
 
     def construct(self):
-        self.set_speech_service(GTTSService(lang="ko", tld="com"))
+        self.set_speech_service(CachedTTSService(lang="ko", tld="com"))
 
         # 제목
         title = Text("Two Sum - 상세 분석", font_size=48, font="NanumGothic").to_edge(UP)
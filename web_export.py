@@ -0,0 +1,453 @@
+"""
+Exports any Manim scene to a web scene graph that web_player.html plays in real time.
+WebExportMixin is mixed into a Scene class. Every frame of every play()/wait(),
+SceneGraphRecorder walks the scene's mobject tree, timed by the scene clock (a
+static wait() draws no frames but still takes its time). Each VMobject is stored as:
+- a geometry: its Bezier control points relative to its centre.
+- a per-frame state: centre, stroke/fill RGBA and stroke width.
+
+Identical geometry (a shape that only moves, or many equal squares) is stored
+once. A keyframe is written only when a state, the draw order or the visible
+set changes, so a paused scene costs nothing. The result goes through
+scene_binary (geometries become typed blocks), so the browser uploads the point
+buffers without JSON parsing.
+
+With --mode tracks, TrackRecorder turns each play() into animation tracks
+instead of per-frame keyframes:
+- a morph track: every frame lies on the straight line between two states
+  (Transform, .animate, FadeIn/FadeOut). It stores the from/to rows and a rate.
+- a partial track: the frames draw a prefix of one full shape (Create).
+A rate is a Manim rate function name the player knows, or a sampled curve.
+The player interpolates both kinds on the GPU. Anything else (Swap's arc
+path, updaters) falls back to keyframes.
+
+Usage:
+    python web_export.py sort_visualization.py SortVisualization -o sort_scene.bin --compress gzip
+    python web_export.py sort_visualization.py SortVisualization -o sort_scene.bin --mode tracks
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import os
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from scene_binary import COMPRESSIONS, ENCODINGS, write_scene
+
+# Coordinates and colours are compared (and geometry deduplicated) at this precision
+DECIMALS = 4
+# Largest deviation of a sampled rate curve from a named rate function that still counts as that function
+RATE_TOLERANCE = 2e-3
+
+
+def _first_rgba(rgbas) -> list:
+    rgbas = np.asarray(rgbas, dtype=float).reshape(-1, 4)
+    return np.round(rgbas[0], DECIMALS).tolist() if len(rgbas) else [0.0, 0.0, 0.0, 0.0]
+
+
+def _sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+def _smooth(t, inflection: float = 10.0):
+    error = _sigmoid(-inflection / 2)
+    return np.clip((_sigmoid(inflection * (t - 0.5)) - error) / (1 - 2 * error), 0, 1)
+
+
+# Manim rate functions the player implements by name (web_player.js RATE_FUNCTIONS)
+RATE_FUNCTIONS = {
+    "linear": lambda t: t,
+    "smooth": _smooth,
+    "rush_into": lambda t: 2 * _smooth(t / 2),
+    "rush_from": lambda t: 2 * _smooth(t / 2 + 0.5) - 1,
+    "double_smooth": lambda t: np.where(t < 0.5, 0.5 * _smooth(2 * t), 0.5 * (1 + _smooth(2 * t - 1))),
+    "there_and_back": lambda t: _smooth(np.where(t < 0.5, 2 * t, 2 * (1 - t))),
+    "smoothstep": lambda t: 3 * t ** 2 - 2 * t ** 3,
+    "smootherstep": lambda t: 6 * t ** 5 - 15 * t ** 4 + 10 * t ** 3,
+    "ease_in_sine": lambda t: 1 - np.cos(t * np.pi / 2),
+    "ease_out_sine": lambda t: np.sin(t * np.pi / 2),
+    "ease_in_out_sine": lambda t: (1 - np.cos(np.pi * t)) / 2,
+    "ease_in_quad": lambda t: t ** 2,
+    "ease_out_quad": lambda t: 1 - (1 - t) ** 2,
+    "ease_in_out_quad": lambda t: np.where(t < 0.5, 2 * t ** 2, 1 - (2 - 2 * t) ** 2 / 2),
+    "ease_in_cubic": lambda t: t ** 3,
+    "ease_out_cubic": lambda t: 1 - (1 - t) ** 3,
+    "ease_in_out_cubic": lambda t: np.where(t < 0.5, 4 * t ** 3, 1 - (2 - 2 * t) ** 3 / 2),
+}
+
+
+def _split_left(curve: np.ndarray, r: float) -> np.ndarray:
+    """Control points of the part t in [0, r] of one cubic Bezier (de Casteljau)."""
+    p01, p12, p23 = curve[:3] + r * (curve[1:] - curve[:3])
+    p012, p123 = p01 + r * (p12 - p01), p12 + r * (p23 - p12)
+    return np.array([curve[0], p01, p012, p012 + r * (p123 - p012)])
+
+
+def _bezier_residue(curve: np.ndarray, point: np.ndarray) -> float:
+    """Parameter r whose curve point is nearest to point (grid search, then ternary refinement)."""
+    t = np.linspace(0, 1, 257)[:, None]
+    samples = ((1 - t) ** 3 * curve[0] + 3 * (1 - t) ** 2 * t * curve[1]
+               + 3 * (1 - t) * t ** 2 * curve[2] + t ** 3 * curve[3])
+    best = float(t[np.linalg.norm(samples - point, axis=1).argmin(), 0])
+    lo, hi = max(best - 1 / 256, 0.0), min(best + 1 / 256, 1.0)
+    for _ in range(40):
+        m1, m2 = lo + (hi - lo) / 3, hi - (hi - lo) / 3
+        if np.linalg.norm(_split_left(curve, m1)[3] - point) < np.linalg.norm(_split_left(curve, m2)[3] - point):
+            hi = m2
+        else:
+            lo = m1
+    return (lo + hi) / 2
+
+
+def drawn_fraction(points: np.ndarray, full: np.ndarray, tolerance: float = 1e-3) -> Optional[float]:
+    """
+    a such that points is VMobject.pointwise_become_partial(full, 0, a), or None.
+    Handles both Manim layouts of the undrawn part: dropped curves, or curves
+    collapsed onto the last drawn point.
+    """
+    if len(points) % 4 or len(full) % 4 or not len(full):
+        return None
+    curves, full_curves = points.reshape(-1, 4, 3), full.reshape(-1, 4, 3)
+    while len(curves) > 1 and np.abs(curves[-1] - curves[-2][3]).max() <= tolerance:
+        curves = curves[:-1]
+    count = len(curves)
+    if not count or count > len(full_curves):
+        return None
+    if count > 1 and np.abs(curves[:-1] - full_curves[:count - 1]).max() > tolerance:
+        return None
+    last, source = curves[-1], full_curves[count - 1]
+    residue = _bezier_residue(source, last[3])
+    if np.abs(_split_left(source, residue) - last).max() > tolerance:
+        return None
+    return (count - 1 + residue) / len(full_curves)
+
+
+class SceneGraphRecorder:
+    """Collects nodes, deduplicated geometries and change-only keyframes from mobject trees."""
+
+    def __init__(self):
+        self.geometries: List[np.ndarray] = []
+        self.nodes: List[dict] = []
+        self.keyframes: List[dict] = []
+        self.clock = 0.0 # Scene time of the next capture without an explicit t
+        self._geometry_ids: Dict[bytes, int] = {}
+        self._node_ids: Dict[int, int] = {}
+        self._mobjects = [] # Keeps recorded mobjects alive so their id() is never reused
+        self._states: Dict[int, tuple] = {}
+        self._order: Optional[list] = None
+
+    def node_id(self, mobject, parent: Optional[int]) -> int:
+        key = id(mobject)
+        if key not in self._node_ids:
+            self._node_ids[key] = len(self.nodes)
+            self._mobjects.append(mobject)
+            self.nodes.append({"type": type(mobject).__name__, "parent": parent})
+        return self._node_ids[key]
+
+    def geometry_id(self, local_points: np.ndarray) -> int:
+        local_points = np.round(local_points, DECIMALS) + 0.0 # + 0.0 folds -0.0 into 0.0
+        key = hashlib.blake2b(local_points.astype(np.float32).tobytes(), digest_size=16).digest()
+        if key not in self._geometry_ids:
+            self._geometry_ids[key] = len(self.geometries)
+            self.geometries.append(local_points)
+        return self._geometry_ids[key]
+
+    @staticmethod
+    def raw_state(mobject) -> Optional[tuple]:
+        """(world points, (stroke RGBA, stroke width, fill RGBA)) of a drawable VMobject, else None."""
+        points = getattr(mobject, "points", None)
+        if points is None or not len(points):
+            return None
+        try:
+            style = (
+                *_first_rgba(mobject.get_stroke_rgbas()),
+                round(float(mobject.get_stroke_width()), DECIMALS),
+                *_first_rgba(mobject.get_fill_rgbas()),
+            )
+        except AttributeError:
+            # Mobject.__getattr__ makes up every get_*, so only the call tells a VMobject apart
+            # from an ImageMobject, PMobject or ValueTracker that has points but no stroke/fill
+            return None
+        return np.array(points, dtype=float), style
+
+    def state_from_raw(self, raw: tuple) -> tuple:
+        points, style = raw
+        center = (points.min(axis=0) + points.max(axis=0)) / 2
+        return (self.geometry_id(points - center), *np.round(center, DECIMALS).tolist(), *style)
+
+    def state(self, mobject) -> Optional[tuple]:
+        """(geometry, x, y, z, stroke RGBA, stroke width, fill RGBA) of a drawable VMobject, else None."""
+        raw = self.raw_state(mobject)
+        return None if raw is None else self.state_from_raw(raw)
+
+    def walk(self, mobjects):
+        """Yields (node, mobject) over the mobject trees, parents before children, in draw order."""
+        stack = [(mobject, None) for mobject in reversed(list(mobjects))]
+        while stack:
+            mobject, parent = stack.pop()
+            node = self.node_id(mobject, parent)
+            stack.extend((child, node) for child in reversed(list(mobject.submobjects)))
+            yield node, mobject
+
+    def capture(self, mobjects, t: Optional[float] = None):
+        """Records a keyframe at scene time t (default: clock) if anything drawable changed."""
+        order = []
+        states = []
+        for node, mobject in self.walk(mobjects):
+            state = self.state(mobject)
+            if state is not None:
+                order.append(node)
+                states.append((node, state))
+        self.record(t, order, states)
+
+    def record(self, t: Optional[float], order: list, states: list):
+        """Adds a keyframe holding the (node, state) pairs that changed and the draw order if it changed."""
+        changes = []
+        for node, state in states:
+            if self._states.get(node) != state:
+                self._states[node] = state
+                changes.append([node, *state])
+
+        keyframe = {"t": round(self.clock if t is None else t, 6), "changes": changes}
+        if order != self._order:
+            self._order = order
+            keyframe["order"] = order
+        if changes or "order" in keyframe:
+            if self.keyframes and self.keyframes[-1]["t"] == keyframe["t"]:
+                self._merge_into_last(keyframe)
+            else:
+                self.keyframes.append(keyframe)
+
+    def _merge_into_last(self, keyframe: dict):
+        last = self.keyframes[-1]
+        changed = {change[0] for change in keyframe["changes"]}
+        last["changes"] = [change for change in last["changes"] if change[0] not in changed] + keyframe["changes"]
+        if "order" in keyframe:
+            last["order"] = keyframe["order"]
+
+    # Hooks called by WebExportMixin around every play()
+    def begin_play(self, t: float):
+        pass
+
+    def frame(self, mobjects, t: float):
+        self.capture(mobjects, t)
+
+    def end_play(self, mobjects, t: float):
+        self.clock = t
+        self.capture(mobjects)
+
+    def to_dict(self, frame_width: float = 14.222222222222221, frame_height: float = 8.0,
+                background: str = "#000000", fps: float = 60.0) -> dict:
+        return {
+            "version": 1,
+            "frame": {"width": frame_width, "height": frame_height, "background": background, "fps": fps},
+            "duration": self.clock,
+            # Column names of a keyframe change row
+            "state": ["node", "geometry", "x", "y", "z", "stroke_r", "stroke_g", "stroke_b", "stroke_a",
+                      "stroke_width", "fill_r", "fill_g", "fill_b", "fill_a"],
+            "nodes": self.nodes,
+            "geometries": self.geometries,
+            "keyframes": self.keyframes,
+        }
+
+
+class TrackRecorder(SceneGraphRecorder):
+    """
+    SceneGraphRecorder that buffers the frames of each play() and replaces the
+    in-between keyframes of every node it can fit with one morph or partial track.
+    """
+
+    def __init__(self, tolerance: float = 1e-3):
+        super().__init__()
+        self.tolerance = tolerance
+        self.rates: List[dict] = []
+        self.tracks: List[dict] = []
+        self._rate_ids: Dict[object, int] = {}
+        self._frames: Optional[list] = None
+
+    def begin_play(self, t: float):
+        self._frames = []
+
+    def frame(self, mobjects, t: float):
+        if self._frames is None:
+            return super().frame(mobjects, t)
+        order = []
+        raws = {}
+        for node, mobject in self.walk(mobjects):
+            raw = self.raw_state(mobject)
+            if raw is not None:
+                order.append(node)
+                raws[node] = raw
+        self._frames.append((round(t, 6), order, raws))
+
+    def end_play(self, mobjects, t: float):
+        self.frame(mobjects, t)
+        frames, self._frames = self._frames, None
+        self.clock = t
+        times = np.array([frame[0] for frame in frames])
+
+        spans = {}
+        for node in frames[0][2]:
+            if all(node in frame[2] for frame in frames[1:]):
+                fit = self.fit(times, [frame[2][node] for frame in frames])
+                if fit is not None:
+                    spans[node] = self._add_track(node, times, frames, *fit)
+
+        # Fitted nodes only need their states up to the track start and from its end on
+        for index, (frame_t, order, raws) in enumerate(frames):
+            states = [
+                (node, self.state_from_raw(raws[node])) for node in order
+                if node not in spans or not spans[node][0] < index < spans[node][1]
+            ]
+            self.record(frame_t, order, states)
+
+    def fit(self, times: np.ndarray, raws: list) -> Optional[tuple]:
+        """(kind, progress per frame, index of the target frame) if the frames fit one track, else None."""
+        if len({raw[0].shape for raw in raws}) == 1:
+            vectors = np.array([np.concatenate([points.ravel(), style]) for points, style in raws])
+            offsets = vectors - vectors[0]
+            distance = np.abs(offsets).max(axis=1)
+            target = int(distance.argmax())
+            if distance[target] <= self.tolerance:
+                return None # Static
+            direction = offsets[target]
+            progress = offsets @ direction / (direction @ direction)
+            if np.abs(offsets - np.outer(progress, direction)).max() <= self.tolerance:
+                return "morph", progress, target
+
+        styles = np.array([style for _, style in raws])
+        if np.ptp(styles, axis=0).max() > self.tolerance:
+            return None
+        # The full shape has the longest control polygon (a prefix may already have all its curves)
+        target = int(np.argmax([np.linalg.norm(np.diff(points, axis=0), axis=1).sum() for points, _ in raws]))
+        progress = [drawn_fraction(points, raws[target][0], self.tolerance) for points, _ in raws]
+        if None in progress:
+            return None
+        return "partial", np.array(progress), target
+
+    def _add_track(self, node: int, times: np.ndarray, frames: list, kind: str,
+                   progress: np.ndarray, target: int) -> tuple:
+        moving = np.flatnonzero(np.abs(np.diff(progress)) > 1e-6)
+        if not len(moving):
+            return 0, 0
+        start, end = int(moving[0]), int(moving[-1]) + 1
+        u = (times[start:end + 1] - times[start]) / (times[end] - times[start])
+        track = {
+            "node": node,
+            "kind": kind,
+            "t0": float(times[start]),
+            "t1": float(times[end]),
+            "rate": self.rate_id(u, progress[start:end + 1]),
+            "to": list(self.state_from_raw(frames[target][2][node])),
+        }
+        if kind == "morph":
+            track["from"] = list(self.state_from_raw(frames[start][2][node]))
+        self.tracks.append(track)
+        return start, end
+
+    def rate_id(self, u: np.ndarray, values: np.ndarray) -> int:
+        """Index into self.rates of a named rate function matching values(u), else of a sampled curve."""
+        for name, function in RATE_FUNCTIONS.items():
+            if np.abs(function(u) - values).max() <= RATE_TOLERANCE:
+                rate, key = {"name": name}, name
+                break
+        else:
+            samples = np.round(np.interp(np.linspace(0, 1, len(u)), u, values), DECIMALS) + 0.0
+            rate, key = {"samples": samples.tolist()}, tuple(samples.tolist())
+        if key not in self._rate_ids:
+            self._rate_ids[key] = len(self.rates)
+            self.rates.append(rate)
+        return self._rate_ids[key]
+
+    def to_dict(self, *args, **kwargs) -> dict:
+        data = super().to_dict(*args, **kwargs)
+        data.update(version=2, rates=self.rates, tracks=self.tracks)
+        return data
+
+
+RECORDERS = {"frames": SceneGraphRecorder, "tracks": TrackRecorder}
+
+
+class WebExportMixin:
+    """
+    Put before a Scene class (class WebSort(WebExportMixin, SortVisualization)) to record
+    self.web_recorder while the scene plays. Render with caching disabled: a cached
+    play() is skipped without running its frames.
+
+    Times come from the scene clock (Scene.time). A static wait() is a frozen frame that
+    never reaches play_internal, so play() itself syncs the recorder clock and captures
+    what was added or removed since the last play.
+    """
+
+    web_recorder_class = SceneGraphRecorder
+
+    def setup(self):
+        super().setup()
+        self.web_recorder = self.web_recorder_class()
+        self._web_play_start = 0.0
+
+    def play(self, *args, **kwargs):
+        self._web_play_start = self.web_recorder.clock = self.time
+        self.web_recorder.capture(self.mobjects)
+        super().play(*args, **kwargs)
+        self.web_recorder.clock = self.time
+
+    def play_internal(self, skip_rendering: bool = False):
+        self.web_recorder.begin_play(self._web_play_start)
+        super().play_internal(skip_rendering)
+        self.web_recorder.end_play(self.mobjects, self._web_play_start + self.duration)
+
+    def update_to_time(self, t):
+        super().update_to_time(t)
+        self.web_recorder.frame(self.mobjects, self._web_play_start + t)
+
+    def tear_down(self):
+        self.web_recorder.clock = self.time
+        self.web_recorder.capture(self.mobjects)
+        super().tear_down()
+
+
+def load_scene_class(path: str, name: str):
+    spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    spec.loader.exec_module(module)
+    return getattr(module, name)
+
+
+def record_scene(scene_class, mode: str = "frames") -> dict:
+    """Runs scene_class without writing video and returns its scene graph dict."""
+    from manim import config, tempconfig
+
+    web_class = type(scene_class.__name__, (WebExportMixin, scene_class), {"web_recorder_class": RECORDERS[mode]})
+    with tempconfig({"dry_run": True, "disable_caching": True, "progress_bar": "none"}):
+        scene = web_class()
+        scene.render()
+        return scene.web_recorder.to_dict(
+            config.frame_width, config.frame_height, str(config.background_color), config.frame_rate
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a Manim scene as a web scene graph (web_player.html)")
+    parser.add_argument("file", help="Python file that defines the scene")
+    parser.add_argument("scene", help="Scene class name")
+    parser.add_argument("-o", "--output", required=True, help="output .bin file")
+    parser.add_argument("--encoding", choices=ENCODINGS, default="float32")
+    parser.add_argument("--compress", nargs="*", choices=COMPRESSIONS, default=[])
+    parser.add_argument("--mode", choices=RECORDERS, default="frames",
+                        help="frames: keyframes on change; tracks: one track per animated node and play()")
+    args = parser.parse_args(argv)
+
+    data = record_scene(load_scene_class(args.file, args.scene), args.mode)
+    for path in write_scene(args.output, data, args.encoding, args.compress):
+        print(f"{path}: {os.path.getsize(path):,} bytes")
+    print(f"{len(data['nodes'])} nodes, {len(data['geometries'])} geometries, "
+          f"{len(data['keyframes'])} keyframes, {len(data.get('tracks', []))} tracks, {data['duration']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
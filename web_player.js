@@ -0,0 +1,317 @@
+// Plays scene graphs written by web_export.py in real time with Three.js.
+// web_player.html?scene=sort_scene.bin loads sort_scene.bin(.gz) through scene_binary.js.
+// Every keyframe row is [node, geometry, x, y, z, stroke rgba, stroke width, fill rgba]
+// (data.state names the columns); keyframes are applied in order as time passes.
+// Version 2 files (web_export.py --mode tracks) add tracks that override a node between t0 and t1:
+// - morph: lerp position/colour from `from` to `to` by a rate; a changed shape morphs on the GPU
+//   (morph target attribute) when both shapes sample to the same polylines.
+// - partial: draw a growing prefix of the `to` shape (Create) with setDrawRange.
+
+const params = new URLSearchParams(window.location.search);
+const sceneUrl = params.get('scene') || 'scene.bin';
+
+const container = document.getElementById('container');
+const playButton = document.getElementById('play_button');
+const timeSlider = document.getElementById('time_slider');
+const timeLabel = document.getElementById('time_label');
+
+const renderer = new THREE.WebGLRenderer({ antialias: true });
+renderer.setPixelRatio(window.devicePixelRatio);
+container.appendChild(renderer.domElement);
+const scene = new THREE.Scene();
+const camera = new THREE.OrthographicCamera(-1, 1, 1, -1, -10, 10);
+const root = new THREE.Group();
+scene.add(root);
+
+const BEZIER_SAMPLES = 12; // Line segments per cubic curve
+let data = null;
+let geometryCache = [];
+let nodeObjects = new Map();
+let cursor = 0;
+let tracks = [];
+let trackCursor = 0;
+let activeTracks = [];
+let morphCache = new Map();
+let time = 0;
+let playing = true;
+let lastFrame = null;
+
+// Manim rate functions web_export.py refers to by name
+function smooth(t) {
+    const sigmoid = x => 1 / (1 + Math.exp(-x));
+    const error = sigmoid(-5);
+    return Math.min(Math.max((sigmoid(10 * (t - 0.5)) - error) / (1 - 2 * error), 0), 1);
+}
+
+const RATE_FUNCTIONS = {
+    linear: t => t,
+    smooth,
+    rush_into: t => 2 * smooth(t / 2),
+    rush_from: t => 2 * smooth(t / 2 + 0.5) - 1,
+    double_smooth: t => t < 0.5 ? 0.5 * smooth(2 * t) : 0.5 * (1 + smooth(2 * t - 1)),
+    there_and_back: t => smooth(t < 0.5 ? 2 * t : 2 * (1 - t)),
+    smoothstep: t => 3 * t * t - 2 * t ** 3,
+    smootherstep: t => 6 * t ** 5 - 15 * t ** 4 + 10 * t ** 3,
+    ease_in_sine: t => 1 - Math.cos(t * Math.PI / 2),
+    ease_out_sine: t => Math.sin(t * Math.PI / 2),
+    ease_in_out_sine: t => (1 - Math.cos(Math.PI * t)) / 2,
+    ease_in_quad: t => t * t,
+    ease_out_quad: t => 1 - (1 - t) ** 2,
+    ease_in_out_quad: t => t < 0.5 ? 2 * t * t : 1 - (2 - 2 * t) ** 2 / 2,
+    ease_in_cubic: t => t ** 3,
+    ease_out_cubic: t => 1 - (1 - t) ** 3,
+    ease_in_out_cubic: t => t < 0.5 ? 4 * t ** 3 : 1 - (2 - 2 * t) ** 3 / 2,
+};
+
+function rate(id, u) {
+    const entry = data.rates[id];
+    u = Math.min(Math.max(u, 0), 1);
+    if (entry.name) return RATE_FUNCTIONS[entry.name](u);
+    const samples = entry.samples;
+    if (samples.length < 2) return samples[0];
+    const x = u * (samples.length - 1);
+    const i = Math.min(Math.floor(x), samples.length - 2);
+    return samples[i] + (samples[i + 1] - samples[i]) * (x - i);
+}
+
+// --- Geometry: Bezier control points -> stroke polylines and a fill shape ---
+function buildGeometry(points) {
+    const strokes = [];
+    const curves = []; // Bezier curves per polyline, for partial drawing
+    const shapes = [];
+    let current = null;
+    let subpath = null;
+    for (let i = 0; i + 11 < points.length; i += 12) {
+        const p = [0, 1, 2, 3].map(k => [points[i + 3 * k], points[i + 3 * k + 1], points[i + 3 * k + 2]]);
+        if (!current || Math.hypot(p[0][0] - current[0], p[0][1] - current[1]) > 1e-6) {
+            subpath = [p[0]];
+            strokes.push(subpath);
+            curves.push(0);
+            shapes.push(new THREE.Shape().moveTo(p[0][0], p[0][1]));
+        }
+        for (let s = 1; s <= BEZIER_SAMPLES; s++) {
+            const t = s / BEZIER_SAMPLES, u = 1 - t;
+            const w = [u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t];
+            subpath.push([0, 1, 2].map(c => w[0] * p[0][c] + w[1] * p[1][c] + w[2] * p[2][c] + w[3] * p[3][c]));
+        }
+        curves[curves.length - 1]++;
+        shapes[shapes.length - 1].bezierCurveTo(p[1][0], p[1][1], p[2][0], p[2][1], p[3][0], p[3][1]);
+        current = p[3];
+    }
+    return {
+        lines: strokes.map(line => new THREE.BufferGeometry().setFromPoints(line.map(q => new THREE.Vector3(...q)))),
+        curves,
+        fill: shapes.length ? new THREE.ShapeGeometry(shapes) : null,
+    };
+}
+
+function geometryFor(id) {
+    if (!geometryCache[id]) geometryCache[id] = buildGeometry(data.geometries[id]);
+    return geometryCache[id];
+}
+
+// Stroke polylines of `from` carrying those of `to` as a morph target; null if they do not line up
+function morphFor(from, to) {
+    const key = `${from}>${to}`;
+    if (!morphCache.has(key)) {
+        const a = geometryFor(from).lines, b = geometryFor(to).lines;
+        const same = a.length === b.length && a.every((line, i) => line.attributes.position.count === b[i].attributes.position.count);
+        morphCache.set(key, same ? a.map((line, i) => {
+            const morph = line.clone();
+            morph.morphAttributes.position = [b[i].attributes.position];
+            return morph;
+        }) : null);
+    }
+    return morphCache.get(key);
+}
+
+// --- Nodes ---
+function nodeObject(id) {
+    let node = nodeObjects.get(id);
+    if (!node) {
+        node = {
+            group: new THREE.Group(),
+            geometry: -1,
+            row: null,
+            order: 0,
+            lines: [],
+            stroke: new THREE.LineBasicMaterial({ transparent: true, depthTest: false }),
+            fill: new THREE.MeshBasicMaterial({ transparent: true, depthTest: false, side: THREE.DoubleSide }),
+        };
+        nodeObjects.set(id, node);
+    }
+    return node;
+}
+
+function setChildren(node, key, fill, lines) {
+    node.geometry = key;
+    node.group.clear();
+    if (fill) node.group.add(new THREE.Mesh(fill, node.fill));
+    node.lines = lines.map(line => new THREE.Line(line, node.stroke));
+    node.lines.forEach(line => node.group.add(line));
+    node.group.children.forEach(child => { child.renderOrder = node.order; });
+}
+
+function setGeometry(node, geometry) {
+    if (node.geometry === geometry) return;
+    const { lines, fill } = geometryFor(geometry);
+    setChildren(node, geometry, fill, lines);
+}
+
+function setStyle(node, [x, y, z, sr, sg, sb, sa, , fr, fg, fb, fa]) {
+    node.group.position.set(x, y, z);
+    node.stroke.color.setRGB(sr, sg, sb);
+    node.stroke.opacity = sa;
+    node.stroke.visible = sa > 0;
+    node.fill.color.setRGB(fr, fg, fb);
+    node.fill.opacity = fa;
+    node.fill.visible = fa > 0;
+}
+
+function applyChange(row) {
+    const node = nodeObject(row[0]);
+    node.row = row;
+    if (node.track) return; // The track owns the node until it ends
+    setGeometry(node, row[1]);
+    setStyle(node, row.slice(2));
+}
+
+function applyOrder(order) {
+    root.clear();
+    order.forEach((id, index) => {
+        const node = nodeObject(id);
+        node.order = index;
+        node.group.renderOrder = index;
+        node.group.children.forEach(child => { child.renderOrder = index; });
+        root.add(node.group);
+    });
+}
+
+// --- Tracks ---
+function applyTrack(track, f) {
+    const node = nodeObject(track.node);
+    const [to, ...target] = track.to;
+    if (track.kind === 'partial') {
+        if (node.geometry !== `partial:${to}`) {
+            const { lines, curves } = geometryFor(to);
+            setChildren(node, `partial:${to}`, null, lines.map(line => line.clone()));
+            node.curves = curves;
+        }
+        setStyle(node, target);
+        let drawn = f * node.curves.reduce((sum, count) => sum + count, 0);
+        node.lines.forEach((line, i) => {
+            const count = Math.min(Math.max(drawn, 0), node.curves[i]);
+            line.geometry.setDrawRange(0, count > 0 ? Math.round(count * BEZIER_SAMPLES) + 1 : 0);
+            drawn -= node.curves[i];
+        });
+        return;
+    }
+
+    const [from, ...start] = track.from;
+    setStyle(node, start.map((value, k) => value + (target[k] - value) * f));
+    if (from === to) {
+        setGeometry(node, from);
+        return;
+    }
+    const morph = morphFor(from, to);
+    if (!morph) {
+        setGeometry(node, f < 0.5 ? from : to);
+        return;
+    }
+    const key = `morph:${from}>${to}:${f < 0.5}`;
+    if (node.geometry !== key) {
+        setChildren(node, key, geometryFor(f < 0.5 ? from : to).fill, morph);
+        node.stroke.morphTargets = true;
+        node.stroke.needsUpdate = true;
+    }
+    node.lines.forEach(line => { line.morphTargetInfluences = [f]; });
+}
+
+function startTrack(track) {
+    nodeObject(track.node).track = track;
+    activeTracks.push(track);
+}
+
+function endTrack(track) {
+    const node = nodeObject(track.node);
+    if (node.track !== track) return;
+    node.track = null;
+    if (typeof node.geometry === 'string' && node.geometry.startsWith('partial:')) node.lines.forEach(line => line.geometry.dispose());
+    if (node.stroke.morphTargets) {
+        node.stroke.morphTargets = false;
+        node.stroke.needsUpdate = true;
+    }
+    node.geometry = -1;
+    if (node.row) applyChange(node.row);
+}
+
+// --- Playback ---
+function reset() {
+    root.clear();
+    nodeObjects = new Map();
+    cursor = 0;
+    trackCursor = 0;
+    activeTracks = [];
+}
+
+function seek(t) {
+    if (t < time) reset();
+    time = t;
+    const keyframes = data.keyframes;
+    while (cursor < keyframes.length && keyframes[cursor].t <= time) {
+        const keyframe = keyframes[cursor++];
+        keyframe.changes.forEach(applyChange);
+        if (keyframe.order) applyOrder(keyframe.order);
+    }
+    while (trackCursor < tracks.length && tracks[trackCursor].t0 <= time) startTrack(tracks[trackCursor++]);
+    activeTracks = activeTracks.filter(track => {
+        if (track.t1 <= time) {
+            endTrack(track);
+            return false;
+        }
+        applyTrack(track, rate(track.rate, (time - track.t0) / (track.t1 - track.t0)));
+        return true;
+    });
+    timeSlider.value = time;
+    timeLabel.textContent = `${time.toFixed(2)} / ${data.duration.toFixed(2)} s`;
+}
+
+function animate(now) {
+    requestAnimationFrame(animate);
+    if (playing && lastFrame !== null) {
+        let t = time + (now - lastFrame) / 1000;
+        if (t > data.duration) t = 0;
+        seek(t);
+    }
+    lastFrame = now;
+    renderer.render(scene, camera);
+}
+
+function resize() {
+    const { width, height } = data.frame;
+    const aspect = window.innerWidth / window.innerHeight;
+    const halfHeight = Math.max(height, width / aspect) / 2;
+    camera.left = -halfHeight * aspect;
+    camera.right = halfHeight * aspect;
+    camera.top = halfHeight;
+    camera.bottom = -halfHeight;
+    camera.updateProjectionMatrix();
+    renderer.setSize(window.innerWidth, window.innerHeight);
+}
+
+loadSceneBinary(sceneUrl).then(loaded => {
+    if (!loaded) throw new Error(`Could not load ${sceneUrl}`);
+    data = loaded;
+    tracks = (data.tracks || []).slice().sort((a, b) => a.t0 - b.t0);
+    scene.background = new THREE.Color(data.frame.background);
+    timeSlider.max = data.duration;
+    playButton.addEventListener('click', () => {
+        playing = !playing;
+        playButton.textContent = playing ? 'Pause' : 'Play';
+    });
+    timeSlider.addEventListener('input', () => seek(parseFloat(timeSlider.value)));
+    window.addEventListener('resize', resize, false);
+    resize();
+    seek(0);
+    requestAnimationFrame(animate);
+});